@@ -12,7 +12,8 @@ import os
 import time
 import re
 from urllib.parse import urljoin
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union
 import concurrent.futures
 from threading import Lock
 
@@ -49,7 +50,47 @@ def _beatport_log(message: str):
 
     logger.log(level, text)
 
+# Next.js pages embed their full dehydrated state in one script tag. Locating
+# it with a regex and handing the payload straight to json.loads skips
+# building a BeautifulSoup tree of the whole page (the slow part of parsing).
+_NEXT_DATA_RE = re.compile(
+    rb'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S | re.I
+)
+
+
+def extract_next_data_json(html: Optional[bytes]) -> Optional[Dict]:
+    """Return the parsed ``__NEXT_DATA__`` object from raw page HTML, or None."""
+    if not html:
+        return None
+    match = _NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    try:
+        obj = json.loads(match.group(1))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
 class BeatportUnifiedScraper:
+    # Conditional-request page cache (URL -> body + validators). Class-level:
+    # the web routes build a fresh scraper per request, and the cache has to
+    # outlive them to save anything. Bounded by entry count and by total body
+    # bytes: a release page is several hundred KB of HTML, and the cache lives
+    # as long as the (single) web worker.
+    PAGE_CACHE_MAX = 512
+    PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    _page_cache: "OrderedDict[str, Dict]" = OrderedDict()
+    _page_cache_lock = Lock()
+    cache_stats = {'hits': 0, 'revalidated': 0, 'misses': 0}
+    _throttle_lock = Lock()
+    _next_request_at = 0.0
+    # Release/track page fetches kept in flight at once.
+    MAX_CONCURRENT_FETCHES = 4
+    # Minimum spacing between request starts across all worker threads —
+    # replaces the old fixed per-item sleeps while staying polite.
+    MIN_REQUEST_INTERVAL = 0.15
+
     def __init__(self):
         self.base_url = "https://beatport.com"
         self.session = requests.Session()
@@ -155,16 +196,105 @@ class BeatportUnifiedScraper:
         # Accept everything else
         return True
 
-    def get_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a page with error handling"""
+    def _throttle(self):
+        """Space request starts MIN_REQUEST_INTERVAL apart across threads."""
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            BeatportUnifiedScraper._next_request_at = max(now, self._next_request_at) + self.MIN_REQUEST_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+
+    def fetch_page_content(self, url: str) -> Optional[bytes]:
+        """Fetch raw page bytes through the conditional-request cache.
+
+        A cached URL is revalidated with If-None-Match / If-Modified-Since; a
+        304 reuses the stored body. Pages without validators are still cached,
+        which lets a JSON-path miss fall back to soup without a second fetch.
+        """
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url)
+            if cached is not None:
+                self._page_cache.move_to_end(url)
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            response = self.session.get(url, timeout=15)
+            self._throttle()
+            response = self.session.get(url, timeout=15, headers=headers or None)
+            if cached and response.status_code == 304:
+                with self._page_cache_lock:
+                    self.cache_stats['revalidated'] += 1
+                return cached['content']
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
         except requests.RequestException as e:
             _beatport_log(f"Error fetching {url}: {e}")
             return None
 
+        content = response.content
+        with self._page_cache_lock:
+            self.cache_stats['misses'] += 1
+            self._page_cache.pop(url, None)
+            if len(content) <= self.PAGE_CACHE_MAX_BYTES:
+                self._page_cache[url] = {
+                    'content': content,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+            total = sum(len(entry['content']) for entry in self._page_cache.values())
+            while self._page_cache and (len(self._page_cache) > self.PAGE_CACHE_MAX
+                                        or total > self.PAGE_CACHE_MAX_BYTES):
+                _url, evicted = self._page_cache.popitem(last=False)
+                total -= len(evicted['content'])
+        return content
+
+    def _cached_content(self, url: str) -> Optional[bytes]:
+        """Body already fetched for ``url`` in this session (no request)."""
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url)
+            if cached is not None:
+                self.cache_stats['hits'] += 1
+                return cached['content']
+        return None
+
+    def get_page(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch and parse a page with error handling"""
+        content = self.fetch_page_content(url)
+        if content is None:
+            return None
+        return BeautifulSoup(content, 'html.parser')
+
+    def get_page_json(self, url: str) -> Optional[Dict]:
+        """Fetch a page and return its embedded Next.js JSON.
+
+        Fast path: regex-locate ``__NEXT_DATA__`` in the raw bytes. Only when
+        that fails is the page parsed with BeautifulSoup and scanned by
+        ``extract_json_object_from_release_page`` (reusing the cached body).
+        """
+        content = self.fetch_page_content(url)
+        if content is None:
+            return None
+        return self._json_from_content(content)
+
+    def _json_from_content(self, content: bytes) -> Optional[Dict]:
+        """``get_page_json`` for bytes the caller already fetched."""
+        json_obj = extract_next_data_json(content)
+        if json_obj is not None:
+            return json_obj
+        return self.extract_json_object_from_release_page(BeautifulSoup(content, 'html.parser'))
+
+    def _soup_for(self, url: str) -> Optional[BeautifulSoup]:
+        """Soup fallback for a page the JSON path already fetched."""
+        content = self._cached_content(url)
+        if content is None:
+            return self.get_page(url)
+        return BeautifulSoup(content, 'html.parser')
+
     def clean_artist_track_data(self, raw_artist: str, raw_title: str) -> Dict[str, str]:
         """Clean and separate artist and track data reliably"""
         if not raw_artist or not raw_title:
@@ -837,8 +967,10 @@ class BeatportUnifiedScraper:
         """Scrape Beatport Top 100"""
         _beatport_log("\nScraping Beatport Top 100...")
 
-        soup = self.get_page(f"{self.base_url}/top-100")
-        tracks = self.extract_tracks_from_page(soup, "Top 100", limit)
+        url = f"{self.base_url}/top-100"
+        tracks = self._try_json_chart_extraction(self.get_page_json(url), "Top 100", limit)
+        if not tracks:
+            tracks = self.extract_tracks_from_page(self._soup_for(url), "Top 100", limit)
 
         # Enrich with per-track release metadata
         if tracks and enrich:
@@ -858,16 +990,10 @@ class BeatportUnifiedScraper:
 
         # Step 2: Extract individual tracks from each release
         all_tracks = []
-        for i, release_url in enumerate(release_urls):
-            _beatport_log(f"\nProcessing release {i+1}/{len(release_urls)}")
-            tracks = self.extract_tracks_from_release_json(release_url)
+        for tracks in self._map_concurrent(self.extract_tracks_from_release_json, release_urls):
             if tracks:
                 all_tracks.extend(tracks)
 
-            # Add small delay between requests to be respectful
-            import time
-            time.sleep(0.5)
-
         _beatport_log(f"Extracted {len(all_tracks)} individual tracks from {len(release_urls)} releases")
         return all_tracks
 
@@ -903,12 +1029,8 @@ class BeatportUnifiedScraper:
         """Extract individual tracks from a release page using JSON data"""
         _beatport_log(f"Extracting tracks from: {release_url}")
 
-        soup = self.get_page(release_url)
-        if not soup:
-            return []
-
         # Extract JSON object from page
-        json_obj = self.extract_json_object_from_release_page(soup)
+        json_obj = self.get_page_json(release_url)
         if not json_obj:
             _beatport_log("   No JSON data found")
             return []
@@ -948,9 +1070,15 @@ class BeatportUnifiedScraper:
 
         return None
 
-    def _try_json_chart_extraction(self, soup, chart_name: str, limit: int) -> List[Dict]:
-        """Try to extract rich track data from page JSON. Returns list of tracks or empty list."""
-        json_obj = self.extract_json_object_from_release_page(soup)
+    def _try_json_chart_extraction(self, page: Union[Dict, BeautifulSoup, None], chart_name: str, limit: int) -> List[Dict]:
+        """Try to extract rich track data from page JSON. Returns list of tracks or empty list.
+
+        ``page`` is either the already-extracted page JSON (fast path) or a
+        soup to pull it from.
+        """
+        json_obj = page if isinstance(page, dict) else (
+            self.extract_json_object_from_release_page(page) if page is not None else None
+        )
         if not json_obj:
             return []
 
@@ -1110,85 +1238,93 @@ class BeatportUnifiedScraper:
         Returns tracks with added: release_name, release_id, release_image, release_date,
         duration, bpm, key, genre, mix_name, label.
         progress_callback: optional callable(completed, total, track_name) for progress updates.
-        """
-        import time
 
-        enriched = []
+        Track pages are fetched MAX_CONCURRENT_FETCHES at a time; output order
+        matches input order. Tracks that already carry release metadata (the
+        JSON chart path provides it) are passed through without a fetch.
+        """
         total = len(tracks)
         _beatport_log(f"   Enriching {total} chart tracks with per-track metadata...")
 
-        for i, track in enumerate(tracks):
-            track_url = track.get('url', '')
-            if not track_url or '/track/' not in track_url:
-                enriched.append(track)
-                continue
+        completed = [0]
+        progress_lock = Lock()
 
+        def _enrich(indexed):
+            i, track = indexed
             try:
-                soup = self.get_page(track_url)
-                if not soup:
-                    enriched.append(track)
-                    continue
+                return self._enrich_chart_track(i, total, track)
+            except Exception as e:
+                _beatport_log(f"   [{i+1}/{total}] Error enriching track: {e}")
+                return track
+            finally:
+                # Report progress (always runs — success, failure, or exception)
+                if progress_callback:
+                    with progress_lock:
+                        completed[0] += 1
+                        done = completed[0]
+                    progress_callback(done, total, track.get('title', 'Unknown'))
 
-                json_obj = self.extract_json_object_from_release_page(soup)
-                if not json_obj:
-                    enriched.append(track)
-                    continue
+        enriched = self._map_concurrent(_enrich, list(enumerate(tracks)))
 
-                # Get all tracks from the JSON — the track page JSON contains the track itself
-                json_tracks = self.extract_all_tracks_from_json(json_obj)
+        enriched_count = sum(1 for t in enriched if t.get('release_name'))
+        _beatport_log(f"   Enrichment complete: {enriched_count}/{total} tracks have release metadata")
+        return enriched
 
-                # Find the matching track by URL id
-                track_id_from_url = track_url.rstrip('/').split('/')[-1]
-                matched = None
-                for jt in json_tracks:
-                    if str(jt.get('id', '')) == track_id_from_url:
-                        matched = jt
-                        break
+    def _enrich_chart_track(self, i: int, total: int, track: Dict) -> Dict:
+        """Enrich one chart track from its track page (see ``enrich_chart_tracks``)."""
+        track_url = track.get('url', '')
+        if not track_url or '/track/' not in track_url or track.get('release_name'):
+            return track
 
-                if not matched and json_tracks:
-                    # Debug: show what IDs we have vs what we're looking for
-                    sample_ids = [str(jt.get('id', '')) for jt in json_tracks[:5]]
-                    _beatport_log(f"   [{i+1}] No ID match for '{track_id_from_url}' in {sample_ids}... trying title match")
-                    # Fallback: match by title similarity
-                    track_title = track.get('title', '').lower().strip()
-                    for jt in json_tracks:
-                        jt_title = (jt.get('title') or jt.get('name', '')).lower().strip()
-                        if track_title and jt_title and (track_title in jt_title or jt_title in track_title):
-                            matched = jt
-                            _beatport_log(f"   [{i+1}] Title matched: '{jt_title}'")
-                            break
+        json_obj = self.get_page_json(track_url)
+        if not json_obj:
+            return track
 
-                # Fallback: use first track if only one result
-                if not matched and len(json_tracks) == 1:
-                    matched = json_tracks[0]
+        # Get all tracks from the JSON — the track page JSON contains the track itself
+        json_tracks = self.extract_all_tracks_from_json(json_obj)
 
-                if matched:
-                    rich = self.convert_chart_json_to_rich_track_format(matched, i + 1, track.get('list_name', ''))
-                    if rich:
-                        enriched.append(rich)
-                        if (i + 1) <= 3 or (i + 1) % 25 == 0:
-                            _beatport_log(f"   [{i+1}/{total}] {rich.get('artist', '?')} - {rich.get('title', '?')} | {rich.get('release_name', 'no release')}")
-                    else:
-                        enriched.append(track)
-                else:
-                    enriched.append(track)
+        # Find the matching track by URL id
+        track_id_from_url = track_url.rstrip('/').split('/')[-1]
+        matched = None
+        for jt in json_tracks:
+            if str(jt.get('id', '')) == track_id_from_url:
+                matched = jt
+                break
 
-            except Exception as e:
-                _beatport_log(f"   [{i+1}/{total}] Error enriching track: {e}")
-                enriched.append(track)
+        if not matched and json_tracks:
+            # Debug: show what IDs we have vs what we're looking for
+            sample_ids = [str(jt.get('id', '')) for jt in json_tracks[:5]]
+            _beatport_log(f"   [{i+1}] No ID match for '{track_id_from_url}' in {sample_ids}... trying title match")
+            # Fallback: match by title similarity
+            track_title = track.get('title', '').lower().strip()
+            for jt in json_tracks:
+                jt_title = (jt.get('title') or jt.get('name', '')).lower().strip()
+                if track_title and jt_title and (track_title in jt_title or jt_title in track_title):
+                    matched = jt
+                    _beatport_log(f"   [{i+1}] Title matched: '{jt_title}'")
+                    break
 
-            # Report progress (always runs — success, failure, or exception)
-            if progress_callback:
-                track_name = track.get('title', 'Unknown')
-                progress_callback(i + 1, total, track_name)
+        # Fallback: use first track if only one result
+        if not matched and len(json_tracks) == 1:
+            matched = json_tracks[0]
 
-            # Small delay between requests
-            if i < total - 1:
-                time.sleep(0.3)
+        if not matched:
+            return track
 
-        enriched_count = sum(1 for t in enriched if t.get('release_name'))
-        _beatport_log(f"   Enrichment complete: {enriched_count}/{total} tracks have release metadata")
-        return enriched
+        rich = self.convert_chart_json_to_rich_track_format(matched, i + 1, track.get('list_name', ''))
+        if not rich:
+            return track
+        if (i + 1) <= 3 or (i + 1) % 25 == 0:
+            _beatport_log(f"   [{i+1}/{total}] {rich.get('artist', '?')} - {rich.get('title', '?')} | {rich.get('release_name', 'no release')}")
+        return rich
+
+    def _map_concurrent(self, func, items: List) -> List:
+        """Run ``func`` over ``items`` with bounded concurrency, preserving order."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        workers = min(self.MAX_CONCURRENT_FETCHES, len(items))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='beatport-fetch') as pool:
+            return list(pool.map(func, items))
 
     def filter_tracks_for_specific_release(self, json_obj: Dict, release_url: str) -> List[Dict]:
         """Filter tracks to only include those from the specific release"""
@@ -1291,11 +1427,11 @@ class BeatportUnifiedScraper:
         open openDownloadMissingModalForArtistAlbum() directly.
         """
         try:
-            soup = self.get_page(release_url)
-            if not soup:
+            content = self.fetch_page_content(release_url)
+            if content is None:
                 return {'success': False, 'error': 'Failed to fetch release page'}
 
-            json_obj = self.extract_json_object_from_release_page(soup)
+            json_obj = self._json_from_content(content)
             if not json_obj:
                 return {'success': False, 'error': 'Could not extract JSON data from release page'}
 
@@ -1446,14 +1582,14 @@ class BeatportUnifiedScraper:
         """Extract individual tracks from a release URL using JSON method - used for Top 10/100"""
         try:
             # Get the release page
-            soup = self.get_page(release_url)
-            if not soup:
+            content = self.fetch_page_content(release_url)
+            if content is None:
                 return []
 
             # Try JSON extraction method (same as New Releases/Hype Picks)
             if hasattr(self, 'extract_json_object_from_release_page') and hasattr(self, 'filter_tracks_for_specific_release'):
                 # Use existing JSON extraction methods
-                json_obj = self.extract_json_object_from_release_page(soup)
+                json_obj = self._json_from_content(content)
                 if json_obj:
                     release_tracks = self.filter_tracks_for_specific_release(json_obj, release_url)
                     if release_tracks and hasattr(self, 'convert_release_json_to_track_format'):
@@ -1467,7 +1603,7 @@ class BeatportUnifiedScraper:
                         return converted_tracks
 
             # Fallback: try the general track extraction method
-            tracks = self.extract_tracks_from_page(soup, source_name, 50)
+            tracks = self.extract_tracks_from_page(BeautifulSoup(content, 'html.parser'), source_name, 50)
             return tracks
 
         except Exception as e:
@@ -1497,15 +1633,13 @@ class BeatportUnifiedScraper:
         _beatport_log(f"\nSCRAPING {len(release_urls)} RELEASE URL{'S' if len(release_urls) > 1 else ''}")
         _beatport_log("=" * 60)
 
-        all_tracks = []
-
-        for i, release_url in enumerate(release_urls, 1):
+        def _scrape_one(indexed):
+            i, release_url = indexed
             _beatport_log(f"\nProcessing release {i}/{len(release_urls)}: {release_url}")
 
             try:
                 tracks = self.extract_individual_tracks_from_release_url(release_url, source_name)
                 if tracks:
-                    all_tracks.extend(tracks)
                     _beatport_log(f"   Found {len(tracks)} tracks")
 
                     # Show first few tracks for verification
@@ -1519,14 +1653,16 @@ class BeatportUnifiedScraper:
                         _beatport_log(f"      ... and {len(tracks) - 3} more tracks")
                 else:
                     _beatport_log("   No tracks found")
+                return tracks or []
 
             except Exception as e:
                 _beatport_log(f"   Error processing release: {e}")
-                continue
+                return []
 
-            # Small delay between requests to be respectful
-            if i < len(release_urls):
-                time.sleep(0.5)
+        # Releases are fetched concurrently (bounded); results keep input order.
+        all_tracks = []
+        for tracks in self._map_concurrent(_scrape_one, list(enumerate(release_urls, 1))):
+            all_tracks.extend(tracks)
 
         _beatport_log("\n" + "=" * 60)
         _beatport_log("SCRAPING COMPLETE")
@@ -1540,9 +1676,14 @@ class BeatportUnifiedScraper:
         _beatport_log("\nScraping Beatport Hype Top 100...")
 
         # Use the correct URL discovered by parser
-        soup = self.get_page(f"{self.base_url}/hype-100")
-        if soup:
-            tracks = self.extract_tracks_from_page(soup, "Hype Top 100", limit)
+        url = f"{self.base_url}/hype-100"
+        soup = None
+        tracks = self._try_json_chart_extraction(self.get_page_json(url), "Hype Top 100", limit)
+        if not tracks:
+            soup = self._soup_for(url)
+        if tracks or soup:
+            if not tracks:
+                tracks = self.extract_tracks_from_page(soup, "Hype Top 100", limit)
             if tracks and enrich:
                 _beatport_log(f"   Enriching {len(tracks)} Hype Top 100 tracks with per-track metadata...")
                 tracks = self.enrich_chart_tracks(tracks)
@@ -1685,20 +1826,10 @@ class BeatportUnifiedScraper:
 
         # Step 2: Crawl each release URL to extract individual tracks
         all_individual_tracks = []
-        for i, release_url in enumerate(release_urls):
-            _beatport_log(f"   Processing Top 100 release {i+1}/{len(release_urls)}: {release_url}")
-
-            # Extract individual tracks from this release
-            tracks = self.extract_individual_tracks_from_release_url(release_url, "Top 100 Releases")
+        for tracks in self._map_concurrent(
+                lambda url: self.extract_individual_tracks_from_release_url(url, "Top 100 Releases"), release_urls):
             if tracks:
-                _beatport_log(f"   Found {len(tracks)} individual tracks")
                 all_individual_tracks.extend(tracks)
-            else:
-                _beatport_log("   No tracks found")
-
-            # Add delay between requests to be respectful
-            if i < len(release_urls) - 1:
-                time.sleep(0.5)
 
         _beatport_log(f"Extracted {len(all_individual_tracks)} individual tracks from {len(release_urls)} Top 100 releases")
         return all_individual_tracks
@@ -1814,16 +1945,10 @@ class BeatportUnifiedScraper:
 
         # Step 2: Extract individual tracks from each release
         all_tracks = []
-        for i, release_url in enumerate(release_urls):
-            _beatport_log(f"\nProcessing release {i+1}/{len(release_urls)}")
-            tracks = self.extract_tracks_from_hype_picks_release_json(release_url)
+        for tracks in self._map_concurrent(self.extract_tracks_from_hype_picks_release_json, release_urls):
             if tracks:
                 all_tracks.extend(tracks)
 
-            # Add small delay between requests to be respectful
-            import time
-            time.sleep(0.5)
-
         _beatport_log(f"Extracted {len(all_tracks)} individual tracks from {len(release_urls)} hype picks releases")
         return all_tracks
 
@@ -1859,12 +1984,8 @@ class BeatportUnifiedScraper:
         """Extract individual tracks from a hype picks release page using JSON data"""
         _beatport_log(f"Extracting tracks from: {release_url}")
 
-        soup = self.get_page(release_url)
-        if not soup:
-            return []
-
         # Extract JSON object from page (same method as New Releases)
-        json_obj = self.extract_json_object_from_release_page(soup)
+        json_obj = self.get_page_json(release_url)
         if not json_obj:
             _beatport_log("   No JSON data found")
             return []
@@ -500,6 +500,15 @@ class ConfigManager:
                 # this many GB free (0 = off). A fresh LXC install left on the
                 # default paths otherwise fills its 8GB root until it hangs.
                 "min_free_disk_gb": 5.0,
+                # One shared poll of slskd's transfer list for every status
+                # consumer; finished transfers leave memory after the retain window
+                # (unless a download task still waits on them), and with nothing
+                # in flight the poll backs off to the idle interval.
+                "transfer_tracker": {
+                    "poll_interval_seconds": 1.0,
+                    "idle_poll_interval_seconds": 15.0,
+                    "retain_finished_seconds": 600,
+                },
             },
             "download_source": {
                 "mode": "soulseek",  # Options: "soulseek", "youtube", "tidal", "qobuz", "hifi", "hybrid", "torrent", "usenet"
@@ -560,6 +569,8 @@ class ConfigManager:
             },
             "tidal_download": {
                 "quality": "lossless",  # Options: "low", "high", "lossless", "hires"
+                # HLS segment requests kept in flight per download (1 = sequential).
+                "segment_concurrency": 4,
                 "session": {
                     "token_type": "",
                     "access_token": "",
@@ -671,7 +682,41 @@ class ConfigManager:
             },
             "database": {
                 "path": os.environ.get('DATABASE_PATH', 'database/music_library.db'),
-                "max_workers": 5
+                "max_workers": 5,
+                # Write-ahead journal of the in-memory download queue
+                # (core/downloads/journal.py). In-flight batches survive a
+                # restart and resume instead of being re-analyzed. Empty path
+                # puts download_journal.db next to the library database.
+                "download_journal": {
+                    "enabled": True,
+                    "path": "",
+                    "flush_interval_seconds": 1.0
+                },
+                # Library backups (core/db_integrity.safe_backup). The online
+                # backup copies pages_per_step pages at a time and pauses
+                # step_sleep_ms between steps so writers aren't stalled. The
+                # optional chunk store (core/db_backup_store.py) also keeps
+                # compressed, deduplicated snapshots where consecutive backups
+                # only add the pages that changed. Empty path = next to the DB.
+                "backup": {
+                    "pages_per_step": 1024,
+                    "step_sleep_ms": 5,
+                    "chunk_store": {
+                        "enabled": False,
+                        "path": "",
+                        "compression": "zstd",
+                        "max_snapshots": 30
+                    }
+                },
+                # Opt-in statement profiler (core/diagnostics/sql_profiler.py):
+                # per-fingerprint latency table + slow-query log with
+                # EXPLAIN QUERY PLAN. Also switchable at runtime via
+                # /api/debug/sql/start|stop.
+                "sql_profiler": {
+                    "enabled": False,
+                    "slow_ms": 100,
+                    "explain": True
+                }
             },
             "image_cache": {
                 "enabled": True,
@@ -700,7 +745,12 @@ class ConfigManager:
                 "single_to_album": False
             },
             "musicbrainz": {
-                "embed_tags": True
+                "embed_tags": True,
+                # Path to a local MusicBrainz mirror built with
+                # scripts/import_musicbrainz_dump.py. When set, lookups are
+                # answered from it first and only misses hit the 1 req/s
+                # web service. Empty disables the mirror.
+                "mirror_path": ""
             },
             "jiosaavn": {
                 "embed_tags": True,
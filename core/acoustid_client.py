@@ -23,7 +23,7 @@ import shutil
 import logging
 import logging.handlers
 
-from utils.logging_config import get_logger
+from utils.logging_config import get_logger, install_queued_handlers
 from config.settings import config_manager
 
 # fpcalc binary location (downloaded automatically if needed)
@@ -43,7 +43,7 @@ if not _acoustid_logger.handlers:
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     ))
-    _acoustid_logger.addHandler(_acoustid_file_handler)
+    install_queued_handlers(_acoustid_logger, [_acoustid_file_handler], source='acoustid')
     _acoustid_logger.propagate = False
 
 logger = get_logger("acoustid.client")
@@ -81,6 +81,12 @@ class ApiCallTracker:
         # Each entry: {ts, event, service, endpoint, duration, detail}
         self._events = deque(maxlen=200)
 
+        # Monotonic per-thread totals — a caller diffs two snapshots to learn
+        # whether ITS OWN calls hit the network (or a rate limit) in between,
+        # without scanning the timestamp deques or counting other threads'
+        # traffic (enrichment workers, UI requests)
+        self._thread_totals = threading.local()
+
         # Restore persisted history from disk
         self._load()
 
@@ -94,6 +100,7 @@ class ApiCallTracker:
         now = time.time()
         minute_floor = int(now // 60) * 60
 
+        self._thread_totals.calls = getattr(self._thread_totals, 'calls', 0) + 1
         with self._lock:
             # Record in recent timestamps
             self._recent_calls[service_key].append(now)
@@ -130,6 +137,7 @@ class ApiCallTracker:
     def record_event(self, service_key, event_type, detail='', endpoint='', duration=0):
         """Record a rate limit event (ban, escalation, cooldown, etc.).
         Called from spotify_client.py when rate limits are detected."""
+        self._thread_totals.events = getattr(self._thread_totals, 'events', 0) + 1
         with self._lock:
             self._events.append({
                 'ts': time.time(),
@@ -140,6 +148,16 @@ class ApiCallTracker:
                 'detail': detail,
             })
 
+    def get_thread_totals(self):
+        """Return ``(api_calls, rate_limit_events)`` recorded by the calling
+        thread since it started.
+
+        Both only ever grow, so the difference between two snapshots taken on
+        the same thread says how many real calls / rate-limit events that
+        thread's own work caused in between."""
+        return (getattr(self._thread_totals, 'calls', 0),
+                getattr(self._thread_totals, 'events', 0))
+
     def get_events(self, since=None):
         """Get rate limit events, optionally filtered by timestamp."""
         cutoff = since or (time.time() - 86400)
@@ -117,9 +117,14 @@ def _backup_db_at(db_path: str, deps: AutomationDeps, automation_id) -> Dict[str
     # safe_backup verifies source + result integrity, so an automated backup
     # can never silently snapshot a corrupt DB (the incident where every
     # rolling backup faithfully copied the corruption).
-    from core.db_integrity import DBIntegrityError, safe_backup, prune_backups
+    from core.db_integrity import DBIntegrityError, prune_backups
+    from core.db_backup_store import run_configured_backup
     try:
-        safe_backup(db_path, backup_path)
+        config = getattr(deps, 'config_manager', None)
+        stats = run_configured_backup(
+            db_path, backup_path,
+            config.get if config is not None else (lambda key, default=None: default),
+        )
     except DBIntegrityError as integ:
         deps.logger.error("Auto-backup refused — DB integrity check failed: %s", integ)
         deps.update_progress(
@@ -137,11 +142,21 @@ def _backup_db_at(db_path: str, deps: AutomationDeps, automation_id) -> Dict[str
             os.remove(removed)
         except Exception as e:  # noqa: BLE001 — best-effort cleanup
             deps.logger.debug("rolling backup cleanup failed: %s", e)
+    copy = stats['backup']
     deps.update_progress(
         automation_id,
-        log_line=f'Backup created: {size_mb}MB ({os.path.basename(backup_path)})',
+        log_line=(f'Backup created: {size_mb}MB ({os.path.basename(backup_path)}) — '
+                  f'{copy["bytes_read"] / 1048576:.1f}MB read in {copy["elapsed_s"]:.1f}s'),
         log_type='success',
     )
+    store = stats.get('store')
+    if store and 'error' not in store:
+        deps.update_progress(
+            automation_id,
+            log_line=(f'Snapshot stored: {store["new_chunks"]} new / {store["reused_chunks"]} '
+                      f'reused chunks, {store["bytes_written"] / 1048576:.1f}MB written'),
+            log_type='info',
+        )
     return {'status': 'completed', 'backup_path': backup_path, 'size_mb': str(size_mb)}
 
 
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
+import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Optional, List, Callable
 from datetime import datetime
 import time
@@ -12,6 +13,74 @@ from config.settings import config_manager
 
 logger = get_logger("database_update_worker")
 
+
+class _ArtistBatch:
+    """One artist's server content, fetched and waiting to be written."""
+
+    __slots__ = ('artist', 'artist_id', 'skip_existing', 'albums', 'tracks', 'note')
+
+    def __init__(self, artist, artist_id: str, skip_existing: bool = False):
+        self.artist = artist
+        self.artist_id = artist_id
+        self.skip_existing = skip_existing
+        self.albums = []     # (album_obj, artist_id)
+        self.tracks = []     # (track_obj, album_id, artist_id)
+        self.note = None     # set when the artist's albums couldn't be listed
+
+
+class _IngestWriter:
+    """The scan's single database writer.
+
+    Fetcher threads (one per artist in the pool) submit their fetched
+    :class:`_ArtistBatch` and wait on the returned Future; this thread drains
+    whatever has queued up — up to ``max_tracks`` tracks — and writes it with
+    one ``write_fn`` call (one bulk transaction), instead of every fetcher
+    contending for SQLite's write lock row by row.
+    """
+
+    def __init__(self, write_fn: Callable[[list], list], max_tracks: int = 2000):
+        self._write_fn = write_fn
+        self.max_tracks = max_tracks
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="db-update-writer")
+        self._thread.start()
+
+    def submit(self, batch: _ArtistBatch) -> Future:
+        future: Future = Future()
+        self._queue.put((batch, future))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        closing = False
+        while not closing:
+            item = self._queue.get()
+            if item is None:
+                break
+            group = [item]
+            tracks = len(item[0].tracks)
+            while tracks < self.max_tracks:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    closing = True
+                    break
+                group.append(nxt)
+                tracks += len(nxt[0].tracks)
+            try:
+                results = self._write_fn([batch for batch, _ in group])
+                for (_, future), res in zip(group, results, strict=True):
+                    future.set_result(res)
+            except Exception as e:
+                for _, future in group:
+                    future.set_exception(e)
+
+
 class DatabaseUpdateWorker:
     """Worker for updating SoulSync database with media server library data."""
     
@@ -80,6 +149,10 @@ class DatabaseUpdateWorker:
             
         logger.info(f"Using {self.max_workers} worker threads for {self.server_type} database update")
         self.thread_lock = threading.Lock()
+
+        # Set while the artist pool runs: the fetchers hand their batches to
+        # this single writer thread instead of writing themselves.
+        self._writer: Optional[_IngestWriter] = None
         
         # Database instance
         self.database: Optional[MusicDatabase] = None
@@ -964,63 +1037,41 @@ class DatabaseUpdateWorker:
             total_processed_albums = 0
             total_processed_artists = 0
             
-            # Process each artist
+            # Gather each artist's albums and tracks, then write them all in
+            # one bulk transaction
+            batches = []
             for artist in artists_to_process:
                 if self.should_stop:
                     break
-                    
+
                 try:
                     artist_id = str(artist.ratingKey)
-                    artist_name = getattr(artist, 'title', 'Unknown Artist')
-                    
-                    # Insert/update the artist
-                    artist_success = self.database.insert_or_update_media_artist(artist, server_source=self.server_type)
-                    if artist_success:
-                        total_processed_artists += 1
-                    
-                    # Process albums for this artist  
-                    artist_album_ids = albums_by_artist.get(artist_id, set())
-                    for album_id in artist_album_ids:
-                        if self.should_stop:
-                            break
-                            
+                    batch = _ArtistBatch(artist, artist_id)
+                    for album_id in albums_by_artist.get(artist_id, set()):
                         try:
                             # Get album from the first track (they all have the same album)
                             album_tracks = tracks_by_album[album_id]
-                            if album_tracks:
-                                album = album_tracks[0].album()  # Get album object
-                                if album:
-                                    # Insert/update album
-                                    album_success = self.database.insert_or_update_media_album(album, artist_id, server_source=self.server_type)
-                                    if album_success:
-                                        total_processed_albums += 1
-                                    
-                                    # Process all tracks in this album
-                                    for track in album_tracks:
-                                        if self.should_stop:
-                                            break
-                                            
-                                        try:
-                                            track_success = self.database.insert_or_update_media_track(track, album_id, artist_id, server_source=self.server_type)
-                                            if track_success:
-                                                total_processed_tracks += 1
-                                                if track_success == 'inserted':
-                                                    self._new_track_ids.add(str(track.ratingKey))
-                                                logger.debug(f"Processed new track: {track.title}")
-                                        except Exception as e:
-                                            logger.warning(f"Failed to process track '{getattr(track, 'title', 'Unknown')}': {e}")
+                            album = album_tracks[0].album() if album_tracks else None
+                            if album:
+                                batch.albums.append((album, artist_id))
+                                batch.tracks.extend((track, album_id, artist_id) for track in album_tracks)
                         except Exception as e:
                             logger.warning(f"Failed to process album {album_id}: {e}")
-                    
-                    # Emit progress for this artist
-                    artist_albums = len(artist_album_ids)
-                    artist_tracks = sum(len(tracks_by_album[aid]) for aid in artist_album_ids if aid in tracks_by_album)
-                    self._emit_signal('artist_processed', artist_name, True, f"Processed {artist_albums} albums, {artist_tracks} tracks", artist_albums, artist_tracks)
-                    
+                    batches.append(batch)
                 except Exception as e:
                     logger.error(f"Error processing artist '{getattr(artist, 'title', 'Unknown')}': {e}")
                     self._emit_signal('artist_processed', getattr(artist, 'title', 'Unknown'), False, f"Error: {str(e)}", 0, 0)
-            
+
+            results = self._write_batches(batches) if batches else []
+            for batch, (success, details, album_count, track_count) in zip(batches, results):
+                artist_name = getattr(batch.artist, 'title', 'Unknown Artist')
+                if success:
+                    total_processed_artists += 1
+                    total_processed_albums += album_count
+                    total_processed_tracks += track_count
+                    details = f"Processed {album_count} albums, {track_count} tracks"
+                self._emit_signal('artist_processed', artist_name, success, details, album_count, track_count)
+
             # Update totals
             with self.thread_lock:
                 self.processed_artists += total_processed_artists
@@ -1375,121 +1426,173 @@ class DatabaseUpdateWorker:
                 # Emit progress signal
                 self._emit_signal('artist_processed', artist_name, success, details, album_count, track_count)
         else:
-            # Parallel processing for local/manual runs
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all tasks
-                future_to_artist = {executor.submit(process_single_artist, artist): artist
-                                  for artist in artists}
-
-                # Process completed tasks as they finish
-                for future in as_completed(future_to_artist):
-                    if self.should_stop:
-                        break
+            # Parallel processing for local/manual runs: the pool only fetches,
+            # one writer thread applies the batches.
+            self._writer = _IngestWriter(self._write_batches)
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    # Submit all tasks
+                    future_to_artist = {executor.submit(process_single_artist, artist): artist
+                                      for artist in artists}
 
-                    result = future.result()
-                    if result is None:  # Task was cancelled
-                        continue
+                    # Process completed tasks as they finish
+                    for future in as_completed(future_to_artist):
+                        if self.should_stop:
+                            break
+
+                        result = future.result()
+                        if result is None:  # Task was cancelled
+                            continue
 
-                    artist_name, success, details, album_count, track_count = result
+                        artist_name, success, details, album_count, track_count = result
 
-                    # Emit progress signal
-                    self._emit_signal('artist_processed', artist_name, success, details, album_count, track_count)
+                        # Emit progress signal
+                        self._emit_signal('artist_processed', artist_name, success, details, album_count, track_count)
+            finally:
+                writer, self._writer = self._writer, None
+                writer.close()
     
     def _process_artist_with_content(self, media_artist, skip_existing_tracks=False, seen_track_ids=None) -> tuple[bool, str, int, int]:
         """Process an artist and all their albums and tracks with optimized API usage.
 
+        The server content is fetched first, then written in one bulk
+        transaction — through the scan's writer thread when the artist pool is
+        running, directly otherwise.
+
         Args:
             skip_existing_tracks: If True, skip tracks already in the DB (deep scan mode)
             seen_track_ids: If provided, collect all server track IDs into this set (deep scan mode)
         """
         try:
-            artist_name = getattr(media_artist, 'title', 'Unknown Artist')
-
-            # 1. Insert/update the artist using server-agnostic method
-            artist_success = self.database.insert_or_update_media_artist(media_artist, server_source=self.server_type)
-            if not artist_success:
-                return False, "Failed to update artist data", 0, 0
-
-            artist_id = str(media_artist.ratingKey)
-
-            # 2. Get all albums for this artist (cached from aggressive pre-population)
-            try:
-                albums = list(media_artist.albums())
-            except Exception as e:
-                logger.warning(f"Could not get albums for artist '{artist_name}': {e}")
-                return True, "Artist updated (no albums accessible)", 0, 0
+            batch = self._collect_artist_content(media_artist, skip_existing_tracks, seen_track_ids)
+            writer = self._writer
+            if writer is not None:
+                return writer.submit(batch).result()
+            return self._write_batches([batch])[0]
 
-            album_count = 0
-            track_count = 0
-            skipped_count = 0
+        except Exception as e:
+            logger.error(f"Error processing artist '{getattr(media_artist, 'title', 'Unknown')}': {e}")
+            return False, f"Processing error: {str(e)}", 0, 0
 
-            # 3. Process albums in smaller batches to reduce memory usage
-            batch_size = 10  # Process 10 albums at a time
-            for i in range(0, len(albums), batch_size):
-                if self.should_stop:
-                    break
+    def _collect_artist_content(self, media_artist, skip_existing_tracks=False, seen_track_ids=None) -> _ArtistBatch:
+        """Fetch an artist's albums and tracks from the server (cached from
+        aggressive pre-population) without touching the database."""
+        artist_name = getattr(media_artist, 'title', 'Unknown Artist')
+        artist_id = str(media_artist.ratingKey)
+        batch = _ArtistBatch(media_artist, artist_id, skip_existing_tracks)
 
-                album_batch = albums[i:i + batch_size]
+        try:
+            albums = list(media_artist.albums())
+        except Exception as e:
+            logger.warning(f"Could not get albums for artist '{artist_name}': {e}")
+            batch.note = "Artist updated (no albums accessible)"
+            return batch
 
-                for album in album_batch:
+        for album in albums:
+            if self.should_stop:
+                break
+            try:
+                album_id = str(album.ratingKey)
+                batch.albums.append((album, artist_id))
+                try:
+                    tracks = list(album.tracks())
+                except Exception as e:
+                    logger.warning(f"Could not get tracks for album '{getattr(album, 'title', 'Unknown')}': {e}")
+                    continue
+                for track in tracks:
                     if self.should_stop:
                         break
+                    # Deep scan: collect all server track IDs
+                    if seen_track_ids is not None:
+                        seen_track_ids.add(str(track.ratingKey))
+                    batch.tracks.append((track, album_id, artist_id))
+            except Exception as e:
+                logger.warning(f"Failed to process album '{getattr(album, 'title', 'Unknown')}': {e}")
+        return batch
+
+    @staticmethod
+    def _content_details(skip_existing: bool, album_count: int, track_count: int, skipped_count: int) -> str:
+        if skip_existing:
+            return f"{album_count} albums, {track_count} new tracks ({skipped_count} existing updated)"
+        return f"Updated with {album_count} albums, {track_count} tracks"
+
+    def _write_batches(self, batches: List[_ArtistBatch]) -> List[tuple]:
+        """Write fetched artist batches in one bulk transaction; returns each
+        batch's ``(success, details, album_count, track_count)``.
+
+        Deep scan: existing tracks are still upserted to refresh file_path and
+        other server-provided fields (the UPDATE preserves enrichment); they're
+        just reported as "existing" rather than new.
+        """
+        result = self.database.bulk_upsert_media_library(
+            [b.artist for b in batches],
+            [a for b in batches for a in b.albums],
+            [t for b in batches for t in b.tracks],
+            server_source=self.server_type,
+        )
+        if result is None:
+            return [self._write_batch_per_row(b) for b in batches]
+
+        failed_artists = set(result['failed_artist_ids'])
+        failed_albums = set(result['failed_album_ids'])
+        failed_tracks = set(result['failed_track_ids'])
+        existing = set(result['existing_track_ids'])
+        with self.thread_lock:
+            self._new_track_ids.update(result['inserted_track_ids'])
+
+        out = []
+        for b in batches:
+            if b.artist_id in failed_artists:
+                out.append((False, "Failed to update artist data", 0, 0))
+                continue
+            if b.note:
+                out.append((True, b.note, 0, 0))
+                continue
+            album_count = sum(1 for album, _ in b.albums if str(album.ratingKey) not in failed_albums)
+            written = [str(t.ratingKey) for t, _, _ in b.tracks if str(t.ratingKey) not in failed_tracks]
+            skipped_count = sum(1 for tid in written if tid in existing) if b.skip_existing else 0
+            track_count = len(written) - skipped_count
+            out.append((True, self._content_details(b.skip_existing, album_count, track_count, skipped_count),
+                        album_count, track_count))
+        return out
+
+    def _write_batch_per_row(self, batch: _ArtistBatch) -> tuple:
+        """Row-by-row fallback for a batch the bulk transaction couldn't write."""
+        if not self.database.insert_or_update_media_artist(batch.artist, server_source=self.server_type):
+            return False, "Failed to update artist data", 0, 0
+        if batch.note:
+            return True, batch.note, 0, 0
+
+        written_albums = set()
+        for album, artist_id in batch.albums:
+            try:
+                if self.database.insert_or_update_media_album(album, artist_id, server_source=self.server_type):
+                    written_albums.add(str(album.ratingKey))
+            except Exception as e:
+                logger.warning(f"Failed to process album '{getattr(album, 'title', 'Unknown')}': {e}")
 
-                    try:
-                        # Insert/update album using server-agnostic method
-                        album_success = self.database.insert_or_update_media_album(album, artist_id, server_source=self.server_type)
-                        if album_success:
-                            album_count += 1
-                            album_id = str(album.ratingKey)
+        track_count = 0
+        skipped_count = 0
+        for track, album_id, artist_id in batch.tracks:
+            if album_id not in written_albums:
+                continue
+            try:
+                track_id_str = str(track.ratingKey)
+                is_existing = batch.skip_existing and self.database.track_exists_by_server(track_id_str, self.server_type)
+                track_success = self.database.insert_or_update_media_track(track, album_id, artist_id, server_source=self.server_type)
+                if is_existing:
+                    skipped_count += 1
+                elif track_success:
+                    track_count += 1
+                    if track_success == 'inserted':
+                        with self.thread_lock:
+                            self._new_track_ids.add(track_id_str)
+            except Exception as e:
+                logger.warning(f"Failed to process track '{getattr(track, 'title', 'Unknown')}': {e}")
 
-                            # 4. Process tracks in this album (cached from aggressive pre-population)
-                            try:
-                                tracks = list(album.tracks())
-
-                                # Batch insert tracks for better database performance
-                                track_batch = []
-                                for track in tracks:
-                                    if self.should_stop:
-                                        break
-                                    track_batch.append((track, album_id, artist_id))
-
-                                # Process track batch
-                                for track, alb_id, art_id in track_batch:
-                                    try:
-                                        track_id_str = str(track.ratingKey)
-
-                                        # Deep scan: collect all server track IDs
-                                        if seen_track_ids is not None:
-                                            seen_track_ids.add(track_id_str)
-
-                                        # Deep scan: always call insert_or_update to refresh file_path
-                                        # and other server-provided fields. UPDATE preserves enrichment.
-                                        is_existing = skip_existing_tracks and self.database.track_exists_by_server(track_id_str, self.server_type)
-                                        track_success = self.database.insert_or_update_media_track(track, alb_id, art_id, server_source=self.server_type)
-                                        if is_existing:
-                                            skipped_count += 1
-                                        elif track_success:
-                                            track_count += 1
-                                            if track_success == 'inserted':
-                                                self._new_track_ids.add(track_id_str)
-                                    except Exception as e:
-                                        logger.warning(f"Failed to process track '{getattr(track, 'title', 'Unknown')}': {e}")
-
-                            except Exception as e:
-                                logger.warning(f"Could not get tracks for album '{getattr(album, 'title', 'Unknown')}': {e}")
-
-                    except Exception as e:
-                        logger.warning(f"Failed to process album '{getattr(album, 'title', 'Unknown')}': {e}")
-
-            if skip_existing_tracks:
-                details = f"{album_count} albums, {track_count} new tracks ({skipped_count} existing updated)"
-            else:
-                details = f"Updated with {album_count} albums, {track_count} tracks"
-            return True, details, album_count, track_count
-            
-        except Exception as e:
-            logger.error(f"Error processing artist '{getattr(media_artist, 'title', 'Unknown')}': {e}")
-            return False, f"Processing error: {str(e)}", 0, 0
+        album_count = len(written_albums)
+        return (True, self._content_details(batch.skip_existing, album_count, track_count, skipped_count),
+                album_count, track_count)
 
     def run_with_callback(self, completion_callback=None):
         """
@@ -9,9 +9,10 @@ file — so when recovery was needed, all snapshots were poisoned.
 This module makes that impossible:
 
 * ``quick_check(path)`` / ``is_healthy(path)`` — fast read-only integrity probe.
-* ``safe_backup(...)`` — verifies the SOURCE is healthy before copying, uses the
-  SQLite Online Backup API, then verifies the RESULT. A corrupt source never
-  produces (or keeps) a backup.
+* ``safe_backup(...)`` — copies with the SQLite Online Backup API in small
+  page steps (writers aren't stalled for the whole copy), then verifies the
+  RESULT, which also proves the source: a corrupt source never produces (or
+  keeps) a backup. Returns what the run read/wrote and how long it took.
 * ``prune_backups(...)`` — rotation that NEVER deletes the most recent
   *verified-healthy* backup, even to honor the max-count, so a run of bad
   backups can't evict your last good one.
@@ -25,7 +26,9 @@ from __future__ import annotations
 import logging
 import os
 import sqlite3
-from typing import Optional
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger("db_integrity")
 
@@ -74,41 +77,158 @@ def is_healthy(db_path: str, *, timeout: float = 30.0) -> bool:
         return False
 
 
-def safe_backup(src_path: str, dst_path: str, *, verify_source: bool = True,
-                verify_result: bool = True) -> None:
+# Online-backup step size and pause between steps. Each step holds the
+# source read transaction only for ``pages_per_step`` pages, so writers on a
+# multi-GB library keep going while the copy runs.
+DEFAULT_PAGES_PER_STEP = 1024
+DEFAULT_STEP_SLEEP = 0.005
+# Every write to the source from another connection restarts a stepped copy
+# from page 0; on a busy library that can go on forever. After this many
+# restarts the copy is redone in one step, which no writer can interrupt.
+DEFAULT_MAX_RESTARTS = 3
+
+
+class _CopyKeepsRestarting(Exception):
+    """Raised from the progress callback to abandon a stepped copy."""
+
+
+@dataclass
+class BackupStats:
+    """What one :func:`safe_backup` run cost."""
+    pages: int = 0
+    page_size: int = 0
+    steps: int = 0
+    restarts: int = 0
+    single_step: bool = False
+    bytes_read: int = 0
+    bytes_written: int = 0
+    elapsed_s: float = 0.0
+    verified_source: bool = False
+    verified_result: bool = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def safe_backup(src_path: str, dst_path: str, *, verify_source: Optional[bool] = None,
+                verify_result: bool = True, pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+                step_sleep: float = DEFAULT_STEP_SLEEP,
+                max_restarts: int = DEFAULT_MAX_RESTARTS,
+                progress: Optional[Callable[[int, int], None]] = None) -> BackupStats:
     """Back up ``src_path`` to ``dst_path`` via the SQLite Online Backup API,
     refusing to produce a backup from (or keep a backup of) a corrupt DB.
 
+    The copy runs in ``pages_per_step`` increments with ``step_sleep``
+    seconds between them (``pages_per_step <= 0`` copies in one step).
+    ``progress(remaining, total)`` is called after every step. A write to
+    the source restarts a stepped copy; after ``max_restarts`` of those it
+    is redone in a single step (``stats.single_step``) so it always ends.
+
+    The backup API copies pages verbatim, so a corrupt source always yields a
+    corrupt copy: with ``verify_result`` on, checking the copy covers the
+    source too, and ``verify_source`` (default: only when ``verify_result`` is
+    off) would just be a second full read of a large file.
+
     Raises ``DBIntegrityError`` and removes any partial ``dst_path`` when the
-    source is unhealthy (``verify_source``) or the produced backup fails its
-    own check (``verify_result``). On success ``dst_path`` is a verified-good
-    copy.
+    source is unhealthy or the produced backup fails its own check. On
+    success ``dst_path`` is a verified-good copy and the returned
+    :class:`BackupStats` says what it cost.
     """
-    if verify_source and not is_healthy(src_path):
-        # Don't immortalize corruption — surface it so the caller can alert
-        # and, crucially, NOT rotate out the existing good backups.
-        raise DBIntegrityError(
-            f"Refusing to back up: source database failed integrity check ({src_path})"
-        )
+    started = time.perf_counter()
+    stats = BackupStats()
+    if verify_source is None:
+        verify_source = not verify_result
+    if verify_source:
+        if not is_healthy(src_path):
+            # Don't immortalize corruption — surface it so the caller can alert
+            # and, crucially, NOT rotate out the existing good backups.
+            raise DBIntegrityError(
+                f"Refusing to back up: source database failed integrity check ({src_path})"
+            )
+        stats.verified_source = True
+        stats.bytes_read += _safe_size(src_path)
+
+    copied = {'pages': 0, 'remaining': None}
+
+    def _on_step(status, remaining, total):
+        # A write from another connection restarts the copy, which shows up
+        # as ``remaining`` not going down — count what was actually read.
+        previous = copied['remaining']
+        restarted = previous is not None and remaining >= previous
+        if previous is None or restarted:
+            copied['pages'] += total - remaining
+        else:
+            copied['pages'] += previous - remaining
+        copied['remaining'] = remaining
+        stats.steps += 1
+        stats.pages = total
+        if progress is not None:
+            progress(remaining, total)
+        if restarted:
+            stats.restarts += 1
+            if stats.restarts > max_restarts and not stats.single_step:
+                raise _CopyKeepsRestarting()
 
     src = dst = None
     try:
         src = sqlite3.connect(src_path)
         dst = sqlite3.connect(dst_path)
-        src.backup(dst)
+        stats.page_size = src.execute("PRAGMA page_size").fetchone()[0]
+        try:
+            src.backup(dst, pages=pages_per_step if pages_per_step > 0 else -1,
+                       progress=_on_step, sleep=max(0.0, step_sleep))
+        except _CopyKeepsRestarting:
+            logger.warning("Backup of %s restarted %d times under concurrent writes; "
+                           "finishing it in a single step", src_path, stats.restarts)
+            stats.single_step = True
+            copied['remaining'] = None
+            src.backup(dst, pages=-1, progress=_on_step)
+    except sqlite3.DatabaseError as e:
+        # A source too damaged to even copy is the same verdict as a failed
+        # quick_check — and the half-written destination must not survive.
+        _close_quietly(dst)
+        dst = None
+        _remove_quietly(dst_path)
+        raise DBIntegrityError(
+            f"Refusing to back up: source database could not be read ({src_path}): {e}"
+        ) from e
     finally:
         _close_quietly(dst)
         _close_quietly(src)
+    stats.bytes_read += copied['pages'] * stats.page_size
 
-    if verify_result and not is_healthy(dst_path):
-        # The copy itself came out bad — discard it rather than keep a dud.
-        try:
-            os.remove(dst_path)
-        except OSError:
-            pass
-        raise DBIntegrityError(
-            f"Backup produced a corrupt file and was discarded ({dst_path})"
-        )
+    if verify_result:
+        if not is_healthy(dst_path):
+            # The copy came out bad — discard it rather than keep a dud. With
+            # the source check skipped, a bad copy means a bad source.
+            _remove_quietly(dst_path)
+            raise DBIntegrityError(
+                f"Refusing to back up: database failed integrity check ({src_path}); "
+                f"the copy was discarded ({dst_path})"
+            )
+        stats.verified_result = True
+        stats.bytes_read += _safe_size(dst_path)
+
+    stats.bytes_written = _safe_size(dst_path)
+    stats.elapsed_s = round(time.perf_counter() - started, 3)
+    logger.info("Backup %s -> %s: %d pages in %d steps, %d bytes read, %d written, %.2fs",
+                src_path, dst_path, stats.pages, stats.steps, stats.bytes_read,
+                stats.bytes_written, stats.elapsed_s)
+    return stats
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _safe_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
 
 
 def prune_backups(backup_paths, max_keep: int,
@@ -41,6 +41,7 @@ def rate_limited(func):
         except Exception as e:
             if "rate limit" in str(e).lower() or "429" in str(e):
                 logger.warning(f"Deezer rate limit hit, implementing backoff: {e}")
+                api_call_tracker.record_event('deezer', 'rate_limited', detail=str(e)[:200])
                 time.sleep(4.0)
             raise e
     return wrapper
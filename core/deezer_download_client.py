@@ -46,6 +46,13 @@ _QUALITY_ORDER = ['flac', 'mp3_320', 'mp3_128']
 # Chunk size for Blowfish decryption (Deezer standard)
 _CHUNK_SIZE = 2048
 
+# Network read size for the streaming decryptor — a whole number of stripes,
+# so shutdown/cancel checks, progress updates and writes happen once per
+# buffer instead of once per 2 KB chunk.
+_READ_SIZE = _CHUNK_SIZE * 32
+
+_BF_IV = b'\x00\x01\x02\x03\x04\x05\x06\x07'
+
 # Minimum valid file size (100KB — anything smaller is likely an error)
 _MIN_FILE_SIZE = 100 * 1024
 
@@ -80,6 +87,77 @@ def _decrypt_chunk(chunk: bytes, key: bytes) -> bytes:
             ) from exc
 
 
+
+def _blowfish_ecb(key: bytes):
+    """Return ``decrypt(data) -> bytes`` for raw Blowfish blocks under ``key``.
+
+    The key schedule runs once here; the returned callable is reused for
+    every stripe of the track.
+    """
+    try:
+        from Crypto.Cipher import Blowfish
+        return Blowfish.new(key, Blowfish.MODE_ECB).decrypt
+    except ImportError:
+        try:
+            from cryptography.hazmat.primitives.ciphers import Cipher, modes
+            try:
+                from cryptography.hazmat.decrepit.ciphers.algorithms import Blowfish
+            except ImportError:
+                from cryptography.hazmat.primitives.ciphers.algorithms import Blowfish
+            return Cipher(Blowfish(key), modes.ECB()).decryptor().update
+        except ImportError as exc:
+            raise ImportError(
+                "Deezer downloads require pycryptodome or cryptography package. "
+                "Install with: pip install pycryptodome"
+            ) from exc
+
+
+class _StripeDecryptor:
+    """Streaming BF_CBC_STRIPE decryption for one track.
+
+    The stream is cut into 2,048-byte chunks and every third full chunk is
+    Blowfish-CBC encrypted with a fixed IV. CBC decryption is ECB
+    decryption XORed with the previous ciphertext block (the IV for the
+    first), so a single ECB key schedule serves the whole track: each
+    ``feed`` decrypts all of its encrypted stripes in one cipher call and
+    applies the per-stripe IV chain with one big-integer XOR.
+    """
+
+    def __init__(self, key: bytes):
+        self._decrypt_blocks = _blowfish_ecb(key)
+        self._pending = bytearray()
+        self._chunk_index = 0
+
+    def feed(self, data: bytes) -> bytes:
+        """Add raw bytes; return everything decodable so far, in order."""
+        self._pending += data
+        usable = len(self._pending) - len(self._pending) % _CHUNK_SIZE
+        if not usable:
+            return b''
+        out = bytearray(self._pending[:usable])
+        del self._pending[:usable]
+
+        first = (-self._chunk_index) % 3
+        offsets = range(first * _CHUNK_SIZE, usable, 3 * _CHUNK_SIZE)
+        self._chunk_index += usable // _CHUNK_SIZE
+        if not offsets:
+            return bytes(out)
+
+        ciphertext = b''.join(out[o:o + _CHUNK_SIZE] for o in offsets)
+        chain = b''.join(_BF_IV + out[o:o + _CHUNK_SIZE - 8] for o in offsets)
+        plain = (int.from_bytes(self._decrypt_blocks(ciphertext), 'big')
+                 ^ int.from_bytes(chain, 'big')).to_bytes(len(ciphertext), 'big')
+        for n, o in enumerate(offsets):
+            out[o:o + _CHUNK_SIZE] = plain[n * _CHUNK_SIZE:(n + 1) * _CHUNK_SIZE]
+        return bytes(out)
+
+    def finish(self) -> bytes:
+        """Trailing partial chunk — never encrypted, passed through as-is."""
+        tail = bytes(self._pending)
+        self._pending.clear()
+        return tail
+
+
 from core.download_plugins.base import DownloadSourcePlugin
 
 
@@ -809,11 +887,11 @@ class DeezerDownloadClient(DownloadSourcePlugin):
                 self._engine.update_record('deezer', download_id, {'size': total_size})
 
             downloaded = 0
-            chunk_index = 0
             start_time = time.time()
+            decryptor = _StripeDecryptor(bf_key)
 
             with open(out_path, 'wb') as f:
-                for raw_chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+                for raw_chunk in resp.iter_content(chunk_size=_READ_SIZE):
                     if not raw_chunk:
                         continue
 
@@ -834,15 +912,9 @@ class DeezerDownloadClient(DownloadSourcePlugin):
                             pass
                         return None
 
-                    # Decrypt every 3rd chunk (Deezer's encryption pattern)
-                    if chunk_index % 3 == 0 and len(raw_chunk) == _CHUNK_SIZE:
-                        chunk_to_write = _decrypt_chunk(raw_chunk, bf_key)
-                    else:
-                        chunk_to_write = raw_chunk
-
-                    f.write(chunk_to_write)
+                    # Decrypt every 3rd 2 KB chunk (Deezer's encryption pattern)
+                    f.write(decryptor.feed(raw_chunk))
                     downloaded += len(raw_chunk)
-                    chunk_index += 1
 
                     # Update progress
                     elapsed = time.time() - start_time
@@ -856,6 +928,8 @@ class DeezerDownloadClient(DownloadSourcePlugin):
                             'speed': speed,
                         })
 
+                f.write(decryptor.finish())
+
             # Validate file size
             file_size = os.path.getsize(out_path)
             if file_size < _MIN_FILE_SIZE:
@@ -0,0 +1,162 @@
+"""Per-route request latency histograms, status counts and in-flight gauges.
+
+The slow-request logger in web_server only says *that* a single request took
+over a second; it can't tell a route that is always 400ms from one that is
+usually 5ms with a long tail, and nothing shows which routes are piling up in
+the (single, 8-thread) gunicorn worker. This module keeps, per
+``METHOD rule`` (the URL rule template, so ``/api/artist/<id>`` is one row,
+not one per id):
+
+  · a fixed-bucket latency histogram (Prometheus-style ``le`` bounds, in ms)
+    from which p50/p95/p99 are estimated
+  · count / total / max latency and a status-code breakdown
+  · an in-flight gauge (requests currently inside the route) and its peak
+
+Recording is a handful of integer updates under one lock, so it is always on.
+web_server drives it from before_request / teardown_request hooks and serves
+the snapshot at GET /api/debug/routes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is +Inf.
+BUCKETS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+UNMATCHED = '<unmatched>'
+
+_lock = threading.Lock()
+_routes: Dict[str, Dict[str, Any]] = {}
+_in_flight: Dict[str, int] = {}
+_since = time.time()
+
+
+def route_key(method: str, rule: Optional[str]) -> str:
+    """``"GET /api/artist/<artist_id>"``. Requests that matched no rule (404s,
+    scanners) share one row so they can't blow up the table."""
+    return f"{method} {rule or UNMATCHED}"
+
+
+def _new_route() -> Dict[str, Any]:
+    return {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'errors': 0,
+            'buckets': [0] * (len(BUCKETS_MS) + 1), 'status': {}, 'peak_in_flight': 0}
+
+
+def begin(key: str) -> float:
+    """Mark a request as in flight; returns the start time to hand to :func:`end`."""
+    with _lock:
+        in_flight = _in_flight.get(key, 0) + 1
+        _in_flight[key] = in_flight
+        route = _routes.get(key)
+        if route is None:
+            route = _routes[key] = _new_route()
+        if in_flight > route['peak_in_flight']:
+            route['peak_in_flight'] = in_flight
+    return time.perf_counter()
+
+
+def end(key: str, started: float, status: int) -> float:
+    """Close a request opened with :func:`begin`. Returns the elapsed ms."""
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _lock:
+        remaining = _in_flight.get(key, 1) - 1
+        if remaining > 0:
+            _in_flight[key] = remaining
+        else:
+            _in_flight.pop(key, None)
+        route = _routes.get(key)
+        if route is None:
+            route = _routes[key] = _new_route()
+        route['count'] += 1
+        route['total_ms'] += elapsed_ms
+        if elapsed_ms > route['max_ms']:
+            route['max_ms'] = elapsed_ms
+        route['buckets'][bisect.bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+        status_key = str(status)
+        route['status'][status_key] = route['status'].get(status_key, 0) + 1
+        if status >= 500:
+            route['errors'] += 1
+    return elapsed_ms
+
+
+def _quantile(buckets: List[int], count: int, q: float, max_ms: float) -> Optional[float]:
+    """Estimate a quantile by linear interpolation inside its bucket."""
+    if count <= 0:
+        return None
+    rank = q * count
+    seen = 0
+    for index, n in enumerate(buckets):
+        if n and seen + n >= rank:
+            lower = BUCKETS_MS[index - 1] if index > 0 else 0.0
+            upper = BUCKETS_MS[index] if index < len(BUCKETS_MS) else max_ms
+            upper = min(upper, max_ms)
+            if upper <= lower:
+                return round(upper, 2)
+            return round(lower + (upper - lower) * ((rank - seen) / n), 2)
+        seen += n
+    return round(max_ms, 2)
+
+
+def snapshot(top: int = 50, order: str = 'total', prefix: Optional[str] = None) -> Dict[str, Any]:
+    """Per-route table sorted by ``order`` (total | count | p95 | max | errors
+    | in_flight), optionally restricted to paths under ``prefix``."""
+    with _lock:
+        routes = {key: dict(route, buckets=list(route['buckets']), status=dict(route['status']))
+                  for key, route in _routes.items()}
+        in_flight = dict(_in_flight)
+
+    rows = []
+    for key, route in routes.items():
+        if prefix and not key.split(' ', 1)[-1].startswith(prefix):
+            continue
+        count = route['count']
+        rows.append({
+            'route': key,
+            'count': count,
+            'in_flight': in_flight.get(key, 0),
+            'peak_in_flight': route['peak_in_flight'],
+            'errors': route['errors'],
+            'status': route['status'],
+            'total_ms': round(route['total_ms'], 1),
+            'avg_ms': round(route['total_ms'] / count, 2) if count else None,
+            'p50_ms': _quantile(route['buckets'], count, 0.50, route['max_ms']),
+            'p95_ms': _quantile(route['buckets'], count, 0.95, route['max_ms']),
+            'p99_ms': _quantile(route['buckets'], count, 0.99, route['max_ms']),
+            'max_ms': round(route['max_ms'], 2),
+            'histogram': {('+Inf' if i == len(BUCKETS_MS) else str(BUCKETS_MS[i])): n
+                          for i, n in enumerate(route['buckets']) if n},
+        })
+
+    sort_keys = {
+        'count': lambda r: r['count'],
+        'p95': lambda r: r['p95_ms'] or 0.0,
+        'max': lambda r: r['max_ms'],
+        'errors': lambda r: r['errors'],
+        'in_flight': lambda r: (r['in_flight'], r['peak_in_flight']),
+    }
+    rows.sort(key=sort_keys.get(order, lambda r: r['total_ms']), reverse=True)
+    return {
+        'since': _since,
+        'uptime_s': round(time.time() - _since, 1),
+        'requests': sum(r['count'] for r in rows),
+        'in_flight': sum(in_flight.values()),
+        'buckets_ms': list(BUCKETS_MS),
+        'routes': rows[:max(1, top)],
+    }
+
+
+def reset() -> Dict[str, Any]:
+    """Drop the collected histograms. In-flight gauges are kept — those
+    requests are still running and will close against a fresh row."""
+    global _since
+    with _lock:
+        cleared = len(_routes)
+        _routes.clear()
+        _since = time.time()
+    return {'cleared': cleared}
@@ -0,0 +1,360 @@
+"""Opt-in SQLite statement profiler.
+
+``MusicDatabase``, ``VideoDatabase`` (and ``MetadataCache``, which borrows the
+music connection) open every connection through :func:`connect`. While the
+profiler is off that is a plain ``sqlite3.connect`` plus one module-global
+read. While it is on, connections are :class:`ProfiledConnection` instances:
+
+* every ``execute`` / ``executemany`` / ``commit`` is timed, including the
+  time spent fetching the statement's rows, and attributed to a *fingerprint*
+  — the statement with literals replaced by ``?``, ``IN (...)`` lists folded
+  and whitespace collapsed — so the same query with different values
+  aggregates into one row
+* per fingerprint it keeps count, total / p50 / p95 / max latency (p50/p95
+  from a bounded window of recent samples) and rows returned or changed
+* statements slower than ``slow_ms`` are logged once per fingerprint with
+  their ``EXPLAIN QUERY PLAN`` and kept in a small slow-query ring
+* ``set_trace_callback`` catches what the wrappers can't see (statements run
+  by ``executescript``, the implicit ``BEGIN`` the sqlite3 module issues) and
+  counts them untimed
+
+Connections opened before :func:`enable` stay uninstrumented; connections
+are short-lived here, so the profile fills within seconds. Endpoints live in
+web_server (GET /api/debug/sql/...).
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from utils.logging_config import get_logger
+
+logger = get_logger("diagnostics.sql")
+
+_enabled = False
+_slow_ms = 100.0
+_explain = True
+_started_at: Optional[float] = None
+
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, Any]] = {}
+_slow_log: deque = deque(maxlen=100)
+_plans: Dict[str, str] = {}
+_local = threading.local()
+
+# Latency samples kept per fingerprint for the percentiles.
+_SAMPLE_WINDOW = 512
+_MAX_FINGERPRINTS = 5000
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_RE = re.compile(r"\bVALUES\s*\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+_EXPLAINABLE = ('SELECT', 'WITH', 'UPDATE', 'DELETE', 'INSERT', 'REPLACE')
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """Normalize a statement so different literal values share one key."""
+    text = _STRING_RE.sub('?', sql)
+    text = _NUMBER_RE.sub('?', text)
+    text = _SPACE_RE.sub(' ', text).strip().rstrip(';').strip()
+    text = _IN_LIST_RE.sub('IN (?+)', text)
+    text = _VALUES_RE.sub(lambda m: m.group(0).split(')', 1)[0] + ')+', text)
+    return text
+
+
+# ── Recording ─────────────────────────────────────────────────────────
+
+
+def _record(db: str, sql: str, elapsed_ms: Optional[float], rows: int,
+            conn: Optional[sqlite3.Connection] = None, params: Any = ()) -> None:
+    fp = fingerprint(sql)
+    key = f"{db}\x00{fp}"
+    with _lock:
+        entry = _stats.get(key)
+        if entry is None:
+            if len(_stats) >= _MAX_FINGERPRINTS:
+                return
+            entry = _stats[key] = {
+                'db': db, 'fingerprint': fp, 'count': 0, 'untimed': 0, 'total_ms': 0.0,
+                'max_ms': 0.0, 'rows': 0, 'samples': deque(maxlen=_SAMPLE_WINDOW),
+            }
+        entry['count'] += 1
+        entry['rows'] += max(0, rows)
+        if elapsed_ms is None:
+            entry['untimed'] += 1
+            return
+        entry['total_ms'] += elapsed_ms
+        entry['samples'].append(elapsed_ms)
+        if elapsed_ms > entry['max_ms']:
+            entry['max_ms'] = elapsed_ms
+        slow = elapsed_ms >= _slow_ms
+        need_plan = slow and _explain and key not in _plans
+    if slow:
+        _log_slow(key, db, fp, sql, elapsed_ms, rows, conn, params if need_plan else None)
+
+
+def _log_slow(key: str, db: str, fp: str, sql: str, elapsed_ms: float, rows: int,
+              conn: Optional[sqlite3.Connection], params: Any) -> None:
+    plan = _plans.get(key)
+    if params is not None and conn is not None and plan is None:
+        plan = _explain_plan(conn, sql, params)
+        with _lock:
+            _plans[key] = plan
+        logger.warning("Slow SQL [%s] %.1fms rows=%d: %s\n%s", db, elapsed_ms, rows, fp, plan)
+    with _lock:
+        _slow_log.append({
+            'ts': time.time(), 'db': db, 'fingerprint': fp, 'sql': sql[:2000],
+            'ms': round(elapsed_ms, 2), 'rows': rows, 'plan': plan,
+        })
+
+
+def _explain_plan(conn: sqlite3.Connection, sql: str, params: Any) -> str:
+    if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+        return ''
+    _local.busy = True
+    try:
+        rows = sqlite3.Connection.execute(conn, 'EXPLAIN QUERY PLAN ' + sql, params or ()).fetchall()
+        return '\n'.join(f"{'  ' * _plan_depth(rows, r)}{r[-1]}" for r in rows)
+    except Exception as e:  # noqa: BLE001 — a plan is best-effort context
+        return f'(plan unavailable: {e})'
+    finally:
+        _local.busy = False
+
+
+def _plan_depth(rows, row) -> int:
+    parents = {r[0]: r[1] for r in rows}
+    depth, parent = 0, row[1]
+    while parent in parents and depth < 20:
+        depth += 1
+        parent = parents[parent]
+    return depth
+
+
+def _trace(db: str):
+    def _callback(statement: str) -> None:
+        if getattr(_local, 'busy', False) or not _enabled:
+            return
+        _record(db, statement, None, 0)
+    return _callback
+
+
+# ── Instrumented connection ───────────────────────────────────────────
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that times each statement from execute until its rows are drained."""
+
+    _pending: Optional[list] = None
+
+    def _run(self, method, sql, params):
+        self._finish()
+        _local.busy = True
+        started = time.perf_counter()
+        try:
+            method(self, sql, params)
+        finally:
+            _local.busy = False
+        elapsed = time.perf_counter() - started
+        self._pending = [sql, params, elapsed, 0]
+        if self.description is None:
+            self._pending[3] = max(self.rowcount, 0)
+            self._finish()
+        return self
+
+    def execute(self, sql, parameters=()):
+        return self._run(sqlite3.Cursor.execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._run(sqlite3.Cursor.executemany, sql, seq_of_parameters)
+
+    def _timed_fetch(self, method, *args):
+        started = time.perf_counter()
+        result = method(self, *args)
+        if self._pending is not None:
+            self._pending[2] += time.perf_counter() - started
+        return result
+
+    def fetchone(self):
+        row = self._timed_fetch(sqlite3.Cursor.fetchone)
+        if row is None:
+            self._finish()
+        elif self._pending is not None:
+            self._pending[3] += 1
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows = self._timed_fetch(sqlite3.Cursor.fetchmany, size)
+        if self._pending is not None:
+            self._pending[3] += len(rows)
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed_fetch(sqlite3.Cursor.fetchall)
+        if self._pending is not None:
+            self._pending[3] += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed_fetch(sqlite3.Cursor.__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        if self._pending is not None:
+            self._pending[3] += 1
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:  # noqa: S110 — interpreter teardown / closed connection
+            pass
+
+    def _finish(self):
+        pending, self._pending = self._pending, None
+        if pending is None or not _enabled:
+            return
+        sql, params, elapsed, rows = pending
+        conn = self.connection
+        _record(getattr(conn, 'profile_label', 'sqlite'), sql, elapsed * 1000.0, rows,
+                conn, params if isinstance(params, (tuple, list, dict)) else ())
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """``sqlite3.Connection`` whose cursors report to the profiler."""
+
+    profile_label = 'sqlite'
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    # Connection.execute would otherwise run the C cursor path directly.
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        started = time.perf_counter()
+        _local.busy = True
+        try:
+            super().commit()
+        finally:
+            _local.busy = False
+        if _enabled:
+            _record(self.profile_label, 'COMMIT', (time.perf_counter() - started) * 1000.0, 0)
+
+
+def connect(database: str, *, label: str, **kwargs) -> sqlite3.Connection:
+    """``sqlite3.connect`` that returns a profiled connection while enabled."""
+    if not _enabled:
+        return sqlite3.connect(database, **kwargs)
+    conn = sqlite3.connect(database, factory=ProfiledConnection, **kwargs)
+    conn.profile_label = label
+    conn.set_trace_callback(_trace(label))
+    return conn
+
+
+# ── Control + report ──────────────────────────────────────────────────
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(slow_ms: Optional[float] = None, explain: Optional[bool] = None) -> Dict[str, Any]:
+    """Instrument connections opened from now on. Idempotent."""
+    global _enabled, _slow_ms, _explain, _started_at
+    if slow_ms is not None:
+        _slow_ms = max(0.0, float(slow_ms))
+    if explain is not None:
+        _explain = bool(explain)
+    already = _enabled
+    if not already:
+        _started_at = time.time()
+        _enabled = True
+        logger.info("SQL profiler enabled (slow >= %.0fms, explain=%s)", _slow_ms, _explain)
+    return {'enabled': True, 'already_running': already, 'slow_ms': _slow_ms, 'started_at': _started_at}
+
+
+def disable() -> Dict[str, Any]:
+    """Stop recording. Collected numbers stay until :func:`reset`."""
+    global _enabled
+    was = _enabled
+    _enabled = False
+    if was:
+        logger.info("SQL profiler disabled")
+    return {'enabled': False, 'was_enabled': was}
+
+
+def reset() -> Dict[str, Any]:
+    """Clear the statement table, slow log and captured plans."""
+    global _started_at
+    with _lock:
+        cleared = len(_stats)
+        _stats.clear()
+        _slow_log.clear()
+        _plans.clear()
+    _started_at = time.time() if _enabled else None
+    return {'cleared': cleared, 'enabled': _enabled}
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+_SORT_KEYS = {'total', 'count', 'max', 'p95', 'avg', 'rows'}
+
+
+def report(top: int = 50, order: str = 'total', db: Optional[str] = None) -> Dict[str, Any]:
+    """The statement table, heaviest first, plus the recent slow-query log."""
+    with _lock:
+        entries = [dict(e, samples=sorted(e['samples'])) for e in _stats.values()
+                   if db is None or e['db'] == db]
+        slow = list(_slow_log)[-top:]
+    table = []
+    for e in entries:
+        samples = e.pop('samples')
+        timed = e['count'] - e['untimed']
+        table.append({
+            **e,
+            'total_ms': round(e['total_ms'], 3),
+            'max_ms': round(e['max_ms'], 3),
+            'avg_ms': round(e['total_ms'] / timed, 3) if timed else 0.0,
+            'p50_ms': round(_percentile(samples, 50), 3),
+            'p95_ms': round(_percentile(samples, 95), 3),
+        })
+    key = order if order in _SORT_KEYS else 'total'
+    field = {'total': 'total_ms', 'max': 'max_ms', 'p95': 'p95_ms', 'avg': 'avg_ms'}.get(key, key)
+    table.sort(key=lambda row: row[field], reverse=True)
+    return {
+        'enabled': _enabled,
+        'started_at': _started_at,
+        'slow_ms': _slow_ms,
+        'fingerprints': len(entries),
+        'statements': sum(e['count'] for e in table),
+        'total_ms': round(sum(e['total_ms'] for e in table), 3),
+        'table': table[:top],
+        'slow_queries': list(reversed(slow)),
+    }
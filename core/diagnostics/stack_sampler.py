@@ -0,0 +1,151 @@
+"""On-demand, all-threads stack sampler for profiling a live process.
+
+cProfile only sees the thread that turns it on, and the heavy work in
+SoulSync runs on background threads (download monitor, enrichment workers,
+watchlist scans) next to the gunicorn request threads. :func:`sample` walks
+``sys._current_frames()`` every ``interval`` seconds for ``duration``
+seconds and counts each thread's stack — no tracing hooks, so the sampled
+code runs at full speed and only the sampler thread pays.
+
+Output is the "collapsed stack" format flamegraph.pl / speedscope /
+inferno read directly: one ``thread;outer;...;inner count`` line per
+distinct stack, plus a top-functions table (self and inclusive samples) for
+reading in a browser.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger("diagnostics.stack_sampler")
+
+MAX_DURATION = 60.0
+MIN_INTERVAL = 0.001
+
+# Only one sampler at a time — two would double the overhead and interleave.
+_running = threading.Lock()
+
+
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    for marker in ('/site-packages/', '/core/', '/database/', '/api/', '/services/', '/utils/'):
+        index = filename.rfind(marker)
+        if index >= 0:
+            filename = filename[index + 1:]
+            break
+    else:
+        filename = filename.rsplit('/', 1)[-1]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _stack(frame, max_depth: int) -> Tuple[str, ...]:
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+def sample(duration: float = 10.0, interval: float = 0.01, *, max_depth: int = 64,
+           include_idle: bool = False, top: int = 30) -> Dict[str, Any]:
+    """Sample every thread's stack for ``duration`` seconds.
+
+    Threads parked in a wait (``Event.wait``, ``Condition.wait``,
+    ``Queue.get``, a selector loop) dominate a naive profile; unless
+    ``include_idle`` they're dropped when their innermost frame is one of
+    those primitives.
+    Raises RuntimeError if another sample is already running.
+    """
+    duration = min(max(0.0, float(duration)), MAX_DURATION)
+    interval = max(MIN_INTERVAL, float(interval))
+    if not _running.acquire(blocking=False):
+        raise RuntimeError("a stack sample is already running")
+    try:
+        own = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        idle_skipped = 0
+        started = time.perf_counter()
+        deadline = started + duration
+        while True:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = _stack(frame, max_depth)
+                if not include_idle and stack and _is_idle(stack[-1]):
+                    idle_skipped += 1
+                    continue
+                stacks[(names.get(ident, f"thread-{ident}"),) + stack] += 1
+            samples += 1
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            time.sleep(min(interval, deadline - now))
+        elapsed = time.perf_counter() - started
+    finally:
+        _running.release()
+
+    logger.info("Stack sample: %d sweeps over %.1fs, %d distinct stacks", samples, elapsed, len(stacks))
+    return {
+        'duration_s': round(elapsed, 3),
+        'interval_ms': round(interval * 1000, 3),
+        'sweeps': samples,
+        'stacks': len(stacks),
+        'idle_skipped': idle_skipped,
+        'top_functions': _top_functions(stacks, top),
+        'collapsed': collapsed(stacks),
+    }
+
+
+# Innermost frames that mean "parked": waits in threading / queue, and
+# selector loops (socketserver, engineio, gunicorn's worker loop).
+_IDLE_FRAMES = frozenset({
+    ('wait', 'threading.py'), ('_wait_for_tstate_lock', 'threading.py'),
+    ('get', 'queue.py'), ('select', 'selectors.py'), ('poll', 'selectors.py'),
+    ('serve_forever', 'socketserver.py'),
+})
+
+
+def _is_idle(label: str) -> bool:
+    name, _, where = label.partition(' (')
+    return (name, where.split(':', 1)[0]) in _IDLE_FRAMES
+
+
+def collapsed(stacks: Counter) -> str:
+    """Render ``{(thread, frame, ...): count}`` as collapsed-stack lines."""
+    return '\n'.join(f"{';'.join(stack)} {count}" for stack, count in stacks.most_common())
+
+
+def _top_functions(stacks: Counter, top: int) -> list:
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack[1:]
+        if not frames:
+            continue
+        own[frames[-1]] += count
+        for label in set(frames):
+            total[label] += count
+    grand = sum(stacks.values()) or 1
+    return [{'function': label, 'self': own.get(label, 0), 'total': n,
+             'total_pct': round(100.0 * n / grand, 1)}
+            for label, n in total.most_common(max(1, top))]
+
+
+def is_running() -> bool:
+    return _running.locked()
+
+
+def parse_args(seconds: Optional[float], interval_ms: Optional[float]) -> Tuple[float, float]:
+    """Clamp endpoint query args to (duration seconds, interval seconds)."""
+    duration = 10.0 if seconds is None else seconds
+    interval = 10.0 if interval_ms is None else interval_ms
+    return min(max(0.1, duration), MAX_DURATION), max(MIN_INTERVAL, interval / 1000.0)
@@ -199,6 +199,9 @@ class DownloadEngine:
             if existing is None:
                 return
             existing.update(patch)
+        if patch.get('state') == 'Cancelled':
+            # Still waiting for a worker? Drop it from the queue now.
+            self.worker.cancel_queued(source_name, download_id)
 
     def update_record_unless_state(self, source_name: str, download_id: str,
                                    patch: DownloadRecord,
@@ -235,7 +238,9 @@ class DownloadEngine:
             # checks don't see a stale source key.
             if not source_bucket:
                 self._records.pop(source_name, None)
-            return removed
+        if removed is not None:
+            self.worker.cancel_queued(source_name, download_id)
+        return removed
 
     def get_record(self, source_name: str, download_id: str) -> Optional[DownloadRecord]:
         """Return a SHALLOW COPY of the record. Caller mutations
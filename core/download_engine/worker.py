@@ -37,11 +37,14 @@ under a passing pinning test.
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import os
 import threading
 import time
 import uuid
-from typing import Any, Callable, Dict, Optional
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
 
 from utils.logging_config import get_logger
 
@@ -54,16 +57,65 @@ logger = get_logger("download_engine.worker")
 ImplCallable = Callable[[str, Any, str], Optional[str]]
 
 
+class _QueuedDownload:
+    """One dispatched download waiting for a pool worker."""
+
+    __slots__ = ('download_id', 'target_id', 'display_name', 'impl_callable',
+                 'thread_name', 'enqueued_at', 'cancelled')
+
+    def __init__(self, download_id, target_id, display_name, impl_callable, thread_name):
+        self.download_id = download_id
+        self.target_id = target_id
+        self.display_name = display_name
+        self.impl_callable = impl_callable
+        self.thread_name = thread_name
+        self.enqueued_at = time.time()
+        self.cancelled = False
+
+
+class _SourcePool:
+    """Work queue + worker bookkeeping for one source. Every field is
+    guarded by ``cond``."""
+
+    def __init__(self, source_name: str) -> None:
+        self.source_name = source_name
+        self.cond = threading.Condition()
+        # (-priority, seq, item) — higher priority first, FIFO within
+        # a priority. Cancelled entries stay in the heap until popped
+        # (or compacted); ``pending`` is the live view.
+        self.heap: List[tuple] = []
+        self.pending: Dict[str, _QueuedDownload] = {}
+        self.seq = itertools.count()
+        self.concurrency = 1
+        self.workers = 0
+        self.idle = 0
+        self.active = 0
+        self.dispatched = 0
+        self.started = 0
+        self.dropped = 0
+        self.recent_waits: deque = deque(maxlen=200)
+
+    def pop_next(self) -> Optional[_QueuedDownload]:
+        while self.heap:
+            item = heapq.heappop(self.heap)[2]
+            if item.cancelled:
+                continue
+            self.pending.pop(item.download_id, None)
+            return item
+        return None
+
+
 class BackgroundDownloadWorker:
-    """Engine-owned thread spawner for per-source downloads.
+    """Engine-owned per-source work queues for downloads.
 
     State-machine semantics (preserved verbatim from the legacy
     per-client workers so consumers reading these fields keep
     working):
 
-    - ``Initializing`` — set on dispatch, before the thread starts.
-    - ``InProgress, Downloading`` — set when the worker thread
-      acquires the semaphore and is about to call the impl.
+    - ``Initializing`` — set on dispatch, while the download waits
+      in its source's queue.
+    - ``InProgress, Downloading`` — set when a pool worker picks the
+      download up and is about to call the impl.
     - ``Completed, Succeeded`` — set when impl returns a non-None
       file path. ``progress=100.0`` and ``file_path=<the path>``
       also written.
@@ -71,24 +123,32 @@ class BackgroundDownloadWorker:
       record is left in place so downstream consumers can inspect
       what failed.
 
-    Per-source serialization: each source gets a ``threading.Semaphore``
-    (default size 1, configurable per-source via ``set_concurrency``).
-    Same shape the existing clients use today (each source defines
-    its own semaphore). Engine owning them centrally lets a future
-    Phase E rate-limiter swap the semaphore for a smarter pool.
+    Per-source pools: each source gets a priority/FIFO queue served
+    by ``concurrency`` long-lived daemon threads (default 1,
+    configurable per-source via ``set_concurrency``). Dispatch only
+    enqueues — a 1,500-track playlist is 1,500 queue entries, not
+    1,500 parked threads fighting over a semaphore. Workers start
+    lazily on the first dispatch and then park on the queue's
+    condition between downloads; lowering the concurrency retires
+    the surplus once their current download finishes.
 
     Per-source delay-between-downloads: default 0 seconds (most
     sources don't need it). YouTube currently uses 3s, Qobuz uses
     1s — the legacy values get configured in via ``set_delay``
     when the source registers.
+
+    Cancelling or removing a queued download's record drops its
+    entry immediately (the engine calls ``cancel_queued``), so it
+    never occupies a worker. ``get_stats`` reports queue depth,
+    wait times and active workers per source.
     """
 
     def __init__(self, engine: Any) -> None:
         self._engine = engine
-        # Per-source semaphores + delay state. The first dispatch
-        # for a source auto-creates a semaphore with concurrency=1
-        # if the source hasn't been configured explicitly.
-        self._semaphores: Dict[str, threading.Semaphore] = {}
+        # Per-source pools + delay state. The first dispatch for a
+        # source auto-creates a pool with concurrency=1 if the source
+        # hasn't been configured explicitly.
+        self._pools: Dict[str, _SourcePool] = {}
         self._delays: Dict[str, float] = {}
         self._last_download_at: Dict[str, float] = {}
         self._config_lock = threading.Lock()
@@ -103,8 +163,13 @@ class BackgroundDownloadWorker:
         the streaming APIs all rate-limit at the API gateway level
         anyway, parallel downloads just trade rate-limit errors for
         thread overhead."""
-        with self._config_lock:
-            self._semaphores[source_name] = threading.Semaphore(max_concurrent)
+        pool = self._get_pool(source_name)
+        with pool.cond:
+            pool.concurrency = max(1, int(max_concurrent))
+            slots = self._claim_worker_slots(pool)
+            # Wake parked workers so any surplus can retire.
+            pool.cond.notify_all()
+        self._start_workers(pool, slots)
 
     def set_delay(self, source_name: str, seconds: float) -> None:
         """Set a minimum delay between successive downloads from the
@@ -113,18 +178,48 @@ class BackgroundDownloadWorker:
         with self._config_lock:
             self._delays[source_name] = float(seconds)
 
-    def _get_semaphore(self, source_name: str) -> threading.Semaphore:
+    def _get_pool(self, source_name: str) -> _SourcePool:
         with self._config_lock:
-            sem = self._semaphores.get(source_name)
-            if sem is None:
-                sem = threading.Semaphore(1)
-                self._semaphores[source_name] = sem
-            return sem
+            pool = self._pools.get(source_name)
+            if pool is None:
+                pool = _SourcePool(source_name)
+                self._pools[source_name] = pool
+            return pool
 
     def _get_delay(self, source_name: str) -> float:
         with self._config_lock:
             return self._delays.get(source_name, 0.0)
 
+    # ------------------------------------------------------------------
+    # Queue gauges
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source queue depth, wait time and worker gauges."""
+        with self._config_lock:
+            pools = list(self._pools.values())
+        now = time.time()
+        stats: Dict[str, Dict[str, Any]] = {}
+        for pool in pools:
+            with pool.cond:
+                oldest = min((item.enqueued_at for item in pool.pending.values()), default=None)
+                waits = list(pool.recent_waits)
+                stats[pool.source_name] = {
+                    'queued': len(pool.pending),
+                    'active': pool.active,
+                    'workers': pool.workers,
+                    'idle_workers': pool.idle,
+                    'concurrency': pool.concurrency,
+                    'delay_seconds': self._get_delay(pool.source_name),
+                    'oldest_wait_seconds': round(now - oldest, 3) if oldest is not None else 0.0,
+                    'avg_wait_ms': round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                    'max_wait_ms': round(max(waits) * 1000, 1) if waits else 0.0,
+                    'dispatched': pool.dispatched,
+                    'started': pool.started,
+                    'dropped': pool.dropped,
+                }
+        return stats
+
     # ------------------------------------------------------------------
     # Dispatch — public API
     # ------------------------------------------------------------------
@@ -139,6 +234,7 @@ class BackgroundDownloadWorker:
         extra_record_fields: Optional[Dict[str, Any]] = None,
         username_override: Optional[str] = None,
         thread_name: Optional[str] = None,
+        priority: int = 0,
     ) -> str:
         """Kick off a background download.
 
@@ -169,7 +265,9 @@ class BackgroundDownloadWorker:
                 uses the canonical name.
             thread_name: Optional thread name for diagnostics. Deezer
                 uses ``'deezer-dl-<track_id>'`` — Phase A pinning
-                tests catch any drift in this convention.
+                tests catch any drift in this convention. The pool
+                worker carries this name while it runs the download.
+            priority: Higher runs sooner; equal priorities are FIFO.
 
         Returns:
             download_id (UUID4 string). The orchestrator polls via
@@ -194,18 +292,96 @@ class BackgroundDownloadWorker:
 
         self._engine.add_record(source_name, download_id, record)
 
-        thread = threading.Thread(
-            target=self._worker_loop,
-            args=(source_name, download_id, target_id, display_name, impl_callable),
-            daemon=True,
-            name=thread_name,
-        )
-        thread.start()
+        pool = self._get_pool(source_name)
+        item = _QueuedDownload(download_id, target_id, display_name, impl_callable, thread_name)
+        with pool.cond:
+            heapq.heappush(pool.heap, (-priority, next(pool.seq), item))
+            pool.pending[download_id] = item
+            pool.dispatched += 1
+            slots = self._claim_worker_slots(pool)
+            pool.cond.notify()
+        self._start_workers(pool, slots)
 
         return download_id
 
+    def cancel_queued(self, source_name: str, download_id: str) -> bool:
+        """Drop a download that hasn't started yet. Returns True if it
+        was still queued. Called by the engine whenever a record is
+        cancelled or removed — O(1), no worker is woken for it."""
+        with self._config_lock:
+            pool = self._pools.get(source_name)
+        if pool is None:
+            return False
+        with pool.cond:
+            item = pool.pending.pop(download_id, None)
+            if item is None:
+                return False
+            item.cancelled = True
+            pool.dropped += 1
+            # Keep tombstones from piling up when a big batch is cancelled.
+            if len(pool.heap) > 64 and len(pool.heap) > 2 * len(pool.pending):
+                pool.heap = [entry for entry in pool.heap if not entry[2].cancelled]
+                heapq.heapify(pool.heap)
+            return True
+
     # ------------------------------------------------------------------
-    # Worker thread — the lifted boilerplate
+    # Pool workers
+    # ------------------------------------------------------------------
+
+    def _claim_worker_slots(self, pool: _SourcePool) -> int:
+        """Reserve worker slots up to the pool's concurrency, but no
+        more than the queue can keep busy. Caller holds ``pool.cond``
+        and starts the threads via ``_start_workers`` after releasing
+        it, so a new worker can pick up its first download right away."""
+        slots = 0
+        while (pool.workers < pool.concurrency
+               and len(pool.pending) > pool.idle):
+            pool.workers += 1
+            pool.idle += 1  # counts as idle until it claims an item
+            slots += 1
+        return slots
+
+    def _start_workers(self, pool: _SourcePool, slots: int) -> None:
+        for _ in range(slots):
+            threading.Thread(
+                target=self._pool_worker, args=(pool,), daemon=True,
+                name=f'download-{pool.source_name}',
+            ).start()
+
+    def _pool_worker(self, pool: _SourcePool) -> None:
+        """Long-lived worker: take the next queued download, run it,
+        repeat. Parks on the queue's condition when there's nothing
+        to do; exits only when the pool has been shrunk."""
+        thread = threading.current_thread()
+        own_name = thread.name
+        while True:
+            with pool.cond:
+                while True:
+                    if pool.workers > pool.concurrency:
+                        pool.workers -= 1
+                        pool.idle -= 1
+                        return
+                    item = pool.pop_next()
+                    if item is not None:
+                        break
+                    pool.cond.wait()
+                pool.idle -= 1
+                pool.active += 1
+                pool.started += 1
+                pool.recent_waits.append(time.time() - item.enqueued_at)
+            if item.thread_name:
+                thread.name = item.thread_name
+            try:
+                self._worker_loop(pool.source_name, item.download_id, item.target_id,
+                                  item.display_name, item.impl_callable)
+            finally:
+                thread.name = own_name
+                with pool.cond:
+                    pool.active -= 1
+                    pool.idle += 1
+
+    # ------------------------------------------------------------------
+    # Per-download lifecycle — the lifted boilerplate
     # ------------------------------------------------------------------
 
     def _worker_loop(
@@ -216,107 +392,105 @@ class BackgroundDownloadWorker:
         display_name: str,
         impl_callable: ImplCallable,
     ) -> None:
-        """Runs on the spawned daemon thread. Handles semaphore
-        acquisition, rate-limit sleep, state lifecycle, exception
-        capture. The plugin-specific work happens entirely inside
-        ``impl_callable``."""
+        """Runs one download on a pool worker. Handles rate-limit
+        sleep, state lifecycle, exception capture. The plugin-specific
+        work happens entirely inside ``impl_callable``."""
         try:
-            with self._get_semaphore(source_name):
-                # Rate-limit delay against the LAST download from
-                # this source (not just this worker — semaphore
-                # ensures serial access while delay is configured).
-                delay = self._get_delay(source_name)
-                if delay > 0:
-                    last_at = self._last_download_at.get(source_name, 0.0)
-                    elapsed = time.time() - last_at
-                    if last_at > 0 and elapsed < delay:
-                        wait_time = delay - elapsed
-                        logger.info(
-                            "Rate-limit delay for %s: waiting %.1fs before next download",
-                            source_name, wait_time,
-                        )
-                        time.sleep(wait_time)
-
-                # A cancel that arrived while this download sat QUEUED must
-                # win: without this check the InProgress write below CLOBBERS
-                # the Cancelled state and the download runs to completion as
-                # if nothing happened. A removed record means the same thing.
-                current = self._engine.get_record(source_name, download_id)
-                if current is None or current.get('state') == 'Cancelled':
+            # Rate-limit delay against the LAST download from
+            # this source (not just this worker — the source's
+            # pool keeps access serial while delay is configured).
+            delay = self._get_delay(source_name)
+            if delay > 0:
+                last_at = self._last_download_at.get(source_name, 0.0)
+                elapsed = time.time() - last_at
+                if last_at > 0 and elapsed < delay:
+                    wait_time = delay - elapsed
                     logger.info(
-                        "%s download %s was cancelled while queued — skipping",
-                        source_name, download_id,
-                    )
-                    return
-
-                self._engine.update_record(source_name, download_id, {
-                    'state': 'InProgress, Downloading',
-                })
-
-                try:
-                    file_path = impl_callable(download_id, target_id, display_name)
-                except Exception as exc:
-                    logger.error(
-                        "%s download %s failed (impl raised): %s",
-                        source_name, download_id, exc,
-                    )
-                    self._mark_terminal(
-                        source_name, download_id,
-                        success=False, error=str(exc),
+                        "Rate-limit delay for %s: waiting %.1fs before next download",
+                        source_name, wait_time,
                     )
-                    return
-
-                self._last_download_at[source_name] = time.time()
-
-                if file_path:
-                    # Atomic write — preserve Cancelled if user cancelled
-                    # between impl returning and this write. Same guard
-                    # _mark_terminal uses; Cin flagged both split sites.
-                    applied = self._engine.update_record_unless_state(
-                        source_name, download_id,
-                        {
-                            'state': 'Completed, Succeeded',
-                            'progress': 100.0,
-                            'file_path': file_path,
-                        },
-                        skip_if_state_in=('Cancelled',),
+                    time.sleep(wait_time)
+
+            # A cancel that arrived while this download sat QUEUED must
+            # win: without this check the InProgress write below CLOBBERS
+            # the Cancelled state and the download runs to completion as
+            # if nothing happened. A removed record means the same thing.
+            current = self._engine.get_record(source_name, download_id)
+            if current is None or current.get('state') == 'Cancelled':
+                logger.info(
+                    "%s download %s was cancelled while queued — skipping",
+                    source_name, download_id,
+                )
+                return
+
+            self._engine.update_record(source_name, download_id, {
+                'state': 'InProgress, Downloading',
+            })
+
+            try:
+                file_path = impl_callable(download_id, target_id, display_name)
+            except Exception as exc:
+                logger.error(
+                    "%s download %s failed (impl raised): %s",
+                    source_name, download_id, exc,
+                )
+                self._mark_terminal(
+                    source_name, download_id,
+                    success=False, error=str(exc),
+                )
+                return
+
+            self._last_download_at[source_name] = time.time()
+
+            if file_path:
+                # Atomic write — preserve Cancelled if user cancelled
+                # between impl returning and this write. Same guard
+                # _mark_terminal uses; Cin flagged both split sites.
+                applied = self._engine.update_record_unless_state(
+                    source_name, download_id,
+                    {
+                        'state': 'Completed, Succeeded',
+                        'progress': 100.0,
+                        'file_path': file_path,
+                    },
+                    skip_if_state_in=('Cancelled',),
+                )
+                if applied:
+                    logger.info(
+                        "%s download %s completed: %s",
+                        source_name, download_id, file_path,
                     )
-                    if applied:
-                        logger.info(
-                            "%s download %s completed: %s",
-                            source_name, download_id, file_path,
-                        )
-                    else:
-                        # The record was cancelled — or cancelled AND removed —
-                        # while the impl was still writing (a streaming cancel
-                        # can't interrupt yt-dlp mid-stream). The finished file
-                        # just landed with no record to claim it: nothing will
-                        # ever post-process or delete it, so it bleeds the
-                        # downloads folder forever. Remove it here.
-                        try:
-                            if os.path.isfile(file_path):
-                                os.remove(file_path)
-                                logger.info(
-                                    "%s download %s was cancelled while landing — "
-                                    "removed unclaimed file: %s",
-                                    source_name, download_id, file_path,
-                                )
-                        except OSError as rm_exc:
-                            logger.warning(
-                                "%s download %s cancelled but its file could not "
-                                "be removed (%s): %s",
-                                source_name, download_id, rm_exc, file_path,
-                            )
                 else:
-                    self._mark_terminal(source_name, download_id, success=False)
-                    logger.error(
-                        "%s download %s failed (impl returned None)",
-                        source_name, download_id,
-                    )
+                    # The record was cancelled — or cancelled AND removed —
+                    # while the impl was still writing (a streaming cancel
+                    # can't interrupt yt-dlp mid-stream). The finished file
+                    # just landed with no record to claim it: nothing will
+                    # ever post-process or delete it, so it bleeds the
+                    # downloads folder forever. Remove it here.
+                    try:
+                        if os.path.isfile(file_path):
+                            os.remove(file_path)
+                            logger.info(
+                                "%s download %s was cancelled while landing — "
+                                "removed unclaimed file: %s",
+                                source_name, download_id, file_path,
+                            )
+                    except OSError as rm_exc:
+                        logger.warning(
+                            "%s download %s cancelled but its file could not "
+                            "be removed (%s): %s",
+                            source_name, download_id, rm_exc, file_path,
+                        )
+            else:
+                self._mark_terminal(source_name, download_id, success=False)
+                logger.error(
+                    "%s download %s failed (impl returned None)",
+                    source_name, download_id,
+                )
 
         except Exception as exc:
-            # Defensive — semaphore / sleep shouldn't blow up the
-            # thread, but if they do the record needs SOME terminal
+            # Defensive — the delay sleep shouldn't blow up the
+            # worker, but if they do the record needs SOME terminal
             # state or it sits at 'Initializing' forever.
             logger.exception(
                 "%s worker_loop crashed for download %s: %s",
@@ -63,9 +63,10 @@ class DownloadOrchestrator:
         # can route through it without further orchestrator changes.
         self.engine = engine if engine is not None else DownloadEngine()
         for source_name, plugin in self.registry.all_plugins():
-            spec = self.registry.get_spec(source_name)
-            aliases = spec.aliases if spec else ()
-            self.engine.register_plugin(source_name, plugin, aliases=aliases)
+            self._register_with_engine(source_name, plugin)
+        # Sources the registry deferred (see PluginSpec.boot) join the
+        # engine when something first asks for them.
+        self.registry.on_built(self._register_with_engine)
 
         if self._init_failures:
             logger.warning(f"Download clients failed to initialize: {', '.join(self._init_failures)}")
@@ -85,6 +86,11 @@ class DownloadOrchestrator:
                 self.hybrid_secondary,
             )
 
+    def _register_with_engine(self, source_name, plugin):
+        spec = self.registry.get_spec(source_name)
+        aliases = spec.aliases if spec else ()
+        self.engine.register_plugin(source_name, plugin, aliases=aliases)
+
     def reload_settings(self):
         """Reload settings from config (call after settings change)"""
         self.mode = config_manager.get('download_source.mode', 'soulseek')
@@ -179,7 +185,10 @@ class DownloadOrchestrator:
         = orch.soulseek` repeated for each source.
         """
         result = {}
-        for name, client in self.registry.all_plugins():
+        for name in self.registry.names():
+            client = self.registry.get(name)  # builds a deferred source
+            if client is None:
+                continue
             try:
                 if not hasattr(client, 'is_configured') or client.is_configured():
                     result[name] = client
@@ -192,10 +201,11 @@ class DownloadOrchestrator:
         Qobuz session restore). Generic dispatch — caller passes the
         source name instead of reaching for ``orch.hifi.reload_instances()``.
 
-        When ``source`` is None, reloads every source that has a
-        ``reload_instances`` method.
+        When ``source`` is None, reloads every built source that has a
+        ``reload_instances`` method (a deferred one reads fresh config
+        when it's built).
         """
-        sources = [source] if source else list(self.registry.names())
+        sources = [source] if source else [name for name, _ in self.registry.all_plugins()]
         ok = True
         for name in sources:
             client = self.client(name)
@@ -21,6 +21,7 @@ clients into helpers the registry exposes.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
@@ -46,9 +47,11 @@ from core.hifi_client import HiFiClient
 from core.lidarr_download_client import LidarrDownloadClient
 from core.qobuz_client import QobuzClient
 from core.soulseek_client import SoulseekClient
-from core.soundcloud_client import SoundcloudClient
 from core.tidal_download_client import TidalDownloadClient
-from core.youtube_client import YouTubeClient
+
+# YouTube and SoundCloud are the exception: both pull in yt-dlp (~350 ms
+# and tens of MB), so their modules are imported by the factory, which
+# only runs once a configured download mode (or a caller) needs them.
 
 logger = get_logger("download_plugins.registry")
 
@@ -67,6 +70,9 @@ class PluginSpec:
     factory: Callable[[], DownloadSourcePlugin]
     display_name: str
     aliases: Tuple[str, ...] = field(default_factory=tuple)
+    # ``initialize`` builds the client only when this returns True; otherwise
+    # it is built on first ``get``. None = always built by ``initialize``.
+    boot: Optional[Callable[[], bool]] = None
 
 
 class DownloadPluginRegistry:
@@ -89,6 +95,9 @@ class DownloadPluginRegistry:
         self._specs: Dict[str, PluginSpec] = {}
         self._instances: Dict[str, Optional[DownloadSourcePlugin]] = {}
         self._init_failures: List[str] = []
+        self._deferred: List[str] = []
+        self._build_lock = threading.Lock()
+        self._listeners: List[Callable[[str, DownloadSourcePlugin], None]] = []
 
     def register(self, spec: PluginSpec) -> None:
         """Register a plugin spec under its canonical name + each alias.
@@ -98,17 +107,43 @@ class DownloadPluginRegistry:
         self._specs[spec.name] = spec
 
     def initialize(self) -> None:
-        """Build every registered plugin's instance. Failures captured
-        in ``init_failures`` and the slot is set to None so the
-        orchestrator can skip unavailable sources without crashing."""
+        """Build every registered plugin's instance — except those whose
+        ``boot`` says they aren't needed yet, which ``get`` builds on
+        first use. Failures captured in ``init_failures`` and the slot is
+        set to None so the orchestrator can skip unavailable sources
+        without crashing."""
         for spec in self._specs.values():
-            try:
-                instance = spec.factory()
-                self._instances[spec.name] = instance
-            except Exception as exc:
-                logger.error("%s download client failed to initialize: %s", spec.display_name, exc)
-                self._init_failures.append(spec.display_name)
-                self._instances[spec.name] = None
+            if spec.boot is not None:
+                try:
+                    wanted = bool(spec.boot())
+                except Exception as exc:
+                    logger.debug("%s boot check failed: %s", spec.display_name, exc)
+                    wanted = True
+                if not wanted:
+                    self._deferred.append(spec.name)
+                    continue
+            self._build(spec)
+
+    def _build(self, spec: PluginSpec) -> Optional[DownloadSourcePlugin]:
+        try:
+            instance = spec.factory()
+        except Exception as exc:
+            logger.error("%s download client failed to initialize: %s", spec.display_name, exc)
+            self._init_failures.append(spec.display_name)
+            instance = None
+        self._instances[spec.name] = instance
+        return instance
+
+    def on_built(self, listener: Callable[[str, DownloadSourcePlugin], None]) -> None:
+        """Call ``listener(name, plugin)`` when a deferred plugin is built
+        by ``get`` (plugins built by ``initialize`` are not announced —
+        iterate ``all_plugins`` for those)."""
+        self._listeners.append(listener)
+
+    @property
+    def deferred(self) -> List[str]:
+        """Sources not built yet (skipped by ``initialize``, never asked for)."""
+        return [name for name in self._deferred if name not in self._instances]
 
     @property
     def init_failures(self) -> List[str]:
@@ -122,11 +157,25 @@ class DownloadPluginRegistry:
         # Direct hit
         if name in self._instances:
             return self._instances[name]
-        # Alias lookup
-        for spec in self._specs.values():
-            if name in spec.aliases:
-                return self._instances.get(spec.name)
-        return None
+        spec = self.get_spec(name)
+        if spec is None:
+            return None
+        if spec.name in self._instances:
+            return self._instances[spec.name]
+        if spec.name not in self._deferred:
+            return None
+        with self._build_lock:
+            if spec.name in self._instances:
+                return self._instances[spec.name]
+            instance = self._build(spec)
+        if instance is not None:
+            logger.info("%s download client initialized on first use", spec.display_name)
+            for listener in list(self._listeners):
+                try:
+                    listener(spec.name, instance)
+                except Exception as exc:
+                    logger.debug("plugin listener failed for %s: %s", spec.name, exc)
+        return instance
 
     def get_spec(self, name: str) -> Optional[PluginSpec]:
         if name in self._specs:
@@ -148,8 +197,10 @@ class DownloadPluginRegistry:
     def all_plugins(self) -> Iterator[Tuple[str, DownloadSourcePlugin]]:
         """Yield (name, plugin) for every successfully-initialized
         plugin. Replaces the orchestrator's hand-maintained client
-        lists in get_all_downloads / cancel_all_downloads / etc."""
-        for name, instance in self._instances.items():
+        lists in get_all_downloads / cancel_all_downloads / etc.
+        Deferred plugins that were never asked for are skipped — they
+        hold no downloads or cached settings yet."""
+        for name, instance in list(self._instances.items()):
             if instance is not None:
                 yield name, instance
 
@@ -165,6 +216,34 @@ class DownloadPluginRegistry:
                 continue
 
 
+def _youtube_client() -> DownloadSourcePlugin:
+    from core.youtube_client import YouTubeClient
+    return YouTubeClient()
+
+
+def _soundcloud_client() -> DownloadSourcePlugin:
+    from core.soundcloud_client import SoundcloudClient
+    return SoundcloudClient()
+
+
+def _source_in_use(name: str) -> Callable[[], bool]:
+    """Boot check: ``name`` is the download mode, or part of the hybrid
+    chain. Anything else (streaming, music videos, a redownload search
+    across every source) builds the client on first ``get``."""
+    def in_use() -> bool:
+        from config.settings import config_manager
+        mode = config_manager.get('download_source.mode', 'soulseek')
+        if mode == name:
+            return True
+        if mode != 'hybrid':
+            return False
+        chain = list(config_manager.get('download_source.hybrid_order', None) or [])
+        chain += [config_manager.get('download_source.hybrid_primary', 'soulseek'),
+                  config_manager.get('download_source.hybrid_secondary', 'youtube')]
+        return name in chain
+    return in_use
+
+
 def build_default_registry() -> DownloadPluginRegistry:
     """Construct the registry with SoulSync's eight built-in download
     sources. Called once during orchestrator init.
@@ -181,7 +260,8 @@ def build_default_registry() -> DownloadPluginRegistry:
 
     registry.register(PluginSpec(name='amazon',    factory=AmazonDownloadClient,   display_name='Amazon Music'))
     registry.register(PluginSpec(name='soulseek',  factory=SoulseekClient,         display_name='Soulseek'))
-    registry.register(PluginSpec(name='youtube',   factory=YouTubeClient,          display_name='YouTube'))
+    registry.register(PluginSpec(name='youtube',   factory=_youtube_client,        display_name='YouTube',
+                                 boot=_source_in_use('youtube')))
     registry.register(PluginSpec(name='tidal',     factory=TidalDownloadClient,    display_name='Tidal'))
     registry.register(PluginSpec(name='qobuz',     factory=QobuzClient,            display_name='Qobuz'))
     registry.register(PluginSpec(name='hifi',      factory=HiFiClient,             display_name='HiFi'))
@@ -191,7 +271,8 @@ def build_default_registry() -> DownloadPluginRegistry:
     registry.register(PluginSpec(name='deezer',    factory=DeezerDownloadClient,   display_name='Deezer',
                                  aliases=('deezer_dl',)))
     registry.register(PluginSpec(name='lidarr',    factory=LidarrDownloadClient,   display_name='Lidarr'))
-    registry.register(PluginSpec(name='soundcloud',factory=SoundcloudClient,       display_name='SoundCloud'))
+    registry.register(PluginSpec(name='soundcloud',factory=_soundcloud_client,     display_name='SoundCloud',
+                                 boot=_source_in_use('soundcloud')))
     registry.register(PluginSpec(name='torrent',   factory=TorrentDownloadPlugin,  display_name='Torrent (Prowlarr)'))
     registry.register(PluginSpec(name='usenet',    factory=UsenetDownloadPlugin,   display_name='Usenet (Prowlarr)'))
 
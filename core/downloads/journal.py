@@ -0,0 +1,446 @@
+"""Write-ahead journal for the in-memory download queue.
+
+``download_tasks`` / ``download_batches`` in ``core.runtime_state`` are plain
+dicts, so a restart (gunicorn reload, crash, container update) used to drop
+every in-flight batch and a 2,000-track playlist sync had to be analyzed and
+searched again from scratch. This module keeps a SQLite copy of that state so
+the queue can be rebuilt on the next start.
+
+  · tasks are mutated in place from dozens of call sites, so transitions are
+    captured by diffing rather than by hooks: every ``flush_interval`` seconds
+    a writer thread takes a shallow copy of each task and batch under
+    ``tasks_lock``, serializes them after releasing it, and appends one
+    ``put`` / ``delete`` row per entity whose JSON changed
+  · every tick is a single transaction with ``synchronous=FULL`` — one fsync
+    per tick no matter how many tasks moved, never one per transition
+  · ``journal_state`` is the checkpoint; once enough rows pile up in
+    ``journal_entries`` they are folded into it and truncated
+  · values that don't survive JSON (client objects, locks, cached
+    ``TrackResult`` candidates) are left out; sets round-trip as sets
+  · the database file is opened on first use (:meth:`recover` / a flush),
+    not when the journal object is built
+
+On startup :meth:`DownloadJournal.recover` reads checkpoint + tail, and
+:func:`rebuild_queue` turns that into a queue the batch manager can resume:
+tasks whose transfer is still live in slskd / the torrent / usenet client are
+re-attached as ``downloading`` (the monitor picks them up), every other
+unfinished task goes back to ``pending`` at the front of the remaining queue.
+When a transfer client can't be asked, in-flight tasks are left on their
+transfer rather than requeued, so nothing is downloaded twice.
+Batches still in ``analysis`` are dropped — the analysis worker that owned
+them is gone and its partial results were never journaled.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger("downloads.journal")
+
+# Task statuses that mean "a transfer may exist for this task right now".
+IN_FLIGHT_STATUSES = frozenset({'downloading', 'queued', 'post_processing'})
+# Task statuses that never started a transfer, or were about to.
+RESTARTABLE_STATUSES = frozenset({'pending', 'searching'})
+# Batch phases that are not worth resuming.
+SKIPPED_BATCH_PHASES = frozenset({'analysis', 'complete', 'error', 'cancelled'})
+
+_SKIP = object()
+_SET_MARKER = '__set__'
+
+
+def _encode(value: Any) -> Any:
+    """Project a task/batch value onto JSON types, or ``_SKIP`` if it can't be."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        out = {}
+        for k, v in value.items():
+            if not isinstance(k, str):
+                continue
+            enc = _encode(v)
+            if enc is not _SKIP:
+                out[k] = enc
+        return out
+    if isinstance(value, (set, frozenset)):
+        items = [_encode(v) for v in value]
+        if any(i is _SKIP for i in items):
+            return _SKIP
+        try:
+            items.sort()
+        except TypeError:
+            pass
+        return {_SET_MARKER: items}
+    if isinstance(value, (list, tuple)):
+        return [v for v in (_encode(i) for i in value) if v is not _SKIP]
+    return _SKIP
+
+
+def _decode_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and _SET_MARKER in obj:
+        return set(obj[_SET_MARKER])
+    return obj
+
+
+def dumps_entity(entity: Dict[str, Any]) -> str:
+    """Serialize one task or batch dict the way the journal stores it."""
+    return json.dumps(_encode(entity), sort_keys=True, separators=(',', ':'))
+
+
+def loads_entity(payload: str) -> Dict[str, Any]:
+    return json.loads(payload, object_hook=_decode_hook)
+
+
+class DownloadJournal:
+    """SQLite-backed journal of ``download_tasks`` and ``download_batches``."""
+
+    def __init__(
+        self,
+        db_path: str,
+        tasks: Optional[Dict[str, Dict[str, Any]]] = None,
+        batches: Optional[Dict[str, Dict[str, Any]]] = None,
+        lock: Optional[threading.Lock] = None,
+        flush_interval: float = 1.0,
+        compact_every: int = 5000,
+    ):
+        if tasks is None or batches is None or lock is None:
+            from core import runtime_state
+            tasks = runtime_state.download_tasks if tasks is None else tasks
+            batches = runtime_state.download_batches if batches is None else batches
+            lock = runtime_state.tasks_lock if lock is None else lock
+        self.db_path = db_path
+        self._tasks = tasks
+        self._batches = batches
+        self._tasks_lock = lock
+        self.flush_interval = max(0.05, float(flush_interval))
+        self.compact_every = max(1, int(compact_every))
+
+        # Last JSON written per (kind, entity_id) — the diff baseline.
+        self._last: Dict[Tuple[str, str], str] = {}
+        self._entries_since_compact = 0
+        self._db_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            'flushes': 0,
+            'entries_written': 0,
+            'compactions': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0,
+            'last_snapshot_ms': 0.0,
+            'max_snapshot_ms': 0.0,
+            'last_lock_ms': 0.0,
+            'max_lock_ms': 0.0,
+            'recovery_ms': None,
+            'recovered_tasks': 0,
+            'recovered_batches': 0,
+        }
+
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        """The journal connection, opened on first use. Call with ``_db_lock`` held."""
+        if self._conn is not None:
+            return self._conn
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=FULL')
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS journal_state (
+                kind TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (kind, entity_id)
+            );
+            CREATE TABLE IF NOT EXISTS journal_entries (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts REAL NOT NULL,
+                kind TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                op TEXT NOT NULL,
+                payload TEXT
+            );
+        """)
+        self._conn = conn
+        return conn
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    def recover(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Return ``(tasks, batches)`` as of the last flushed tick.
+
+        Also primes the diff baseline, so the first flush after :meth:`start`
+        only writes what changed relative to what's already on disk.
+        """
+        start = time.perf_counter()
+        state: Dict[Tuple[str, str], str] = {}
+        with self._db_lock:
+            conn = self._db()
+            for kind, entity_id, payload in conn.execute(
+                    'SELECT kind, entity_id, payload FROM journal_state'):
+                state[(kind, entity_id)] = payload
+            tail = 0
+            for kind, entity_id, op, payload in conn.execute(
+                    'SELECT kind, entity_id, op, payload FROM journal_entries ORDER BY seq'):
+                tail += 1
+                if op == 'delete':
+                    state.pop((kind, entity_id), None)
+                else:
+                    state[(kind, entity_id)] = payload
+
+        tasks: Dict[str, Dict[str, Any]] = {}
+        batches: Dict[str, Dict[str, Any]] = {}
+        for (kind, entity_id), payload in state.items():
+            try:
+                entity = loads_entity(payload)
+            except ValueError:
+                logger.warning("Skipping unreadable journal %s %s", kind, entity_id)
+                continue
+            (tasks if kind == 'task' else batches)[entity_id] = entity
+
+        self._last = state
+        self._entries_since_compact = tail
+        elapsed = (time.perf_counter() - start) * 1000
+        self._stats.update(recovery_ms=round(elapsed, 2),
+                           recovered_tasks=len(tasks),
+                           recovered_batches=len(batches))
+        logger.info("Download journal recovered %d batches / %d tasks in %.1fms (%d tail entries)",
+                    len(batches), len(tasks), elapsed, tail)
+        return tasks, batches
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _snapshot(self) -> Dict[Tuple[str, str], str]:
+        # Only the shallow copies are taken under tasks_lock — serializing
+        # thousands of tasks there stalled every status poll and worker.
+        start = time.perf_counter()
+        with self._tasks_lock:
+            copies = [(kind, entity_id, dict(entity))
+                      for kind, source in (('batch', self._batches), ('task', self._tasks))
+                      for entity_id, entity in source.items()
+                      if isinstance(entity, dict)]
+        locked = (time.perf_counter() - start) * 1000
+
+        snap: Dict[Tuple[str, str], str] = {}
+        for kind, entity_id, entity in copies:
+            try:
+                snap[(kind, entity_id)] = dumps_entity(entity)
+            except (TypeError, ValueError, RuntimeError) as e:
+                # A nested list/dict changed mid-serialize: keep what's on
+                # disk (so it isn't journaled as deleted) and retry next tick.
+                previous = self._last.get((kind, entity_id))
+                if previous is not None:
+                    snap[(kind, entity_id)] = previous
+                logger.debug("Journal skipped %s %s: %s", kind, entity_id, e)
+        elapsed = (time.perf_counter() - start) * 1000
+        st = self._stats
+        st['last_snapshot_ms'] = round(elapsed, 3)
+        st['max_snapshot_ms'] = max(st['max_snapshot_ms'], round(elapsed, 3))
+        st['last_lock_ms'] = round(locked, 3)
+        st['max_lock_ms'] = max(st['max_lock_ms'], round(locked, 3))
+        return snap
+
+    def flush(self) -> int:
+        """Journal every change since the last flush. Returns rows written."""
+        snap = self._snapshot()
+        now = time.time()
+        rows = [(now, kind, eid, 'put', payload)
+                for (kind, eid), payload in snap.items()
+                if self._last.get((kind, eid)) != payload]
+        rows.extend((now, kind, eid, 'delete', None)
+                    for (kind, eid) in self._last.keys() - snap.keys())
+        if not rows:
+            return 0
+
+        start = time.perf_counter()
+        with self._db_lock:
+            conn = self._db()
+            conn.execute('BEGIN')
+            try:
+                conn.executemany(
+                    'INSERT INTO journal_entries (ts, kind, entity_id, op, payload) VALUES (?, ?, ?, ?, ?)',
+                    rows)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        elapsed = (time.perf_counter() - start) * 1000
+
+        self._last = snap
+        self._entries_since_compact += len(rows)
+        st = self._stats
+        st['flushes'] += 1
+        st['entries_written'] += len(rows)
+        st['last_flush_ms'] = round(elapsed, 3)
+        st['max_flush_ms'] = max(st['max_flush_ms'], round(elapsed, 3))
+        st['total_flush_ms'] += elapsed
+
+        if self._entries_since_compact >= self.compact_every:
+            self.compact()
+        return len(rows)
+
+    def compact(self) -> None:
+        """Fold the entry log into the checkpoint and truncate it."""
+        state = dict(self._last)
+        with self._db_lock:
+            conn = self._db()
+            conn.execute('BEGIN')
+            try:
+                conn.execute('DELETE FROM journal_state')
+                conn.executemany(
+                    'INSERT INTO journal_state (kind, entity_id, payload) VALUES (?, ?, ?)',
+                    [(kind, eid, payload) for (kind, eid), payload in state.items()])
+                conn.execute('DELETE FROM journal_entries')
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        self._entries_since_compact = 0
+        self._stats['compactions'] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Download journal flush failed: {e}")
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='download-journal', daemon=True)
+        self._thread.start()
+
+    def stop(self, final_flush: bool = True) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        if final_flush:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Download journal final flush failed: {e}")
+
+    def close(self) -> None:
+        self.stop(final_flush=False)
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        st = dict(self._stats)
+        flushes = st.pop('total_flush_ms')
+        st['avg_flush_ms'] = round(flushes / st['flushes'], 3) if st['flushes'] else 0.0
+        st['pending_entries'] = self._entries_since_compact
+        st['tracked_entities'] = len(self._last)
+        st['running'] = bool(self._thread and self._thread.is_alive())
+        return st
+
+
+# ---------------------------------------------------------------------------
+# Rebuilding the queue
+# ---------------------------------------------------------------------------
+
+def rebuild_queue(
+    tasks: Dict[str, Dict[str, Any]],
+    batches: Dict[str, Dict[str, Any]],
+    is_live: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None,
+) -> Dict[str, Any]:
+    """Turn recovered journal state into batches the batch manager can resume.
+
+    Mutates ``tasks`` / ``batches`` in place and returns a summary. Each
+    resumable batch's queue is reordered to ``[finished + re-attached, pending]``
+    so ``queue_index`` / ``active_count`` line up with what
+    ``start_next_batch_of_downloads`` expects.
+
+    ``is_live`` returning None means "can't tell" (the transfer client is
+    unreachable): the task keeps its status and transfer, counted as
+    ``unverified``, and the monitor re-attaches it once the client answers or
+    retries it through its usual missing-transfer path.
+    """
+    now = time.time()
+    summary = {'batches': 0, 'dropped_batches': 0, 'reattached': 0, 'unverified': 0,
+               'requeued': 0, 'finished': 0}
+
+    for batch_id in list(batches):
+        if batches[batch_id].get('phase') in SKIPPED_BATCH_PHASES:
+            del batches[batch_id]
+            summary['dropped_batches'] += 1
+    for task_id in [t for t, task in tasks.items() if task.get('batch_id') not in batches]:
+        del tasks[task_id]
+
+    for batch_id, batch in batches.items():
+        done, waiting, active = [], [], 0
+        for task_id in batch.get('queue', []):
+            task = tasks.get(task_id)
+            if task is None:
+                continue
+            status = task.get('status')
+            live = _safe_is_live(is_live, task) if status in IN_FLIGHT_STATUSES and is_live is not None else False
+            if live:
+                task['status'] = 'downloading'
+                task['status_change_time'] = now
+                done.append(task_id)
+                active += 1
+                summary['reattached'] += 1
+            elif live is None:
+                task['status_change_time'] = now
+                done.append(task_id)
+                active += 1
+                summary['unverified'] += 1
+            elif status in IN_FLIGHT_STATUSES or status in RESTARTABLE_STATUSES:
+                task['status'] = 'pending'
+                task['status_change_time'] = now
+                task['download_id'] = None
+                task['username'] = None
+                task['filename'] = None
+                waiting.append(task_id)
+                summary['requeued'] += 1
+            else:
+                done.append(task_id)
+                summary['finished'] += 1
+        batch['queue'] = done + waiting
+        batch['queue_index'] = len(done)
+        batch['active_count'] = active
+        batch['phase'] = 'downloading'
+        batch['resumed_from_journal'] = True
+        summary['batches'] += 1
+    return summary
+
+
+def _safe_is_live(is_live: Callable[[Dict[str, Any]], Optional[bool]], task: Dict[str, Any]) -> Optional[bool]:
+    try:
+        live = is_live(task)
+        return None if live is None else bool(live)
+    except Exception as e:
+        logger.debug("Live transfer check failed: %s", e)
+        return False
+
+
+_journal: Optional[DownloadJournal] = None
+
+
+def get_download_journal() -> Optional[DownloadJournal]:
+    return _journal
+
+
+def set_download_journal(journal: Optional[DownloadJournal]) -> None:
+    global _journal
+    _journal = journal
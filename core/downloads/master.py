@@ -534,6 +534,23 @@ def run_full_missing_tracks_process(batch_id, playlist_id, tracks_json, deps: Ma
                 except Exception as album_err:
                     logger.error(f"[Album Analysis] Album lookup error: {album_err} — falling back to per-track search")
 
+        # Resolve every global library lookup this pass will make in one bulk
+        # query up front instead of N per-track LIKE searches.
+        from core.library.presence import LibraryPresence, artist_names
+        # Key the prefetch with the same album the per-track checks below use:
+        # the album fast path falls back with the batch album name, every
+        # other path checks without one.
+        presence = LibraryPresence(db, confidence_threshold=0.7, server_source=active_server)
+        _fallback_album = (batch_album_context.get('name') if album_tracks_map and batch_album_context
+                           else None)
+        if not force_download_all and not (allow_duplicates and batch_is_album):
+            presence.prefetch(
+                (t.get('name', ''), name, _fallback_album, t.get('duration_ms'))
+                for t in tracks_json
+                if not (album_tracks_map and t.get('name', '').lower().strip() in album_tracks_map)
+                for name in artist_names(t.get('artists', []))
+            )
+
         for i, track_data in enumerate(tracks_json):
             # Use original table index if provided (for partial track selection),
             # otherwise fall back to enumeration index
@@ -641,16 +658,9 @@ def run_full_missing_tracks_process(batch_id, playlist_id, tracks_json, deps: Ma
                         if allow_duplicates and batch_is_album:
                             found, confidence = False, 0.0
                         else:
-                            _fallback_album = batch_album_context.get('name') if batch_album_context else None
-                            for artist in artists:
-                                if isinstance(artist, str):
-                                    artist_name = artist
-                                elif isinstance(artist, dict) and 'name' in artist:
-                                    artist_name = artist['name']
-                                else:
-                                    artist_name = str(artist)
-                                db_track, track_confidence = db.check_track_exists(
-                                    track_name, artist_name, confidence_threshold=0.7, server_source=active_server, album=_fallback_album
+                            for artist_name in artist_names(artists):
+                                db_track, track_confidence = presence.check(
+                                    track_name, artist_name, album=_fallback_album
                                 )
                                 if db_track and track_confidence >= 0.7:
                                     # Re-release gate (5BILLION round 3): the hit
@@ -671,17 +681,8 @@ def run_full_missing_tracks_process(batch_id, playlist_id, tracks_json, deps: Ma
                 found, confidence = False, 0.0
             else:
                 # Non-album download (playlist/single track) — always check global
-                for artist in artists:
-                    # Handle both string format and Spotify API format {'name': 'Artist Name'}
-                    if isinstance(artist, str):
-                        artist_name = artist
-                    elif isinstance(artist, dict) and 'name' in artist:
-                        artist_name = artist['name']
-                    else:
-                        artist_name = str(artist)
-                    db_track, track_confidence = db.check_track_exists(
-                        track_name, artist_name, confidence_threshold=0.7, server_source=active_server
-                    )
+                for artist_name in artist_names(artists):
+                    db_track, track_confidence = presence.check(track_name, artist_name)
                     if db_track and track_confidence >= 0.7:
                         found, confidence = True, track_confidence
                         matched_track = db_track
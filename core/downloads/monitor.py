@@ -35,6 +35,7 @@ _start_next_batch_of_downloads = None
 _orphaned_download_keys = None
 missing_download_executor = None
 download_orchestrator = None
+transfer_tracker = None
 _RELEASE_SOURCE_NAMES = frozenset(('torrent', 'usenet'))
 
 # Hard ceiling on automatic next-candidate retries after a download was
@@ -295,11 +296,13 @@ def init(
     orphaned_download_keys,
     missing_download_executor_obj,
     download_orchestrator_obj,
+    transfer_tracker_obj=None,
 ):
     """Bind web_server-side helpers/globals so the class body can resolve them."""
     global _make_context_key, _on_download_completed, _download_track_worker
     global _run_post_processing_worker, _start_next_batch_of_downloads
     global _orphaned_download_keys, missing_download_executor, download_orchestrator
+    global transfer_tracker
     _make_context_key = make_context_key
     _on_download_completed = on_download_completed
     _download_track_worker = download_track_worker
@@ -308,6 +311,7 @@ def init(
     _orphaned_download_keys = orphaned_download_keys
     missing_download_executor = missing_download_executor_obj
     download_orchestrator = download_orchestrator_obj
+    transfer_tracker = transfer_tracker_obj
 
 
 class WebUIDownloadMonitor:
@@ -521,11 +525,18 @@ class WebUIDownloadMonitor:
     
     def _get_live_transfers(self):
         """Get current transfer status from slskd API and YouTube client"""
-        try:
-            # Check if we should stop due to shutdown
-            if not self.monitoring:
-                return {}
+        # Check if we should stop due to shutdown
+        if not self.monitoring:
+            return {}
+        return self.fetch_live_transfers()
 
+    def fetch_live_transfers(self):
+        """Live transfer lookup keyed like ``_lookup_live_info`` expects.
+
+        Callable before the monitor loop runs — journal recovery uses it to
+        find which restored tasks still have a transfer to re-attach to.
+        """
+        try:
             live_transfers = {}
 
             # Only hit slskd API if soulseek is actually configured and active
@@ -534,10 +545,14 @@ class WebUIDownloadMonitor:
             soulseek_active = (dl_mode == 'soulseek' or
                               (dl_mode == 'hybrid' and 'soulseek' in hybrid_order))
 
-            # Get Soulseek downloads from API
+            # Get Soulseek downloads — from the shared transfer tracker when
+            # one is wired (one slskd poll for every consumer), else the API.
             transfers_data = None
             _slsk = download_orchestrator.client('soulseek') if download_orchestrator and hasattr(download_orchestrator, 'client') else None
-            if soulseek_active and _slsk and _slsk.base_url:
+            if transfer_tracker is not None:
+                if soulseek_active:
+                    live_transfers.update(transfer_tracker.get_lookup())
+            elif soulseek_active and _slsk and _slsk.base_url:
                 transfers_data = run_async(download_orchestrator._make_request('GET', 'transfers/downloads'))
             if transfers_data:
                 for user_data in transfers_data:
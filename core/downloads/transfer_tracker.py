@@ -0,0 +1,301 @@
+"""Incremental, indexed view of slskd's download transfers.
+
+slskd only offers the whole ``transfers/downloads`` tree (every user →
+directory → file, finished ones included), and the status cache, the
+download monitor and the dashboard speed stat each used to fetch and
+flatten it on their own. :class:`TransferTracker` polls it once per
+``poll_interval`` for all of them and diffs the result against the
+previous poll:
+
+  · a transfer whose ``(state, bytesTransferred, percentComplete,
+    averageSpeed)`` signature is unchanged keeps its existing dict — the
+    lookup consumers read is only copied when something actually moved
+  · the view is indexed by context key (``username::path``), by slskd
+    transfer id, and by download batch when a ``batch_index`` callable is
+    supplied
+  · every change gets a sequence number; :meth:`changes_since` and
+    :meth:`subscribe` hand consumers only what changed
+  · a transfer that has been ``Completed, *`` for ``retain_finished``
+    seconds ages out of memory (and stays out while slskd keeps listing
+    it) — unless its key is in ``pinned()``, the transfers a download task
+    is still waiting on; transfers slskd no longer reports are dropped
+    immediately
+  · with nothing in flight the background poll backs off, doubling up to
+    ``idle_interval``; a transfer in progress brings it back to
+    ``poll_interval``
+
+Readers that run before the background thread starts (or without it, or
+while it is backing off) get an inline refresh when the view is older than
+``poll_interval`` — a download queued while idle is seen on the next read.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger("downloads.transfer_tracker")
+
+
+def iter_slskd_files(transfers_data: Any) -> Iterator[Dict[str, Any]]:
+    """Flatten slskd's user → directory → file tree, stamping ``username``."""
+    for user_data in transfers_data or []:
+        username = user_data.get('username', 'Unknown')
+        for directory in user_data.get('directories') or []:
+            for file_info in directory.get('files') or []:
+                file_info['username'] = username
+                yield file_info
+
+
+def _signature(transfer: Dict[str, Any]) -> Tuple:
+    return (transfer.get('state'), transfer.get('bytesTransferred'),
+            transfer.get('percentComplete'), transfer.get('averageSpeed'))
+
+
+def _is_finished(transfer: Dict[str, Any]) -> bool:
+    return str(transfer.get('state') or '').startswith('Completed')
+
+
+class TransferTracker:
+    """Polls slskd transfers on one cadence and keeps a diffed, indexed view."""
+
+    def __init__(self, fetch: Callable[[], Any], make_key: Callable[[str, str], str],
+                 poll_interval: float = 1.0, retain_finished: float = 600.0,
+                 batch_index: Optional[Callable[[], Dict[str, str]]] = None,
+                 pinned: Optional[Callable[[], Set[str]]] = None,
+                 idle_interval: float = 15.0, history: int = 5000):
+        self._fetch = fetch
+        self._make_key = make_key
+        self.poll_interval = max(0.1, float(poll_interval))
+        self.idle_interval = max(self.poll_interval, float(idle_interval))
+        self.retain_finished = float(retain_finished)
+        self._batch_index = batch_index
+        self._pinned = pinned
+
+        self._refresh_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._lookup: Dict[str, Dict[str, Any]] = {}
+        self._signatures: Dict[str, Tuple] = {}
+        self._by_id: Dict[str, str] = {}
+        self._by_batch: Dict[str, Set[str]] = {}
+        self._finished_at: Dict[str, float] = {}
+        self._expired: Set[str] = set()
+        self._last_refresh = 0.0
+
+        self._seq = 0
+        self._changes: deque = deque(maxlen=history)
+        self._listeners: List[Callable[[List[Dict[str, Any]], List[str]], None]] = []
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wait = self.poll_interval
+        self._stats = {'polls': 0, 'errors': 0, 'last_poll_ms': None, 'max_poll_ms': 0.0,
+                       'last_changed': 0, 'last_removed': 0, 'aged_out': 0}
+
+    # ── Polling ───────────────────────────────────────────────────────
+
+    def refresh(self) -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+        """Poll once. Returns ``(changed transfers, removed keys)``, or None
+        if the fetch failed (the previous view is kept)."""
+        with self._refresh_lock:
+            started = time.perf_counter()
+            try:
+                data = self._fetch()
+            except Exception as e:
+                self._stats['errors'] += 1
+                logger.debug(f"Transfer poll failed: {e}")
+                return None
+            changed, removed = self._apply(data or [], time.time())
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+            self._stats['polls'] += 1
+            self._stats['last_poll_ms'] = elapsed_ms
+            self._stats['max_poll_ms'] = max(self._stats['max_poll_ms'], elapsed_ms)
+            self._stats['last_changed'] = len(changed)
+            self._stats['last_removed'] = len(removed)
+        if changed or removed:
+            for listener in list(self._listeners):
+                try:
+                    listener(changed, removed)
+                except Exception as e:
+                    logger.debug(f"Transfer listener failed: {e}")
+        return changed, removed
+
+    def _apply(self, data: Any, now: float) -> Tuple[List[Dict[str, Any]], List[str]]:
+        seen: Set[str] = set()
+        updates: Dict[str, Dict[str, Any]] = {}
+        for transfer in iter_slskd_files(data):
+            key = self._make_key(transfer.get('username'), transfer.get('filename', ''))
+            seen.add(key)
+            if key in self._expired:
+                continue
+            signature = _signature(transfer)
+            if self._signatures.get(key) == signature:
+                continue
+            self._signatures[key] = signature
+            updates[key] = transfer
+            if _is_finished(transfer):
+                self._finished_at.setdefault(key, now)
+            else:
+                self._finished_at.pop(key, None)
+
+        removed = [key for key in self._lookup if key not in seen]
+        aging = [key for key, finished_at in self._finished_at.items()
+                 if key in seen and now - finished_at >= self.retain_finished]
+        if aging and self._pinned is not None:
+            try:
+                pinned = self._pinned() or set()
+            except Exception as e:
+                logger.debug(f"Transfer pin lookup failed: {e}")
+                pinned = set(aging)  # keep them until the next poll can tell
+            aging = [key for key in aging if key not in pinned]
+        for key in aging:
+            removed.append(key)
+            updates.pop(key, None)
+            self._expired.add(key)
+            self._stats['aged_out'] += 1
+        self._expired &= seen
+
+        batch_map = None
+        if self._batch_index is not None:
+            try:
+                batch_map = self._batch_index() or {}
+            except Exception as e:
+                logger.debug(f"Transfer batch index failed: {e}")
+
+        with self._lock:
+            if updates or removed:
+                lookup = dict(self._lookup)
+                for key in removed:
+                    transfer = lookup.pop(key, None)
+                    self._signatures.pop(key, None)
+                    self._finished_at.pop(key, None)
+                    if transfer is not None and transfer.get('id') is not None:
+                        self._by_id.pop(str(transfer['id']), None)
+                for key, transfer in updates.items():
+                    lookup[key] = transfer
+                    if transfer.get('id') is not None:
+                        self._by_id[str(transfer['id'])] = key
+                self._lookup = lookup
+                for key in updates:
+                    self._seq += 1
+                    self._changes.append((self._seq, key))
+                for key in removed:
+                    self._seq += 1
+                    self._changes.append((self._seq, key))
+            if batch_map is not None:
+                by_batch: Dict[str, Set[str]] = {}
+                for key, batch_id in batch_map.items():
+                    if batch_id and key in self._lookup:
+                        by_batch.setdefault(batch_id, set()).add(key)
+                self._by_batch = by_batch
+            self._last_refresh = now
+        return list(updates.values()), removed
+
+    def _in_flight(self) -> bool:
+        return len(self._lookup) > len(self._finished_at)
+
+    def _ensure_fresh(self) -> None:
+        running = self._thread is not None and self._thread.is_alive()
+        idle = running and self._wait > self.poll_interval
+        if (not running or idle) and time.time() - self._last_refresh >= self.poll_interval:
+            self.refresh()
+            if idle and self._in_flight():
+                self._wake.set()
+
+    # ── Reads ─────────────────────────────────────────────────────────
+
+    def get_lookup(self) -> Dict[str, Dict[str, Any]]:
+        """Context key → transfer dict. Treat as read-only; it is replaced,
+        never mutated, when the view changes."""
+        self._ensure_fresh()
+        return self._lookup
+
+    def get(self, username: str, filename: str) -> Optional[Dict[str, Any]]:
+        return self.get_lookup().get(self._make_key(username, filename))
+
+    def get_by_id(self, transfer_id: str) -> Optional[Dict[str, Any]]:
+        self._ensure_fresh()
+        with self._lock:
+            key = self._by_id.get(str(transfer_id))
+            return self._lookup.get(key) if key else None
+
+    def transfers_for_batch(self, batch_id: str) -> List[Dict[str, Any]]:
+        self._ensure_fresh()
+        with self._lock:
+            return [self._lookup[key] for key in self._by_batch.get(batch_id, ()) if key in self._lookup]
+
+    def changes_since(self, seq: int) -> Dict[str, Any]:
+        """Transfers changed after ``seq``. ``reset`` means ``seq`` was 0 or
+        the history no longer reaches back that far, and ``changed`` is the
+        full view."""
+        self._ensure_fresh()
+        with self._lock:
+            current = self._seq
+            oldest = self._changes[0][0] if self._changes else current + 1
+            if seq <= 0 or seq < oldest - 1 or seq > current:
+                return {'seq': current, 'reset': True,
+                        'changed': list(self._lookup.values()), 'removed': []}
+            keys = []
+            for change_seq, key in self._changes:
+                if change_seq > seq and key not in keys:
+                    keys.append(key)
+            changed = [self._lookup[key] for key in keys if key in self._lookup]
+            removed = [key for key in keys if key not in self._lookup]
+            return {'seq': current, 'reset': False, 'changed': changed, 'removed': removed}
+
+    def subscribe(self, listener: Callable[[List[Dict[str, Any]], List[str]], None]) -> None:
+        """Call ``listener(changed, removed_keys)`` after every poll that moved something."""
+        self._listeners.append(listener)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, transfers=len(self._lookup), finished=len(self._finished_at),
+                        expired=len(self._expired), seq=self._seq, poll_wait=self._wait,
+                        running=self._thread is not None and self._thread.is_alive())
+
+    # ── Lifecycle ─────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._wake.clear()
+        self._wait = self.poll_interval
+        self._thread = threading.Thread(target=self._run, name='slskd-transfer-tracker', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            if self._in_flight():
+                self._wait = self.poll_interval
+            else:
+                self._wait = min(self.idle_interval, self._wait * 2)
+            self._wake.wait(self._wait)
+            if self._wake.is_set() and not self._stop.is_set():
+                self._wake.clear()
+                self._wait = self.poll_interval
+
+
+_tracker: Optional[TransferTracker] = None
+
+
+def get_transfer_tracker() -> Optional[TransferTracker]:
+    return _tracker
+
+
+def set_transfer_tracker(tracker: Optional[TransferTracker]) -> None:
+    global _tracker
+    _tracker = tracker
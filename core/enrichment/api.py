@@ -176,6 +176,11 @@ def create_blueprint() -> Blueprint:
         if service is None:
             return jsonify({'error': f'Unknown enrichment service: {service_id}'}), 404
         worker = service.get_worker()
+        if worker is None and service.worker_loader is not None:
+            # Deferred while paused: nothing to stop, just keep the choice.
+            _persist_paused(service, True)
+            _invalidate_status_cache(service.id)
+            return jsonify({'status': 'paused'}), 200
         if worker is None:
             return jsonify({
                 'error': f'{service.display_name} enrichment worker not initialized',
@@ -196,7 +201,7 @@ def create_blueprint() -> Blueprint:
         service = get_service(service_id)
         if service is None:
             return jsonify({'error': f'Unknown enrichment service: {service_id}'}), 404
-        worker = service.get_worker()
+        worker = service.get_worker() or service.load_worker()
         if worker is None:
             return jsonify({
                 'error': f'{service.display_name} enrichment worker not initialized',
@@ -56,6 +56,11 @@ class EnrichmentService:
       mechanism.
     - ``extra_status_defaults`` is merged into the fallback status
       payload (Tidal / Qobuz add ``'authenticated': False``).
+    - ``worker_loader`` builds the worker on demand for services the host
+      doesn't construct at boot — paused (Amazon, Discogs, Similar
+      Artists), missing credentials (Spotify, Last.fm, Genius, Tidal,
+      Qobuz) or not opted in (JioSaavn, Bandcamp). Until it runs, status
+      reports the service as paused + deferred and resume builds it.
     """
 
     id: str
@@ -65,6 +70,7 @@ class EnrichmentService:
     pre_resume_check: Optional[Callable[[], Optional[Tuple[int, str]]]] = None
     auto_pause_token: Optional[str] = None
     extra_status_defaults: Dict[str, Any] = field(default_factory=dict)
+    worker_loader: Optional[Callable[[], Any]] = None
 
     def get_worker(self) -> Any:
         """Resolve the worker reference (None if init failed)."""
@@ -73,6 +79,15 @@ class EnrichmentService:
         except Exception:
             return None
 
+    def load_worker(self) -> Any:
+        """Build a deferred worker now (None if there's no loader or it failed)."""
+        if self.worker_loader is None:
+            return None
+        try:
+            return self.worker_loader()
+        except Exception:
+            return None
+
     def fallback_status(self) -> Dict[str, Any]:
         """Return the shape we serve when the worker isn't initialized."""
         payload = dict(_DEFAULT_STATUS_FALLBACK)
@@ -81,6 +96,10 @@ class EnrichmentService:
         payload['stats'] = dict(_DEFAULT_STATUS_FALLBACK['stats'])
         if self.extra_status_defaults:
             payload.update(self.extra_status_defaults)
+        if self.worker_loader is not None:
+            # Not built at boot (paused / not configured) — not a failed init.
+            payload['paused'] = True
+            payload['deferred'] = True
         return payload
 
 
@@ -0,0 +1,384 @@
+"""Cached, versioned snapshots of the artist-graph payloads (/api/graph/*).
+
+The Taste Map and Discovery Web used to re-read ``artists`` + the profile's
+``similar_artists`` (~75k rows) and rebuild the whole graph on every page
+load, even though the underlying data only moves when a library scan or the
+similar-artists worker writes. This module keeps, per profile:
+
+* the loaded inputs (artists, owned set, meta, similar_artists rows grouped by
+  source artist), refreshed **incrementally** — triggers maintained by
+  :meth:`MusicDatabase._add_graph_change_tracking` bump a counter per scope and
+  log which (profile, source artist) pairs changed, so a refresh re-reads only
+  those sources' rows (or the artists table, when it changed);
+* one snapshot per ``(profile, kind, params)`` — the finished payload as
+  gzip-compressed JSON plus an ETag, tagged with the data version it was built
+  from.
+
+A request for an up-to-date snapshot is served straight from memory. A stale
+one is served as-is while a background rebuild runs (stale-while-revalidate);
+only the very first request for a key builds synchronously. The builders in
+:mod:`core.graph.artist_graph` rank globally (genre anchors, top anchors,
+per-target merges), so the graph itself is rebuilt from the patched inputs
+rather than patched node-by-node.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger("graph_snapshots")
+
+LIBRARY = 'library'
+DISCOVERY = 'discovery'
+
+# Past this many changed source artists one full reload beats chunked IN lists.
+_FULL_RELOAD_SOURCES = 5000
+_IN_CHUNK = 500
+
+_SIMILAR_COLUMNS = ("id, source_artist_id, similar_artist_name, similar_artist_spotify_id, "
+                    "similar_artist_deezer_id, similar_artist_itunes_id, occurrence_count, popularity, "
+                    "image_url, genres")
+
+
+@dataclass(frozen=True)
+class GraphSnapshot:
+    """One built graph payload. ``body`` is gzip-compressed JSON."""
+    version: Tuple[int, int]
+    body: bytes
+    etag: str
+    raw_size: int
+    built_at: float
+
+    def json_bytes(self) -> bytes:
+        return gzip.decompress(self.body)
+
+
+@dataclass
+class _Inputs:
+    """A profile's loaded graph inputs at ``(artists_version, similar_seq)``."""
+    artists_version: int
+    similar_seq: int
+    artists: List[tuple] = field(default_factory=list)
+    owned: set = field(default_factory=set)
+    meta: Dict[str, dict] = field(default_factory=dict)
+    by_source: Dict[Any, List[tuple]] = field(default_factory=dict)
+    _rows: Optional[List[tuple]] = None
+
+    @property
+    def version(self) -> Tuple[int, int]:
+        return self.artists_version, self.similar_seq
+
+    def rows(self) -> List[tuple]:
+        """The profile's similar_artists rows (9 columns) in table order."""
+        if self._rows is None:
+            flat = [r for group in self.by_source.values() for r in group]
+            flat.sort(key=lambda r: r[0])
+            self._rows = [r[1:] for r in flat]
+        return self._rows
+
+
+def _default_database():
+    from database.music_database import get_database
+    return get_database()
+
+
+def _build_payload(kind: str, inputs: _Inputs, params: tuple) -> dict:
+    from core.graph.artist_graph import build_discovery_map, build_genre_grouped_map
+
+    if kind == LIBRARY:
+        graph = build_genre_grouped_map(inputs.artists, [r[:7] for r in inputs.rows()],
+                                        inputs.owned, artist_meta=inputs.meta)
+        return {**graph, "counts": {
+            "nodes": len(graph["nodes"]), "edges": len(graph["edges"]),
+            "artists": sum(1 for n in graph["nodes"] if n.get("kind") == "artist"),
+            "genres": sum(1 for n in graph["nodes"] if n.get("kind") == "genre"),
+        }}
+    if kind == DISCOVERY:
+        seed, per = params
+        graph = build_discovery_map(inputs.rows(), inputs.owned, inputs.meta, seed_count=seed, per_anchor=per)
+        return {**graph, "counts": {
+            "nodes": len(graph["nodes"]), "edges": len(graph["edges"]),
+            "owned": sum(1 for n in graph["nodes"] if n.get("kind") == "owned"),
+            "discovery": sum(1 for n in graph["nodes"] if n.get("kind") == "discovery"),
+        }}
+    raise ValueError(f"unknown graph kind: {kind!r}")
+
+
+class GraphSnapshotStore:
+    """Per-profile graph inputs + versioned payload snapshots. Thread-safe."""
+
+    def __init__(self, database_getter: Callable[[], Any] = _default_database,
+                 max_snapshots: int = 32, rebuild_delay: float = 5.0):
+        self._db = database_getter
+        self.max_snapshots = max_snapshots
+        self.rebuild_delay = rebuild_delay
+        self._lock = threading.Lock()            # guards the dicts below
+        self._build_lock = threading.Lock()      # one load/build at a time
+        self._inputs: Dict[int, _Inputs] = {}
+        self._snapshots: "OrderedDict[tuple, GraphSnapshot]" = OrderedDict()
+        self._rebuilding: Dict[tuple, threading.Thread] = {}
+        self._timers: Dict[int, threading.Timer] = {}
+        self.stats = {'hits': 0, 'stale_hits': 0, 'builds': 0,
+                      'full_loads': 0, 'incremental_loads': 0, 'sources_reloaded': 0}
+
+    # ── public API ────────────────────────────────────────────────────────
+    def get(self, profile_id: int, kind: str, params: tuple = ()) -> GraphSnapshot:
+        """The snapshot for ``(profile_id, kind, params)``.
+
+        Current → served from memory. Stale → served anyway while a background
+        rebuild catches it up. Missing → built now.
+        """
+        key = (profile_id, kind, tuple(params))
+        version = self._current_version(profile_id)
+        with self._lock:
+            snap = self._snapshots.get(key)
+            if snap is not None:
+                self._snapshots.move_to_end(key)
+                if version is not None and snap.version == version:
+                    self.stats['hits'] += 1
+                    return snap
+        if snap is not None and version is not None:
+            self.stats['stale_hits'] += 1
+            self._rebuild_async(key)
+            return snap
+        return self._build(key)
+
+    def inputs(self, profile_id: int) -> Tuple[set, Dict[str, dict], List[tuple]]:
+        """``(owned, owned_meta, rows)`` for ad-hoc builders (discovery expand),
+        brought up to date with the database first."""
+        inputs = self._load_inputs(profile_id)
+        return inputs.owned, inputs.meta, inputs.rows()
+
+    def note_similar_artists_changed(self, profile_id: int = 1) -> None:
+        """Hint from a similar_artists writer: refresh this profile's existing
+        snapshots in the background, debounced so a worker storing one artist
+        every few seconds triggers one rebuild per ``rebuild_delay``."""
+        with self._lock:
+            if profile_id in self._timers:
+                return
+            if not any(k[0] == profile_id for k in self._snapshots):
+                return
+            timer = threading.Timer(self.rebuild_delay, self._refresh_profile, args=(profile_id,))
+            timer.daemon = True
+            self._timers[profile_id] = timer
+        timer.start()
+
+    def invalidate(self, profile_id: Optional[int] = None) -> None:
+        """Drop cached inputs + snapshots (all profiles, or one)."""
+        with self._lock:
+            if profile_id is None:
+                self._inputs.clear()
+                self._snapshots.clear()
+            else:
+                self._inputs.pop(profile_id, None)
+                for key in [k for k in self._snapshots if k[0] == profile_id]:
+                    del self._snapshots[key]
+
+    def wait_for_rebuilds(self, timeout: float = 10.0) -> bool:
+        """Block until in-flight background rebuilds finish (tests / shutdown)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                pending = list(self._rebuilding.values()) + list(self._timers.values())
+            if not pending:
+                return True
+            for t in pending:
+                t.join(max(0.0, deadline - time.monotonic()))
+            if time.monotonic() >= deadline:
+                with self._lock:
+                    return not self._rebuilding and not self._timers
+
+    def stop(self) -> None:
+        with self._lock:
+            timers = list(self._timers.values())
+            self._timers.clear()
+        for t in timers:
+            t.cancel()
+
+    # ── versions + inputs ─────────────────────────────────────────────────
+    def _current_version(self, profile_id: int) -> Optional[Tuple[int, int]]:
+        """``(artists_version, similar_seq)``; None when change tracking is
+        unavailable (the store then builds fresh on every call)."""
+        conn = self._db()._get_connection()
+        try:
+            return self._read_version(conn.cursor(), profile_id)
+        except Exception as exc:
+            logger.debug("Graph change tracking unavailable: %s", exc)
+            return None
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _read_version(cur, profile_id: int) -> Tuple[int, int]:
+        row = cur.execute(
+            "SELECT (SELECT version FROM graph_data_versions WHERE scope = 'artists'), "
+            "(SELECT MAX(seq) FROM graph_similar_changes WHERE profile_id = ?)", (profile_id,)
+        ).fetchone()
+        return int(row[0] or 0), int(row[1] or 0)
+
+    def _load_inputs(self, profile_id: int) -> _Inputs:
+        with self._build_lock:
+            return self._load_inputs_locked(profile_id)
+
+    def _load_inputs_locked(self, profile_id: int) -> _Inputs:
+        conn = self._db()._get_connection()
+        try:
+            cur = conn.cursor()
+            try:
+                artists_version, similar_seq = self._read_version(cur, profile_id)
+            except Exception:
+                artists_version = similar_seq = -1      # untracked: always reload
+            with self._lock:
+                cached = self._inputs.get(profile_id)
+            if cached is not None and cached.version == (artists_version, similar_seq) and artists_version >= 0:
+                return cached
+
+            # Versions are read before the data: a write landing in between is
+            # loaded now AND again next time (its seq is newer) — never missed.
+            fresh = _Inputs(artists_version, similar_seq)
+            if cached is not None and cached.artists_version == artists_version and artists_version >= 0:
+                fresh.artists, fresh.owned, fresh.meta = cached.artists, cached.owned, cached.meta
+            else:
+                self._load_artists(cur, fresh)
+
+            changed = None
+            if cached is not None and similar_seq >= 0 and cached.similar_seq >= 0:
+                changed = [r[0] for r in cur.execute(
+                    "SELECT source_artist_id FROM graph_similar_changes WHERE profile_id = ? AND seq > ?",
+                    (profile_id, cached.similar_seq))]
+            if changed is None or len(changed) > _FULL_RELOAD_SOURCES:
+                self._load_all_rows(cur, profile_id, fresh)
+                self.stats['full_loads'] += 1
+            else:
+                fresh.by_source = dict(cached.by_source)
+                self._reload_sources(cur, profile_id, changed, fresh.by_source)
+                self.stats['incremental_loads'] += 1
+                self.stats['sources_reloaded'] += len(changed)
+        finally:
+            conn.close()
+        with self._lock:
+            self._inputs[profile_id] = fresh
+        return fresh
+
+    @staticmethod
+    def _load_artists(cur, inputs: _Inputs) -> None:
+        for name, thumb, genres, aid, source in cur.execute(
+            "SELECT name, thumb_url, genres, id, server_source FROM artists"
+        ):
+            key = (name or "").strip().lower()
+            inputs.owned.add(key)
+            inputs.meta[key] = {"thumb_url": thumb, "genres": genres, "id": aid}
+            inputs.artists.append((name, genres, thumb, aid, source))
+
+    @staticmethod
+    def _load_all_rows(cur, profile_id: int, inputs: _Inputs) -> None:
+        """similar_artists is per-profile (unique on profile_id + source + name); without the
+        filter a multi-profile install double-counts every anchor->target pair. Rows carry the
+        table's OWN image_url/genres — enriching from metadata_cache_entities instead measured
+        18-250s per request for data these rows already have."""
+        by_source: Dict[Any, List[tuple]] = {}
+        for row in cur.execute(
+            f"SELECT {_SIMILAR_COLUMNS} FROM similar_artists WHERE profile_id = ?", (profile_id,)
+        ):
+            by_source.setdefault(row[1], []).append(tuple(row))
+        inputs.by_source = by_source
+
+    @staticmethod
+    def _reload_sources(cur, profile_id: int, sources: List[Any], by_source: Dict[Any, List[tuple]]) -> None:
+        for source in sources:
+            by_source.pop(source, None)
+        for i in range(0, len(sources), _IN_CHUNK):
+            chunk = sources[i:i + _IN_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            for row in cur.execute(
+                f"SELECT {_SIMILAR_COLUMNS} FROM similar_artists "
+                f"WHERE profile_id = ? AND source_artist_id IN ({marks})", (profile_id, *chunk)
+            ):
+                by_source.setdefault(row[1], []).append(tuple(row))
+
+    # ── building ──────────────────────────────────────────────────────────
+    def _build(self, key: tuple) -> GraphSnapshot:
+        profile_id, kind, params = key
+        with self._build_lock:
+            inputs = self._load_inputs_locked(profile_id)
+            start = time.perf_counter()
+            raw = json.dumps(_build_payload(kind, inputs, params), separators=(",", ":")).encode("utf-8")
+            snap = GraphSnapshot(
+                version=inputs.version,
+                body=gzip.compress(raw, compresslevel=6, mtime=0),
+                etag=hashlib.blake2b(raw, digest_size=12).hexdigest(),
+                raw_size=len(raw),
+                built_at=time.time(),
+            )
+            self.stats['builds'] += 1
+            logger.debug("Built %s graph for profile %s: %d bytes (%d gzipped) in %.0f ms", kind, profile_id,
+                         len(raw), len(snap.body), (time.perf_counter() - start) * 1000)
+        with self._lock:
+            self._snapshots[key] = snap
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snap
+
+    def _rebuild_async(self, key: tuple) -> None:
+        with self._lock:
+            if key in self._rebuilding:
+                return
+            thread = threading.Thread(target=self._rebuild_worker, args=(key,),
+                                      daemon=True, name="graph-snapshot-rebuild")
+            self._rebuilding[key] = thread
+        thread.start()
+
+    def _rebuild_worker(self, key: tuple) -> None:
+        try:
+            self._build(key)
+        except Exception as exc:
+            logger.warning("Graph snapshot rebuild failed for %s: %s", key, exc)
+        finally:
+            with self._lock:
+                self._rebuilding.pop(key, None)
+
+    def _refresh_profile(self, profile_id: int) -> None:
+        try:
+            version = self._current_version(profile_id)
+            with self._lock:
+                stale = [k for k, s in self._snapshots.items()
+                         if k[0] == profile_id and s.version != version]
+            for key in stale:
+                self._build(key)
+        except Exception as exc:
+            logger.warning("Graph snapshot refresh failed for profile %s: %s", profile_id, exc)
+        finally:
+            with self._lock:
+                self._timers.pop(profile_id, None)
+
+
+_singleton: Optional[GraphSnapshotStore] = None
+_singleton_lock = threading.Lock()
+
+
+def get_snapshot_store() -> GraphSnapshotStore:
+    global _singleton
+    with _singleton_lock:
+        if _singleton is None:
+            _singleton = GraphSnapshotStore()
+        return _singleton
+
+
+def reset_snapshot_store_for_tests() -> None:
+    """Test-only: drop the singleton so the next get_snapshot_store() returns
+    a fresh instance. Production code never calls this."""
+    global _singleton
+    with _singleton_lock:
+        if _singleton is not None:
+            _singleton.stop()
+        _singleton = None
@@ -41,6 +41,7 @@ def rate_limited(func):
             # Implement exponential backoff for API errors
             if "403" in str(e):
                 logger.warning(f"Rate limit hit, implementing backoff: {e}")
+                api_call_tracker.record_event('itunes', 'rate_limited', detail=str(e)[:200])
                 time.sleep(60.0)  # Wait 60 seconds for iTunes rate limit
             raise e
     return wrapper
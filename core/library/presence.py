@@ -0,0 +1,79 @@
+"""Batched "is this track already in the library?" lookups.
+
+Missing-track analysis, wishlist cleanup and the watchlist scanner all ask
+``MusicDatabase.check_track_exists`` one track (and one artist credit) at a
+time, and each call is several LIKE scans. :class:`LibraryPresence` lets them
+hand the whole batch to ``MusicDatabase.check_tracks_exist`` up front and then
+read answers back per track; anything that wasn't prefetched (or a database
+object without the bulk API) falls through to the per-track call.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger("library.presence")
+
+
+def artist_names(artists: Any) -> List[str]:
+    """Artist credit names from plain strings or ``{'name': ...}`` dicts."""
+    names = []
+    for artist in artists or []:
+        if isinstance(artist, str):
+            names.append(artist)
+        elif isinstance(artist, dict) and 'name' in artist:
+            names.append(artist['name'])
+        else:
+            names.append(str(artist))
+    return names
+
+
+class LibraryPresence:
+    """Memoized ``check_track_exists`` answers for one analysis pass."""
+
+    def __init__(self, db, confidence_threshold: float = 0.7, server_source: Optional[str] = None):
+        self.db = db
+        self.confidence_threshold = confidence_threshold
+        self.server_source = server_source
+        self._results: Dict[Tuple[str, str, Optional[str]], Tuple[Any, float]] = {}
+
+    def prefetch(self, queries: Iterable[Tuple]) -> int:
+        """Resolve ``(title, artist, album, duration_ms)`` tuples in one bulk pass.
+
+        Returns how many lookups were resolved. A no-op when the database
+        doesn't offer ``check_tracks_exist``.
+        """
+        bulk = getattr(self.db, 'check_tracks_exist', None)
+        if bulk is None:
+            return 0
+        pending, seen = [], set()
+        for query in queries:
+            title, artist, album, duration = (tuple(query) + (None, None, None, None))[:4]
+            key = (title or '', artist or '', album or None)
+            if not key[0] or key in self._results or key in seen:
+                continue
+            seen.add(key)
+            pending.append((key[0], key[1], key[2], duration))
+        if not pending:
+            return 0
+        try:
+            results = bulk(pending, confidence_threshold=self.confidence_threshold,
+                           server_source=self.server_source)
+        except Exception as e:
+            logger.warning(f"Bulk library presence check failed, using per-track lookups: {e}")
+            return 0
+        for (title, artist, album, _duration), result in zip(pending, results, strict=False):
+            self._results[(title, artist, album)] = result
+        return len(pending)
+
+    def check(self, title: str, artist: str, album: Optional[str] = None) -> Tuple[Any, float]:
+        """``(track, confidence)`` for one lookup, prefetched or not."""
+        key = (title or '', artist or '', album or None)
+        if key not in self._results:
+            self._results[key] = self.db.check_track_exists(
+                title, artist, confidence_threshold=self.confidence_threshold,
+                server_source=self.server_source, album=album,
+            )
+        return self._results[key]
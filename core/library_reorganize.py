@@ -9,8 +9,8 @@ bugs (multi-disc deluxe collapsing to single-disc when even one file's
 tag was missing; tracks silently skipped when their file paths didn't
 resolve on disk; etc.).
 
-The new design follows the import page's pattern: copy each file to a
-staging folder, build the same context dict the download workers
+The new design follows the import page's pattern: stage each file in a
+staging folder (reflink, hardlink or copy — see ``_stage_track``), build the same context dict the download workers
 build, then call ``_post_process_matched_download`` for each one.
 Post-processing already knows how to pick the right destination, write
 the right tags, handle multi-disc subfolders, recreate sidecars (cover
@@ -37,6 +37,11 @@ from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+try:
+    import fcntl
+except ImportError:  # Windows — no ioctl, staging falls back to hardlink/copy
+    fcntl = None
+
 # Per-album track concurrency. Matches the download workers' per-batch
 # concurrency (3) so reorganize feels comparable to a fresh download.
 #
@@ -61,6 +66,20 @@ _HUNG_WORKER_THRESHOLD_SECONDS = 300  # 5 min — generous; real worst-case
                                        # is ffmpeg downsampling a long
                                        # hi-res FLAC, ~30-60s typically.
 
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share the source's extents
+# with the staged file on btrfs / XFS / bcachefs instead of copying them.
+_FICLONE = 0x40049409
+
+# errnos that mean "this filesystem (pair) can't do that at all" — once
+# seen, the rest of the run skips straight to the next staging method
+# instead of failing the same syscall for every track.
+_STAGING_UNSUPPORTED_ERRNOS = frozenset(
+    code for code in (
+        errno.EXDEV, errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', None),
+        errno.EINVAL, errno.ENOTTY, errno.EPERM, errno.ENOSYS, errno.EMLINK,
+    ) if code is not None
+)
+
 from core.metadata_service import (
     get_album_for_source,
     get_album_tracks_for_source,
@@ -450,6 +469,22 @@ def _preserve_casing_enabled() -> bool:
         return True
 
 
+_STAGING_MODES = ('auto', 'reflink', 'copy')
+
+
+def _staging_mode() -> str:
+    """How ``_stage_track`` puts files into staging: ``auto`` (reflink →
+    hardlink → copy, the default), ``reflink`` (reflink → copy; never share
+    an inode with the library file) or ``copy`` (always a full copy, the
+    pre-reflink behaviour). Isolated so tests can monkeypatch it."""
+    try:
+        from config.settings import config_manager
+        mode = str(config_manager.get("library.reorganize_staging", "auto") or "auto").lower()
+    except Exception:
+        return 'auto'
+    return mode if mode in _STAGING_MODES else 'auto'
+
+
 def _keep_user_year(api_release_date, user_year):
     """Prefer the user's own album year over the source's original-release
     year when preserving is on (#1080 QT3496: a file imported as [2023] — a
@@ -1440,12 +1475,15 @@ class _RunContext:
         summary              dict — counts and errors list
         src_dirs_touched     set — populated by `_finalize_track`
         dst_dirs_touched     set — populated by `_finalize_track`
+        staging_stats        dict — files per staging method + bytes staged
+        staging_unsupported  set — methods this run's filesystems refused
 
     Read-only after construction (safe to read without locking):
 
         album_id, api_album, artist_name, album_title, total_discs,
         staging_album_dir, resolve_file_path_fn, post_process_fn,
-        update_track_path_fn, on_progress, stop_check, state_lock
+        update_track_path_fn, on_progress, stop_check, state_lock,
+        staging_mode, started_at
 
     Side-effecting methods that take the lock internally:
 
@@ -1473,6 +1511,24 @@ class _RunContext:
     on_progress: Optional[Callable[[dict], None]] = None
     stop_check: Optional[Callable[[], bool]] = None
     transfer_dir: Optional[str] = None      # anchors the #746 /deleted-quarantine skip
+    staging_mode: str = 'auto'              # see _staging_mode()
+    started_at: float = field(default_factory=time.monotonic)
+    staging_stats: dict = field(default_factory=lambda: {
+        'reflink': 0, 'hardlink': 0, 'copy': 0, 'bytes': 0,
+    })                                      # LOCK-PROTECTED
+    staging_unsupported: Set[str] = field(default_factory=set)  # LOCK-PROTECTED
+
+    def throughput(self) -> dict:
+        """Progress-payload snapshot of staging throughput. Caller holds
+        ``state_lock`` (it reads ``staging_stats`` and ``summary``)."""
+        elapsed = max(time.monotonic() - self.started_at, 1e-6)
+        processed = self.summary['moved'] + self.summary['skipped'] + self.summary['failed']
+        return {
+            'bytes_processed': self.staging_stats['bytes'],
+            'bytes_per_sec': round(self.staging_stats['bytes'] / elapsed),
+            'files_per_sec': round(processed / elapsed, 2),
+            'staging': {k: self.staging_stats[k] for k in ('reflink', 'hardlink', 'copy')},
+        }
 
     def emit(self, **updates) -> None:
         """Fire the progress callback. Caller is responsible for
@@ -1506,9 +1562,38 @@ class _RunContext:
             })
 
 
+def _reflink_file(src: str, dst: str) -> None:
+    """Clone ``src`` to the new file ``dst`` with the FICLONE ioctl (the
+    data blocks are shared copy-on-write, so it's instant and costs no
+    space). Raises ``OSError`` when the platform or filesystem can't."""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, 'reflink not supported on this platform')
+    try:
+        with open(src, 'rb') as src_f, open(dst, 'xb') as dst_f:
+            fcntl.ioctl(dst_f.fileno(), _FICLONE, src_f.fileno())
+    except OSError:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        raise
+    try:
+        shutil.copystat(src, dst)
+    except OSError:
+        pass
+
+
+def _staging_methods(mode: str) -> Tuple[str, ...]:
+    if mode == 'copy':
+        return ('copy',)
+    if mode == 'reflink':
+        return ('reflink', 'copy')
+    return ('reflink', 'hardlink', 'copy')
+
+
 def _stage_track(ctx: _RunContext, track_id, title, resolved_src) -> Optional[str]:
-    """Stage a copy of ``resolved_src`` into a per-track UUID
-    subdirectory under ``ctx.staging_album_dir``.
+    """Stage ``resolved_src`` into a per-track UUID subdirectory under
+    ``ctx.staging_album_dir``.
 
     Per-track subdirs are required for concurrent safety: post-process
     calls ``_cleanup_empty_directories`` after each move, which walks
@@ -1525,24 +1610,76 @@ def _stage_track(ctx: _RunContext, track_id, title, resolved_src) -> Optional[st
       subdirs → not empty → walk stops). ✓
     - Worker B's stage-in: makedirs its OWN subdir, copies into
       it. No interference from worker A. ✓
+
+    Copying a whole album just so post-processing can move it away
+    again is most of a reorganize's I/O, so the staged file is made
+    the cheapest way the filesystem allows (``ctx.staging_mode``):
+
+    - reflink — a copy-on-write clone; independent file, no data copied.
+    - hardlink — same inode as the original. Safe because every tag write
+      goes through ``save_audio_file``, whose temp copy + ``os.replace``
+      gives the staged name a fresh inode before anything is modified
+      (its in-place fallback detaches the link first). The original is
+      never written through the link; it's removed by ``_finalize_track``.
+    - copy — ``shutil.copy2``, the old behaviour and the last resort.
+
+    A method the filesystem refuses outright (EXDEV when staging sits on
+    another device, EOPNOTSUPP on ext4 reflinks, …) is remembered for
+    the rest of the run so later tracks go straight to the next one.
     """
     worker_dir = os.path.join(ctx.staging_album_dir, uuid.uuid4().hex[:8])
-    try:
-        os.makedirs(worker_dir, exist_ok=True)
-    except OSError as mk_err:
-        ctx.record_error(track_id, title,
-                         f"Couldn't create staging subdirectory: {mk_err}",
-                         kind='failed')
-        return None
+    for attempt in range(3):
+        try:
+            os.makedirs(worker_dir, exist_ok=True)
+            break
+        except FileNotFoundError as mk_err:
+            # Another worker's cleanup walk removed the (momentarily
+            # empty) album dir between makedirs creating it and our
+            # subdir — recreate both.
+            if attempt == 2:
+                ctx.record_error(track_id, title,
+                                 f"Couldn't create staging subdirectory: {mk_err}",
+                                 kind='failed')
+                return None
+        except OSError as mk_err:
+            ctx.record_error(track_id, title,
+                             f"Couldn't create staging subdirectory: {mk_err}",
+                             kind='failed')
+            return None
     staging_file = os.path.join(worker_dir, os.path.basename(resolved_src))
-    try:
-        shutil.copy2(resolved_src, staging_file)
-    except OSError as copy_err:
-        ctx.record_error(track_id, title,
-                         f"Couldn't copy to staging: {copy_err}",
-                         kind='failed')
-        return None
-    return staging_file
+    with ctx.state_lock:
+        methods = [m for m in _staging_methods(ctx.staging_mode)
+                   if m == 'copy' or m not in ctx.staging_unsupported]
+    for method in methods:
+        try:
+            if method == 'reflink':
+                _reflink_file(resolved_src, staging_file)
+            elif method == 'hardlink':
+                os.link(resolved_src, staging_file)
+            else:
+                shutil.copy2(resolved_src, staging_file)
+        except OSError as stage_err:
+            if method == 'copy':
+                ctx.record_error(track_id, title,
+                                 f"Couldn't copy to staging: {stage_err}",
+                                 kind='failed')
+                return None
+            if stage_err.errno in _STAGING_UNSUPPORTED_ERRNOS:
+                with ctx.state_lock:
+                    if method not in ctx.staging_unsupported:
+                        logger.info(f"[Reorganize] {method} staging unavailable "
+                                    f"({stage_err}) — skipping it for this album")
+                    ctx.staging_unsupported.add(method)
+            continue
+        try:
+            size = os.path.getsize(staging_file)
+        except OSError:
+            size = 0
+        with ctx.state_lock:
+            ctx.staging_stats[method] += 1
+            ctx.staging_stats['bytes'] += size
+        return staging_file
+    return None
 
 
 def _run_post_process_for_track(ctx: _RunContext, track_id, title, api_track, staging_file, *, per_item_api_album=None) -> Optional[str]:
@@ -1692,6 +1829,7 @@ def _process_one_track(ctx: _RunContext, plan_item: dict) -> None:
         ctx.emit(
             moved=ctx.summary['moved'],
             processed=ctx.summary['moved'] + ctx.summary['skipped'] + ctx.summary['failed'],
+            **ctx.throughput(),
         )
 
 
@@ -1739,7 +1877,9 @@ def reorganize_album(
         on_progress: Optional callback for live status updates.
             Receives a dict with any subset of the standard reorganize
             state keys (``current_track``, ``processed``, ``moved``,
-            ``skipped``, ``failed``, ``errors``).
+            ``skipped``, ``failed``, ``errors``); each moved track also
+            reports staging throughput (``bytes_processed``,
+            ``bytes_per_sec``, ``files_per_sec``, ``staging``).
         primary_source: Override for the configured primary source.
             Defaults to ``get_primary_source()``.
         stop_check: Returns True when the caller wants the reorganize
@@ -1872,6 +2012,7 @@ def reorganize_album(
         on_progress=on_progress,
         stop_check=stop_check,
         transfer_dir=transfer_dir,
+        staging_mode=_staging_mode(),
     )
 
     try:
@@ -1934,6 +2075,15 @@ def reorganize_album(
                         )
                         warned_about.add(f)
 
+        with state_lock:
+            summary.update(ctx.throughput())
+        logger.info(
+            f"[Reorganize] {album_title}: staged {summary['bytes_processed'] / 1e6:.1f} MB "
+            f"({summary['bytes_per_sec'] / 1e6:.1f} MB/s, {summary['files_per_sec']} files/s) — "
+            f"{summary['staging']['reflink']} reflinked, {summary['staging']['hardlink']} hardlinked, "
+            f"{summary['staging']['copy']} copied"
+        )
+
     finally:
         # Best-effort cleanup of the staging dir.
         try:
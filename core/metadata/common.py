@@ -327,10 +327,40 @@ def save_audio_file(audio_file: Any, symbols: Any) -> bool:
             pass
         logger.warning("[Atomic Save] atomic path failed (%s) — in-place fallback for %s",
                        atomic_err, os.path.basename(path))
+        if not _detach_hardlink(path):
+            logger.error("[Atomic Save] %s is hardlinked and could not be detached — tags NOT "
+                         "written so the other link is left untouched", os.path.basename(path))
+            return False
         _raw_audio_save(audio_file, symbols)
         return True
 
 
+def _detach_hardlink(path: str) -> bool:
+    """Give ``path`` its own inode before an in-place write if it shares one
+    with another name (reorganize stages library files as hardlinks, and an
+    in-place save would rewrite the original through the link). The atomic
+    path never needs this — its ``os.replace`` swaps in a new inode anyway.
+    Returns False only when the file is shared and could not be detached."""
+    try:
+        if os.stat(path).st_nlink <= 1:
+            return True
+    except OSError:
+        return True  # let the save itself report the problem
+    tmp = f"{path}.sslink"
+    try:
+        shutil.copy2(path, tmp)
+        os.replace(tmp, path)
+        return True
+    except OSError as e:
+        logger.warning("[Atomic Save] could not detach hardlink %s: %s", os.path.basename(path), e)
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+
 def get_image_dimensions(data: bytes):
     try:
         if data[:8] == b"\x89PNG\r\n\x1a\n":
@@ -55,6 +55,32 @@ def rate_limited(func):
             raise e
     return wrapper
 
+def mirror_first(func):
+    """Answer from the local MusicBrainz mirror when it has the data.
+
+    Applied outside ``rate_limited`` so a mirror hit never waits on the
+    1 req/s limiter. The mirror returns None when it cannot vouch for an
+    answer — the entity type is not fully imported, the stored document
+    lacks a requested include, or nothing matched exactly — and that, or
+    any mirror error, falls through to the web service. Any other result
+    (including an empty browse page past the end of a mirrored list) is
+    returned as-is, so a paginated walk stays on one source.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        mirror = self._get_mirror()
+        if mirror is not None:
+            try:
+                result = getattr(mirror, func.__name__)(*args, **kwargs)
+                if result is not None:
+                    return result
+            except Exception as e:
+                logger.debug(f"MusicBrainz mirror {func.__name__} failed, using web service: {e}")
+        self.web_request_count = getattr(self, 'web_request_count', 0) + 1
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
 class MusicBrainzClient:
     """Client for interacting with MusicBrainz API"""
 
@@ -82,8 +108,17 @@ class MusicBrainzClient:
             'Accept': 'application/json'
         })
 
+        # Calls that went past the local mirror to the rate-limited web service
+        self.web_request_count = 0
+
         logger.info(f"MusicBrainz client initialized with user agent: {self.user_agent}")
+
+    def _get_mirror(self):
+        """Local mirror to consult before the web service (None when not configured)."""
+        from core.musicbrainz_mirror import get_musicbrainz_mirror
+        return get_musicbrainz_mirror()
     
+    @mirror_first
     @rate_limited
     def search_artist(self, artist_name: str, limit: int = 10, strict: bool = True) -> List[Dict[str, Any]]:
         """
@@ -140,6 +175,7 @@ class MusicBrainzClient:
             logger.error(f"Error searching for artist '{artist_name}': {e}")
             return []
     
+    @mirror_first
     @rate_limited
     def search_release(self, album_name: str, artist_name: Optional[str] = None,
                        limit: int = 10, strict: bool = True) -> List[Dict[str, Any]]:
@@ -203,6 +239,7 @@ class MusicBrainzClient:
             logger.error(f"Error searching for release '{album_name}': {e}")
             return []
     
+    @mirror_first
     @rate_limited
     def search_recording(self, track_name: str, artist_name: Optional[str] = None,
                          limit: int = 10, strict: bool = True) -> List[Dict[str, Any]]:
@@ -271,6 +308,7 @@ class MusicBrainzClient:
             logger.error(f"Error searching for recording '{track_name}': {e}")
             return []
     
+    @mirror_first
     @rate_limited
     def browse_artist_release_groups(self, artist_mbid: str,
                                      release_types: Optional[List[str]] = None,
@@ -317,6 +355,7 @@ class MusicBrainzClient:
             logger.error(f"Error browsing release-groups for artist {artist_mbid}: {e}")
             return []
 
+    @mirror_first
     @rate_limited
     def browse_release_group_releases(self, release_group_mbid: str,
                                       limit: int = 100,
@@ -440,6 +479,7 @@ class MusicBrainzClient:
             logger.error(f"Error searching recordings for artist {artist_mbid}: {e}")
             return []
 
+    @mirror_first
     @rate_limited
     def get_artist(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
@@ -470,6 +510,7 @@ class MusicBrainzClient:
             logger.error(f"Error fetching artist {mbid}: {e}")
             return None
     
+    @mirror_first
     @rate_limited
     def get_release(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
@@ -500,6 +541,7 @@ class MusicBrainzClient:
             logger.error(f"Error fetching release {mbid}: {e}")
             return None
     
+    @mirror_first
     @rate_limited
     def get_release_group(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """Get full release-group details by MBID.
@@ -532,6 +574,7 @@ class MusicBrainzClient:
             logger.error(f"Error fetching release-group {mbid}: {e}")
             return None
 
+    @mirror_first
     @rate_limited
     def get_recording(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
@@ -561,3 +604,31 @@ class MusicBrainzClient:
         except Exception as e:
             logger.error(f"Error fetching recording {mbid}: {e}")
             return None
+
+    @mirror_first
+    @rate_limited
+    def lookup_isrc(self, isrc: str) -> List[Dict[str, Any]]:
+        """
+        Get the recordings carrying an ISRC
+
+        Args:
+            isrc: International Standard Recording Code
+
+        Returns:
+            List of recording results (empty if unknown)
+        """
+        try:
+            response = self.session.get(
+                f"{self.BASE_URL}/isrc/{isrc.strip().upper()}",
+                params={'fmt': 'json', 'inc': 'artist-credits'},
+                timeout=10
+            )
+            if response.status_code == 404:
+                return []
+            response.raise_for_status()
+
+            return response.json().get('recordings', [])
+
+        except Exception as e:
+            logger.error(f"Error looking up ISRC {isrc}: {e}")
+            return []
@@ -0,0 +1,634 @@
+"""Local, indexed SQLite mirror of MusicBrainz for offline lookups.
+
+The public web service is limited to one request per second, so enriching a
+large library through ``MusicBrainzClient`` takes days. This module loads the
+MusicBrainz JSON dumps (https://metabrainz.org/datasets — one WS/2-shaped JSON
+document per line, optionally inside the published ``.tar.xz`` archives) or a
+hand-made subset of them into a local database, and answers the same lookups
+at local-disk speed.
+
+The mirror is strictly a first-chance cache: ``MusicBrainzClient`` asks it
+first and falls back to the rate-limited web service whenever the mirror
+cannot vouch for an answer (lookups return None) or raises. Documents are
+stored verbatim, so a mirror hit returns exactly the shape the web service
+would have returned.
+
+A lookup is only answered locally when the mirror holds the *whole* entity
+set it would be answering from — i.e. an import of that type ran to the end
+and was marked complete (official dump archives are; hand-made subsets are
+not unless imported with ``complete=True``) — and, for get-by-MBID, when the
+stored document already carries every requested include. Served locally:
+get-by-MBID, browse by artist / release-group, ISRC, and *strict* name
+searches that have an exact normalized-name match. A browse of a known parent
+is answered for every offset, including empty pages past the end, so one
+paginated walk never mixes mirror and web pages. Fuzzy user-facing searches
+keep going to the web service, whose Lucene ranking the mirror does not try
+to reproduce.
+
+Enable by pointing ``musicbrainz.mirror_path`` at the database file and
+import with ``scripts/import_musicbrainz_dump.py``.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import sqlite3
+import tarfile
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger("musicbrainz_mirror")
+
+ENTITY_TYPES = ('artist', 'release-group', 'release', 'recording')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mb_artist (
+    mbid TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_norm TEXT NOT NULL,
+    sort_name TEXT,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_mb_artist_name_norm ON mb_artist (name_norm);
+
+CREATE TABLE IF NOT EXISTS mb_artist_alias (
+    alias_norm TEXT NOT NULL,
+    artist_mbid TEXT NOT NULL,
+    PRIMARY KEY (alias_norm, artist_mbid)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS mb_release_group (
+    mbid TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_norm TEXT NOT NULL,
+    credit_norm TEXT,
+    primary_type TEXT,
+    first_release_date TEXT,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_mb_release_group_title ON mb_release_group (title_norm, credit_norm);
+
+CREATE TABLE IF NOT EXISTS mb_release (
+    mbid TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_norm TEXT NOT NULL,
+    credit_norm TEXT,
+    release_group_mbid TEXT,
+    date TEXT,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_mb_release_title ON mb_release (title_norm, credit_norm);
+CREATE INDEX IF NOT EXISTS idx_mb_release_rg ON mb_release (release_group_mbid);
+
+CREATE TABLE IF NOT EXISTS mb_recording (
+    mbid TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_norm TEXT NOT NULL,
+    credit_norm TEXT,
+    length INTEGER,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_mb_recording_title ON mb_recording (title_norm, credit_norm);
+
+CREATE TABLE IF NOT EXISTS mb_isrc (
+    isrc TEXT NOT NULL,
+    recording_mbid TEXT NOT NULL,
+    PRIMARY KEY (isrc, recording_mbid)
+) WITHOUT ROWID;
+
+-- entity -> credited artist, for browse-by-artist
+CREATE TABLE IF NOT EXISTS mb_entity_artist (
+    artist_mbid TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    entity_mbid TEXT NOT NULL,
+    PRIMARY KEY (artist_mbid, entity_type, entity_mbid)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS mb_import_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT,
+    entity_type TEXT,
+    rows INTEGER,
+    seconds REAL,
+    imported_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- entity types whose full set is loaded; only these are answered locally
+CREATE TABLE IF NOT EXISTS mb_import_state (
+    entity_type TEXT PRIMARY KEY,
+    complete INTEGER NOT NULL DEFAULT 0,
+    source TEXT,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+_TABLES = {
+    'artist': 'mb_artist',
+    'release-group': 'mb_release_group',
+    'release': 'mb_release',
+    'recording': 'mb_recording',
+}
+
+# ``inc=`` value -> document key(s) that carry it. An include not listed
+# here (and not a plain ``*-rels``) is never assumed to be in a stored doc.
+_INCLUDE_KEYS = {
+    'aliases': ('aliases',),
+    'tags': ('tags',),
+    'genres': ('genres',),
+    'ratings': ('rating',),
+    'annotation': ('annotation',),
+    'isrcs': ('isrcs',),
+    'artist-credits': ('artist-credit',),
+    'artists': ('artist-credit',),
+    'release-groups': ('release-group',),
+    'releases': ('releases',),
+    'recordings': ('media',),
+    'media': ('media',),
+    'labels': ('label-info',),
+}
+
+
+def _satisfies(doc: Dict[str, Any], includes: Optional[List[str]]) -> bool:
+    """True when ``doc`` already holds everything ``includes`` asks for."""
+    for inc in includes or []:
+        if inc.endswith('-rels') and not inc.endswith('-level-rels'):
+            keys: Tuple[str, ...] = ('relations',)
+        else:
+            keys = _INCLUDE_KEYS.get(inc, ())
+        if not any(key in doc for key in keys):
+            return False
+    return True
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """Fold case, diacritics and whitespace so equal names compare equal."""
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(stripped.casefold().split())
+
+
+def _credit_name(doc: Dict[str, Any]) -> str:
+    """Flatten an ``artist-credit`` list into the displayed credit string."""
+    parts = []
+    for credit in doc.get('artist-credit') or []:
+        if isinstance(credit, dict):
+            name = credit.get('name') or (credit.get('artist') or {}).get('name') or ''
+            parts.append(name + (credit.get('joinphrase') or ''))
+        elif isinstance(credit, str):
+            parts.append(credit)
+    return ''.join(parts)
+
+
+def _credit_artist_ids(doc: Dict[str, Any]) -> List[str]:
+    ids = []
+    for credit in doc.get('artist-credit') or []:
+        if isinstance(credit, dict):
+            artist_id = (credit.get('artist') or {}).get('id')
+            if artist_id:
+                ids.append(artist_id)
+    return ids
+
+
+def _credit_norms(doc: Dict[str, Any]) -> Tuple[str, List[str]]:
+    """Full credit plus each credited artist's own name, normalized.
+
+    Strict searches pass a single artist name, so "Artist A feat. Artist B"
+    must still match a lookup for "Artist A".
+    """
+    names = []
+    for credit in doc.get('artist-credit') or []:
+        if isinstance(credit, dict):
+            names.append(normalize_name(credit.get('name') or (credit.get('artist') or {}).get('name')))
+    return normalize_name(_credit_name(doc)), [n for n in names if n]
+
+
+def _iter_dump_lines(path: str) -> Iterator[Tuple[str, bytes]]:
+    """Yield ``(member_name, line)`` from a plain JSON-lines file or a dump tarball."""
+    if tarfile.is_tarfile(path):
+        with tarfile.open(path, 'r:*') as tar:
+            for member in tar:
+                if not member.isfile() or not member.name.startswith('mbdump/'):
+                    continue
+                handle = tar.extractfile(member)
+                if handle is None:
+                    continue
+                name = os.path.basename(member.name)
+                for line in io.BufferedReader(handle):
+                    yield name, line
+        return
+    name = os.path.basename(path).split('.')[0]
+    with open(path, 'rb') as f:
+        for line in f:
+            yield name, line
+
+
+class MusicBrainzMirror:
+    """Indexed SQLite store of MusicBrainz documents.
+
+    Reads use one connection per thread; imports use a dedicated writer
+    connection and commit in batches.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        parent = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(parent, exist_ok=True)
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA query_only=1")
+            self._local.conn = conn
+        return conn
+
+    def _record(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _docs(self, sql: str, params: Iterable[Any]) -> List[Dict[str, Any]]:
+        rows = self._conn().execute(sql, tuple(params)).fetchall()
+        docs = [json.loads(row[0]) for row in rows]
+        self._record(bool(docs))
+        return docs
+
+    def _doc(self, table: str, mbid: str) -> Optional[Dict[str, Any]]:
+        docs = self._docs(f"SELECT doc FROM {table} WHERE mbid = ?", (mbid,))
+        return docs[0] if docs else None
+
+    def is_complete(self, entity_type: str) -> bool:
+        """Whether a full import of ``entity_type`` has finished."""
+        row = self._conn().execute(
+            "SELECT complete FROM mb_import_state WHERE entity_type = ?", (entity_type,)
+        ).fetchone()
+        return bool(row and row[0])
+
+    def _has_rows(self, sql: str, params: Iterable[Any]) -> bool:
+        return self._conn().execute(sql, tuple(params)).fetchone() is not None
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+
+    def import_dump(self, path: str, entity_type: Optional[str] = None,
+                    batch_size: int = 5000, progress=None,
+                    complete: Optional[bool] = None) -> Dict[str, int]:
+        """Load a JSON dump (plain JSON-lines file or ``.tar.xz``) into the mirror.
+
+        ``entity_type`` defaults to the member/file name (``artist``,
+        ``release-group``, ``release``, ``recording``). Rows are upserted, so
+        re-importing a newer dump refreshes the mirror in place. Returns
+        per-entity row counts.
+
+        ``complete`` says the file holds every entity of its type, which is
+        what lets the mirror answer lookups of that type. It defaults to True
+        for dump archives and False for plain files (subsets). A type is only
+        marked complete once such an import has run to the end; upserts never
+        remove rows, so re-importing or topping up a complete type keeps it
+        complete.
+        """
+        if complete is None:
+            complete = tarfile.is_tarfile(path)
+        counts: Dict[str, int] = {}
+        started = time.monotonic()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            pending = 0
+            conn.execute("BEGIN")
+            for member, line in _iter_dump_lines(path):
+                kind = entity_type or member
+                if kind not in ENTITY_TYPES:
+                    continue
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    doc = json.loads(line)
+                except ValueError:
+                    logger.debug(f"Skipping malformed {kind} line in {path}")
+                    continue
+                self._store(conn, kind, doc)
+                counts[kind] = counts.get(kind, 0) + 1
+                pending += 1
+                if pending >= batch_size:
+                    conn.execute("COMMIT")
+                    conn.execute("BEGIN")
+                    pending = 0
+                    if progress:
+                        progress(dict(counts))
+            conn.execute("COMMIT")
+            elapsed = time.monotonic() - started
+            for kind, rows in counts.items():
+                conn.execute(
+                    "INSERT INTO mb_import_log (source, entity_type, rows, seconds) VALUES (?, ?, ?, ?)",
+                    (os.path.basename(path), kind, rows, round(elapsed, 3)),
+                )
+                if complete:
+                    self._mark_complete(conn, kind, path)
+            conn.commit()
+            conn.execute("ANALYZE")
+        finally:
+            conn.close()
+        logger.info(f"MusicBrainz mirror import of {path}: {counts} in {time.monotonic() - started:.1f}s")
+        return counts
+
+    def import_documents(self, entity_type: str, docs: Iterable[Dict[str, Any]]) -> int:
+        """Upsert already-parsed documents (test subsets, incremental top-ups).
+
+        Leaves the type's completeness as it was.
+        """
+        if entity_type not in ENTITY_TYPES:
+            raise ValueError(f"Unknown MusicBrainz entity type: {entity_type}")
+        count = 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                for doc in docs:
+                    self._store(conn, entity_type, doc)
+                    count += 1
+        finally:
+            conn.close()
+        return count
+
+    @staticmethod
+    def _mark_complete(conn: sqlite3.Connection, kind: str, path: str) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO mb_import_state (entity_type, complete, source, updated_at) "
+            "VALUES (?, 1, ?, CURRENT_TIMESTAMP)",
+            (kind, os.path.basename(path)),
+        )
+
+    def _store(self, conn: sqlite3.Connection, kind: str, doc: Dict[str, Any]) -> None:
+        mbid = doc.get('id')
+        if not mbid:
+            return
+        raw = json.dumps(doc, separators=(',', ':'), ensure_ascii=False)
+        if kind == 'artist':
+            conn.execute(
+                "INSERT OR REPLACE INTO mb_artist (mbid, name, name_norm, sort_name, doc) VALUES (?, ?, ?, ?, ?)",
+                (mbid, doc.get('name') or '', normalize_name(doc.get('name')), doc.get('sort-name'), raw),
+            )
+            aliases = {normalize_name(a.get('name')) for a in doc.get('aliases') or [] if isinstance(a, dict)}
+            aliases.add(normalize_name(doc.get('sort-name')))
+            aliases.discard('')
+            aliases.discard(normalize_name(doc.get('name')))
+            conn.executemany(
+                "INSERT OR IGNORE INTO mb_artist_alias (alias_norm, artist_mbid) VALUES (?, ?)",
+                [(alias, mbid) for alias in aliases],
+            )
+            return
+
+        credit_norm, _ = _credit_norms(doc)
+        title = doc.get('title') or ''
+        if kind == 'release-group':
+            conn.execute(
+                "INSERT OR REPLACE INTO mb_release_group (mbid, title, title_norm, credit_norm, primary_type, "
+                "first_release_date, doc) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (mbid, title, normalize_name(title), credit_norm, (doc.get('primary-type') or '').lower() or None,
+                 doc.get('first-release-date'), raw),
+            )
+        elif kind == 'release':
+            release_group = doc.get('release-group') or {}
+            conn.execute(
+                "INSERT OR REPLACE INTO mb_release (mbid, title, title_norm, credit_norm, release_group_mbid, date, doc) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (mbid, title, normalize_name(title), credit_norm, release_group.get('id'), doc.get('date'), raw),
+            )
+            # Release dumps embed their release-group and every track's
+            # recording — index those too so a release-only import still
+            # answers recording / ISRC lookups.
+            if release_group.get('id'):
+                exists = conn.execute("SELECT 1 FROM mb_release_group WHERE mbid = ?", (release_group['id'],)).fetchone()
+                if not exists:
+                    rg_doc = dict(release_group)
+                    rg_doc.setdefault('artist-credit', doc.get('artist-credit') or [])
+                    self._store(conn, 'release-group', rg_doc)
+            for medium in doc.get('media') or []:
+                for track in medium.get('tracks') or []:
+                    recording = track.get('recording')
+                    if not isinstance(recording, dict) or not recording.get('id'):
+                        continue
+                    exists = conn.execute("SELECT 1 FROM mb_recording WHERE mbid = ?", (recording['id'],)).fetchone()
+                    if not exists:
+                        self._store(conn, 'recording', recording)
+        elif kind == 'recording':
+            conn.execute(
+                "INSERT OR REPLACE INTO mb_recording (mbid, title, title_norm, credit_norm, length, doc) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (mbid, title, normalize_name(title), credit_norm, doc.get('length'), raw),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO mb_isrc (isrc, recording_mbid) VALUES (?, ?)",
+                [(isrc.upper(), mbid) for isrc in doc.get('isrcs') or [] if isinstance(isrc, str)],
+            )
+        conn.executemany(
+            "INSERT OR IGNORE INTO mb_entity_artist (artist_mbid, entity_type, entity_mbid) VALUES (?, ?, ?)",
+            [(artist_id, kind, mbid) for artist_id in _credit_artist_ids(doc)],
+        )
+
+    # ------------------------------------------------------------------
+    # Lookups — same signatures/shapes as MusicBrainzClient
+    # ------------------------------------------------------------------
+
+    # Every lookup returns None when the mirror cannot vouch for the answer
+    # (type not fully imported, include not stored, no exact match), which
+    # sends MusicBrainzClient to the web service.
+
+    def _get(self, kind: str, mbid: str, includes: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        if not self.is_complete(kind):
+            return None
+        doc = self._doc(_TABLES[kind], mbid)
+        if doc is None or not _satisfies(doc, includes):
+            return None
+        return doc
+
+    def get_artist(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        return self._get('artist', mbid, includes)
+
+    def get_release_group(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        wants_releases = bool(includes) and 'releases' in includes
+        if wants_releases and not self.is_complete('release'):
+            return None
+        rest = [inc for inc in includes or [] if inc != 'releases']
+        doc = self._get('release-group', mbid, rest)
+        if doc is not None and wants_releases and 'releases' not in doc:
+            doc['releases'] = self.browse_release_group_releases(mbid)
+        return doc
+
+    def get_release(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        return self._get('release', mbid, includes)
+
+    def get_recording(self, mbid: str, includes: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        return self._get('recording', mbid, includes)
+
+    def search_artist(self, artist_name: str, limit: int = 10,
+                      strict: bool = True) -> Optional[List[Dict[str, Any]]]:
+        if not strict or not self.is_complete('artist'):
+            return None
+        norm = normalize_name(artist_name)
+        docs = self._docs(
+            "SELECT doc FROM mb_artist WHERE name_norm = ? "
+            "UNION SELECT a.doc FROM mb_artist_alias al JOIN mb_artist a ON a.mbid = al.artist_mbid "
+            "WHERE al.alias_norm = ? LIMIT ?",
+            (norm, norm, limit),
+        )
+        if not docs:
+            return None
+        return [self._scored(d, 100 if normalize_name(d.get('name')) == norm else 90) for d in docs]
+
+    def search_release(self, album_name: str, artist_name: Optional[str] = None,
+                       limit: int = 10, strict: bool = True) -> Optional[List[Dict[str, Any]]]:
+        if not strict or not self.is_complete('release'):
+            return None
+        return self._search_titled('mb_release', album_name, artist_name, limit)
+
+    def search_recording(self, track_name: str, artist_name: Optional[str] = None,
+                         limit: int = 10, strict: bool = True) -> Optional[List[Dict[str, Any]]]:
+        if not strict or not self.is_complete('recording'):
+            return None
+        return self._search_titled('mb_recording', track_name, artist_name, limit)
+
+    def _search_titled(self, table: str, title: str, artist_name: Optional[str],
+                       limit: int) -> Optional[List[Dict[str, Any]]]:
+        rows = self._conn().execute(
+            f"SELECT doc FROM {table} WHERE title_norm = ?", (normalize_name(title),)
+        ).fetchall()
+        docs = [json.loads(r[0]) for r in rows]
+        if artist_name:
+            wanted = normalize_name(artist_name)
+            docs = [d for d in docs if wanted == _credit_norms(d)[0] or wanted in _credit_norms(d)[1]]
+        self._record(bool(docs))
+        if not docs:
+            return None
+        return [self._scored(d, 100) for d in docs[:limit]]
+
+    def browse_artist_release_groups(self, artist_mbid: str, release_types: Optional[List[str]] = None,
+                                     limit: int = 100, offset: int = 0) -> Optional[List[Dict[str, Any]]]:
+        # A complete release-group import holds every group credited to the
+        # artist, so any page of a known artist — even an empty one past the
+        # end — is the real answer.
+        if not self.is_complete('release-group'):
+            return None
+        known = (self._has_rows("SELECT 1 FROM mb_artist WHERE mbid = ?", (artist_mbid,))
+                 or self._has_rows("SELECT 1 FROM mb_entity_artist WHERE artist_mbid = ? "
+                                   "AND entity_type = 'release-group' LIMIT 1", (artist_mbid,)))
+        if not known:
+            return None
+        sql = ("SELECT rg.doc FROM mb_entity_artist ea JOIN mb_release_group rg ON rg.mbid = ea.entity_mbid "
+               "WHERE ea.artist_mbid = ? AND ea.entity_type = 'release-group'")
+        params: List[Any] = [artist_mbid]
+        if release_types:
+            sql += f" AND rg.primary_type IN ({','.join('?' * len(release_types))})"
+            params.extend(t.lower() for t in release_types)
+        sql += " ORDER BY rg.first_release_date, rg.title, rg.mbid LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        return self._docs(sql, params)
+
+    def browse_release_group_releases(self, release_group_mbid: str, limit: int = 100,
+                                      offset: int = 0) -> Optional[List[Dict[str, Any]]]:
+        if not self.is_complete('release'):
+            return None
+        known = (self._has_rows("SELECT 1 FROM mb_release_group WHERE mbid = ?", (release_group_mbid,))
+                 or self._has_rows("SELECT 1 FROM mb_release WHERE release_group_mbid = ? LIMIT 1",
+                                   (release_group_mbid,)))
+        if not known:
+            return None
+        return self._docs(
+            "SELECT doc FROM mb_release WHERE release_group_mbid = ? ORDER BY date, mbid LIMIT ? OFFSET ?",
+            (release_group_mbid, limit, offset),
+        )
+
+    def lookup_isrc(self, isrc: str) -> Optional[List[Dict[str, Any]]]:
+        if not self.is_complete('recording'):
+            return None
+        docs = self._docs(
+            "SELECT r.doc FROM mb_isrc i JOIN mb_recording r ON r.mbid = i.recording_mbid WHERE i.isrc = ?",
+            ((isrc or '').strip().upper(),),
+        )
+        return docs or None
+
+    @staticmethod
+    def _scored(doc: Dict[str, Any], score: int) -> Dict[str, Any]:
+        out = dict(doc)
+        out.setdefault('score', score)
+        return out
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        conn = self._conn()
+        counts = {kind: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for kind, table in _TABLES.items()}
+        counts['isrc'] = conn.execute("SELECT COUNT(*) FROM mb_isrc").fetchone()[0]
+        complete = [row[0] for row in conn.execute(
+            "SELECT entity_type FROM mb_import_state WHERE complete = 1 ORDER BY entity_type")]
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        return {
+            'path': self.db_path,
+            'counts': counts,
+            'complete': complete,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 3) if hits + misses else 0.0,
+        }
+
+
+_mirror_lock = threading.Lock()
+_mirror: Optional[MusicBrainzMirror] = None
+_mirror_path: Optional[str] = None
+
+
+def get_musicbrainz_mirror() -> Optional[MusicBrainzMirror]:
+    """Return the configured mirror, or None when ``musicbrainz.mirror_path`` is unset/missing.
+
+    Re-reads the config on each call so enabling the mirror in settings
+    takes effect without a restart; the instance is reused while the path
+    is unchanged.
+    """
+    global _mirror, _mirror_path
+    try:
+        from config.settings import config_manager
+        path = (config_manager.get('musicbrainz.mirror_path', '') or '').strip()
+    except Exception:
+        path = ''
+    if not path or not os.path.exists(path):
+        return None
+    with _mirror_lock:
+        if _mirror is None or _mirror_path != path:
+            try:
+                _mirror = MusicBrainzMirror(path)
+                _mirror_path = path
+            except Exception as e:
+                logger.warning(f"MusicBrainz mirror at {path} unavailable: {e}")
+                _mirror = None
+                _mirror_path = None
+        return _mirror
@@ -98,6 +98,16 @@ class MusicBrainzWorker:
 
         is_idle = is_actually_running and not self.paused and self.stats['pending'] == 0 and self.current_item is None
 
+        # Local mirror hit rate, when one is configured
+        mirror_stats = None
+        try:
+            from core.musicbrainz_mirror import get_musicbrainz_mirror
+            mirror = get_musicbrainz_mirror()
+            if mirror is not None:
+                mirror_stats = mirror.get_stats()
+        except Exception as e:
+            logger.debug(f"MusicBrainz mirror stats unavailable: {e}")
+
         return {
             'enabled': True,
             'running': is_actually_running and not self.paused,
@@ -105,7 +115,8 @@ class MusicBrainzWorker:
             'idle': is_idle,
             'current_item': self.current_item,
             'stats': self.stats.copy(),
-            'progress': progress
+            'progress': progress,
+            'mirror': mirror_stats,
         }
 
     def _run(self):
@@ -147,11 +158,15 @@ class MusicBrainzWorker:
 
 
                 # Process the item
+                client = getattr(self.mb_service, 'mb_client', None)
+                web_calls_before = getattr(client, 'web_request_count', None)
                 self._process_item(item)
 
                 # Keep current_item set during sleep so UI can see what was just processed
-                # Rate limit: 1 request per second
-                interruptible_sleep(self._stop_event, 1)
+                # Rate limit: 1 request per second — unless every lookup for this
+                # item was answered by the local mirror (no web request made).
+                if web_calls_before is None or getattr(client, 'web_request_count', None) != web_calls_before:
+                    interruptible_sleep(self._stop_event, 1)
 
             except Exception as e:
                 logger.error(f"Error in worker loop: {e}")
@@ -99,6 +99,7 @@ class PersonalizedPlaylistsService:
     def __init__(self, database, spotify_client=None):
         self.database = database
         self.spotify_client = spotify_client
+        self._eligibility_flags: Optional[bool] = None
 
     def _get_active_source(self) -> str:
         """Determine which music source is active — delegates to centralized metadata_service."""
@@ -167,15 +168,18 @@ class PersonalizedPlaylistsService:
         The WHERE clause always includes:
             source = ?
             AND (spotify_track_id IS NOT NULL OR itunes_track_id IS NOT NULL OR deezer_track_id IS NOT NULL)
-            AND LOWER(artist_name) NOT IN
-                (SELECT LOWER(artist_name) FROM discovery_artist_blacklist)
+            AND blocked = 0    -- artist not on either blocklist
 
         When `exclude_owned=True` (default) the WHERE additionally excludes
         any discovery_pool row whose IDs already match a row in the local
-        `tracks` table — i.e. tracks the user already has in their library.
-        Without this filter, Discovery / Hidden Gems / Popular Picks etc.
-        would happily surface tracks the user owns. Note the column-name
-        asymmetry: `tracks.deezer_id` ↔ `discovery_pool.deezer_track_id`.
+        `tracks` table (`owned = 0`) — i.e. tracks the user already has in
+        their library. Without this filter, Discovery / Hidden Gems / Popular
+        Picks etc. would happily surface tracks the user owns. Both flags are
+        maintained by triggers; a database without them falls back to the
+        equivalent NOT EXISTS / NOT IN subqueries.
+
+        `order_by="RANDOM()"` (with `exclude_owned`) is served by
+        `_sample_window` instead of sorting the whole pool.
 
         The ID gate is mandatory and not opt-out by design — if a future
         method needs to skip it, that's a design discussion, not a flag.
@@ -210,11 +214,20 @@ class PersonalizedPlaylistsService:
             columns = self._STANDARD_DISCOVERY_COLUMNS + tuple(extra_columns)
             select_cols = ",\n                        ".join(columns)
 
-            owned_clause = ""
-            if exclude_owned:
-                # Note column-name asymmetry: discovery_pool.deezer_track_id
-                # but tracks.deezer_id. Don't refactor without checking.
-                owned_clause = """
+            with self.database._get_connection() as conn:
+                cursor = conn.cursor()
+                flags = self._has_eligibility_flags(cursor)
+
+                if flags:
+                    # owned / blocked are kept current by triggers (see
+                    # MusicDatabase._ensure_discovery_eligibility).
+                    eligibility = "AND blocked = 0" + (" AND owned = 0" if exclude_owned else "")
+                else:
+                    eligibility = "AND LOWER(artist_name) NOT IN (SELECT LOWER(artist_name) FROM discovery_artist_blacklist UNION SELECT LOWER(name) FROM blocklist WHERE entity_type='artist')"
+                    if exclude_owned:
+                        # Note column-name asymmetry: discovery_pool.deezer_track_id
+                        # but tracks.deezer_id. Don't refactor without checking.
+                        eligibility += """
                   AND NOT EXISTS (
                       SELECT 1 FROM tracks t
                       WHERE (t.spotify_track_id IS NOT NULL AND t.spotify_track_id = discovery_pool.spotify_track_id)
@@ -222,25 +235,22 @@ class PersonalizedPlaylistsService:
                          OR (t.deezer_id IS NOT NULL AND t.deezer_id = discovery_pool.deezer_track_id)
                   )"""
 
-            query = f"""
+                query = f"""
                 SELECT
                         {select_cols}
                 FROM discovery_pool
                 WHERE source = ?
                   AND (spotify_track_id IS NOT NULL OR itunes_track_id IS NOT NULL OR deezer_track_id IS NOT NULL)
-                  AND LOWER(artist_name) NOT IN (SELECT LOWER(artist_name) FROM discovery_artist_blacklist UNION SELECT LOWER(name) FROM blocklist WHERE entity_type='artist')
-                  {owned_clause}
+                  {eligibility}
                   {extra_where}
-                ORDER BY {order_by}
-                LIMIT ?
-            """
-
-            params = (source,) + tuple(extra_params) + (fetch_limit,)
+                """
+                params = (source,) + tuple(extra_params)
 
-            with self.database._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
+                if flags and exclude_owned and order_by.strip().upper() == "RANDOM()":
+                    rows = self._sample_window(cursor, query, params, fetch_limit)
+                else:
+                    cursor.execute(f"{query} ORDER BY {order_by} LIMIT ?", params + (fetch_limit,))
+                    rows = cursor.fetchall()
 
             return [self._build_track_dict(row, source) for row in rows]
 
@@ -248,6 +258,39 @@ class PersonalizedPlaylistsService:
             logger.error(f"Error in _select_discovery_tracks (source={source}): {e}")
             return []
 
+    def _has_eligibility_flags(self, cursor) -> bool:
+        """Whether discovery_pool carries the maintained owned/blocked flags
+        and sample_key. Always true on a migrated MusicDatabase; a database
+        without them keeps the correlated-subquery filters."""
+        if self._eligibility_flags is None:
+            cursor.execute("PRAGMA table_info(discovery_pool)")
+            cols = {row[1] for row in cursor.fetchall()}
+            self._eligibility_flags = {'owned', 'blocked', 'sample_key'} <= cols
+        return self._eligibility_flags
+
+    @staticmethod
+    def _sample_window(cursor, query: str, params: tuple, fetch_limit: int) -> list:
+        """Uniform-start random sample without sorting the pool.
+
+        Every row holds a ``sample_key`` drawn from random() when it entered
+        the pool. Reading ``fetch_limit`` rows upward from a random pivot
+        (wrapping past the top) walks the partial
+        ``(source, sample_key) WHERE owned = 0 AND blocked = 0`` index, so
+        the cost is O(fetch_limit) rows — divided by the selectivity of any
+        extra filter — rather than ``ORDER BY RANDOM()``'s full sort. The
+        window comes back shuffled so its key order never leaks through.
+        """
+        pivot = random.getrandbits(64) - (1 << 63)
+        cursor.execute(f"{query} AND sample_key >= ? ORDER BY sample_key LIMIT ?",
+                       params + (pivot, fetch_limit))
+        rows = cursor.fetchall()
+        if len(rows) < fetch_limit:
+            cursor.execute(f"{query} AND sample_key < ? ORDER BY sample_key LIMIT ?",
+                           params + (pivot, fetch_limit - len(rows)))
+            rows += cursor.fetchall()
+        random.shuffle(rows)
+        return rows
+
     def _apply_diversity_filter(
         self,
         tracks: List[Dict],
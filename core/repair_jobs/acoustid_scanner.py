@@ -55,6 +55,7 @@ class AcoustIDScannerJob(RepairJob):
         'batch_size': 200,
     }
     auto_fix = False  # User chooses fix action per finding
+    lane = 'io'  # writes the verification tag into scanned files
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
@@ -49,6 +49,7 @@ class AlbumCompletenessJob(RepairJob):
         'min_completion_pct': 0,
     }
     auto_fix = False
+    lane = 'network'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
@@ -141,6 +141,7 @@ class AlbumTagConsistencyJob(RepairJob):
         'check_mb_release_id': True,
     }
     auto_fix = False
+    lane = 'io'
 
     def _get_settings(self, context: JobContext) -> dict:
         """Get job settings from config, merged with defaults."""
@@ -21,6 +21,12 @@ one at a time from the findings list like every other job.
 Decode-testing is real work (it decodes the whole file), so this is opt-in and
 respects stop/pause per file. The optional ``only_modified_within_days`` setting
 narrows the scan to recently-touched files for a fast, targeted pass.
+
+Files that decode clean go into a verified-file ledger (``repair_verified_files``)
+fingerprinted by size, mtime and the STREAMINFO MD5; the next run skips any file
+whose fingerprint is unchanged, until ``reverify_after_days`` says it's time to
+re-read it anyway (a dying disk doesn't touch mtimes). The files that do need a
+test are decoded in a small pool of ``flac``/``ffmpeg`` subprocesses.
 """
 
 from __future__ import annotations
@@ -29,7 +35,8 @@ import os
 import shutil
 import subprocess
 import time
-from typing import Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional, Tuple
 
 from core.library.path_resolver import resolve_library_file_path
 from core.repair_jobs import register_job
@@ -42,6 +49,10 @@ logger = get_logger("repair_jobs.audio_corruption")
 # `flac -t` can MD5-verify. Other formats would need a looser ffmpeg-only check.
 _CORRUPT_CHECK_EXTS = {'.flac'}
 _DECODE_TIMEOUT_S = 600
+# Auto-sized pool cap: decoding is CPU-bound, but past a few readers a
+# spinning disk or NAS share just seeks between them.
+_MAX_AUTO_WORKERS = 4
+_LEDGER_FLUSH_EVERY = 200
 
 
 def _resolve(file_path: str, context: JobContext) -> Optional[str]:
@@ -72,6 +83,18 @@ def _first_error_line(text: Optional[str]) -> str:
     return ''
 
 
+class IntegrityResult(tuple):
+    """``(ok, reason)`` from :func:`check_flac_integrity`, plus ``tested`` —
+    False when no decoder actually finished (timeout, missing binary). Such a
+    file is never flagged, but it isn't proven clean either, so it stays out
+    of the verified ledger."""
+
+    def __new__(cls, ok: bool, reason: str, tested: bool = True):
+        result = super().__new__(cls, (ok, reason))
+        result.tested = tested
+        return result
+
+
 def check_flac_integrity(path: str) -> Tuple[bool, str]:
     """Decode-test a FLAC. Returns (ok, reason).
 
@@ -86,10 +109,11 @@ def check_flac_integrity(path: str) -> Tuple[bool, str]:
             proc = subprocess.run([flac_bin, '-t', '-s', path],
                                   capture_output=True, text=True, timeout=_DECODE_TIMEOUT_S)
         except (subprocess.TimeoutExpired, OSError):
-            return True, ''  # our own failure — don't flag a good file
+            # our own failure — don't flag a good file
+            return IntegrityResult(True, '', tested=False)
         if proc.returncode != 0:
-            return False, _first_error_line(proc.stderr) or 'flac -t reported errors'
-        return True, ''
+            return IntegrityResult(False, _first_error_line(proc.stderr) or 'flac -t reported errors')
+        return IntegrityResult(True, '')
 
     ffmpeg_bin = shutil.which('ffmpeg')
     if ffmpeg_bin:
@@ -98,20 +122,66 @@ def check_flac_integrity(path: str) -> Tuple[bool, str]:
                 [ffmpeg_bin, '-v', 'error', '-nostdin', '-i', path, '-f', 'null', '-'],
                 capture_output=True, text=True, timeout=_DECODE_TIMEOUT_S)
         except (subprocess.TimeoutExpired, OSError):
-            return True, ''
+            return IntegrityResult(True, '', tested=False)
         err = (proc.stderr or '').strip()
         if proc.returncode != 0 or err:
-            return False, _first_error_line(err) or 'ffmpeg decode errors'
-        return True, ''
+            return IntegrityResult(False, _first_error_line(err) or 'ffmpeg decode errors')
+        return IntegrityResult(True, '')
 
     # No decoder available → can't test → never flag.
-    return True, ''
+    return IntegrityResult(True, '', tested=False)
+
+
+def read_streaminfo_md5(path: str) -> Optional[str]:
+    """Hex MD5 of the decoded audio as stored in the FLAC STREAMINFO block,
+    read from the first 42 bytes. None when the file doesn't start with a
+    STREAMINFO block or the encoder left the signature unset (all zeros)."""
+    try:
+        with open(path, 'rb') as fh:
+            head = fh.read(42)
+    except OSError:
+        return None
+    # "fLaC", then a 4-byte block header: type 0 (STREAMINFO), length 34.
+    if len(head) < 42 or head[:4] != b'fLaC' or head[4] & 0x7F != 0 or head[5:8] != b'\x00\x00\x22':
+        return None
+    md5 = head[26:42]
+    return md5.hex() if any(md5) else None
+
+
+def file_fingerprint(path: str) -> Optional[Dict[str, Any]]:
+    """Size, mtime (ns) and STREAMINFO MD5 — the ledger key for ``path``."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+            'streaminfo_md5': read_streaminfo_md5(path)}
+
+
+def _ledger_current(entry: Optional[Dict[str, Any]], fingerprint: Dict[str, Any],
+                    reverify_before: Optional[float]) -> bool:
+    """True when the ledger already vouches for this exact file."""
+    if not entry:
+        return False
+    if reverify_before is not None and (entry.get('verified_at') or 0) < reverify_before:
+        return False
+    return (entry.get('size') == fingerprint['size']
+            and entry.get('mtime_ns') == fingerprint['mtime_ns']
+            and entry.get('streaminfo_md5') == fingerprint['streaminfo_md5'])
 
 
 def _decoder_available() -> bool:
     return bool(shutil.which('flac') or shutil.which('ffmpeg'))
 
 
+def _decoder_name() -> str:
+    return 'flac' if shutil.which('flac') else 'ffmpeg'
+
+
+def _auto_workers() -> int:
+    return max(1, min(os.cpu_count() or 1, _MAX_AUTO_WORKERS))
+
+
 @register_job
 class AudioCorruptionDetectorJob(RepairJob):
     job_id = 'audio_corruption_detector'
@@ -131,26 +201,37 @@ class AudioCorruptionDetectorJob(RepairJob):
         'This is opt-in and does real work (it decodes every file), so it can take a '
         'while on a large library. Use "Only modified within days" to run a fast, '
         'targeted pass over recently-touched files.\n\n'
+        'Files that pass are remembered (by size, modification time and the FLAC\'s '
+        'own audio MD5), so later runs only decode new or changed files.\n\n'
         'Requires the flac or ffmpeg binary to run the decode test.\n\n'
         'Settings:\n'
         '  - only_modified_within_days: only test files modified in the last N days '
-        '(0 = test everything).'
+        '(0 = test everything).\n'
+        '  - reverify_after_days: decode a file that passed before again once its last '
+        'clean test is this old, even if unchanged — catches disk rot (0 = never).\n'
+        '  - parallel_tests: files decoded at once (0 = auto: CPU count, at most 4). '
+        'Use 1 for a single spinning disk.'
     )
     icon = 'repair-icon-lossless'
     default_enabled = False
     default_interval_hours = 168  # weekly
     default_settings = {
         'only_modified_within_days': 0,
+        'reverify_after_days': 180,
+        'parallel_tests': 0,
     }
     setting_options: dict = {}
     auto_fix = False
+    lane = 'cpu'
 
     def _setting_int(self, context: JobContext, key: str, default: int) -> int:
         cm = getattr(context, 'config_manager', None)
         if cm is None:
             return default
         try:
-            return int(cm.get(self.get_config_key(key), default) or default)
+            value = cm.get(self.get_config_key(key), default)
+            # 0 is meaningful for these settings — only blanks mean "default".
+            return default if value in (None, '') else int(value)
         except (TypeError, ValueError):
             return default
 
@@ -197,58 +278,65 @@ class AudioCorruptionDetectorJob(RepairJob):
         if context.report_progress:
             context.report_progress(phase=f'Decode-testing {total} FLAC files...', total=total)
 
-        tested = 0
+        reverify_days = self._setting_int(context, 'reverify_after_days', 180)
+        reverify_before = (time.time() - reverify_days * 86400) if reverify_days > 0 else None
+        workers = self._setting_int(context, 'parallel_tests', 0)
+        workers = workers if workers > 0 else _auto_workers()
+        ledger_db = context.db if hasattr(context.db, 'get_verified_files') else None
+        ledger = ledger_db.get_verified_files(self.job_id) if ledger_db else {}
+        verifier = _decoder_name()
+        verified_batch = []
+
+        stats = {'tested': 0, 'done': 0, 'bytes': 0}
         unresolved = 0
         outside_window = 0
-        for i, row in enumerate(rows):
-            if context.check_stop():
-                return result
-            if i % 5 == 0 and context.wait_if_paused():
-                return result
-
-            result.scanned += 1
+        already_verified = 0
+        started = time.monotonic()
+
+        def flush_ledger(force=False):
+            if ledger_db and verified_batch and (force or len(verified_batch) >= _LEDGER_FLUSH_EVERY):
+                ledger_db.record_verified_files(self.job_id, verified_batch)
+                verified_batch.clear()
+
+        def tick():
+            stats['done'] += 1
+            if context.update_progress and stats['done'] % 5 == 0:
+                context.update_progress(stats['done'], total)
+
+        def finish(future, row, resolved, fingerprint):
+            """Fold one decode result back in — always on the scan thread, so
+            findings, progress and ledger writes never race."""
             title = row['title'] or 'Unknown'
             artist = row['artist_name'] or 'Unknown'
-            resolved = _resolve(row['file_path'], context)
-
-            if not resolved:
-                unresolved += 1
-                result.skipped += 1
-                continue
-
-            # Optional "recently modified only" narrowing — cheap stat, big speedup.
-            if cutoff_mtime is not None:
-                try:
-                    if os.path.getmtime(resolved) < cutoff_mtime:
-                        outside_window += 1
-                        result.skipped += 1
-                        continue
-                except OSError:
-                    result.skipped += 1
-                    continue
-
-            if context.report_progress:
-                context.report_progress(
-                    scanned=i + 1, total=total,
-                    phase=f'Decode-testing {i + 1}/{total}...',
-                    log_line=f'{artist} — {title}', log_type='info')
-
-            tested += 1
             try:
-                ok, reason = check_flac_integrity(resolved)
+                verdict = future.result()
             except Exception as e:
                 logger.debug("[Corrupt File Detector] decode test errored for %s: %s",
                              os.path.basename(resolved), e)
                 result.errors += 1
-                if context.update_progress and (i + 1) % 5 == 0:
-                    context.update_progress(i + 1, total)
-                continue
+                tick()
+                return
+            ok, reason = verdict
+            stats['tested'] += 1
+            stats['bytes'] += fingerprint['size']
+            tick()
+            if context.report_progress:
+                elapsed = max(time.monotonic() - started, 1e-6)
+                context.report_progress(
+                    scanned=stats['done'], total=total,
+                    phase=(f'Decode-testing {stats["done"]}/{total} '
+                           f'({stats["bytes"] / elapsed / 1e6:.1f} MB/s)...'),
+                    log_line=f'{artist} — {title}', log_type='info')
 
             if ok:
-                if context.update_progress and (i + 1) % 5 == 0:
-                    context.update_progress(i + 1, total)
-                continue
-
+                if getattr(verdict, 'tested', True):
+                    verified_batch.append(dict(fingerprint, path=resolved, verifier=verifier,
+                                               verified_at=time.time()))
+                    flush_ledger()
+                return
+
+            if ledger_db and resolved in ledger:
+                ledger_db.forget_verified_files(self.job_id, [resolved])
             if context.report_progress:
                 context.report_progress(
                     log_line=f'Corrupt: {artist} — {title} ({reason})', log_type='error')
@@ -284,9 +372,70 @@ class AudioCorruptionDetectorJob(RepairJob):
                                  row['id'], e)
                     result.errors += 1
 
-            if context.update_progress and (i + 1) % 5 == 0:
-                context.update_progress(i + 1, total)
+        def drain(pending, until):
+            while len(pending) > until:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(future, *pending.pop(future))
+
+        pending = {}
+        # Bounded pool: stat/MD5/ledger checks run here, decodes run in at most
+        # `workers` subprocesses, and only a couple of files per worker are
+        # queued ahead so a stop doesn't leave thousands of tests behind it.
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='flac-verify')
+        stopped = False
+        try:
+            for i, row in enumerate(rows):
+                if context.check_stop():
+                    stopped = True
+                    break
+                if i % 5 == 0 and context.wait_if_paused():
+                    stopped = True
+                    break
+
+                result.scanned += 1
+                resolved = _resolve(row['file_path'], context)
+
+                if not resolved:
+                    unresolved += 1
+                    result.skipped += 1
+                    tick()
+                    continue
+
+                fingerprint = file_fingerprint(resolved)
+                if fingerprint is None:
+                    result.skipped += 1
+                    tick()
+                    continue
+
+                # Optional "recently modified only" narrowing — cheap stat, big speedup.
+                if cutoff_mtime is not None and fingerprint['mtime_ns'] < cutoff_mtime * 1e9:
+                    outside_window += 1
+                    result.skipped += 1
+                    tick()
+                    continue
+
+                if _ledger_current(ledger.get(resolved), fingerprint, reverify_before):
+                    already_verified += 1
+                    result.skipped += 1
+                    tick()
+                    continue
+
+                pending[pool.submit(check_flac_integrity, resolved)] = (row, resolved, fingerprint)
+                drain(pending, workers * 2)
+
+            if not stopped:
+                drain(pending, 0)
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=not stopped, cancel_futures=True)
+            flush_ledger(force=True)
+
+        if stopped:
+            return result
 
+        elapsed = time.monotonic() - started
         if context.update_progress:
             context.update_progress(total, total)
         # An honest summary: 'decode-tested' means DECODED, not merely seen —
@@ -294,8 +443,11 @@ class AudioCorruptionDetectorJob(RepairJob):
         # resolution failure completely ('6741 decode-tested ... in 0.1s').
         logger.info(
             "[Corrupt File Detector] %d of %d FLAC files decode-tested, %d corrupt, "
-            "%d path-unresolved, %d outside the modified window",
-            tested, total, result.findings_created, unresolved, outside_window)
+            "%d unchanged since a clean test, %d path-unresolved, %d outside the modified "
+            "window; %.1f MB read in %.1fs (%.1f MB/s, %d parallel)",
+            stats['tested'], total, result.findings_created, already_verified, unresolved,
+            outside_window, stats['bytes'] / 1e6, elapsed,
+            stats['bytes'] / max(elapsed, 1e-6) / 1e6, workers)
         if total and unresolved == total:
             # Every single path failed to resolve — that's a mapping problem,
             # not a healthy library. Say so where the user is looking.
@@ -6,6 +6,13 @@ import os
 import threading
 from typing import Any, Callable, Dict, List, Optional
 
+# Scheduling lanes. The worker runs each lane's due jobs independently (with
+# per-lane concurrency), so a multi-hour decode scan in ``cpu`` never holds up
+# a quick ``db`` sweep. ``io`` is where every job that moves, renames, deletes
+# or rewrites library files (or scans the files those jobs touch) lives — it
+# runs one job at a time, whatever the concurrency setting, so they never race.
+JOB_LANES = ('db', 'io', 'cpu', 'network')
+
 
 def skip_deleted_quarantine(root: str, dirs: list, transfer_folder: str) -> None:
     """In-place prune of the ``<transfer>/deleted`` quarantine from an ``os.walk``
@@ -56,6 +63,13 @@ class JobContext:
     update_progress: Optional[Callable[[int, int], None]] = None
     report_progress: Optional[Callable] = None  # Rich progress: (phase, log_line, log_type, scanned, total)
 
+    # Resume cursor left by a previous run of this job that didn't finish
+    # (stopped, restarted, crashed), and the callback that persists a new one
+    # (None clears it). See load_checkpoint / save_checkpoint.
+    checkpoint: Optional[Dict[str, Any]] = None
+    persist_checkpoint: Optional[Callable[[Optional[Dict[str, Any]]], None]] = None
+    _checkpoint_saved_at: float = field(default=0.0, repr=False)
+
     def check_stop(self) -> bool:
         """Return True if the worker should stop."""
         if self.stop_event and self.stop_event.is_set():
@@ -86,6 +100,38 @@ class JobContext:
                 time.sleep(0.2)
         return self.check_stop()
 
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """The resume cursor an interrupted previous run saved, or None.
+
+        The cursor is whatever the job passed to :meth:`save_checkpoint`; the
+        job decides whether it still applies (e.g. the setting it was built
+        under changed) and simply starts over when it doesn't."""
+        return dict(self.checkpoint) if self.checkpoint else None
+
+    def save_checkpoint(self, cursor: Dict[str, Any], min_interval: float = 5.0) -> bool:
+        """Persist a JSON-serialisable resume cursor for this job.
+
+        Cheap to call per item: writes at most once per ``min_interval``
+        seconds (0 forces a write). The worker drops the cursor once the scan
+        returns without being stopped, so only an interrupted run resumes.
+        Returns True when the cursor was written."""
+        self.checkpoint = dict(cursor)
+        if not self.persist_checkpoint:
+            return False
+        import time
+        now = time.monotonic()
+        if min_interval and now - self._checkpoint_saved_at < min_interval:
+            return False
+        self._checkpoint_saved_at = now
+        self.persist_checkpoint(self.checkpoint)
+        return True
+
+    def clear_checkpoint(self) -> None:
+        """Forget the resume cursor (the next run starts from the beginning)."""
+        self.checkpoint = None
+        if self.persist_checkpoint:
+            self.persist_checkpoint(None)
+
     def sleep_or_stop(self, seconds: float, step: float = 0.2) -> bool:
         """Sleep in small increments so stop requests can interrupt quickly."""
         if seconds <= 0:
@@ -120,6 +166,9 @@ class RepairJob(ABC):
     # these instead of a free-text box. Keys not listed render by value type.
     setting_options: Dict[str, list] = {}
     auto_fix: bool = False
+    # One of JOB_LANES — what the scan mostly waits on. Jobs sharing a lane
+    # queue behind each other; jobs in different lanes run side by side.
+    lane: str = 'io'
 
     @abstractmethod
     def scan(self, context: JobContext) -> JobResult:
@@ -27,6 +27,7 @@ class CacheEvictorJob(RepairJob):
     default_interval_hours = 6
     default_settings = {}
     auto_fix = True
+    lane = 'db'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
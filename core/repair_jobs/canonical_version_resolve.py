@@ -106,6 +106,7 @@ class CanonicalVersionResolveJob(RepairJob):
         'source_selection': ['active_preferred', 'active_only', 'best_fit'],
     }
     auto_fix = True
+    lane = 'db'
 
     def _get_settings(self, context: JobContext) -> dict:
         merged = dict(self.default_settings)
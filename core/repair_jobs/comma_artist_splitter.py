@@ -97,6 +97,7 @@ class CommaArtistSplitterJob(RepairJob):
     default_enabled = False
     default_interval_hours = 168  # Weekly
     auto_fix = False
+    lane = 'network'
 
     def estimate_scope(self, context: JobContext) -> int:
         try:
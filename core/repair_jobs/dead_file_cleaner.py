@@ -48,6 +48,7 @@ class DeadFileCleanerJob(RepairJob):
         'min_tracks_for_guard': 25,
     }
     auto_fix = False
+    lane = 'io'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
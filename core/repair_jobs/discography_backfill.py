@@ -63,6 +63,7 @@ class DiscographyBackfillJob(RepairJob):
         'include_instrumentals': False,
     }
     auto_fix = False
+    lane = 'network'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
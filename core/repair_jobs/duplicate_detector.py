@@ -1,8 +1,10 @@
 """Duplicate Track Detector Job — finds potential duplicate tracks in the library."""
 
+import bisect
 import os
-from collections import defaultdict
+from collections import Counter, defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 from core.imports.file_ops import _strip_slskd_dedup_suffix
 from core.repair_jobs import register_job
@@ -39,6 +41,10 @@ class DuplicateDetectorJob(RepairJob):
         'ignore_cross_album': False,
     }
     auto_fix = False
+    lane = 'cpu'
+    # Neighbours each distinct (title, artist) key is paired with in every
+    # sorted order of the blocking index.
+    block_window = 12
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
@@ -84,14 +90,11 @@ class DuplicateDetectorJob(RepairJob):
         if context.update_progress:
             context.update_progress(0, total)
 
-        # Group tracks by normalized key for fast comparison
-        # Bucket by first 4 chars of normalized title for efficiency
-        buckets = defaultdict(list)
+        library = []
         for row in tracks:
             track_id, title, artist_name, album_title, file_path, bitrate, duration, album_thumb, artist_thumb, artist_id = row
             norm_title = _normalize(title)
-            bucket_key = norm_title[:4] if len(norm_title) >= 4 else norm_title
-            buckets[bucket_key].append({
+            library.append({
                 'id': track_id,
                 'title': title,
                 'norm_title': norm_title,
@@ -106,29 +109,32 @@ class DuplicateDetectorJob(RepairJob):
                 'artist_id': artist_id,
             })
 
-        # Find duplicates within each bucket
         found_groups = set()  # Track IDs already in a group
-        processed_holder = {'count': 0}
+        processed_holder = {'count': 0, 'pairs': 0}
 
         if context.report_progress:
             context.report_progress(phase=f'Comparing {total} tracks...', total=total)
 
-        # Pass 1 — bucket by normalized-title prefix (existing behavior).
-        for _bucket_key, bucket_tracks in buckets.items():
-            if context.check_stop():
-                return result
-            self._scan_bucket(
-                bucket_tracks=bucket_tracks,
-                require_metadata_match=True,
-                title_threshold=title_threshold,
-                artist_threshold=artist_threshold,
-                ignore_cross_album=ignore_cross_album,
-                found_groups=found_groups,
-                processed_holder=processed_holder,
-                total=total,
-                result=result,
-                context=context,
-            )
+        # Pass 1 — title/artist similarity, scored only on the candidate
+        # pairs the blocking index proposes (see _BlockingIndex). The old
+        # first-4-chars-of-title buckets compared every pair inside a bucket,
+        # and common prefixes ("the ", "love", "intr") made that quadratic
+        # over tens of thousands of tracks.
+        self._scan_bucket(
+            bucket_tracks=library,
+            candidates=_BlockingIndex(library, self.block_window),
+            require_metadata_match=True,
+            title_threshold=title_threshold,
+            artist_threshold=artist_threshold,
+            ignore_cross_album=ignore_cross_album,
+            found_groups=found_groups,
+            processed_holder=processed_holder,
+            total=total,
+            result=result,
+            context=context,
+        )
+        if context.check_stop():
+            return result
 
         # Pass 2 — re-bucket leftover tracks by canonical filename stem
         # (slskd dedup suffix stripped). Catches dupes whose tag metadata
@@ -140,7 +146,7 @@ class DuplicateDetectorJob(RepairJob):
         # compared. Discord-reported scenario: 7 copies of one OST track
         # accumulating in one folder, only 1 caught by the detector.
         filename_buckets = self._build_filename_buckets(
-            buckets=buckets,
+            buckets={'': library},
             found_groups=found_groups,
         )
         for _fname_key, fname_tracks in filename_buckets.items():
@@ -166,14 +172,15 @@ class DuplicateDetectorJob(RepairJob):
         if context.update_progress:
             context.update_progress(total, total)
 
-        logger.info("Duplicate scan: %d tracks checked, %d duplicate groups found",
-                     result.scanned, result.findings_created)
+        logger.info("Duplicate scan: %d tracks checked, %d pairs scored, %d duplicate groups found",
+                     result.scanned, processed_holder['pairs'], result.findings_created)
         return result
 
     def _scan_bucket(
         self,
         *,
         bucket_tracks,
+        candidates=None,
         require_metadata_match,
         title_threshold,
         artist_threshold,
@@ -184,7 +191,11 @@ class DuplicateDetectorJob(RepairJob):
         result,
         context,
     ) -> None:
-        """Compare every pair within a bucket; emit duplicate groups.
+        """Compare pairs within a bucket; emit duplicate groups.
+
+        Every pair is compared unless ``candidates`` is given — then only
+        ``candidates.after(i)`` (indices > i, ascending) are scored against
+        track ``i``, in the same order an all-pairs pass would visit them.
 
         ``require_metadata_match`` gates the title / artist similarity
         thresholds. Pass ``False`` for buckets whose grouping is already
@@ -209,16 +220,20 @@ class DuplicateDetectorJob(RepairJob):
                     log_line=f'Checking: {t1["title"]} — {t1["artist"]}',
                     log_type='info'
                 )
+            if context.update_progress and processed % 200 == 0:
+                context.update_progress(processed, total)
 
             if t1['id'] in found_groups:
                 continue
 
             group = [t1]
 
-            for j in range(i + 1, len(bucket_tracks)):
+            later = candidates.after(i) if candidates is not None else range(i + 1, len(bucket_tracks))
+            for j in later:
                 t2 = bucket_tracks[j]
                 if t2['id'] in found_groups:
                     continue
+                processed_holder['pairs'] = processed_holder.get('pairs', 0) + 1
 
                 # Applies to both passes — a shared filename (e.g. a
                 # single edit vs. the album version of the same track)
@@ -229,11 +244,11 @@ class DuplicateDetectorJob(RepairJob):
                     continue
 
                 if require_metadata_match:
-                    title_sim = SequenceMatcher(None, t1['norm_title'], t2['norm_title']).ratio()
-                    if title_sim < title_threshold:
+                    # Artist first: both gates must pass, and artist names are
+                    # short (or identical) so most rejections are cheap.
+                    if not _similar(t1['norm_artist'], t2['norm_artist'], artist_threshold):
                         continue
-                    artist_sim = SequenceMatcher(None, t1['norm_artist'], t2['norm_artist']).ratio()
-                    if artist_sim < artist_threshold:
+                    if not _similar(t1['norm_title'], t2['norm_title'], title_threshold):
                         continue
                 else:
                     # Filename-bucket pass: filename agreement is strong but
@@ -312,8 +327,6 @@ class DuplicateDetectorJob(RepairJob):
                         logger.debug("Error creating duplicate finding: %s", e)
                         result.errors += 1
 
-        if context.update_progress and processed_holder['count'] % 200 == 0:
-            context.update_progress(processed_holder['count'], total)
 
     def _build_filename_buckets(self, *, buckets, found_groups):
         """Re-bucket all tracks by canonical filename stem.
@@ -371,6 +384,87 @@ def _normalize(text: str) -> str:
     return ''.join(c for c in t if c.isalnum() or c in '() ').strip()
 
 
+@lru_cache(maxsize=65536)
+def _char_counts(text: str) -> Counter:
+    return Counter(text)
+
+
+def _similar(a: str, b: str, threshold: float) -> bool:
+    """``SequenceMatcher(a, b).ratio() >= threshold``, skipping the matcher
+    when the answer is already known. Equal strings score 1.0; the ratio can
+    never exceed ``2 * min(len) / (len(a) + len(b))``, nor the share of
+    characters the two have in common (``SequenceMatcher.quick_ratio``)."""
+    if a == b:
+        return True
+    total = len(a) + len(b)
+    if 2.0 * min(len(a), len(b)) / total < threshold:
+        return False
+    common = sum((_char_counts(a) & _char_counts(b)).values())
+    if 2.0 * common / total < threshold:
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= threshold
+
+
+class _BlockingIndex:
+    """Candidate pairs for the title/artist pass, by sorted-neighbourhood blocking.
+
+    Tracks sharing a normalized (title, artist) key are always candidates of
+    each other. Each distinct key is also paired with the ``window`` keys on
+    either side of it in three sort orders, so near-duplicates land next to
+    each other whichever end of the title differs:
+
+      · title, then artist            — suffix edits ("song" / "song (live)")
+      · reversed title, then artist   — prefix edits ("the song" / "song")
+      · artist, duration bucket, title — same-length re-downloads whose
+        titles differ anywhere, even at the start
+
+    Exact scoring still happens in ``_scan_bucket``; this only decides which
+    pairs get scored — O(n·window) of them instead of every pair in a bucket.
+    Nothing is materialized per pair: :meth:`after` walks the neighbours of
+    one track's key when asked.
+    """
+
+    _DURATION_BUCKET_MS = 2000   # tracks.duration is milliseconds
+
+    def __init__(self, tracks, window: int):
+        self._window = max(1, int(window))
+        members = defaultdict(list)
+        durations = {}
+        for index, track in enumerate(tracks):
+            key = (track['norm_title'], track['norm_artist'])
+            members[key].append(index)   # ascending: tracks are enumerated in order
+            if key not in durations:
+                duration = track.get('duration') or 0
+                durations[key] = int(duration // self._DURATION_BUCKET_MS) if duration else -1
+        self._members = members
+        self._key_of = [(t['norm_title'], t['norm_artist']) for t in tracks]
+        keys = list(members)
+        self._orders = []
+        for sort_key in (
+            lambda k: (k[0], k[1]),
+            lambda k: (k[0][::-1], k[1]),
+            lambda k: (k[1], durations[k], k[0]),
+        ):
+            order = sorted(keys, key=sort_key)
+            self._orders.append((order, {key: pos for pos, key in enumerate(order)}))
+
+    def neighbour_keys(self, key):
+        found = {key}
+        for order, position in self._orders:
+            pos = position[key]
+            found.update(order[max(0, pos - self._window):pos + self._window + 1])
+        return found
+
+    def after(self, index: int):
+        """Candidate track indices greater than ``index``, ascending."""
+        later = []
+        for key in self.neighbour_keys(self._key_of[index]):
+            indices = self._members[key]
+            later.extend(indices[bisect.bisect_right(indices, index):])
+        later.sort()
+        return later
+
+
 def _is_same_physical_file(p1, p2, dur1, dur2) -> bool:
     """Detect when two DB rows point at the same file mounted at different paths.
 
@@ -77,6 +77,7 @@ class EmptyFolderCleanerJob(RepairJob):
     default_interval_hours = 168  # weekly — empties accrue slowly
     default_settings = {'remove_junk_files': True, 'remove_residual_files': False}
     auto_fix = False
+    lane = 'io'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
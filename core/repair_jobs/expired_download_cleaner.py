@@ -96,6 +96,7 @@ class ExpiredDownloadCleanerJob(RepairJob):
     # dry_run vs delete decision. Setting True surfaces the Scan → Dry Run /
     # Auto-fix flow badge (without it the job mislabels as "Scan Only").
     auto_fix = True
+    lane = 'io'
 
     def _get_settings(self, context: JobContext) -> dict:
         merged = dict(self.default_settings)
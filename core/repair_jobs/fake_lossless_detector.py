@@ -1,5 +1,6 @@
 """Fake Lossless Detector Job — detects FLAC/WAV files transcoded from lossy sources."""
 
+import bisect
 import json
 import os
 import subprocess
@@ -37,6 +38,7 @@ class FakeLosslessDetectorJob(RepairJob):
         'spectral_cutoff_khz': 16.0,
     }
     auto_fix = False
+    lane = 'cpu'
 
     def scan(self, context: JobContext) -> JobResult:
         global _ffprobe_warned
@@ -66,21 +68,32 @@ class FakeLosslessDetectorJob(RepairJob):
                 ext = os.path.splitext(fname)[1].lower()
                 if ext in LOSSLESS_EXTENSIONS:
                     lossless_files.append(os.path.join(root, fname))
+        # Sorted so a resume cursor ("carry on from this path") means the same
+        # thing on the next run even though os.walk order isn't stable.
+        lossless_files.sort()
 
         total = len(lossless_files)
+        start = 0
+        checkpoint = context.load_checkpoint()
+        if (checkpoint and checkpoint.get('transfer') == transfer
+                and checkpoint.get('cutoff_khz') == cutoff_khz):
+            start = bisect.bisect_left(lossless_files, checkpoint.get('resume_from') or '')
+            logger.info("Resuming fake lossless scan at file %d of %d", start + 1, total)
         if context.update_progress:
-            context.update_progress(0, total)
+            context.update_progress(start, total)
 
-        logger.info("Scanning %d lossless files for fakes", total)
+        logger.info("Scanning %d lossless files for fakes", total - start)
 
         if context.report_progress:
             context.report_progress(phase=f'Analyzing {total} lossless files...', total=total)
 
-        for i, fpath in enumerate(lossless_files):
+        for i in range(start, total):
+            fpath = lossless_files[i]
             if context.check_stop():
                 return result
             if i % 10 == 0 and context.wait_if_paused():
                 return result
+            context.save_checkpoint({'resume_from': fpath, 'cutoff_khz': cutoff_khz, 'transfer': transfer})
 
             result.scanned += 1
             fname = os.path.basename(fpath)
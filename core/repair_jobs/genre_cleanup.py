@@ -68,6 +68,7 @@ class GenreCleanupJob(RepairJob):
     default_enabled = True
     default_interval_hours = 24 * 7
     auto_fix = False
+    lane = 'db'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
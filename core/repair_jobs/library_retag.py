@@ -270,6 +270,7 @@ class LibraryRetagJob(RepairJob):
         'source': ['auto', 'spotify', 'itunes', 'deezer', 'musicbrainz'],
     }
     auto_fix = True
+    lane = 'io'  # reads tags of files the other io jobs move; applying rewrites them
 
     def _get_settings(self, context: JobContext) -> dict:
         merged = dict(self.default_settings)
@@ -94,6 +94,7 @@ class LiveCommentaryCleanerJob(RepairJob):
         'scope': 'tracks',  # 'tracks' or 'albums'
     }
     auto_fix = False
+    lane = 'db'
 
     def _get_settings(self, context: JobContext) -> dict:
         if not context.config_manager:
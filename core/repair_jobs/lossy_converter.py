@@ -69,6 +69,7 @@ class LossyConverterJob(RepairJob):
         'delete_original': False,  # Blasphemy Mode — delete FLAC after conversion
     }
     auto_fix = False
+    lane = 'io'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
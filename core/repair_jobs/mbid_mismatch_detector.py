@@ -321,6 +321,7 @@ class MbidMismatchDetectorJob(RepairJob):
         'similarity_threshold': 0.55,
     }
     auto_fix = False
+    lane = 'network'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
@@ -31,6 +31,7 @@ class MetadataGapFillerJob(RepairJob):
         'fill_musicbrainz_id': True,
     }
     auto_fix = False
+    lane = 'network'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
@@ -51,6 +51,7 @@ class MissingLyricsJob(RepairJob):
     default_interval_hours = 48
     default_settings = {}
     auto_fix = False
+    lane = 'network'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
@@ -31,6 +31,7 @@ class OrphanFileDetectorJob(RepairJob):
     default_interval_hours = 24
     default_settings = {}
     auto_fix = False
+    lane = 'io'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
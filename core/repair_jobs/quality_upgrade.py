@@ -449,6 +449,7 @@ class QualityUpgradeJob(RepairJob):
     default_settings = {'scope': 'all', 'min_confidence': 0.7, 'deep_audio_verify': False}
     setting_options = {'scope': ['all', 'watchlist'], 'deep_audio_verify': [True, False]}
     auto_fix = False
+    lane = 'network'
 
     def _get_settings(self, context: JobContext) -> Dict[str, Any]:
         merged = dict(self.default_settings)
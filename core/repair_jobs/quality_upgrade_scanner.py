@@ -126,6 +126,7 @@ class QualityUpgradeScannerJob(RepairJob):
     setting_options = {'library_tracks_only': [True, False],
                        'deep_audio_verify': [True, False]}
     auto_fix = False  # User chooses fix action per finding
+    lane = 'cpu'
 
     def _load_dismissed_findings(self, db):
         """Two lookups — by track id and by file path, mirroring the OR in
@@ -93,6 +93,7 @@ class ReplayGainFillerJob(RepairJob):
         'rescan_existing': False,
     }
     auto_fix = False
+    lane = 'io'  # reads RG tags of files the other io jobs move; applying writes them
 
     # Flood guard for rescan_existing: a whole library re-flag lands in batches
     # of this many findings per scan run (the cap is LOGGED, never silent).
@@ -80,6 +80,7 @@ class ShortPreviewTrackJob(RepairJob):
     }
     setting_options: Dict[str, list] = {}
     auto_fix = False
+    lane = 'network'
 
     def _setting_bool(self, context: JobContext, key: str, default: bool) -> bool:
         cm = getattr(context, "config_manager", None)
@@ -37,6 +37,7 @@ class SingleAlbumDedupJob(RepairJob):
         'artist_similarity': 0.80,
     }
     auto_fix = False
+    lane = 'db'
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
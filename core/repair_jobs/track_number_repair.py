@@ -66,6 +66,7 @@ class TrackNumberRepairJob(RepairJob):
         'dry_run': True,
     }
     auto_fix = True
+    lane = 'io'  # auto-fix rewrites track tags and renames files
 
     def scan(self, context: JobContext) -> JobResult:
         result = JobResult()
@@ -53,6 +53,7 @@ class UnknownArtistFixerJob(RepairJob):
         'reorganize_files': True,
     }
     auto_fix = True
+    lane = 'io'  # auto-fix re-tags and moves files into the right artist folder
 
     def estimate_scope(self, context: JobContext) -> int:
         try:
@@ -4,6 +4,12 @@ Rotates through registered repair jobs (track number repair, AcoustID scanner,
 duplicate detection, etc.) based on staleness-priority scheduling. Each job
 is independently configurable and can be enabled/disabled by the user.
 
+Jobs are grouped into lanes by what they wait on (``db``, ``io``, ``cpu``,
+``network`` — see ``RepairJob.lane``); each lane runs its own due jobs with its
+own concurrency, so a long decode scan never blocks a quick database sweep.
+Jobs that save a resume cursor (``JobContext.save_checkpoint``) continue where
+they stopped after a restart.
+
 The worker is deactivated by default — the user must explicitly enable it.
 """
 
@@ -16,6 +22,7 @@ import sqlite3
 import threading
 import time
 import uuid
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
@@ -27,13 +34,29 @@ from core.metadata_service import (
 )
 from core.library.path_resolver import resolve_library_file_path
 from core.repair_jobs import get_all_jobs
-from core.repair_jobs.base import JobContext, JobResult, RepairJob
+from core.repair_jobs.base import JOB_LANES, JobContext, JobResult, RepairJob
 from utils.logging_config import get_logger
 
 logger = get_logger("repair_worker")
 
 AUDIO_EXTENSIONS = {'.mp3', '.flac', '.ogg', '.opus', '.m4a', '.aac', '.wav', '.wma', '.aiff', '.aif'}
 
+# Upper bound for ``repair.lane_concurrency.<lane>`` (default 1 per lane;
+# ``io`` is fixed at 1).
+_MAX_LANE_CONCURRENCY = 4
+
+
+@dataclass
+class _ActiveRun:
+    """A job the worker is executing right now — at most one per job id."""
+    job_id: str
+    display_name: str
+    lane: str
+    forced: bool = False
+    cancel: threading.Event = field(default_factory=threading.Event)
+    progress: Dict[str, int] = field(default_factory=lambda: {'scanned': 0, 'total': 0, 'percent': 0})
+    thread: Optional[threading.Thread] = None
+
 
 def _album_fill_artist_names_match(expected_artist: str, candidate_artist: str) -> bool:
     """Strict artist gate for Album Completeness auto-fill.
@@ -135,8 +158,9 @@ def _resolve_file_path(file_path, transfer_folder, download_folder=None,
 class RepairWorker:
     """Multi-job background maintenance worker.
 
-    Rotates through enabled repair jobs using staleness-priority scheduling.
-    Deactivated by default — user must enable via the management modal.
+    Rotates through enabled repair jobs using staleness-priority scheduling,
+    one lane at a time per free slot. Deactivated by default — user must enable
+    via the management modal.
     """
 
     def __init__(self, database, transfer_folder: str = None):
@@ -154,7 +178,14 @@ class RepairWorker:
         self._cancel_current_job = threading.Event()
         self.thread = None
 
-        # Current job being executed
+        # Jobs executing right now, by job id — each on its own thread inside
+        # its lane. _wake nudges the dispatcher when a run ends or Run Now is
+        # pressed, instead of it waiting out its poll interval.
+        self._active: Dict[str, _ActiveRun] = {}
+        self._active_lock = threading.Lock()
+        self._wake = threading.Event()
+
+        # Most recently started of the active jobs (single-job status/tooltip)
         self._current_job_id = None
         self._current_job_name = None
         self._current_progress = {'scanned': 0, 'total': 0, 'percent': 0}
@@ -340,7 +371,13 @@ class RepairWorker:
         """
         was_running = False
         dequeued = False
-        if self._current_job_id == job_id:
+        with self._active_lock:
+            run = self._active.get(job_id)
+        if run is not None:
+            run.cancel.set()
+            was_running = True
+            logger.info("Stop requested for running job %s", job_id)
+        elif self._current_job_id == job_id:
             self._cancel_current_job.set()
             was_running = True
             logger.info("Stop requested for running job %s", job_id)
@@ -418,7 +455,8 @@ class RepairWorker:
                 'setting_options': dict(getattr(job, 'setting_options', {}) or {}),
                 'last_run': last_run,
                 'next_run': next_run,
-                'is_running': self._current_job_id == job_id,
+                'is_running': job_id in self._active or self._current_job_id == job_id,
+                'lane': self._job_lane(job_id),
                 'pending_findings_count': pending_by_job.get(job_id, 0),
             })
         return jobs_info
@@ -464,6 +502,7 @@ class RepairWorker:
         self.should_stop = True
         self.running = False
         self._stop_event.set()
+        self._wake.set()
         self._bulk_fix_stop_event.set()  # halt a background Fix All too
         if self.thread:
             self.thread.join(timeout=2)
@@ -521,9 +560,12 @@ class RepairWorker:
     # ------------------------------------------------------------------
     def get_stats(self) -> Dict[str, Any]:
         is_actually_running = self.running and (self.thread is not None and self.thread.is_alive())
+        with self._active_lock:
+            active = list(self._active.values())
         is_idle = (
             is_actually_running
             and self.enabled
+            and not active
             and self._current_job_id is None
         )
 
@@ -540,6 +582,15 @@ class RepairWorker:
             'findings_pending': findings_pending,
             'stats': self.stats.copy(),
             'progress': self._get_progress(),
+            'running_jobs': [{
+                'job_id': run.job_id,
+                'display_name': run.display_name,
+                'lane': run.lane,
+                'progress': run.progress.copy(),
+            } for run in active],
+            'lanes': {lane: {'slots': self._lane_slots(lane),
+                             'running': [run.job_id for run in active if run.lane == lane]}
+                      for lane in JOB_LANES},
         }
 
         if self._current_job_id:
@@ -581,53 +632,102 @@ class RepairWorker:
         self._ensure_jobs_loaded()
 
         while not self._stop_event.is_set():
+            self._wake.clear()
             try:
-                # Check force-run queue even when disabled (user explicitly requested)
-                forced_job = None
-                with self._force_run_lock:
-                    if self._force_run_queue:
-                        forced_job = self._force_run_queue.pop(0)
-
-                if forced_job:
-                    self._run_job(forced_job, forced=True)
-                    if self._sleep_or_stop(2):
-                        break
-                    continue
-
-                if not self.enabled:
-                    self._current_job_id = None
-                    self._current_job_name = None
-                    if self._sleep_or_stop(2):
-                        break
-                    continue
-
-                # Find the next job to run based on staleness
-                next_job = self._pick_next_job()
-
-                if not next_job:
-                    # Nothing due — sleep and re-check
-                    self._current_job_id = None
-                    self._current_job_name = None
-                    if self._sleep_or_stop(10):
-                        break
-                    continue
-
-                # Run the selected job
-                self._run_job(next_job)
-
-                # Brief pause between jobs
-                if self._sleep_or_stop(5):
-                    break
-
+                self._dispatch()
             except Exception as e:
                 logger.error("Error in repair worker loop: %s", e, exc_info=True)
-                self._current_job_id = None
-                self._current_job_name = None
                 if self._sleep_or_stop(30):
                     break
+                continue
+            # Re-check as soon as a run ends or Run Now is pressed; otherwise
+            # poll for newly-due jobs.
+            self._wake.wait(10)
 
         logger.info("Repair worker thread finished")
 
+    # ------------------------------------------------------------------
+    # Lanes
+    # ------------------------------------------------------------------
+    def _job_lane(self, job_id: str) -> str:
+        lane = getattr(self._jobs.get(job_id), 'lane', 'io')
+        return lane if lane in JOB_LANES else 'io'
+
+    def _lane_slots(self, lane: str) -> int:
+        """How many jobs ``lane`` may run at once (``repair.lane_concurrency.<lane>``).
+        ``io`` is always one: its jobs move, rename and rewrite the same files."""
+        if lane == 'io':
+            return 1
+        value = 1
+        if self._config_manager:
+            try:
+                value = int(self._config_manager.get(f'repair.lane_concurrency.{lane}', 1) or 1)
+            except (TypeError, ValueError):
+                value = 1
+        return max(1, min(value, _MAX_LANE_CONCURRENCY))
+
+    def _lane_has_room(self, lane: str) -> bool:
+        with self._active_lock:
+            busy = sum(1 for run in self._active.values() if run.lane == lane)
+        return busy < self._lane_slots(lane)
+
+    def _dispatch(self) -> int:
+        """Start everything that can run now: queued Run Now jobs first (even
+        while the worker is disabled — the user asked), then, if enabled, the
+        stalest due job for each free lane slot. Returns how many started."""
+        started = 0
+        with self._force_run_lock:
+            queued = list(self._force_run_queue)
+        for job_id in queued:
+            if job_id in self._active or not self._lane_has_room(self._job_lane(job_id)):
+                continue  # stays queued until it (or its lane) is free
+            with self._force_run_lock:
+                if job_id not in self._force_run_queue:
+                    continue  # stopped while we looked
+                self._force_run_queue.remove(job_id)
+            self._start_run(job_id, forced=True)
+            started += 1
+
+        if not self.enabled:
+            return started
+
+        for lane in JOB_LANES:
+            while self._lane_has_room(lane):
+                with self._force_run_lock:
+                    busy = set(self._active) | set(self._force_run_queue)
+                job_id = self._pick_next_job(lane=lane, exclude=busy)
+                if not job_id:
+                    break
+                self._start_run(job_id)
+                started += 1
+        return started
+
+    def _start_run(self, job_id: str, forced: bool = False):
+        job = self._jobs.get(job_id)
+        if not job:
+            return
+        run = _ActiveRun(job_id=job_id, display_name=job.display_name,
+                         lane=self._job_lane(job_id), forced=forced)
+        with self._active_lock:
+            self._active[job_id] = run
+        run.thread = threading.Thread(target=self._run_job, args=(job_id, forced, run),
+                                      daemon=True, name=f'repair-{run.lane}-{job_id}')
+        run.thread.start()
+
+    def _refresh_current_job(self):
+        """Point the single-job status fields at the newest active run."""
+        with self._active_lock:
+            run = next(reversed(self._active.values()), None)
+        if run is None:
+            self._current_job_id = None
+            self._current_job_name = None
+            self._current_progress = {'scanned': 0, 'total': 0, 'percent': 0}
+            return
+        self._current_job_id = run.job_id
+        self._current_job_name = run.display_name
+        self._current_progress = run.progress
+        self._cancel_current_job = run.cancel
+
     @staticmethod
     def _hours_since(finished_at_iso: str, now_utc: datetime) -> float:
         """Hours between a stored ``finished_at`` and ``now_utc``, both in UTC.
@@ -644,17 +744,25 @@ class RepairWorker:
             dt = dt.replace(tzinfo=timezone.utc)
         return (now_utc - dt).total_seconds() / 3600
 
-    def _pick_next_job(self) -> Optional[str]:
+    def _pick_next_job(self, lane: Optional[str] = None, exclude=()) -> Optional[str]:
         """Pick the next job to run based on staleness priority.
 
         Returns job_id of the stalest job whose interval has elapsed,
-        or None if nothing is due.
+        or None if nothing is due. ``lane`` limits the choice to one lane;
+        ``exclude`` skips jobs that are already running or queued. A job whose
+        last run was interrupted mid-scan (it left a resume checkpoint) is due
+        straight away so it can finish.
         """
         now = datetime.now(timezone.utc)
         best_job_id = None
         best_staleness = -1
+        resumable = self._resumable_jobs()
 
         for job_id, _job in self._jobs.items():
+            if job_id in exclude:
+                continue
+            if lane is not None and self._job_lane(job_id) != lane:
+                continue
             config = self.get_job_config(job_id)
             if not config['enabled']:
                 continue
@@ -663,6 +771,11 @@ class RepairWorker:
             if not interval_hours or interval_hours <= 0:
                 continue  # Skip jobs with invalid interval
 
+            if job_id in resumable:
+                best_job_id = job_id
+                best_staleness = float('inf')
+                continue
+
             last_run = self._get_last_run(job_id)
 
             if not last_run or not last_run.get('finished_at'):
@@ -688,23 +801,37 @@ class RepairWorker:
 
         return best_job_id
 
-    def _run_job(self, job_id: str, forced: bool = False):
+    def _run_job(self, job_id: str, forced: bool = False, run: Optional[_ActiveRun] = None):
         """Execute a single job and record the run.
 
         When forced=True, the user explicitly triggered this via "Run Now" —
         the job runs even if the master worker is paused, and wait_if_paused()
-        does not block.
+        does not block. ``run`` is the slot _start_run reserved for it; called
+        directly, the job registers its own.
         """
         job = self._jobs.get(job_id)
         if not job:
             return
+        if run is None:
+            run = _ActiveRun(job_id=job_id, display_name=job.display_name,
+                             lane=self._job_lane(job_id), forced=forced)
+            with self._active_lock:
+                self._active[job_id] = run
+        try:
+            self._execute_run(job, run)
+        finally:
+            with self._active_lock:
+                self._active.pop(job_id, None)
+            self._refresh_current_job()
+            self._wake.set()
 
-        logger.info("Starting job: %s (%s)", job.display_name, job_id)
+    def _execute_run(self, job: RepairJob, run: _ActiveRun):
+        job_id = run.job_id
+        forced = run.forced
+        logger.info("Starting job: %s (%s) [%s lane]", job.display_name, job_id, run.lane)
 
-        self._current_job_id = job_id
-        self._current_job_name = job.display_name
-        self._current_progress = {'scanned': 0, 'total': 0, 'percent': 0}
-        self._cancel_current_job.clear()   # fresh per run — a prior stop must not leak here
+        # Each run has its own cancel event — a prior stop must not leak here
+        self._refresh_current_job()
 
         # Re-read transfer path — prefer config_manager (same source as web_server)
         if self._config_manager:
@@ -742,29 +869,38 @@ class RepairWorker:
             acoustid_client=self.acoustid_client,
             metadata_cache=self.metadata_cache,
             create_finding=self._create_finding,
-            should_stop=lambda: self.should_stop or self._cancel_current_job.is_set(),
+            should_stop=lambda: self.should_stop or run.cancel.is_set(),
             stop_event=self._stop_event,
             is_paused=(lambda: False) if forced else (lambda: not self.enabled),
-            update_progress=self._update_progress,
+            update_progress=lambda scanned, total: self._update_progress(scanned, total, run),
             report_progress=_report_progress,
+            checkpoint=self._load_checkpoint(job_id),
+            persist_checkpoint=lambda cursor: self._store_checkpoint(job_id, cursor),
         )
+        resumed = context.checkpoint is not None
+        if resumed:
+            logger.info("Job %s resuming from its last checkpoint", job_id)
 
         start_time = time.time()
         result = JobResult()
+        failed = False
 
         try:
             result = job.scan(context)
         except Exception as e:
             logger.error("Job %s failed: %s", job_id, e, exc_info=True)
             result.errors += 1
+            failed = True
 
         duration = time.time() - start_time
+        self._settle_checkpoint(job_id, context, failed, resumed)
 
-        # Update aggregate stats
-        self.stats['scanned'] += result.scanned
-        self.stats['repaired'] += result.auto_fixed
-        self.stats['skipped'] += result.skipped
-        self.stats['errors'] += result.errors
+        # Update aggregate stats (lanes finish concurrently)
+        with self._active_lock:
+            self.stats['scanned'] += result.scanned
+            self.stats['repaired'] += result.auto_fixed
+            self.stats['skipped'] += result.skipped
+            self.stats['errors'] += result.errors
 
         # Record job completion
         self._record_job_finish(run_id, job_id, result, duration)
@@ -795,9 +931,71 @@ class RepairWorker:
             result.findings_created, result.errors, duration
         )
 
-        self._current_job_id = None
-        self._current_job_name = None
-        self._current_progress = {'scanned': 0, 'total': 0, 'percent': 0}
+    # ------------------------------------------------------------------
+    # Resume checkpoints
+    # ------------------------------------------------------------------
+    def _load_checkpoint(self, job_id: str) -> Optional[dict]:
+        conn = None
+        try:
+            conn = self.db._get_connection()
+            row = conn.execute("SELECT cursor_json FROM repair_job_checkpoints WHERE job_id = ?",
+                               (job_id,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.debug("Error loading checkpoint for %s: %s", job_id, e)
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    def _store_checkpoint(self, job_id: str, cursor: Optional[dict], parked: bool = False):
+        """Persist (or, with ``cursor=None``, drop) a job's resume cursor."""
+        conn = None
+        try:
+            conn = self.db._get_connection()
+            if cursor is None:
+                conn.execute("DELETE FROM repair_job_checkpoints WHERE job_id = ?", (job_id,))
+            else:
+                conn.execute("""
+                    INSERT INTO repair_job_checkpoints (job_id, cursor_json, parked, updated_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(job_id) DO UPDATE SET cursor_json = excluded.cursor_json,
+                        parked = excluded.parked, updated_at = excluded.updated_at
+                """, (job_id, json.dumps(cursor), 1 if parked else 0))
+            conn.commit()
+        except Exception as e:
+            logger.debug("Error saving checkpoint for %s: %s", job_id, e)
+        finally:
+            if conn:
+                conn.close()
+
+    def _resumable_jobs(self) -> set:
+        """Jobs whose last run was cut short by a shutdown/crash (not by the user)."""
+        conn = None
+        try:
+            conn = self.db._get_connection()
+            rows = conn.execute("SELECT job_id FROM repair_job_checkpoints WHERE parked = 0").fetchall()
+            return {row[0] for row in rows}
+        except Exception:
+            return set()
+        finally:
+            if conn:
+                conn.close()
+
+    def _settle_checkpoint(self, job_id: str, context: JobContext, failed: bool, resumed: bool):
+        """After a scan returns: a finished scan drops its cursor; an interrupted
+        one keeps the latest (flushing past save_checkpoint's throttle). A user
+        stop parks it for the job's next regular run, a shutdown leaves it due
+        as soon as the worker is back. A scan that raised starts over, so a
+        poisoned item can't fail the same resume forever."""
+        interrupted = not failed and context.check_stop()
+        if not interrupted:
+            if resumed or context.checkpoint is not None:
+                self._store_checkpoint(job_id, None)
+            return
+        if context.checkpoint is not None:
+            shutting_down = self.should_stop or self._stop_event.is_set()
+            self._store_checkpoint(job_id, context.checkpoint, parked=not shutting_down)
 
     def _sleep_or_stop(self, seconds: float, step: float = 0.2) -> bool:
         """Sleep in small chunks so shutdown interrupts quickly."""
@@ -813,8 +1011,9 @@ class RepairWorker:
     def run_job_now(self, job_id: str):
         """Queue a job for immediate execution by the main worker loop.
 
-        Uses a thread-safe queue instead of spawning a separate thread
-        to avoid race conditions with the main loop's _run_job().
+        Uses a thread-safe queue instead of spawning a separate thread, so
+        the dispatcher starts it (once its lane has a free slot) and the same
+        job never runs twice at once.
         """
         self._ensure_jobs_loaded()
         if job_id not in self._jobs:
@@ -825,15 +1024,20 @@ class RepairWorker:
             if job_id not in self._force_run_queue:
                 self._force_run_queue.append(job_id)
                 logger.info("Job %s queued for immediate run", job_id)
+        self._wake.set()
 
-    def _update_progress(self, scanned: int, total: int):
+    def _update_progress(self, scanned: int, total: int, run: Optional[_ActiveRun] = None):
         """Callback for jobs to report progress."""
         percent = round(scanned / total * 100) if total > 0 else 0
-        self._current_progress = {
+        progress = {
             'scanned': scanned,
             'total': total,
             'percent': percent,
         }
+        if run is None:
+            self._current_progress = progress
+        else:
+            run.progress.update(progress)  # _current_progress may alias it
 
     # ------------------------------------------------------------------
     # Findings
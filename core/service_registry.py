@@ -0,0 +1,194 @@
+"""Lazy registry for optional provider clients and enrichment workers.
+
+web_server used to import every worker module at the top of the file and
+construct + start every enrichment worker at import time — including ones
+the user has switched off (Amazon ships paused, a paused worker still gets a
+thread, a DB handle and its client). :class:`ServiceRegistry` holds a recipe
+per service instead:
+
+  · ``module`` / ``attr`` name the class (or factory) — nothing is imported
+    until the service is first needed
+  · ``build`` turns it into the live object (construct, apply the persisted
+    pause flag, start its thread)
+  · ``enabled`` decides whether :meth:`ServiceRegistry.boot` builds it at
+    startup (not paused, credentials present, opted in); a service left out
+    is built on first :meth:`get` (a resume click, a manual match) or by
+    :meth:`refresh` once its settings are saved, and announced to
+    ``on_built`` listeners so hosts can rebind their handles
+
+The host calls :meth:`boot` when its runtime starts, not at import, so
+importing the host (tests, CLI tools) never constructs a worker.
+
+Every build records its import and construction time and the RSS the
+process grew by while it ran (best-effort — other threads allocate too), so
+``report()`` shows what each service actually costs at boot.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logging_config import get_logger
+
+logger = get_logger("service_registry")
+
+
+def _rss_kb() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as fh:
+            return int(fh.read().split()[1]) * (os.sysconf("SC_PAGE_SIZE") // 1024)
+    except Exception:   # noqa: BLE001 - no /proc (macOS/Windows): memory attribution stays None
+        return None
+
+
+@dataclass
+class LazyService:
+    name: str
+    module: str
+    attr: str
+    build: Callable[[Any], Any]
+    enabled: Callable[[], bool] = lambda: True
+    kind: str = "worker"
+    instance: Any = None
+    state: str = "registered"          # registered | deferred | built | failed
+    error: Optional[str] = None
+    import_ms: Optional[float] = None
+    init_ms: Optional[float] = None
+    rss_kb: Optional[int] = None
+    modules_loaded: Optional[int] = None
+    built_at: Optional[float] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "kind": self.kind, "module": self.module, "state": self.state,
+                "error": self.error, "import_ms": self.import_ms, "init_ms": self.init_ms,
+                "rss_kb": self.rss_kb, "modules_loaded": self.modules_loaded,
+                "built_at": self.built_at}
+
+
+class ServiceRegistry:
+    def __init__(self):
+        self._services: Dict[str, LazyService] = {}
+        self._listeners: List[Callable[[str, Any], None]] = []
+        self._boot_ms: Optional[float] = None
+        self._booted = False
+
+    def register(self, name: str, module: str, attr: str, build: Callable[[Any], Any], *,
+                 enabled: Optional[Callable[[], bool]] = None, kind: str = "worker") -> LazyService:
+        service = LazyService(name=name, module=module, attr=attr, build=build, kind=kind,
+                              enabled=enabled or (lambda: True))
+        self._services[name] = service
+        return service
+
+    def on_built(self, listener: Callable[[str, Any], None]) -> None:
+        """Call ``listener(name, instance)`` after every successful build."""
+        self._listeners.append(listener)
+
+    def names(self) -> List[str]:
+        return list(self._services)
+
+    def peek(self, name: str) -> Any:
+        """The live instance if it has been built, else None. Never builds."""
+        service = self._services.get(name)
+        return service.instance if service is not None else None
+
+    def get(self, name: str) -> Any:
+        """The live instance, importing and building it on first call.
+        Returns None if the service is unknown or its build failed."""
+        service = self._services.get(name)
+        if service is None:
+            return None
+        if service.instance is not None or service.state == "failed":
+            return service.instance
+        with service.lock:
+            if service.instance is None and service.state != "failed":
+                self._build(service)
+        return service.instance
+
+    def _build(self, service: LazyService) -> None:
+        rss_before = _rss_kb()
+        modules_before = len(sys.modules)
+        started = time.perf_counter()
+        try:
+            target = getattr(importlib.import_module(service.module), service.attr)
+            imported = time.perf_counter()
+            instance = service.build(target)
+        except Exception as e:
+            service.state = "failed"
+            service.error = str(e)
+            logger.error("%s initialization failed: %s", service.name, e)
+            return
+        finished = time.perf_counter()
+        rss_after = _rss_kb()
+        service.import_ms = round((imported - started) * 1000, 2)
+        service.init_ms = round((finished - imported) * 1000, 2)
+        service.rss_kb = (rss_after - rss_before) if rss_before is not None and rss_after is not None else None
+        service.modules_loaded = len(sys.modules) - modules_before
+        service.built_at = time.time()
+        service.instance = instance
+        service.state = "built"
+        for listener in list(self._listeners):
+            try:
+                listener(service.name, instance)
+            except Exception as e:
+                logger.debug("service listener failed for %s: %s", service.name, e)
+
+    def boot(self) -> Dict[str, Any]:
+        """Build every service whose ``enabled()`` is true now; the rest stay
+        deferred until something calls :meth:`get` or :meth:`refresh`."""
+        started = time.perf_counter()
+        self._build_enabled()
+        self._booted = True
+        self._boot_ms = round((time.perf_counter() - started) * 1000, 2)
+        return self.report()
+
+    def refresh(self) -> List[str]:
+        """After a settings change: build the deferred services whose
+        ``enabled()`` has turned true. No-op before :meth:`boot`."""
+        if not self._booted:
+            return []
+        return self._build_enabled()
+
+    def _build_enabled(self) -> List[str]:
+        built = []
+        for service in list(self._services.values()):
+            if service.instance is not None:
+                continue
+            try:
+                wanted = bool(service.enabled())
+            except Exception as e:
+                logger.debug("enabled check failed for %s: %s", service.name, e)
+                wanted = True
+            if wanted:
+                if self.get(service.name) is not None:
+                    built.append(service.name)
+            elif service.state != "failed":
+                service.state = "deferred"
+        return built
+
+    def report(self) -> Dict[str, Any]:
+        rows = [s.as_dict() for s in self._services.values()]
+        built = [r for r in rows if r["state"] == "built"]
+        return {
+            "boot_ms": self._boot_ms,
+            "built": len(built),
+            "deferred": sum(1 for r in rows if r["state"] == "deferred"),
+            "failed": sum(1 for r in rows if r["state"] == "failed"),
+            "total_import_ms": round(sum(r["import_ms"] or 0 for r in built), 2),
+            "total_init_ms": round(sum(r["init_ms"] or 0 for r in built), 2),
+            "total_rss_kb": sum(r["rss_kb"] or 0 for r in built),
+            "services": sorted(rows, key=lambda r: -((r["import_ms"] or 0) + (r["init_ms"] or 0))),
+        }
+
+
+_registry = ServiceRegistry()
+
+
+def get_service_registry() -> ServiceRegistry:
+    return _registry
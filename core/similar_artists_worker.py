@@ -241,6 +241,7 @@ class SimilarArtistsWorker:
                 self._mark(artist['id'], status)
                 if status == 'matched':
                     self.stats['matched'] += 1
+                    self._note_graph_change()
                     logger.debug("Similar artists: %s → stored %d", artist['name'], count)
                 elif status == 'not_found':
                     self.stats['not_found'] += 1
@@ -303,6 +304,14 @@ class SimilarArtistsWorker:
             logger.debug("Similar Artists _get_next_artist failed: %s", exc)
             return None
 
+    def _note_graph_change(self):
+        """Let the artist-graph snapshots refresh in the background (debounced there)."""
+        try:
+            from core.graph.snapshots import get_snapshot_store
+            get_snapshot_store().note_similar_artists_changed(self.profile_id)
+        except Exception as exc:
+            logger.debug("Graph snapshot refresh hint failed: %s", exc)
+
     def _mark(self, artist_id, status: str):
         try:
             conn = self.db._get_connection()
@@ -19,6 +19,7 @@ import subprocess
 import threading
 import contextlib
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
@@ -30,6 +31,7 @@ except ImportError:
     tidalapi = None
 
 import requests as http_requests
+from requests.adapters import HTTPAdapter
 
 from utils.logging_config import get_logger
 from config.settings import config_manager
@@ -195,6 +197,10 @@ def _looks_like_json_decode_error(exc: Exception) -> bool:
     )
 
 
+class _SegmentFetchAborted(Exception):
+    """Shutdown or user cancel interrupted a segment download."""
+
+
 class TidalDownloadClient(DownloadSourcePlugin):
     """
     Tidal download client using tidalapi.
@@ -1088,29 +1094,9 @@ class TidalDownloadClient(DownloadSourcePlugin):
                 if self._engine is not None:
                     self._engine.update_record('tidal', download_id, {'size': 0})
 
+                segment_urls = ([init_uri] if init_uri else []) + list(segment_uris)
                 with intermediate_path.open('wb') as output_file:
-                    if init_uri:
-                        if self.shutdown_check and self.shutdown_check():
-                            logger.info("Shutdown detected, aborting Tidal download")
-                            intermediate_path.unlink(missing_ok=True)
-                            return None
-
-                        logger.debug(f"Downloading init segment: {init_uri}")
-                        init_data = self._download_segment_with_retry(init_uri)
-                        output_file.write(init_data)
-                        downloaded += len(init_data)
-                        segments_completed += 1
-
-                        self._update_download_progress(download_id, downloaded,
-                                                       segments_completed, total_segments, speed_start)
-
-                    for segment_url in segment_uris:
-                        if self.shutdown_check and self.shutdown_check():
-                            logger.info("Shutdown detected, aborting Tidal download")
-                            intermediate_path.unlink(missing_ok=True)
-                            return None
-
-                        segment_data = self._download_segment_with_retry(segment_url)
+                    for segment_data in self._iter_segments_in_order(segment_urls, download_id):
                         output_file.write(segment_data)
                         downloaded += len(segment_data)
                         segments_completed += 1
@@ -1118,6 +1104,10 @@ class TidalDownloadClient(DownloadSourcePlugin):
                         self._update_download_progress(download_id, downloaded,
                                                        segments_completed, total_segments, speed_start)
 
+            except _SegmentFetchAborted as e:
+                logger.info(f"{e}, aborting Tidal download")
+                intermediate_path.unlink(missing_ok=True)
+                return None
             except Exception as e:
                 logger.warning(f"Download failed at quality {q_key}: {e}")
                 intermediate_path.unlink(missing_ok=True)
@@ -1156,12 +1146,75 @@ class TidalDownloadClient(DownloadSourcePlugin):
         logger.error(f"All quality tiers exhausted for '{display_name}'")
         return None
 
+    def _segment_window(self) -> int:
+        try:
+            window = int(config_manager.get('tidal_download.segment_concurrency', 4))
+        except (TypeError, ValueError):
+            window = 4
+        return max(1, min(window, 16))
+
+    def _segment_session(self) -> http_requests.Session:
+        """Keep-alive session shared by segment fetches, pooled wide enough
+        for every in-flight request of the fetch window."""
+        session = getattr(self, '_segment_http', None)
+        if session is None:
+            session = http_requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._segment_http = session
+        return session
+
+    def _check_segment_abort(self, download_id: Optional[str]) -> None:
+        if self.shutdown_check and self.shutdown_check():
+            raise _SegmentFetchAborted("Shutdown detected")
+        if download_id is not None and self._engine is not None:
+            record = self._engine.get_record('tidal', download_id)
+            if record is not None and record.get('state') == 'Cancelled':
+                raise _SegmentFetchAborted("Download cancelled")
+
+    def _iter_segments_in_order(self, urls: List[str], download_id: Optional[str] = None):
+        """Yield segment bodies in playlist order while keeping up to
+        ``tidal_download.segment_concurrency`` requests in flight.
+
+        Segments finish out of order; each finished future waits in the
+        window until everything before it has been yielded, so the caller
+        can write straight to the output file. Shutdown and cancellation
+        are checked before every submit and every yield and raise
+        ``_SegmentFetchAborted``; whatever is still queued is dropped.
+        """
+        window = self._segment_window()
+        if window <= 1 or len(urls) <= 1:
+            for url in urls:
+                self._check_segment_abort(download_id)
+                yield self._download_segment_with_retry(url)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(window, len(urls)),
+                                      thread_name_prefix='tidal-segment')
+        in_flight: Dict[int, Any] = {}
+        next_submit = 0
+        try:
+            for index in range(len(urls)):
+                while next_submit < len(urls) and next_submit < index + window:
+                    self._check_segment_abort(download_id)
+                    in_flight[next_submit] = executor.submit(
+                        self._download_segment_with_retry, urls[next_submit])
+                    next_submit += 1
+                data = in_flight.pop(index).result()
+                self._check_segment_abort(download_id)
+                yield data
+        finally:
+            for future in in_flight.values():
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _download_segment_with_retry(self, url: str) -> bytes:
         """Download a single HLS segment with 3 retries and 2s fixed backoff."""
         last_error = None
         for attempt in range(4):
             try:
-                resp = http_requests.get(url, allow_redirects=True, timeout=30)
+                resp = self._segment_session().get(url, allow_redirects=True, timeout=30)
                 resp.raise_for_status()
                 return resp.content
             except http_requests.exceptions.HTTPError as e:
@@ -744,6 +744,10 @@ def _recover_youtube(db_provider) -> None:
     YouTube rows are owned by their yt-dlp worker (not the slskd/client poll below), so
     this is their ONLY reliable recovery path once the process that owned them is gone."""
     try:
+        # No YouTube row in flight → nothing to re-adopt or pump; don't load yt-dlp for it.
+        if not any(d.get("source") == "youtube"
+                   for d in (db_provider().get_active_video_downloads() or [])):
+            return
         from core.video.youtube_download import recover_and_pump
         recovered, started = recover_and_pump(db_provider)
         if recovered or started:
@@ -20,12 +20,30 @@ def _int(val):
         return None
 
 
-class TMDBClient:
-    BASE = "https://api.themoviedb.org/3"
-    IMG = "https://image.tmdb.org/t/p/original"
+class _HTTPClient:
+    """GET plumbing shared by the provider clients. With an ``http`` cache
+    (build_clients passes the process-wide :class:`HTTPCache`) requests are
+    pooled and cached on disk; without one it's a bare ``requests.get``."""
+    SOURCE = ""
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, http=None):
         self.api_key = api_key or None
+        self.http = http
+
+    def _get(self, url, params=None, headers=None, timeout=15, cache=True):
+        if self.http is not None:
+            return self.http.get(self.SOURCE, url, params=params, headers=headers,
+                                 timeout=timeout, cache=cache)
+        import requests
+        if headers is not None:
+            return requests.get(url, headers=headers, params=params, timeout=timeout)
+        return requests.get(url, params=params, timeout=timeout)
+
+
+class TMDBClient(_HTTPClient):
+    SOURCE = "tmdb"
+    BASE = "https://api.themoviedb.org/3"
+    IMG = "https://image.tmdb.org/t/p/original"
 
     @property
     def enabled(self):
@@ -34,9 +52,9 @@ class TMDBClient:
     def test(self):
         if not self.api_key:
             return False, "No TMDB API key set"
-        import requests
         try:
-            r = requests.get(self.BASE + "/configuration", params={"api_key": self.api_key}, timeout=12)
+            r = self._get(self.BASE + "/configuration", params={"api_key": self.api_key}, timeout=12,
+                          cache=False)
             if r.status_code == 200:
                 return True, "TMDB connection OK"
             if r.status_code == 401:
@@ -49,7 +67,6 @@ class TMDBClient:
     def match(self, kind, title, year, known_id=None):
         if not self.api_key:
             return None
-        import requests
         # The server already knows the TMDB id → go straight to the details
         # fetch (accurate, one call). Otherwise fall back to a title/year search.
         tmdb_id = _int(known_id)
@@ -61,7 +78,7 @@ class TMDBClient:
             params = {"api_key": self.api_key, "query": title}
             if year:
                 params["year" if kind == "movie" else "first_air_date_year"] = year
-            resp = requests.get(self.BASE + path, params=params, timeout=15)
+            resp = self._get(self.BASE + path, params=params, timeout=15)
             # A non-200 (429 rate-limit, 5xx, timeout-as-error) is a FAILED call,
             # not "no match" — raise so the worker records 'error' (retried later)
             # instead of burning the item to 'not_found'.
@@ -79,7 +96,7 @@ class TMDBClient:
         # ~29% of shows with no status/network). A 404 = TMDB genuinely has nothing,
         # so keep what we have and let it settle.
         detail_path = "/movie/" if kind == "movie" else "/tv/"
-        _resp = requests.get(self.BASE + detail_path + str(tmdb_id),
+        _resp = self._get(self.BASE + detail_path + str(tmdb_id),
                              params={"api_key": self.api_key,
                                      "append_to_response": "external_ids,credits,images",
                                      "include_image_language": "en,null"},
@@ -157,9 +174,8 @@ class TMDBClient:
         call (429/5xx) so the route reports an error instead of 'no results'."""
         if not self.api_key or not (query or "").strip():
             return []
-        import requests
         path = "/search/movie" if kind == "movie" else "/search/tv"
-        r = requests.get(self.BASE + path,
+        r = self._get(self.BASE + path,
                          params={"api_key": self.api_key, "query": query.strip()}, timeout=15)
         r.raise_for_status()
         out = []
@@ -216,12 +232,11 @@ class TMDBClient:
         'where to watch' providers for a region, and similar titles."""
         if not self.api_key or tmdb_id is None:
             return {}
-        import requests
         path = ("/movie/" if kind == "movie" else "/tv/") + str(tmdb_id)
         # TV uses aggregate_credits (it carries per-actor episode counts); movies
         # use credits. One call (append_to_response) fetches everything.
         creds = "aggregate_credits" if kind == "show" else "credits"
-        r = requests.get(self.BASE + path, params={
+        r = self._get(self.BASE + path, params={
             "api_key": self.api_key, "include_image_language": "en,null",
             "append_to_response": "videos,watch/providers,similar,recommendations,images,keywords,reviews," + creds},
             timeout=15)
@@ -235,8 +250,7 @@ class TMDBClient:
         (theatrical / digital / physical). Feeds the 'is it downloadable yet' gate."""
         if not self.api_key or tmdb_id is None:
             return []
-        import requests
-        r = requests.get(self.BASE + "/movie/" + str(tmdb_id) + "/release_dates",
+        r = self._get(self.BASE + "/movie/" + str(tmdb_id) + "/release_dates",
                          params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         return (r.json() or {}).get("results") or []
@@ -247,9 +261,8 @@ class TMDBClient:
         English + textless posters first so the grid leads with clean covers."""
         if not self.api_key or tmdb_id is None:
             return []
-        import requests
         path = ("/movie/" if kind == "movie" else "/tv/") + str(tmdb_id) + "/images"
-        r = requests.get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
+        r = self._get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         out = []
         for p in (r.json() or {}).get("posters") or []:
@@ -267,9 +280,8 @@ class TMDBClient:
         Netflix-style billboard wordmark), or None. One light /images call."""
         if not self.api_key or tmdb_id is None:
             return None
-        import requests
         path = ("/movie/" if kind == "movie" else "/tv/") + str(tmdb_id) + "/images"
-        r = requests.get(self.BASE + path,
+        r = self._get(self.BASE + path,
                          params={"api_key": self.api_key,
                                  "include_image_language": "en,null"},
                          timeout=15)
@@ -457,8 +469,7 @@ class TMDBClient:
         """The films of a movie collection (franchise), ordered by release date."""
         if not self.api_key or collection_id is None:
             return []
-        import requests
-        r = requests.get(self.BASE + "/collection/" + str(collection_id),
+        r = self._get(self.BASE + "/collection/" + str(collection_id),
                          params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         out = []
@@ -479,10 +490,9 @@ class TMDBClient:
         list of title strings; best-effort ([] on any error / no key)."""
         if not self.api_key or tmdb_id is None:
             return []
-        import requests
         path = "/movie/" if kind == "movie" else "/tv/"
         try:
-            r = requests.get(self.BASE + path + str(tmdb_id) + "/alternative_titles",
+            r = self._get(self.BASE + path + str(tmdb_id) + "/alternative_titles",
                              params={"api_key": self.api_key}, timeout=12)
             r.raise_for_status()
             d = r.json() or {}
@@ -505,8 +515,7 @@ class TMDBClient:
         server lacked. Returns {'overview', 'episodes': [...]} or None."""
         if not self.api_key or tv_id is None or season_number is None:
             return None
-        import requests
-        r = requests.get(self.BASE + "/tv/" + str(tv_id) + "/season/" + str(season_number),
+        r = self._get(self.BASE + "/tv/" + str(tv_id) + "/season/" + str(season_number),
                          params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         data = r.json() or {}
@@ -530,8 +539,7 @@ class TMDBClient:
         episode expand. Returns {guest_stars, still_url, rating, overview, ...}."""
         if not self.api_key or tv_id is None:
             return None
-        import requests
-        r = requests.get(self.BASE + "/tv/%s/season/%s/episode/%s" % (tv_id, season_number, episode_number),
+        r = self._get(self.BASE + "/tv/%s/season/%s/episode/%s" % (tv_id, season_number, episode_number),
                          params={"api_key": self.api_key, "append_to_response": "credits"}, timeout=15)
         r.raise_for_status()
         d = r.json() or {}
@@ -549,8 +557,7 @@ class TMDBClient:
         everything resolves back into SoulSync."""
         if not self.api_key or not (query or "").strip():
             return []
-        import requests
-        r = requests.get(self.BASE + "/search/multi", params={
+        r = self._get(self.BASE + "/search/multi", params={
             "api_key": self.api_key, "query": query, "include_adult": "false"}, timeout=15)
         r.raise_for_status()
         out = []
@@ -581,8 +588,7 @@ class TMDBClient:
         tmdb_id, title, logo, origin_country}]. Companies aren't in /search/multi."""
         if not self.api_key or not (query or "").strip():
             return []
-        import requests
-        r = requests.get(self.BASE + "/search/company",
+        r = self._get(self.BASE + "/search/company",
                          params={"api_key": self.api_key, "query": query}, timeout=15)
         r.raise_for_status()
         out = []
@@ -599,8 +605,7 @@ class TMDBClient:
         origin_country, homepage}, or None if unknown."""
         if not self.api_key or company_id is None:
             return None
-        import requests
-        r = requests.get(self.BASE + "/company/" + str(company_id),
+        r = self._get(self.BASE + "/company/" + str(company_id),
                          params={"api_key": self.api_key}, timeout=15)
         if r.status_code == 404:
             return None
@@ -622,8 +627,7 @@ class TMDBClient:
         empty = {"results": [], "page": 1, "total_pages": 0, "total_results": 0}
         if not self.api_key or company_id is None:
             return empty
-        import requests
-        r = requests.get(self.BASE + "/discover/movie", params={
+        r = self._get(self.BASE + "/discover/movie", params={
             "api_key": self.api_key, "with_companies": str(company_id), "sort_by": sort,
             "page": max(1, min(500, int(page))), "include_adult": "false"}, timeout=15)
         r.raise_for_status()
@@ -649,11 +653,10 @@ class TMDBClient:
         Single-type endpoints omit media_type, so the kind is forced into _disc_map."""
         if not self.api_key:
             return []
-        import requests
         path = ("/trending/movie/" if kind == "movie"
                 else "/trending/tv/" if kind == "show"
                 else "/trending/all/") + window
-        r = requests.get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
+        r = self._get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         forced = kind if kind in ("movie", "show") else None
         return self._disc_map((r.json() or {}).get("results"), forced)[:20]
@@ -706,9 +709,8 @@ class TMDBClient:
         spec = self._CURATED.get(key)
         if not spec or not self.api_key:
             return []
-        import requests
         path, kind = spec
-        r = requests.get(self.BASE + path,
+        r = self._get(self.BASE + path,
                          params={"api_key": self.api_key, "page": page}, timeout=15)
         r.raise_for_status()
         return self._disc_map((r.json() or {}).get("results"), kind)
@@ -718,8 +720,7 @@ class TMDBClient:
         title art) or None. Powers context posters for franchise collections."""
         if not self.api_key or collection_id is None:
             return None
-        import requests
-        r = requests.get(self.BASE + "/collection/" + str(collection_id),
+        r = self._get(self.BASE + "/collection/" + str(collection_id),
                          params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         d = r.json() or {}
@@ -732,8 +733,7 @@ class TMDBClient:
         search hit, or None. Powers context posters for director collections."""
         if not self.api_key or not (name or "").strip():
             return None
-        import requests
-        r = requests.get(self.BASE + "/search/person",
+        r = self._get(self.BASE + "/search/person",
                          params={"api_key": self.api_key, "query": name,
                                  "include_adult": "false"}, timeout=15)
         r.raise_for_status()
@@ -747,8 +747,7 @@ class TMDBClient:
         with a logo, or None. Powers context posters for studio collections."""
         if not self.api_key or not (name or "").strip():
             return None
-        import requests
-        r = requests.get(self.BASE + "/search/company",
+        r = self._get(self.BASE + "/search/company",
                          params={"api_key": self.api_key, "query": name}, timeout=15)
         r.raise_for_status()
         for it in (r.json() or {}).get("results") or []:
@@ -762,8 +761,7 @@ class TMDBClient:
         Powers the keyless IMDb chart/list sources (tt-ids → TMDB)."""
         if not self.api_key or not (imdb_id or "").startswith("tt"):
             return None
-        import requests
-        r = requests.get(self.BASE + "/find/" + imdb_id,
+        r = self._get(self.BASE + "/find/" + imdb_id,
                          params={"api_key": self.api_key, "external_source": "imdb_id"},
                          timeout=15)
         r.raise_for_status()
@@ -784,8 +782,7 @@ class TMDBClient:
         change can't silently break the seasonal collections. None if no hit."""
         if not self.api_key or not (query or "").strip():
             return None
-        import requests
-        r = requests.get(self.BASE + "/search/keyword",
+        r = self._get(self.BASE + "/search/keyword",
                          params={"api_key": self.api_key, "query": query}, timeout=15)
         r.raise_for_status()
         results = (r.json() or {}).get("results") or []
@@ -800,8 +797,7 @@ class TMDBClient:
         Returns (items, total_pages)."""
         if not self.api_key or not list_id:
             return [], 0
-        import requests
-        r = requests.get(self.BASE + f"/list/{list_id}",
+        r = self._get(self.BASE + f"/list/{list_id}",
                          params={"api_key": self.api_key, "page": page}, timeout=15)
         r.raise_for_status()
         d = r.json() or {}
@@ -828,7 +824,6 @@ class TMDBClient:
           rails (computed relative to today)."""
         if not self.api_key:
             return []
-        import requests
         is_movie = kind == "movie"
         path = "/discover/movie" if is_movie else "/discover/tv"
         params = {"api_key": self.api_key, "sort_by": sort_by, "page": page,
@@ -882,7 +877,7 @@ class TMDBClient:
                     params["primary_release_date.gte"], params["primary_release_date.lte"] = start, end
                 else:
                     params["first_air_date.gte"], params["first_air_date.lte"] = start, end
-        r = requests.get(self.BASE + path, params=params, timeout=15)
+        r = self._get(self.BASE + path, params=params, timeout=15)
         r.raise_for_status()
         return self._disc_map((r.json() or {}).get("results"), kind)
 
@@ -890,9 +885,8 @@ class TMDBClient:
         """TMDB genre id→name list for movies or shows."""
         if not self.api_key:
             return []
-        import requests
         path = "/genre/movie/list" if kind == "movie" else "/genre/tv/list"
-        r = requests.get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
+        r = self._get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         return [{"id": g["id"], "name": g["name"]}
                 for g in (r.json() or {}).get("genres") or [] if g.get("id")]
@@ -901,9 +895,8 @@ class TMDBClient:
         """TMDB 'recommended' titles for a movie/show — powers 'More like …' rails."""
         if not self.api_key or tmdb_id is None:
             return []
-        import requests
         path = ("/movie/" if kind == "movie" else "/tv/") + str(tmdb_id) + "/recommendations"
-        r = requests.get(self.BASE + path,
+        r = self._get(self.BASE + path,
                          params={"api_key": self.api_key, "page": page}, timeout=15)
         r.raise_for_status()
         return self._disc_map((r.json() or {}).get("results"), kind)
@@ -913,9 +906,8 @@ class TMDBClient:
         Light — just the /videos endpoint, not the whole detail append."""
         if not self.api_key or tmdb_id is None:
             return None
-        import requests
         path = ("/movie/" if kind == "movie" else "/tv/") + str(tmdb_id) + "/videos"
-        r = requests.get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
+        r = self._get(self.BASE + path, params={"api_key": self.api_key}, timeout=15)
         r.raise_for_status()
         teaser = None
         for v in ((r.json() or {}).get("results") or []):
@@ -934,10 +926,9 @@ class TMDBClient:
         renders it). Seasons carry counts; episodes load lazily per season."""
         if not self.api_key or tmdb_id is None:
             return None
-        import requests
         path = ("/movie/" if kind == "movie" else "/tv/") + str(tmdb_id)
         agg = ",aggregate_credits" if kind == "show" else ""
-        r = requests.get(self.BASE + path, params={
+        r = self._get(self.BASE + path, params={
             "api_key": self.api_key,
             "append_to_response": "external_ids,credits,images,videos,watch/providers,similar,"
                                   "recommendations,keywords,reviews" + agg,
@@ -1005,8 +996,7 @@ class TMDBClient:
         person page. Everything points back to TMDB ids we resolve in SoulSync."""
         if not self.api_key or tmdb_id is None:
             return None
-        import requests
-        r = requests.get(self.BASE + "/person/" + str(tmdb_id), params={
+        r = self._get(self.BASE + "/person/" + str(tmdb_id), params={
             "api_key": self.api_key,
             "append_to_response": "combined_credits,external_ids,images"}, timeout=15)
         r.raise_for_status()
@@ -1053,11 +1043,12 @@ class TMDBClient:
             "photos": photos, "also_known_as": akas, "credits": credits}
 
 
-class TVDBClient:
+class TVDBClient(_HTTPClient):
+    SOURCE = "tvdb"
     BASE = "https://api4.thetvdb.com/v4"
 
-    def __init__(self, api_key):
-        self.api_key = api_key or None
+    def __init__(self, api_key, http=None):
+        super().__init__(api_key, http)
         self._token = None
 
     @property
@@ -1089,14 +1080,13 @@ class TVDBClient:
         """GET with the bearer token, transparently re-authenticating once if the
         cached token has expired (401). Raises on any other non-200 so the worker
         records 'error' rather than a false 'not_found'."""
-        import requests
         token = self._auth()
         if not token:
             return None
-        r = requests.get(self.BASE + path, headers={"Authorization": "Bearer " + token},
+        r = self._get(self.BASE + path, headers={"Authorization": "Bearer " + token},
                          params=params, timeout=15)
         if r.status_code == 401 and self._auth(force=True):   # token expired → refresh once
-            r = requests.get(self.BASE + path, headers={"Authorization": "Bearer " + self._token},
+            r = self._get(self.BASE + path, headers={"Authorization": "Bearer " + self._token},
                              params=params, timeout=15)
         r.raise_for_status()
         return r.json() or {}
@@ -1190,15 +1180,13 @@ class OMDbAuthError(Exception):
     churning the whole library on a bad key."""
 
 
-class OMDBClient:
+class OMDBClient(_HTTPClient):
     """Ratings provider — IMDb / Rotten Tomatoes / Metacritic by imdb_id. Not a
     matcher (we already have the id), so it's used as a ratings backfill, not a
     worker."""
+    SOURCE = "omdb"
     BASE = "https://www.omdbapi.com/"
 
-    def __init__(self, api_key):
-        self.api_key = api_key or None
-
     @property
     def enabled(self):
         return bool(self.api_key)
@@ -1206,9 +1194,9 @@ class OMDBClient:
     def test(self):
         if not self.api_key:
             return False, "No OMDb API key set"
-        import requests
         try:
-            r = requests.get(self.BASE, params={"apikey": self.api_key, "i": "tt0111161"}, timeout=12)
+            r = self._get(self.BASE, params={"apikey": self.api_key, "i": "tt0111161"}, timeout=12,
+                          cache=False)
             # OMDb returns a JSON body even on 401 — surface its actual Error so the
             # user sees WHY ("Invalid API key!" = not activated/wrong key;
             # "Request limit reached!" = free-tier daily quota, resets at midnight).
@@ -1231,8 +1219,7 @@ class OMDBClient:
     def ratings(self, imdb_id):
         if not self.api_key or not imdb_id:
             return None
-        import requests
-        r = requests.get(self.BASE, params={"apikey": self.api_key, "i": imdb_id}, timeout=12)
+        r = self._get(self.BASE, params={"apikey": self.api_key, "i": imdb_id}, timeout=12)
         # A bad/expired key is a 401 (sometimes a 200 with "Invalid API key!") — a
         # config problem that affects EVERY item, so flag it distinctly.
         if r.status_code == 401:
@@ -1272,9 +1259,12 @@ class OMDBClient:
 
 def build_clients(db) -> dict:
     """Construct the source clients from the saved API keys (in video_settings).
-    OMDb is included as a worker (a ratings filler) alongside the matchers."""
+    OMDb is included as a worker (a ratings filler) alongside the matchers. All
+    three share the disk-backed HTTP cache (pooled session + revalidation)."""
+    from .http_cache import get_http_cache
+    http = get_http_cache(db)
     return {
-        "tmdb": TMDBClient(db.get_setting("tmdb_api_key")),
-        "tvdb": TVDBClient(db.get_setting("tvdb_api_key")),
-        "omdb": OMDBClient(db.get_setting("omdb_api_key")),
+        "tmdb": TMDBClient(db.get_setting("tmdb_api_key"), http),
+        "tvdb": TVDBClient(db.get_setting("tvdb_api_key"), http),
+        "omdb": OMDBClient(db.get_setting("omdb_api_key"), http),
     }
@@ -1135,8 +1135,10 @@ def get_video_enrichment_engine():
                 from database.video_database import VideoDatabase
                 from .clients import build_clients, OMDBClient
                 db = VideoDatabase()
-                eng = VideoEnrichmentEngine(db, build_clients(db),
-                                            ratings_client=OMDBClient(db.get_setting("omdb_api_key")))
+                clients = build_clients(db)
+                eng = VideoEnrichmentEngine(db, clients,
+                                            ratings_client=OMDBClient(db.get_setting("omdb_api_key"),
+                                                                      clients["omdb"].http))
                 eng.start_all()
                 _engine = eng
     return _engine
@@ -0,0 +1,366 @@
+"""Disk-backed, revalidating HTTP response cache for the video metadata clients.
+
+The engine's in-memory ``TTLCache`` (256 entries, 30 min) only smooths over
+re-opening the same title within one run; every restart, and any library
+larger than 256 titles, re-fetched TMDB details / credits / images /
+release dates / logos (and the TVDB + OMDb equivalents) from scratch.
+
+:class:`HTTPCache` sits under the clients instead:
+
+  · responses (200s only) are stored in a small SQLite file next to
+    video_library.db, keyed by URL + params with credentials stripped
+    (``api_key`` / ``apikey`` / the TVDB bearer header never reach the key,
+    so a key change doesn't orphan the cache)
+  · each URL gets a TTL from a per-provider path policy — search and
+    trending go stale in hours, images and collections in days
+  · an expired entry is kept and revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``; a 304 re-arms it without a body download
+  · the file is size-bounded; past the limit the least-recently-used
+    entries are evicted
+  · every request (cached or not) goes through one pooled
+    ``requests.Session`` so keep-alive connections are reused
+
+Hit rate and bytes saved per provider are reported on each enrichment
+worker's status. Isolated: stdlib + requests only; no music, no video.db.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+from utils.logging_config import get_logger
+
+logger = get_logger("video_enrichment.http_cache")
+
+DAY = 86400
+
+# Params / headers that carry credentials — never part of the cache key.
+_SECRET_PARAMS = frozenset({"api_key", "apikey"})
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+# (provider, regex on "path?sorted-query", ttl seconds). First match wins;
+# ttl 0 = never cache. Unmatched URLs fall back to _DEFAULT_TTL.
+TTL_POLICY = (
+    ("tmdb", r"^/configuration", 0),
+    ("tmdb", r"watch/providers|^/trending/|^/(movie|tv)/(popular|top_rated|now_playing|upcoming|on_the_air|airing_today)", 3600),
+    ("tmdb", r"^/discover/|^/search/", 6 * 3600),
+    ("tmdb", r"^/(movie|tv)/\d+/(images|alternative_titles)|^/genre/|^/find/", 7 * DAY),
+    ("tmdb", r"^/(collection|person|company)/", 3 * DAY),
+    ("tmdb", r"^/(movie|tv)/\d+", DAY),
+    ("tvdb", r"^/search", 6 * 3600),
+    ("tvdb", r"^/series/\d+/extended", 3 * DAY),
+    ("omdb", r"", 3 * DAY),
+)
+_DEFAULT_TTL = DAY
+_COMPILED = tuple((provider, re.compile(pattern), ttl) for provider, pattern, ttl in TTL_POLICY)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    url TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_http_cache_last_access ON http_cache (last_access);
+"""
+
+
+def ttl_for(provider: str, url: str, params: Optional[dict] = None) -> int:
+    """Seconds a response for this request stays fresh (0 = don't cache)."""
+    target = urlsplit(url).path
+    base = _BASE_PATHS.get(provider)
+    if base and target.startswith(base):
+        target = target[len(base):]
+    if params:
+        target += "?" + "&".join("%s=%s" % kv for kv in sorted(
+            (str(k), str(v)) for k, v in params.items() if v is not None and k not in _SECRET_PARAMS))
+    for rule_provider, pattern, ttl in _COMPILED:
+        if rule_provider == provider and pattern.search(target):
+            return ttl
+    return _DEFAULT_TTL
+
+
+# Path prefix of each provider's API base, stripped before matching the policy.
+_BASE_PATHS = {"tmdb": "/3", "tvdb": "/v4"}
+
+
+def _canonical_query(params: Optional[dict]) -> str:
+    if not params:
+        return ""
+    return urlencode(sorted((str(k), str(v)) for k, v in params.items()
+                            if v is not None and k not in _SECRET_PARAMS))
+
+
+def cache_key(url: str, params: Optional[dict] = None) -> str:
+    return hashlib.sha1((url + "?" + _canonical_query(params)).encode("utf-8")).hexdigest()
+
+
+def _cacheable(provider: str, body: bytes) -> bool:
+    """OMDb reports errors (bad key, daily limit, unknown id) as HTTP 200 with
+    ``"Response":"False"`` — never pin those for days."""
+    if provider == "omdb":
+        return b'"Response":"False"' not in body.replace(b" ", b"")
+    return True
+
+
+def _new_provider_stats() -> Dict[str, Any]:
+    return {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "uncached": 0,
+            "bytes_fetched": 0, "bytes_saved": 0}
+
+
+class HTTPCache:
+    """SQLite response store + pooled session. ``get`` is a drop-in for
+    ``requests.get`` that returns a real ``requests.Response``."""
+
+    def __init__(self, path, max_bytes: int = DEFAULT_MAX_BYTES, *,
+                 session=None, clock=time.time):
+        self.path = Path(path)
+        self.max_bytes = max(1024 * 1024, int(max_bytes))
+        self._session = session
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._evictions = 0
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    # ── storage ──────────────────────────────────────────────────────────
+    def _db(self) -> sqlite3.Connection:
+        """Open lazily, so building the clients never touches disk."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(_SCHEMA)
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def _http(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def _provider(self, provider: str) -> Dict[str, Any]:
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = self._stats[provider] = _new_provider_stats()
+        return stats
+
+    # ── requests ─────────────────────────────────────────────────────────
+    def get(self, provider: str, url: str, params: Optional[dict] = None,
+            headers: Optional[dict] = None, timeout: float = 15, cache: bool = True):
+        ttl = ttl_for(provider, url, params) if cache else 0
+        if ttl <= 0:
+            resp = self._http().get(url, params=params, headers=headers, timeout=timeout)
+            with self._lock:
+                stats = self._provider(provider)
+                stats["uncached"] += 1
+                stats["bytes_fetched"] += len(resp.content or b"")
+            return resp
+
+        key = cache_key(url, params)
+        row = self._lookup(key)
+        now = self._clock()
+        if row is not None and row["expires_at"] > now:
+            self._touch(key, now)
+            with self._lock:
+                stats = self._provider(provider)
+                stats["hits"] += 1
+                stats["bytes_saved"] += row["size"]
+            return self._response(row, url)
+
+        send_headers = dict(headers or {})
+        if row is not None:
+            if row["headers"].get("ETag"):
+                send_headers["If-None-Match"] = row["headers"]["ETag"]
+            if row["headers"].get("Last-Modified"):
+                send_headers["If-Modified-Since"] = row["headers"]["Last-Modified"]
+        resp = self._http().get(url, params=params, headers=send_headers or None, timeout=timeout)
+
+        if resp.status_code == 304 and row is not None:
+            self._rearm(key, now + ttl, now)
+            with self._lock:
+                stats = self._provider(provider)
+                stats["revalidated"] += 1
+                stats["bytes_saved"] += row["size"]
+            return self._response(row, url)
+
+        body = resp.content or b""
+        with self._lock:
+            stats = self._provider(provider)
+            stats["misses"] += 1
+            stats["bytes_fetched"] += len(body)
+        if resp.status_code == 200 and _cacheable(provider, body):
+            self._store(key, provider, url, resp, body, now, ttl)
+        return resp
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._lock:
+                row = self._db().execute(
+                    "SELECT headers, body, size, expires_at FROM http_cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            logger.debug("http cache lookup failed", exc_info=True)
+            return None
+        if row is None:
+            return None
+        try:
+            headers = json.loads(row[0]) or {}
+        except ValueError:
+            headers = {}
+        return {"headers": headers, "body": row[1], "size": row[2], "expires_at": row[3]}
+
+    def _touch(self, key: str, now: float) -> None:
+        try:
+            with self._lock:
+                self._db().execute("UPDATE http_cache SET last_access = ? WHERE key = ?", (now, key))
+                self._db().commit()
+        except sqlite3.Error:
+            logger.debug("http cache touch failed", exc_info=True)
+
+    def _rearm(self, key: str, expires_at: float, now: float) -> None:
+        try:
+            with self._lock:
+                self._db().execute("UPDATE http_cache SET expires_at = ?, last_access = ? WHERE key = ?",
+                                   (expires_at, now, key))
+                self._db().commit()
+        except sqlite3.Error:
+            logger.debug("http cache rearm failed", exc_info=True)
+
+    def _store(self, key, provider, url, resp, body: bytes, now: float, ttl: int) -> None:
+        if len(body) > self.max_bytes // 4:
+            return
+        headers = {h: resp.headers.get(h) for h in _STORED_HEADERS if resp.headers.get(h)}
+        try:
+            with self._lock:
+                db = self._db()
+                old = db.execute("SELECT size FROM http_cache WHERE key = ?", (key,)).fetchone()
+                db.execute(
+                    "INSERT OR REPLACE INTO http_cache "
+                    "(key, provider, url, headers, body, size, stored_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, url, json.dumps(headers), sqlite3.Binary(body), len(body),
+                     now, now + ttl, now))
+                self._total_bytes += len(body) - (old[0] if old else 0)
+                self._provider(provider)["stored"] += 1
+                if self._total_bytes > self.max_bytes:
+                    self._evict_locked(db)
+                db.commit()
+        except sqlite3.Error:
+            logger.debug("http cache store failed", exc_info=True)
+
+    def _evict_locked(self, db) -> None:
+        """Drop least-recently-used entries until the store is at 90% of its cap."""
+        target = int(self.max_bytes * 0.9)
+        doomed = []
+        for key, size in db.execute("SELECT key, size FROM http_cache ORDER BY last_access"):
+            if self._total_bytes <= target:
+                break
+            doomed.append((key,))
+            self._total_bytes -= size
+        db.executemany("DELETE FROM http_cache WHERE key = ?", doomed)
+        self._evictions += len(doomed)
+        logger.debug("http cache evicted %d entries", len(doomed))
+
+    @staticmethod
+    def _response(row: Dict[str, Any], url: str):
+        import requests
+        resp = requests.models.Response()
+        resp.status_code = 200
+        resp._content = bytes(row["body"])
+        resp.headers.update(row["headers"])
+        resp.url = url
+        resp.reason = "OK"
+        resp.from_cache = True
+        return resp
+
+    # ── status ───────────────────────────────────────────────────────────
+    def get_stats(self, provider: Optional[str] = None) -> Dict[str, Any]:
+        """Counters since startup (one provider's, or summed) plus store size."""
+        with self._lock:
+            if provider is not None:
+                stats = dict(self._stats.get(provider) or _new_provider_stats())
+            else:
+                stats = _new_provider_stats()
+                for per in self._stats.values():
+                    for k, v in per.items():
+                        stats[k] += v
+            entries = None
+            if self._conn is not None:
+                try:
+                    entries = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+                except sqlite3.Error:
+                    entries = None
+            total_bytes = self._total_bytes
+            evictions = self._evictions
+        served = stats["hits"] + stats["revalidated"]
+        lookups = served + stats["misses"]
+        stats["hit_rate"] = round(served / lookups, 3) if lookups else None
+        stats.update(entries=entries, store_bytes=total_bytes, max_bytes=self.max_bytes,
+                     evictions=evictions)
+        return stats
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = self._db().execute("DELETE FROM http_cache").rowcount
+            self._db().commit()
+            self._total_bytes = 0
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: Optional[HTTPCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache(db=None) -> HTTPCache:
+    """The process-wide cache, stored beside the video database
+    (``video_http_cache.db``). Size cap from the ``http_cache_max_mb`` video
+    setting when ``db`` is given."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            base = Path(getattr(db, "database_path", None) or "database/video_library.db")
+            max_bytes = DEFAULT_MAX_BYTES
+            try:
+                configured = db.get_setting("http_cache_max_mb") if db is not None else None
+                if configured:
+                    max_bytes = int(float(configured) * 1024 * 1024)
+            except Exception:   # noqa: BLE001 - a bad setting falls back to the default cap
+                logger.debug("http_cache_max_mb unreadable", exc_info=True)
+            _cache = HTTPCache(base.with_name("video_http_cache.db"), max_bytes)
+        return _cache
+
+
+def set_http_cache(cache: Optional[HTTPCache]) -> None:
+    global _cache
+    with _cache_lock:
+        _cache = cache
@@ -330,6 +330,13 @@ class VideoEnrichmentWorker:
             done = b["matched"] + b["not_found"]
             progress[kind] = {"matched": b["matched"], "total": total,
                               "percent": round(done / total * 100) if total else 0}
+        http_cache = None
+        http = getattr(self.client, "http", None)
+        if http is not None:
+            try:
+                http_cache = http.get_stats(self.service)
+            except Exception:
+                logger.debug("http cache stats failed", exc_info=True)
         return {
             "enabled": self.enabled,
             "needs_key": True,   # matchers (TMDB/TVDB/OMDb) always require an API key
@@ -342,4 +349,5 @@ class VideoEnrichmentWorker:
             "stats": {**self.stats, "pending": pending},
             "progress": progress,
             "breakdown": breakdown,
+            "http_cache": http_cache,   # hit rate / bytes saved for this source's API calls
         }
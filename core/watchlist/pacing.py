@@ -0,0 +1,93 @@
+"""Call-driven pacing for the watchlist scan.
+
+The scanner used to sleep a fixed ``DELAY_BETWEEN_ARTISTS`` /
+``DELAY_BETWEEN_ALBUMS`` after every artist and album, even when the
+discography and album payloads all came out of the metadata cache and no
+request ever left the process. The per-client ``rate_limited`` decorators
+already space out real requests; the scan delays exist to keep the overall
+request *rate* polite over a long scan.
+
+:class:`ScanPacer` keys those delays off the central ``api_call_tracker``
+instead: it snapshots the tracker's monotonic totals for the scanning thread,
+and at the next pace point only sleeps if that thread made real API calls in
+between — enrichment workers and UI requests hitting the same providers
+don't count. Rate-limit events the scan ran into in the same window (Spotify
+bans, Deezer 429s, iTunes 403s) double a backoff multiplier, and each clean
+window halves it back towards 1. Windows are kept per thread, so the pacer
+works the same on the prefetch thread as on the scan thread.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger("watchlist.pacing")
+
+
+def _tracker_totals() -> Tuple[int, int]:
+    from core.api_call_tracker import api_call_tracker
+    return api_call_tracker.get_thread_totals()
+
+
+class ScanPacer:
+    """Sleeps between scan steps only when the step made real API calls."""
+
+    def __init__(self, *, totals: Callable[[], Tuple[int, int]] = _tracker_totals,
+                 sleep: Callable[[float], None] = time.sleep, max_backoff: float = 8.0):
+        self._totals = totals
+        self._sleep = sleep
+        self.max_backoff = max(1.0, float(max_backoff))
+        self.backoff = 1.0
+        self._lock = threading.Lock()
+        self._marks: Dict[int, Tuple[int, int]] = {threading.get_ident(): self._snapshot()}
+        self.stats = {'paced': 0, 'skipped': 0, 'slept_seconds': 0.0, 'rate_limit_events': 0}
+
+    def _snapshot(self) -> Tuple[int, int]:
+        try:
+            return self._totals()
+        except Exception as e:
+            logger.debug("api call totals unavailable: %s", e)
+            return 0, 0
+
+    def mark(self) -> None:
+        """Start a new window; the next :meth:`pace` only counts calls after this."""
+        with self._lock:
+            self._marks[threading.get_ident()] = self._snapshot()
+
+    def pace(self, delay: float) -> float:
+        """Close the current window and sleep ``delay`` (times the backoff)
+        if it contained real API calls. Returns the seconds slept."""
+        with self._lock:
+            calls, events = self._snapshot()
+            # A thread's first pace point opens its window — nothing to count yet
+            mark = self._marks.get(threading.get_ident(), (calls, events))
+            new_calls = calls - mark[0]
+            new_events = events - mark[1]
+            self._marks[threading.get_ident()] = (calls, events)
+            if new_events > 0:
+                self.backoff = min(self.max_backoff, self.backoff * 2.0)
+                self.stats['rate_limit_events'] += new_events
+                logger.info("Rate-limit feedback during watchlist scan — backing off x%.0f", self.backoff)
+            elif new_calls > 0:
+                self.backoff = max(1.0, self.backoff / 2.0)
+
+            if delay <= 0 or (new_calls <= 0 and new_events <= 0):
+                self.stats['skipped'] += 1
+                return 0.0
+            seconds = delay * self.backoff
+            self.stats['paced'] += 1
+            self.stats['slept_seconds'] += seconds
+        self._sleep(seconds)
+        return seconds
+
+
+def tracker_totals_or_none() -> Optional[Tuple[int, int]]:
+    """The calling thread's tracker totals, or None when the tracker can't be read."""
+    try:
+        return _tracker_totals()
+    except Exception:
+        return None
@@ -6,8 +6,12 @@ Watchlist Scanner Service - Monitors watched artists for new releases
 
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import re
+import threading
 import time
 from difflib import SequenceMatcher
 import requests
@@ -21,6 +25,7 @@ from core.metadata_service import (
     get_source_priority,
 )
 from core.wishlist_service import get_wishlist_service
+from core.watchlist.pacing import ScanPacer, tracker_totals_or_none
 from core.matching_engine import MusicMatchingEngine
 from utils.logging_config import get_logger
 
@@ -470,6 +475,24 @@ class WatchlistDiscographyResult:
     albums: List[Any]
     image_url: Optional[str] = None
 
+# Marks an album whose payload fetch raised, so the check pass skips it
+# without treating it as "no tracks".
+_ALBUM_FETCH_FAILED = object()
+
+
+@dataclass
+class _PreparedArtist:
+    """Network half of one artist's scan, fetched ahead of its library checks."""
+    discography: Any  # None = discography lookup failed
+    albums: List[Any] = field(default_factory=list)
+    source_artist_id: str = ''
+    artist_image_url: str = ''
+    album_payloads: List[Any] = field(default_factory=list)
+    failed_albums: int = 0
+    fingerprint: Optional[str] = None
+    unchanged: bool = False
+
+
 class WatchlistScanner:
     """Service for scanning watched artists for new releases"""
     
@@ -1248,280 +1271,348 @@ class WatchlistScanner:
             album_delay,
         )
 
-        for i, artist in enumerate(watchlist_artists):
-            if cancel_check and cancel_check():
-                logger.info("Watchlist scan cancelled after %s/%s artists", i, len(watchlist_artists))
-                if scan_state is not None:
-                    successful_scans = [r for r in scan_results if r.success]
-                    scan_state['status'] = 'cancelled'
-                    scan_state['current_phase'] = 'cancelled'
-                    scan_state['summary'] = {
-                        'total_artists': i,
-                        'successful_scans': len(successful_scans),
-                        'new_tracks_found': sum(r.new_tracks_found for r in successful_scans),
-                        'tracks_added_to_wishlist': sum(r.tracks_added_to_wishlist for r in successful_scans),
-                        'cancelled': True,
-                    }
-                _emit('cancelled', processed=i, total=len(watchlist_artists))
-                break
-
-            source_artist_id = (
-                artist.spotify_artist_id
-                or artist.itunes_artist_id
-                or artist.deezer_artist_id
-                or artist.discogs_artist_id
-                or getattr(artist, 'musicbrainz_artist_id', None)
-                or str(artist.id)
+        # Pacing follows real provider traffic: a step that was served
+        # entirely from the metadata cache costs no delay (core/watchlist/pacing.py).
+        pacer = ScanPacer(sleep=lambda seconds: time.sleep(seconds))
+        fingerprint_skip = self._release_fingerprint_skip_enabled()
+        stop_prefetch = threading.Event()
+
+        def _prepare(index: int) -> _PreparedArtist:
+            return self._prepare_artist_scan(
+                watchlist_artists[index],
+                pacer=pacer,
+                pace_before=artist_delay if index > 0 else 0.0,
+                album_delay=album_delay,
+                lookback_period=lookback_period,
+                fingerprint_skip=fingerprint_skip,
+                stop_event=stop_prefetch,
             )
 
-            try:
-                discography_result = self.get_artist_discography_for_watchlist(artist, artist.last_scan_timestamp)
-                if discography_result is None:
-                    scan_results.append(ScanResult(
-                        artist_name=artist.artist_name,
-                        spotify_artist_id=source_artist_id,
-                        albums_checked=0,
-                        new_tracks_found=0,
-                        tracks_added_to_wishlist=0,
-                        success=False,
-                        error_message="Failed to get artist discography",
-                    ))
-                    _emit(
-                        'artist_error',
-                        artist_name=artist.artist_name,
-                        profile_id=profile_id,
-                        error_message="Failed to get artist discography",
-                    )
-                    continue
+        # Bounded pipeline: one background thread fetches the next artist(s)'
+        # discography and album payloads while this thread runs the library
+        # presence checks and wishlist writes for the current one. The
+        # similar-artists lookup is queued on that same thread, so every
+        # provider call of the scan stays sequential and paced by one window.
+        prefetch_depth = self._scan_prefetch_depth() if len(watchlist_artists) > 1 else 0
+        prefetcher = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix='watchlist-prefetch')
+            if prefetch_depth > 0 else None
+        )
+        pending: Dict[int, Any] = {}
+        similar_jobs: List[Any] = []
+        cancelled = False
 
-                if isinstance(discography_result, list):
-                    albums = discography_result
-                    artist_image_url = self.get_artist_image_url(artist) or ''
-                    album_fetcher = lambda album_id, album_name='': self.metadata_service.get_album(album_id)
-                else:
-                    source = discography_result.source
-                    albums = discography_result.albums
-                    source_artist_id = discography_result.artist_id
-                    artist_image_url = discography_result.image_url or self.get_artist_image_url(artist) or ''
-                    album_fetcher = lambda album_id, album_name='', source=source: self._get_album_data_for_source(source, album_id, album_name)
-
-                absolute_index = artist_index_offset + i + 1
-                if scan_state is not None:
-                    scan_state.update({
-                        'current_artist_index': absolute_index,
-                        'current_artist_name': artist.artist_name,
-                        'current_artist_image_url': artist_image_url,
-                        'current_phase': 'fetching_discography',
-                        'albums_to_check': 0,
-                        'albums_checked': 0,
-                        'current_album': '',
-                        'current_album_image_url': '',
-                        'current_track_name': '',
-                    })
-
-                _emit(
-                    'artist_started',
-                    artist_name=artist.artist_name,
-                    artist_index=absolute_index,
-                    total_artists=total_artists_override if total_artists_override is not None else len(watchlist_artists),
-                    profile_id=profile_id,
-                    artist_image_url=artist_image_url,
+        try:
+            for i, artist in enumerate(watchlist_artists):
+                if cancel_check and cancel_check():
+                    cancelled = True
+                    logger.info("Watchlist scan cancelled after %s/%s artists", i, len(watchlist_artists))
+                    if scan_state is not None:
+                        successful_scans = [r for r in scan_results if r.success]
+                        scan_state['status'] = 'cancelled'
+                        scan_state['current_phase'] = 'cancelled'
+                        scan_state['summary'] = {
+                            'total_artists': i,
+                            'successful_scans': len(successful_scans),
+                            'new_tracks_found': sum(r.new_tracks_found for r in successful_scans),
+                            'tracks_added_to_wishlist': sum(r.tracks_added_to_wishlist for r in successful_scans),
+                            'cancelled': True,
+                        }
+                    _emit('cancelled', processed=i, total=len(watchlist_artists))
+                    break
+
+                source_artist_id = (
+                    artist.spotify_artist_id
+                    or artist.itunes_artist_id
+                    or artist.deezer_artist_id
+                    or artist.discogs_artist_id
+                    or getattr(artist, 'musicbrainz_artist_id', None)
+                    or str(artist.id)
                 )
 
-                if scan_state is not None:
-                    scan_state.update({
-                        'current_phase': 'checking_albums',
-                        'albums_to_check': len(albums),
-                        'albums_checked': 0,
-                    })
+                try:
+                    if prefetcher is not None:
+                        for ahead in range(i, min(len(watchlist_artists), i + prefetch_depth + 1)):
+                            if ahead not in pending:
+                                pending[ahead] = prefetcher.submit(_prepare, ahead)
+                        future = pending.pop(i)
+                        if not future.done() and scan_state is not None:
+                            scan_state['current_phase'] = 'fetching_discography'
+                        prepared = future.result()
+                    else:
+                        prepared = _prepare(i)
 
-                artist_new_tracks = 0
-                artist_added_tracks = 0
+                    if prepared.discography is None:
+                        scan_results.append(ScanResult(
+                            artist_name=artist.artist_name,
+                            spotify_artist_id=source_artist_id,
+                            albums_checked=0,
+                            new_tracks_found=0,
+                            tracks_added_to_wishlist=0,
+                            success=False,
+                            error_message="Failed to get artist discography",
+                        ))
+                        _emit(
+                            'artist_error',
+                            artist_name=artist.artist_name,
+                            profile_id=profile_id,
+                            error_message="Failed to get artist discography",
+                        )
+                        continue
 
-                for album_index, album in enumerate(albums):
-                    try:
-                        album_data = album_fetcher(album.id, getattr(album, 'name', ''))
-                        tracks = self._extract_track_items(album_data)
-                        if not album_data or not tracks:
-                            logger.debug("Skipping album %s (id=%s): no track data returned", album.name, album.id)
-                            continue
+                    albums = prepared.albums
+                    source_artist_id = prepared.source_artist_id or source_artist_id
+                    artist_image_url = prepared.artist_image_url
 
-                        album_name = getattr(album, 'name', '')
-                        if isinstance(album_data, dict):
-                            album_name = album_data.get('name', album_name)
-                        else:
-                            album_name = getattr(album_data, 'name', album_name)
+                    absolute_index = artist_index_offset + i + 1
+                    if scan_state is not None:
+                        scan_state.update({
+                            'current_artist_index': absolute_index,
+                            'current_artist_name': artist.artist_name,
+                            'current_artist_image_url': artist_image_url,
+                            'current_phase': 'fetching_discography',
+                            'albums_to_check': 0,
+                            'albums_checked': 0,
+                            'current_album': '',
+                            'current_album_image_url': '',
+                            'current_track_name': '',
+                        })
 
-                        if self._has_placeholder_tracks(tracks):
-                            logger.info("Skipping album with placeholder tracks: %s", album_name)
-                            continue
-                        if not self._should_include_release(len(tracks), artist):
-                            # Make the type-filter skip visible — otherwise a user
-                            # with "Albums" toggled off just sees missing tracks
-                            # with no explanation (Sokhi #815-adjacent: 14 singles,
-                            # 0 albums because include_albums was off).
-                            _n = len(tracks)
-                            _kind = 'album' if _n >= 7 else ('EP' if _n >= 4 else 'single')
-                            logger.info(
-                                "Skipping %s '%s' (%d tracks) — release type filter "
-                                "(albums=%s, eps=%s, singles=%s) excludes it",
-                                _kind, album_name, _n,
-                                getattr(artist, 'include_albums', True),
-                                getattr(artist, 'include_eps', True),
-                                getattr(artist, 'include_singles', True))
-                            continue
+                    _emit(
+                        'artist_started',
+                        artist_name=artist.artist_name,
+                        artist_index=absolute_index,
+                        total_artists=total_artists_override if total_artists_override is not None else len(watchlist_artists),
+                        profile_id=profile_id,
+                        artist_image_url=artist_image_url,
+                    )
 
-                        album_image_url = ''
-                        album_images = []
-                        if isinstance(album_data, dict):
-                            album_images = album_data.get('images') or []
-                        else:
-                            album_images = getattr(album_data, 'images', None) or []
-                        if album_images:
-                            first_image = album_images[0]
-                            if isinstance(first_image, dict):
-                                album_image_url = first_image.get('url', '')
+                    if scan_state is not None:
+                        scan_state.update({
+                            'current_phase': 'checking_albums',
+                            'albums_to_check': len(albums),
+                            'albums_checked': 0,
+                        })
 
-                        if scan_state is not None:
-                            scan_state.update({
-                                'albums_checked': album_index + 1,
-                                'current_album': album_name,
-                                'current_album_image_url': album_image_url,
-                                'current_phase': f'checking_album_{album_index + 1}_of_{len(albums)}',
-                            })
+                    artist_new_tracks = 0
+                    artist_added_tracks = 0
+                    album_errors = prepared.failed_albums
 
-                        _emit(
-                            'album_started',
-                            artist_name=artist.artist_name,
-                            album_name=album_name,
-                            album_index=album_index + 1,
-                            total_albums=len(albums),
-                            album_image_url=album_image_url,
+                    if prepared.unchanged:
+                        logger.info(
+                            "Releases unchanged since last scan for %s — skipping %d album checks",
+                            artist.artist_name, len(albums),
                         )
+                        if scan_state is not None:
+                            scan_state['albums_checked'] = len(albums)
+                        albums = []
+
+                    for album_index, album in enumerate(albums):
+                        try:
+                            album_data = prepared.album_payloads[album_index] if album_index < len(prepared.album_payloads) else None
+                            if album_data is _ALBUM_FETCH_FAILED:
+                                continue
+                            tracks = self._extract_track_items(album_data)
+                            if not album_data or not tracks:
+                                logger.debug("Skipping album %s (id=%s): no track data returned", album.name, album.id)
+                                continue
 
-                        for track in tracks:
-                            if not self._should_include_track(track, album_data, artist):
+                            album_name = getattr(album, 'name', '')
+                            if isinstance(album_data, dict):
+                                album_name = album_data.get('name', album_name)
+                            else:
+                                album_name = getattr(album_data, 'name', album_name)
+
+                            if self._has_placeholder_tracks(tracks):
+                                logger.info("Skipping album with placeholder tracks: %s", album_name)
                                 continue
+                            if not self._should_include_release(len(tracks), artist):
+                                # Make the type-filter skip visible — otherwise a user
+                                # with "Albums" toggled off just sees missing tracks
+                                # with no explanation (Sokhi #815-adjacent: 14 singles,
+                                # 0 albums because include_albums was off).
+                                _n = len(tracks)
+                                _kind = 'album' if _n >= 7 else ('EP' if _n >= 4 else 'single')
+                                logger.info(
+                                    "Skipping %s '%s' (%d tracks) — release type filter "
+                                    "(albums=%s, eps=%s, singles=%s) excludes it",
+                                    _kind, album_name, _n,
+                                    getattr(artist, 'include_albums', True),
+                                    getattr(artist, 'include_eps', True),
+                                    getattr(artist, 'include_singles', True))
+                                continue
+
+                            album_image_url = ''
+                            album_images = []
+                            if isinstance(album_data, dict):
+                                album_images = album_data.get('images') or []
+                            else:
+                                album_images = getattr(album_data, 'images', None) or []
+                            if album_images:
+                                first_image = album_images[0]
+                                if isinstance(first_image, dict):
+                                    album_image_url = first_image.get('url', '')
 
-                            track_name = track.get('name', 'Unknown Track')
                             if scan_state is not None:
-                                scan_state['current_track_name'] = track_name
+                                scan_state.update({
+                                    'albums_checked': album_index + 1,
+                                    'current_album': album_name,
+                                    'current_album_image_url': album_image_url,
+                                    'current_phase': f'checking_album_{album_index + 1}_of_{len(albums)}',
+                                })
+
+                            _emit(
+                                'album_started',
+                                artist_name=artist.artist_name,
+                                album_name=album_name,
+                                album_index=album_index + 1,
+                                total_albums=len(albums),
+                                album_image_url=album_image_url,
+                            )
 
-                            if self.is_track_missing_from_library(track, album_name=album_name):
-                                artist_new_tracks += 1
-                                if scan_state is not None:
-                                    scan_state['tracks_found_this_scan'] += 1
-
-                                # "Follow only" artists (auto_download off): discover and
-                                # surface the release exactly like normal, but skip the one
-                                # call that adds it to the wishlist — so nothing auto-downloads
-                                # and the user can pick what to grab (corruption's request).
-                                if getattr(artist, 'auto_download', True):
-                                    added = self.add_track_to_wishlist(
-                                        track, album_data, artist,
-                                        scan_run_id=(scan_state or {}).get('scan_run_id', ''),
-                                    )
-                                else:
-                                    added = False
+                            presence = self.prefetch_library_presence(
+                                [t for t in tracks if self._should_include_track(t, album_data, artist)],
+                                album_name=album_name,
+                            )
 
-                                track_artists = track.get('artists', [])
-                                track_artist_name = track_artists[0].get('name', 'Unknown Artist') if track_artists else 'Unknown Artist'
+                            for track in tracks:
+                                if not self._should_include_track(track, album_data, artist):
+                                    continue
 
-                                # #831: per-run ledger so the completed-scan
-                                # summary can list WHICH tracks the counts mean.
-                                # 'skipped' = found-new but add_to_wishlist
-                                # declined (already queued in the wishlist, or
-                                # the artist is blocklisted). Capped for sanity.
+                                track_name = track.get('name', 'Unknown Track')
                                 if scan_state is not None:
-                                    events = scan_state.setdefault('scan_track_events', [])
-                                    if len(events) < 500:
-                                        events.append({
-                                            'track_name': track_name,
-                                            'artist_name': track_artist_name,
-                                            'album_name': album_name,
-                                            'album_image_url': album_image_url,
-                                            'status': 'added' if added else 'skipped',
-                                        })
-
-                                if added:
-                                    artist_added_tracks += 1
+                                    scan_state['current_track_name'] = track_name
+
+                                if self.is_track_missing_from_library(track, album_name=album_name, presence=presence):
+                                    artist_new_tracks += 1
                                     if scan_state is not None:
-                                        scan_state['tracks_added_this_scan'] += 1
-                                        scan_state['recent_wishlist_additions'].insert(0, {
-                                            'track_name': track_name,
-                                            'artist_name': track_artist_name,
-                                            'album_image_url': album_image_url,
-                                        })
-                                        if len(scan_state['recent_wishlist_additions']) > 10:
-                                            scan_state['recent_wishlist_additions'].pop()
-
-                        if album_index < len(albums) - 1:
-                            time.sleep(album_delay)
+                                        scan_state['tracks_found_this_scan'] += 1
+
+                                    # "Follow only" artists (auto_download off): discover and
+                                    # surface the release exactly like normal, but skip the one
+                                    # call that adds it to the wishlist — so nothing auto-downloads
+                                    # and the user can pick what to grab (corruption's request).
+                                    if getattr(artist, 'auto_download', True):
+                                        added = self.add_track_to_wishlist(
+                                            track, album_data, artist,
+                                            scan_run_id=(scan_state or {}).get('scan_run_id', ''),
+                                        )
+                                    else:
+                                        added = False
+
+                                    track_artists = track.get('artists', [])
+                                    track_artist_name = track_artists[0].get('name', 'Unknown Artist') if track_artists else 'Unknown Artist'
+
+                                    # #831: per-run ledger so the completed-scan
+                                    # summary can list WHICH tracks the counts mean.
+                                    # 'skipped' = found-new but add_to_wishlist
+                                    # declined (already queued in the wishlist, or
+                                    # the artist is blocklisted). Capped for sanity.
+                                    if scan_state is not None:
+                                        events = scan_state.setdefault('scan_track_events', [])
+                                        if len(events) < 500:
+                                            events.append({
+                                                'track_name': track_name,
+                                                'artist_name': track_artist_name,
+                                                'album_name': album_name,
+                                                'album_image_url': album_image_url,
+                                                'status': 'added' if added else 'skipped',
+                                            })
+
+                                    if added:
+                                        artist_added_tracks += 1
+                                        if scan_state is not None:
+                                            scan_state['tracks_added_this_scan'] += 1
+                                            scan_state['recent_wishlist_additions'].insert(0, {
+                                                'track_name': track_name,
+                                                'artist_name': track_artist_name,
+                                                'album_image_url': album_image_url,
+                                            })
+                                            if len(scan_state['recent_wishlist_additions']) > 10:
+                                                scan_state['recent_wishlist_additions'].pop()
 
-                    except Exception as e:
-                        logger.warning("Error checking album %s: %s", album.name, e)
-                        continue
+                        except Exception as e:
+                            album_errors += 1
+                            logger.warning("Error checking album %s: %s", album.name, e)
+                            continue
 
-                self.update_artist_scan_timestamp(artist)
-
-                scan_results.append(ScanResult(
-                    artist_name=artist.artist_name,
-                    spotify_artist_id=source_artist_id or artist.spotify_artist_id or '',
-                    albums_checked=len(albums),
-                    new_tracks_found=artist_new_tracks,
-                    tracks_added_to_wishlist=artist_added_tracks,
-                    success=True,
-                ))
-
-                _emit(
-                    'artist_completed',
-                    artist_name=artist.artist_name,
-                    artist_index=absolute_index,
-                    total_artists=total_artists_override if total_artists_override is not None else len(watchlist_artists),
-                    profile_id=profile_id,
-                    albums_checked=len(albums),
-                    new_tracks_found=artist_new_tracks,
-                    tracks_added_to_wishlist=artist_added_tracks,
-                )
+                    self.update_artist_scan_timestamp(artist)
+                    if prepared.fingerprint and albums:
+                        # Only a clean pass whose every missing track made it onto
+                        # the wishlist may vouch for "nothing left to find" here;
+                        # anything else forgets the fingerprint so the next scan
+                        # re-checks the tracks.
+                        clean = album_errors == 0 and artist_new_tracks == artist_added_tracks
+                        self._store_release_fingerprint(artist, prepared.fingerprint if clean else None)
+
+                    scan_results.append(ScanResult(
+                        artist_name=artist.artist_name,
+                        spotify_artist_id=source_artist_id or artist.spotify_artist_id or '',
+                        albums_checked=len(prepared.albums),
+                        new_tracks_found=artist_new_tracks,
+                        tracks_added_to_wishlist=artist_added_tracks,
+                        success=True,
+                    ))
+
+                    _emit(
+                        'artist_completed',
+                        artist_name=artist.artist_name,
+                        artist_index=absolute_index,
+                        total_artists=total_artists_override if total_artists_override is not None else len(watchlist_artists),
+                        profile_id=profile_id,
+                        albums_checked=len(prepared.albums),
+                        new_tracks_found=artist_new_tracks,
+                        tracks_added_to_wishlist=artist_added_tracks,
+                    )
 
-                try:
-                    if scan_state is not None:
-                        scan_state['current_phase'] = 'fetching_similar_artists'
                     artist_profile_id = getattr(artist, 'profile_id', profile_id)
-                    if self.database.has_fresh_similar_artists(source_artist_id, days_threshold=30, profile_id=artist_profile_id):
-                        logger.info("Similar artists for %s are cached and fresh (profile %s)", artist.artist_name, artist_profile_id)
-                        self._backfill_similar_artists_fallback_ids(source_artist_id, profile_id=artist_profile_id)
+                    if prefetcher is not None:
+                        similar_jobs.append(prefetcher.submit(
+                            self._refresh_similar_artists, artist, artist_profile_id, source_artist_id))
                     else:
-                        logger.info("Fetching similar artists for %s (profile %s)...", artist.artist_name, artist_profile_id)
-                        self.update_similar_artists(artist, profile_id=artist_profile_id, source_artist_id=source_artist_id)
-                        logger.info("Similar artists updated for %s", artist.artist_name)
-                except Exception as similar_error:
-                    logger.warning("Failed to update similar artists for %s: %s", artist.artist_name, similar_error)
+                        if scan_state is not None:
+                            scan_state['current_phase'] = 'fetching_similar_artists'
+                        self._refresh_similar_artists(artist, artist_profile_id, source_artist_id)
 
-                if i < len(watchlist_artists) - 1:
-                    if scan_state is not None:
+                    if i < len(watchlist_artists) - 1 and scan_state is not None:
                         scan_state['current_phase'] = 'rate_limiting'
-                    time.sleep(artist_delay)
 
-            except Exception as e:
-                logger.error("Error scanning artist %s: %s", artist.artist_name, e)
-                scan_results.append(ScanResult(
-                    artist_name=artist.artist_name,
-                    spotify_artist_id=source_artist_id,
-                    albums_checked=0,
-                    new_tracks_found=0,
-                    tracks_added_to_wishlist=0,
-                    success=False,
-                    error_message=str(e),
-                ))
-                _emit(
-                    'artist_error',
-                    artist_name=artist.artist_name,
-                    artist_index=artist_index_offset + i + 1,
-                    total_artists=total_artists_override if total_artists_override is not None else len(watchlist_artists),
-                    profile_id=profile_id,
-                    error_message=str(e),
-                )
+                except Exception as e:
+                    logger.error("Error scanning artist %s: %s", artist.artist_name, e)
+                    scan_results.append(ScanResult(
+                        artist_name=artist.artist_name,
+                        spotify_artist_id=source_artist_id,
+                        albums_checked=0,
+                        new_tracks_found=0,
+                        tracks_added_to_wishlist=0,
+                        success=False,
+                        error_message=str(e),
+                    ))
+                    _emit(
+                        'artist_error',
+                        artist_name=artist.artist_name,
+                        artist_index=artist_index_offset + i + 1,
+                        total_artists=total_artists_override if total_artists_override is not None else len(watchlist_artists),
+                        profile_id=profile_id,
+                        error_message=str(e),
+                    )
+            if not cancelled:
+                # Queued behind the last prefetch; let them land before the
+                # scan reports completion.
+                for job in similar_jobs:
+                    job.result()
+        finally:
+            stop_prefetch.set()
+            if prefetcher is not None:
+                for future in pending.values():
+                    future.cancel()
+                prefetcher.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            "Watchlist pacing: %d delays taken (%.1fs), %d skipped with no API traffic, %d rate-limit events",
+            pacer.stats['paced'], pacer.stats['slept_seconds'],
+            pacer.stats['skipped'], pacer.stats['rate_limit_events'],
+        )
 
         if scan_state is not None:
             successful_scans = [r for r in scan_results if r.success]
@@ -1550,6 +1641,136 @@ class WatchlistScanner:
         )
         return scan_results
     
+    def _refresh_similar_artists(self, artist: WatchlistArtist, profile_id: int, source_artist_id: str) -> None:
+        """Refresh (or backfill) one artist's similar artists. Runs on the
+        prefetch thread when there is one, between its provider fetches."""
+        try:
+            if self.database.has_fresh_similar_artists(source_artist_id, days_threshold=30, profile_id=profile_id):
+                logger.info("Similar artists for %s are cached and fresh (profile %s)", artist.artist_name, profile_id)
+                self._backfill_similar_artists_fallback_ids(source_artist_id, profile_id=profile_id)
+            else:
+                logger.info("Fetching similar artists for %s (profile %s)...", artist.artist_name, profile_id)
+                self.update_similar_artists(artist, profile_id=profile_id, source_artist_id=source_artist_id)
+                logger.info("Similar artists updated for %s", artist.artist_name)
+        except Exception as similar_error:
+            logger.warning("Failed to update similar artists for %s: %s", artist.artist_name, similar_error)
+
+    def _prepare_artist_scan(
+        self,
+        artist: WatchlistArtist,
+        *,
+        pacer: ScanPacer,
+        pace_before: float,
+        album_delay: float,
+        lookback_period: str,
+        fingerprint_skip: bool,
+        stop_event: threading.Event,
+    ) -> _PreparedArtist:
+        """Fetch everything the scan needs from providers for one artist.
+
+        Runs on the prefetch thread, so it must not touch scan state. Pacing
+        happens here, in front of each provider step, and only costs time
+        when the previous step made real API calls.
+        """
+        pacer.pace(pace_before)
+
+        discography_result = self.get_artist_discography_for_watchlist(artist, artist.last_scan_timestamp)
+        if discography_result is None:
+            return _PreparedArtist(discography=None)
+
+        if isinstance(discography_result, list):
+            source = 'metadata'
+            albums = discography_result
+            source_artist_id = ''
+            artist_image_url = self.get_artist_image_url(artist) or ''
+            album_fetcher = lambda album_id, album_name='': self.metadata_service.get_album(album_id)
+        else:
+            source = discography_result.source
+            albums = discography_result.albums
+            source_artist_id = discography_result.artist_id
+            artist_image_url = discography_result.image_url or self.get_artist_image_url(artist) or ''
+            album_fetcher = lambda album_id, album_name='', source=source: self._get_album_data_for_source(source, album_id, album_name)
+
+        prepared = _PreparedArtist(
+            discography=discography_result,
+            albums=list(albums or []),
+            source_artist_id=source_artist_id,
+            artist_image_url=artist_image_url,
+        )
+        if fingerprint_skip and prepared.albums:
+            prepared.fingerprint = self._release_fingerprint(artist, source, prepared.albums, lookback_period)
+            if prepared.fingerprint == self._stored_release_fingerprint(artist):
+                prepared.unchanged = True
+                return prepared
+
+        for album_index, album in enumerate(prepared.albums):
+            if stop_event.is_set():
+                break
+            if album_index > 0:
+                pacer.pace(album_delay)
+            try:
+                prepared.album_payloads.append(album_fetcher(album.id, getattr(album, 'name', '')))
+            except Exception as e:
+                logger.warning("Error fetching album %s: %s", getattr(album, 'name', album.id), e)
+                prepared.album_payloads.append(_ALBUM_FETCH_FAILED)
+                prepared.failed_albums += 1
+        return prepared
+
+    @staticmethod
+    def _release_fingerprint(artist: WatchlistArtist, source: str, albums: List[Any], lookback_period: str) -> str:
+        """Hash of the release set (album ids + track counts) and the settings
+        that decide which of its tracks the scan looks at."""
+        releases = sorted(
+            (str(getattr(album, 'id', '')), getattr(album, 'total_tracks', None) or 0)
+            for album in albums
+        )
+        settings = [
+            lookback_period,
+            getattr(artist, 'lookback_days', None),
+            *(bool(getattr(artist, flag, default)) for flag, default in (
+                ('include_albums', True), ('include_eps', True), ('include_singles', True),
+                ('include_live', False), ('include_remixes', False), ('include_acoustic', False),
+                ('include_compilations', False), ('include_instrumentals', False),
+            )),
+        ]
+        payload = json.dumps([source, settings, releases], separators=(',', ':'))
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _stored_release_fingerprint(self, artist: WatchlistArtist) -> Optional[str]:
+        getter = getattr(self.database, 'get_watchlist_release_fingerprint', None)
+        if getter is None or getattr(artist, 'id', None) is None:
+            return None
+        try:
+            return getter(artist.id)
+        except Exception as e:
+            logger.debug("Could not read release fingerprint for %s: %s", artist.artist_name, e)
+            return None
+
+    def _store_release_fingerprint(self, artist: WatchlistArtist, fingerprint: Optional[str]) -> None:
+        setter = getattr(self.database, 'set_watchlist_release_fingerprint', None)
+        if setter is None or getattr(artist, 'id', None) is None:
+            return
+        try:
+            setter(artist.id, fingerprint)
+        except Exception as e:
+            logger.debug("Could not store release fingerprint for %s: %s", artist.artist_name, e)
+
+    def _scan_prefetch_depth(self) -> int:
+        """How many artists the prefetch thread may run ahead (0 = sequential)."""
+        try:
+            from config.settings import config_manager
+            depth = int(config_manager.get('watchlist.scan_prefetch_artists', 1))
+        except Exception:
+            depth = 1
+        return max(0, min(depth, 4))
+
+    def _release_fingerprint_skip_enabled(self) -> bool:
+        try:
+            from config.settings import config_manager
+            return bool(config_manager.get('watchlist.release_fingerprint_skip', True))
+        except Exception:
+            return True
+
     def get_artist_discography(
         self,
         spotify_artist_id: str,
@@ -1638,6 +1859,7 @@ class WatchlistScanner:
             # Only pass max_pages to clients that support it (spotify_client)
             if hasattr(client, 'sp'):
                 _skip['max_pages'] = _max_pages
+            calls_before = tracker_totals_or_none()
             albums = client.get_artist_albums(artist_id, album_type='album,single', limit=50, **_skip)
 
             if albums is None:
@@ -1647,8 +1869,10 @@ class WatchlistScanner:
                 logger.debug(f"No albums found for artist {artist_id}")
                 return []
 
-            # Add small delay after fetching artist discography to be extra safe
-            time.sleep(0.3)  # 300ms breathing room
+            # Small breathing room after a discography fetch that actually hit
+            # the provider — a cache hit needs none
+            if calls_before is None or tracker_totals_or_none() != calls_before:
+                time.sleep(0.3)
 
             # Filter by release date if we have a cutoff timestamp
             if cutoff_timestamp:
@@ -2151,35 +2375,66 @@ class WatchlistScanner:
             logger.warning(f"Error checking track content type inclusion: {e}")
             return True  # Default to including on error
 
-    def is_track_missing_from_library(self, track, album_name: str = None) -> bool:
+    def _library_lookup_terms(self, track):
+        """``(original_title, artists_to_search, title_variations)`` for a library lookup."""
+        # Handle both dict and object track formats
+        if isinstance(track, dict):
+            original_title = track.get('name', 'Unknown')
+            track_artists = track.get('artists', [])
+            artists_to_search = [artist.get('name', 'Unknown') for artist in track_artists] if track_artists else ["Unknown"]
+        else:
+            original_title = track.name
+            artists_to_search = [artist.name for artist in track.artists] if track.artists else ["Unknown"]
+
+        # Generate title variations (same logic as sync page)
+        title_variations = [original_title]
+
+        # Only add cleaned version if it removes clear noise
+        cleaned_for_search = clean_track_name_for_search(original_title)
+        if cleaned_for_search.lower() != original_title.lower():
+            title_variations.append(cleaned_for_search)
+
+        # Use matching engine's conservative clean_title
+        base_title = self.matching_engine.clean_title(original_title)
+        if base_title.lower() not in [t.lower() for t in title_variations]:
+            title_variations.append(base_title)
+
+        return original_title, artists_to_search, list(dict.fromkeys(title_variations))
+
+    def prefetch_library_presence(self, tracks, album_name: str = None):
+        """Bulk-resolve every lookup ``is_track_missing_from_library`` will make for ``tracks``.
+
+        Returns a :class:`~core.library.presence.LibraryPresence` to pass back
+        in as ``presence=`` — one set-based query per album instead of a
+        LIKE search per track x artist x title variation.
+        """
+        from config.settings import config_manager
+        from core.library.presence import LibraryPresence
+        try:
+            presence = LibraryPresence(self.database, confidence_threshold=0.7,
+                                       server_source=config_manager.get_active_media_server())
+            search_album = None if config_manager.get('wishlist.allow_duplicate_tracks', True) else album_name
+            queries = []
+            for track in tracks:
+                _title, artists_to_search, variations = self._library_lookup_terms(track)
+                duration = track.get('duration_ms') if isinstance(track, dict) else getattr(track, 'duration_ms', None)
+                queries.extend((title, artist_name, search_album, duration)
+                               for artist_name in artists_to_search for title in variations)
+            presence.prefetch(queries)
+            return presence
+        except Exception as e:
+            # Per-track lookups still work — this is only a shortcut.
+            logger.debug(f"Library presence prefetch failed for '{album_name}': {e}")
+            return None
+
+    def is_track_missing_from_library(self, track, album_name: str = None, presence=None) -> bool:
         """
         Check if a track is missing from the local library.
         Uses the same matching logic as the download missing tracks modals.
+        ``presence`` is an optional prefetched lookup from ``prefetch_library_presence``.
         """
         try:
-            # Handle both dict and object track formats
-            if isinstance(track, dict):
-                original_title = track.get('name', 'Unknown')
-                track_artists = track.get('artists', [])
-                artists_to_search = [artist.get('name', 'Unknown') for artist in track_artists] if track_artists else ["Unknown"]
-            else:
-                original_title = track.name
-                artists_to_search = [artist.name for artist in track.artists] if track.artists else ["Unknown"]
-            
-            # Generate title variations (same logic as sync page)
-            title_variations = [original_title]
-            
-            # Only add cleaned version if it removes clear noise
-            cleaned_for_search = clean_track_name_for_search(original_title)
-            if cleaned_for_search.lower() != original_title.lower():
-                title_variations.append(cleaned_for_search)
-
-            # Use matching engine's conservative clean_title
-            base_title = self.matching_engine.clean_title(original_title)
-            if base_title.lower() not in [t.lower() for t in title_variations]:
-                title_variations.append(base_title)
-            
-            unique_title_variations = list(dict.fromkeys(title_variations))
+            original_title, artists_to_search, unique_title_variations = self._library_lookup_terms(track)
 
             # Search for each artist with each title variation
             from config.settings import config_manager
@@ -2266,7 +2521,10 @@ class WatchlistScanner:
                 for query_title in unique_title_variations:
                     # When allow_duplicates is on, skip album hint so we get title+artist matches only
                     search_album = None if allow_duplicates else album_name
-                    db_track, confidence = self.database.check_track_exists(query_title, artist_name, confidence_threshold=0.7, server_source=active_server, album=search_album)
+                    if presence is not None:
+                        db_track, confidence = presence.check(query_title, artist_name, album=search_album)
+                    else:
+                        db_track, confidence = self.database.check_track_exists(query_title, artist_name, confidence_threshold=0.7, server_source=active_server, album=search_album)
 
                     if db_track and confidence >= 0.7:
                         # When allow_duplicates is on, only skip if we believe
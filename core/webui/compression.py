@@ -0,0 +1,305 @@
+"""Negotiated response compression for static assets and JSON API responses.
+
+gunicorn runs one worker with 8 threads, and a thread is held for as long as a
+response takes to reach the client — a multi-MB library listing or a 500 KB
+bundle over a slow link pins one for seconds. Two layers:
+
+- Static text assets (JS/CSS/SVG/JSON/maps) are compressed once, on first
+  request, and the compressed bytes are cached in memory keyed by the file's
+  content hash. That hash is also the ETag, so a conditional request for an
+  unchanged file is a 304 whatever the mtime says.
+- JSON responses above :data:`JSON_MIN_BYTES` are compressed on the fly when
+  the client accepts it. Responses that already carry a Content-Encoding (the
+  pre-gzipped graph snapshots), are streamed / passed through, or opt out
+  with ``Cache-Control: no-transform`` are left alone.
+
+Brotli is used when the optional ``brotli`` package is installed and the
+client prefers it; gzip (stdlib) otherwise. :func:`compression_stats` reports
+bytes in / out / saved per layer, served at GET /api/debug/compression.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:  # optional — gzip is always available
+    import brotli as _brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    _brotli = None
+
+# Below about one TCP segment compression can't save a round trip, only CPU.
+JSON_MIN_BYTES = 1400
+STATIC_MIN_BYTES = 1024
+
+# Static suffixes worth compressing; images / fonts / audio are already compressed.
+COMPRESSIBLE_SUFFIXES = frozenset({
+    ".js", ".mjs", ".css", ".svg", ".json", ".map", ".txt", ".html", ".webmanifest",
+})
+
+# On-the-fly levels favour speed; static assets are compressed once, so harder.
+_LEVELS = {
+    'json': {'gzip': 6, 'br': 4},
+    'static': {'gzip': 9, 'br': 9},
+}
+
+# Upper bound on the static file bytes (originals + variants) kept in memory.
+STATIC_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings this process can produce, best first."""
+    return ('br', 'gzip') if _brotli is not None else ('gzip',)
+
+
+def negotiate_encoding(accept_encodings) -> Optional[str]:
+    """Pick the encoding to use from a werkzeug ``request.accept_encodings``
+    (``MIMEAccept``-style, indexable by name → quality). The client's highest
+    quality wins, ties go to the better codec; ``None`` = send identity."""
+    best, best_q = None, 0.0
+    for encoding in available_encodings():
+        q = accept_encodings[encoding]
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress_bytes(data: bytes, encoding: str, kind: str = 'json') -> bytes:
+    level = _LEVELS[kind][encoding]
+    if encoding == 'br':
+        return _brotli.compress(data, quality=level)
+    # mtime=0 keeps the output (and anything hashed from it) deterministic.
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+# ── stats ──
+
+_stats_lock = threading.Lock()
+
+
+def _new_stats() -> Dict[str, Dict[str, int]]:
+    return {kind: {'responses': 0, 'bytes_in': 0, 'bytes_out': 0, 'skipped': 0}
+            for kind in ('json', 'static')}
+
+
+_stats = _new_stats()
+
+
+def record_transfer(kind: str, bytes_in: int = 0, bytes_out: int = 0, skipped: bool = False) -> None:
+    """Count one ``kind`` ('json' / 'static') response sent compressed
+    (``bytes_in`` -> ``bytes_out``), or a candidate sent as identity."""
+    with _stats_lock:
+        row = _stats[kind]
+        if skipped:
+            row['skipped'] += 1
+            return
+        row['responses'] += 1
+        row['bytes_in'] += bytes_in
+        row['bytes_out'] += bytes_out
+
+
+def compression_stats() -> Dict[str, Any]:
+    """Per layer: responses compressed, bytes before / after, bytes saved, and
+    ``skipped`` (candidates sent as identity — the client didn't accept an
+    encoding we produce)."""
+    with _stats_lock:
+        out = {kind: dict(row, bytes_saved=row['bytes_in'] - row['bytes_out'])
+               for kind, row in _stats.items()}
+    out['encodings'] = list(available_encodings())
+    out['static_cache'] = _static_cache.stats()
+    return out
+
+
+def reset_compression_stats() -> Dict[str, Any]:
+    global _stats
+    with _stats_lock:
+        _stats = _new_stats()
+    return compression_stats()
+
+
+# ── JSON responses ──
+
+def compress_json_response(response, accept_encodings, min_bytes: int = JSON_MIN_BYTES):
+    """Compress a buffered JSON ``response`` in place when it's worth it and
+    the client accepts an encoding. Returns the response."""
+    if response.mimetype != 'application/json':
+        return response
+    if response.status_code < 200 or response.status_code >= 300 or response.status_code in (204, 206):
+        return response
+    if response.direct_passthrough or response.is_streamed:
+        return response
+    if 'Content-Encoding' in response.headers:
+        return response
+    if 'no-transform' in (response.headers.get('Cache-Control') or ''):
+        return response
+
+    body = response.get_data()
+    if len(body) < min_bytes:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding(accept_encodings)
+    if encoding is None:
+        record_transfer('json', skipped=True)
+        return response
+
+    compressed = compress_bytes(body, encoding, 'json')
+    if len(compressed) >= len(body):
+        return response
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        # A different representation needs a different entity tag.
+        response.set_etag(f"{etag}-{encoding}", weak=weak)
+    record_transfer('json', len(body), len(compressed))
+    return response
+
+
+# ── static assets ──
+
+class _StaticVariantCache:
+    """Content hash + compressed variants per static file, keyed by
+    (path, mtime, size) so an edited file is re-read; LRU-bounded by the
+    bytes held (originals + variants)."""
+
+    def __init__(self, max_bytes: int = STATIC_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.builds = 0
+
+    def _entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        entry = {'key': key, 'etag': hashlib.sha256(data).hexdigest()[:20], 'data': data, 'variants': {}}
+        with self._lock:
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                self._drop(stale)
+            self._entries[key] = entry
+            self._add_bytes(len(data))
+        return entry
+
+    def _add_bytes(self, n: int) -> None:
+        self._bytes += n
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry['data']) + sum(len(v) for v in entry['variants'].values())
+
+    def content_hash(self, path: Path) -> Optional[str]:
+        entry = self._entry(path)
+        return entry['etag'] if entry else None
+
+    def variant(self, path: Path, encoding: str) -> Optional[Tuple[bytes, str, int]]:
+        """``(compressed bytes, content hash, original size)``, or None when
+        the file is unreadable or doesn't shrink."""
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        body = entry['variants'].get(encoding)
+        if body is None:
+            body = compress_bytes(entry['data'], encoding, 'static')
+            with self._lock:
+                self.builds += 1
+                if entry['key'] in self._entries and encoding not in entry['variants']:
+                    entry['variants'][encoding] = body
+                    self._add_bytes(len(body))
+        else:
+            with self._lock:
+                self.hits += 1
+        if len(body) >= len(entry['data']):
+            return None
+        return body, entry['etag'], len(entry['data'])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'files': len(self._entries), 'bytes': self._bytes,
+                    'hits': self.hits, 'builds': self.builds}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.builds = 0
+
+
+_static_cache = _StaticVariantCache()
+
+
+def clear_static_variant_cache() -> None:
+    """Drop cached static variants. Primarily useful for tests."""
+    _static_cache.clear()
+
+
+def static_content_hash(path: Path) -> Optional[str]:
+    """The file's content hash (its ETag), cached alongside its variants."""
+    return _static_cache.content_hash(Path(path))
+
+
+def static_variant(path: Path, accept_encodings) -> Optional[Tuple[str, bytes, str, int]]:
+    """``(encoding, compressed bytes, content hash, original size)`` for a
+    static file the client can take compressed, else None (serve the file).
+    The caller records the transfer once it knows the body is actually sent
+    (not a 304)."""
+    path = Path(path)
+    if path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+        return None
+    try:
+        if path.stat().st_size < STATIC_MIN_BYTES:
+            return None
+    except OSError:
+        return None
+    encoding = negotiate_encoding(accept_encodings)
+    if encoding is None:
+        record_transfer('static', skipped=True)
+        return None
+    found = _static_cache.variant(path, encoding)
+    if found is None:
+        return None
+    body, etag, size = found
+    return encoding, body, etag, size
+
+
+def is_content_hashed_asset(filename: str) -> bool:
+    """Vite emits ``dist/assets/<name>-<hash>.<ext>``: the URL changes with
+    the content, so the response can be cached as immutable."""
+    return filename.replace('\\', '/').lstrip('/').startswith('dist/assets/')
+
+
+def static_tree_version(static_dir: Path) -> str:
+    """Short hash over the contents of every file under ``static_dir`` — the
+    ``?v=`` cache-bust for the unhashed legacy assets. Unlike a start-time
+    stamp it only changes when an asset does, so browser caches survive
+    restarts and a URL tagged with the current version can be immutable."""
+    digest = hashlib.sha256()
+    root = Path(static_dir)
+    for path in sorted(p for p in root.rglob('*') if p.is_file()):
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        digest.update(str(path.relative_to(root)).encode('utf-8') + b'\0')
+        digest.update(data)
+    return digest.hexdigest()[:12]
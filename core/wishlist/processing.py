@@ -582,6 +582,20 @@ def remove_tracks_already_in_library(
         for t in wishlist_service.get_wishlist_tracks_for_download(profile_id=pid):
             cleanup_tracks.append((pid, t))
 
+    def _album_name(track):
+        album = track.get('album')
+        return album.get('name') if isinstance(album, dict) else album
+
+    # One bulk library lookup for the whole wishlist instead of a LIKE-search
+    # round per track and artist credit.
+    from core.library.presence import LibraryPresence, artist_names
+    presence = LibraryPresence(music_database, confidence_threshold=0.7, server_source=active_server)
+    presence.prefetch(
+        (t.get('name', ''), name, _album_name(t), t.get('duration_ms'))
+        for _pid, t in cleanup_tracks
+        for name in artist_names(t.get('artists', []))
+    )
+
     cleanup_removed = 0
     for profile_id, track in cleanup_tracks:
         if skip_track_fn and skip_track_fn(track):
@@ -590,7 +604,7 @@ def remove_tracks_already_in_library(
         track_name = track.get('name', '')
         artists = track.get('artists', [])
         spotify_track_id = track.get('spotify_track_id') or track.get('id')
-        track_album = track.get('album', {}).get('name') if isinstance(track.get('album'), dict) else track.get('album')
+        track_album = _album_name(track)
 
         if not track_name or not artists or not spotify_track_id:
             continue
@@ -608,22 +622,9 @@ def remove_tracks_already_in_library(
 
         found_in_db = False
         matched_artist_name = ''
-        for artist in artists:
-            if isinstance(artist, str):
-                artist_name = artist
-            elif isinstance(artist, dict) and 'name' in artist:
-                artist_name = artist['name']
-            else:
-                artist_name = str(artist)
-
+        for artist_name in artist_names(artists):
             try:
-                db_track, confidence = music_database.check_track_exists(
-                    track_name,
-                    artist_name,
-                    confidence_threshold=0.7,
-                    server_source=active_server,
-                    album=track_album,
-                )
+                db_track, confidence = presence.check(track_name, artist_name, album=track_album)
 
                 if db_track and confidence >= 0.7:
                     found_in_db = True
@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
+from core.diagnostics import sql_profiler
 from utils.logging_config import get_logger
 
 logger = get_logger("music_database")
@@ -19,6 +20,40 @@ _database_initialized_paths = set()
 _database_sidecar_warnings = set()
 _database_initialization_lock = threading.Lock()
 
+# Word tokens used to pre-filter an artist's tracks in check_tracks_exist.
+_TITLE_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def _title_tokens(normalized_title: str) -> set:
+    """Words of 3+ chars (like the fuzzy LIKE fallback), or every word for very short titles."""
+    words = _TITLE_TOKEN_RE.findall(normalized_title)
+    return {w for w in words if len(w) >= 3} or set(words)
+
+
+# Basename / parent-directory keys for file paths. The media server, the
+# download pipeline and Docker mounts disagree about roots and separators, so
+# "same file" lookups used to fall back to ``file_path LIKE '%/<name>'`` — a
+# full scan per call. ``tracks`` and ``track_downloads`` carry an indexed
+# ``file_basename`` (+ ``file_parent``, the last directory name, to pick the
+# right one of several same-named files), generated from file_path. The SQL
+# below and _file_path_key must agree; both treat ``\`` as ``/``.
+def _basename_sql(expr: str) -> str:
+    # rtrim(x, <every non-slash char of x>) leaves x up to its last '/'.
+    return f"substr({expr}, length(rtrim({expr}, replace({expr}, '/', ''))) + 1)"
+
+
+def _file_key_sql(column: str) -> Tuple[str, str]:
+    """SQL expressions for (basename, parent directory name) of ``column``."""
+    norm = f"replace({column}, '\\', '/')"
+    return _basename_sql(norm), _basename_sql(f"rtrim(rtrim({norm}, replace({norm}, '/', '')), '/')")
+
+
+def _file_path_key(file_path: str) -> Tuple[str, str]:
+    """(basename, parent directory name) of a path, matching the SQL keys.
+    Lookups bind an empty parent as NULL so it never acts as a tie-breaker."""
+    head, _, base = str(file_path).replace('\\', '/').rpartition('/')
+    return base, head.rstrip('/').rpartition('/')[2]
+
 # Import matching engine for enhanced similarity logic
 try:
     from core.matching_engine import MusicMatchingEngine
@@ -247,7 +282,7 @@ class MusicDatabase:
         for attempt in range(4):
             connection = None
             try:
-                connection = sqlite3.connect(str(self.database_path), timeout=30.0)
+                connection = sql_profiler.connect(str(self.database_path), label='music', timeout=30.0)
                 connection.row_factory = sqlite3.Row
                 # Register Unicode-normalizing function for diacritics-aware LIKE queries
                 try:
@@ -651,6 +686,7 @@ class MusicDatabase:
             # dropped. Adding it here (after the last recreate) makes it stick.
             self._add_watchlist_auto_download_column(cursor)
             self._add_watchlist_quality_profile_column(cursor)
+            self._add_watchlist_release_fingerprint_table(cursor)
 
             # Spotify library cache
             self._add_spotify_library_cache_table(cursor)
@@ -660,6 +696,7 @@ class MusicDatabase:
 
             # Repair worker v2 tables (findings + job runs)
             self._add_repair_worker_tables(cursor)
+            self._add_repair_job_state_tables(cursor)
 
             # Mirrored playlists — persistent backup of parsed playlists from any service
             cursor.execute("""
@@ -1193,6 +1230,10 @@ class MusicDatabase:
             self._backfill_native_quality_profile_assignments(cursor)
 
             self._ensure_core_media_schema_columns(cursor)
+            self._ensure_file_basename_keys(cursor)
+            self._ensure_discovery_eligibility(cursor)
+            self._add_graph_change_tracking(cursor)
+            self._add_fts_search_indexes(cursor)
             self._normalize_genres_to_json(cursor)
             # Unify scattered migration state into the ledger + stamp the schema
             # version. Additive backstop — runs last, gates nothing.
@@ -1448,6 +1489,366 @@ class MusicDatabase:
         except Exception as e:
             logger.error("Error repairing core media schema columns: %s", e)
 
+    def _ensure_file_basename_keys(self, cursor):
+        """Indexed ``file_basename`` / ``file_parent`` on tracks and track_downloads
+        (and the missing plain ``tracks.file_path`` index).
+
+        Both are VIRTUAL generated columns over ``file_path``: every writer on
+        any connection keeps them current with no code on the write path, and
+        building the index is the backfill for existing rows. ``COLLATE
+        NOCASE`` keeps the ASCII case-insensitivity the old suffix LIKE had.
+        Generated columns are hidden from ``PRAGMA table_info`` (so the
+        in-place rebuild migrations never copy them); ``table_xinfo`` sees them.
+        """
+        base_sql, parent_sql = _file_key_sql('file_path')
+        for table in ('tracks', 'track_downloads'):
+            try:
+                cursor.execute(f"PRAGMA table_xinfo({table})")
+                cols = {c[1] for c in cursor.fetchall()}
+                if not cols:
+                    continue
+                for col, expr in (('file_basename', base_sql), ('file_parent', parent_sql)):
+                    if col not in cols:
+                        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col} TEXT COLLATE NOCASE "
+                                       f"GENERATED ALWAYS AS ({expr}) VIRTUAL")
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_file_basename "
+                               f"ON {table} (file_basename, file_parent)")
+                if table == 'tracks':
+                    # The exact-path probe that runs before the basename
+                    # fallback was itself a full scan (track_downloads
+                    # already has idx_td_file_path).
+                    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_file_path ON tracks (file_path)")
+            except Exception as e:
+                logger.error("Error ensuring file_basename keys on %s: %s", table, e)
+
+    # Per-row eligibility of a discovery_pool row, evaluated inside an
+    # ``UPDATE discovery_pool``. Every probe is an index lookup (tracks'
+    # source-ID indexes, the NOCASE name indexes on both blocklists). Note
+    # the column-name asymmetry: tracks.deezer_id ↔ discovery_pool.deezer_track_id.
+    _DISCOVERY_OWNED_SQL = """(
+        EXISTS (SELECT 1 FROM tracks t WHERE t.spotify_track_id = discovery_pool.spotify_track_id)
+        OR EXISTS (SELECT 1 FROM tracks t WHERE t.itunes_track_id = discovery_pool.itunes_track_id)
+        OR EXISTS (SELECT 1 FROM tracks t WHERE t.deezer_id = discovery_pool.deezer_track_id))"""
+    _DISCOVERY_BLOCKED_SQL = """(
+        EXISTS (SELECT 1 FROM discovery_artist_blacklist b WHERE b.artist_name = discovery_pool.artist_key)
+        OR EXISTS (SELECT 1 FROM blocklist k WHERE k.name = discovery_pool.artist_key AND k.entity_type = 'artist'))"""
+
+    def _ensure_discovery_eligibility(self, cursor):
+        """Maintained ``owned`` / ``blocked`` flags and a ``sample_key`` on
+        discovery_pool, so playlist selection is a partial-index walk instead
+        of a correlated NOT EXISTS over three OR'd ID columns, a blocklist
+        subquery and ``ORDER BY RANDOM()`` over the whole pool.
+
+        - ``artist_key`` — VIRTUAL ``LOWER(artist_name)``, indexed; the same
+          normalization the old ``LOWER(artist_name) NOT IN (...)`` used.
+        - ``owned`` — a ``tracks`` row shares a source ID with this row.
+        - ``blocked`` — the artist is on discovery_artist_blacklist or is an
+          artist entry in the blocklist (any profile, as before).
+        - ``sample_key`` — a random() drawn once per row; selection reads a
+          window of it from a random pivot (see PersonalizedPlaylistsService).
+
+        Triggers on tracks, both blocklists and discovery_pool itself keep
+        the flags current from any writer. In-place table rebuilds drop
+        their triggers, so this runs (and fully resyncs the flags — a pool
+        is a few thousand rows) on every start.
+        """
+        try:
+            cursor.execute("PRAGMA table_xinfo(discovery_pool)")
+            cols = {c[1] for c in cursor.fetchall()}
+            if not cols:
+                return
+            if 'artist_key' not in cols:
+                cursor.execute("ALTER TABLE discovery_pool ADD COLUMN artist_key TEXT "
+                               "GENERATED ALWAYS AS (LOWER(artist_name)) VIRTUAL")
+            for col in ('owned', 'blocked'):
+                if col not in cols:
+                    cursor.execute(f"ALTER TABLE discovery_pool ADD COLUMN {col} INTEGER NOT NULL DEFAULT 0")
+            if 'sample_key' not in cols:
+                cursor.execute("ALTER TABLE discovery_pool ADD COLUMN sample_key INTEGER")
+            # The profile-v2 rebuild dropped the table's original indexes; the
+            # tracks triggers below look rows up by each source ID.
+            for index, col in (('idx_discovery_pool_spotify_track', 'spotify_track_id'),
+                               ('idx_discovery_pool_itunes_track', 'itunes_track_id'),
+                               ('idx_discovery_pool_deezer_track', 'deezer_track_id'),
+                               ('idx_discovery_pool_artist_key', 'artist_key')):
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index} ON discovery_pool ({col})")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_discovery_pool_eligible_sample "
+                           "ON discovery_pool (source, sample_key) WHERE owned = 0 AND blocked = 0")
+
+            owned, blocked = self._DISCOVERY_OWNED_SQL, self._DISCOVERY_BLOCKED_SQL
+            ids_match = ("discovery_pool.spotify_track_id = {r}.spotify_track_id "
+                         "OR discovery_pool.itunes_track_id = {r}.itunes_track_id "
+                         "OR discovery_pool.deezer_track_id = {r}.deezer_id")
+            triggers = {
+                'trg_discovery_pool_eligibility_insert': f"""
+                    AFTER INSERT ON discovery_pool BEGIN
+                        UPDATE discovery_pool SET owned = {owned}, blocked = {blocked},
+                            sample_key = COALESCE(sample_key, random())
+                        WHERE id = NEW.id;
+                    END""",
+                'trg_discovery_pool_eligibility_update': f"""
+                    AFTER UPDATE OF artist_name, spotify_track_id, itunes_track_id, deezer_track_id
+                    ON discovery_pool BEGIN
+                        UPDATE discovery_pool SET owned = {owned}, blocked = {blocked} WHERE id = NEW.id;
+                    END""",
+                'trg_tracks_discovery_owned_insert': f"""
+                    AFTER INSERT ON tracks BEGIN
+                        UPDATE discovery_pool SET owned = 1
+                        WHERE owned = 0 AND ({ids_match.format(r='NEW')});
+                    END""",
+                'trg_tracks_discovery_owned_delete': f"""
+                    AFTER DELETE ON tracks BEGIN
+                        UPDATE discovery_pool SET owned = {owned}
+                        WHERE owned = 1 AND ({ids_match.format(r='OLD')});
+                    END""",
+                'trg_tracks_discovery_owned_update': f"""
+                    AFTER UPDATE OF spotify_track_id, itunes_track_id, deezer_id ON tracks BEGIN
+                        UPDATE discovery_pool SET owned = {owned}
+                        WHERE {ids_match.format(r='OLD')} OR {ids_match.format(r='NEW')};
+                    END""",
+            }
+            for table, name_col, guard in (('discovery_artist_blacklist', 'artist_name', ''),
+                                           ('blocklist', 'name', "entity_type = 'artist'")):
+                for event, ref in (('INSERT', 'NEW'), ('DELETE', 'OLD')):
+                    when = f"WHEN {ref}.{guard} " if guard else ""
+                    triggers[f'trg_{table}_discovery_blocked_{event.lower()}'] = f"""
+                        AFTER {event} ON {table} {when}BEGIN
+                            UPDATE discovery_pool SET blocked = {blocked}
+                            WHERE artist_key = LOWER({ref}.{name_col});
+                        END"""
+                triggers[f'trg_{table}_discovery_blocked_update'] = f"""
+                    AFTER UPDATE ON {table} BEGIN
+                        UPDATE discovery_pool SET blocked = {blocked}
+                        WHERE artist_key IN (LOWER(OLD.{name_col}), LOWER(NEW.{name_col}));
+                    END"""
+            for name, body in triggers.items():
+                cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+            cursor.execute(f"UPDATE discovery_pool SET owned = {owned}, blocked = {blocked}, "
+                           f"sample_key = COALESCE(sample_key, random())")
+        except Exception as e:
+            logger.error("Error ensuring discovery_pool eligibility flags: %s", e)
+
+    def _add_graph_change_tracking(self, cursor):
+        """Change counters behind the cached artist-graph snapshots
+        (core/graph/snapshots.py).
+
+        ``graph_data_versions`` holds one counter per scope (``artists``,
+        ``similar_artists``), bumped by triggers on exactly the columns the
+        graphs read — the enrichment workers' constant status updates don't
+        invalidate anything. ``graph_similar_changes`` records, per profile
+        and source artist, the similar_artists counter value of its latest
+        change, so a snapshot can reload just the touched source artists'
+        rows instead of the whole table. Recreated on every start because
+        the in-place table rebuilds drop their triggers.
+        """
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS graph_data_versions (
+                    scope TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS graph_similar_changes (
+                    profile_id INTEGER NOT NULL,
+                    source_artist_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    PRIMARY KEY (profile_id, source_artist_id)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_graph_similar_changes_seq "
+                           "ON graph_similar_changes (profile_id, seq)")
+
+            cursor.execute("INSERT OR IGNORE INTO graph_data_versions (scope, version) "
+                           "VALUES ('artists', 0), ('similar_artists', 0)")
+
+            # Plain UPDATE / DELETE+INSERT rather than OR REPLACE: a trigger's
+            # conflict clause is overridden by the outer statement's, so the
+            # similar_artists UPSERT would turn OR REPLACE back into ABORT.
+            def bump(scope):
+                return f"UPDATE graph_data_versions SET version = version + 1 WHERE scope = '{scope}';"
+
+            def log_source(ref):
+                return ("DELETE FROM graph_similar_changes "
+                        f"WHERE profile_id = COALESCE({ref}.profile_id, 1) AND source_artist_id = {ref}.source_artist_id; "
+                        "INSERT INTO graph_similar_changes (profile_id, source_artist_id, seq) "
+                        f"VALUES (COALESCE({ref}.profile_id, 1), {ref}.source_artist_id, "
+                        "(SELECT version FROM graph_data_versions WHERE scope = 'similar_artists'));")
+
+            # Library syncs and similar-artist refreshes rewrite rows with the
+            # values they already hold; only a real change may invalidate the
+            # cached graphs.
+            def changed(cols):
+                return "WHEN " + " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in cols)
+
+            artist_cols = ("id", "name", "thumb_url", "genres", "server_source")
+            similar_cols = ("profile_id", "source_artist_id", "similar_artist_name", "similar_artist_spotify_id",
+                            "similar_artist_deezer_id", "similar_artist_itunes_id", "occurrence_count",
+                            "popularity", "image_url", "genres")
+            triggers = {
+                'trg_artists_graph_insert': f"AFTER INSERT ON artists BEGIN {bump('artists')} END",
+                'trg_artists_graph_delete': f"AFTER DELETE ON artists BEGIN {bump('artists')} END",
+                'trg_artists_graph_update':
+                    f"AFTER UPDATE OF {', '.join(artist_cols)} ON artists {changed(artist_cols)} "
+                    f"BEGIN {bump('artists')} END",
+                'trg_similar_artists_graph_insert':
+                    f"AFTER INSERT ON similar_artists BEGIN {bump('similar_artists')} {log_source('NEW')} END",
+                'trg_similar_artists_graph_delete':
+                    f"AFTER DELETE ON similar_artists BEGIN {bump('similar_artists')} {log_source('OLD')} END",
+                'trg_similar_artists_graph_update':
+                    f"AFTER UPDATE OF {', '.join(similar_cols)} ON similar_artists {changed(similar_cols)} "
+                    f"BEGIN {bump('similar_artists')} {log_source('OLD')} {log_source('NEW')} END",
+            }
+            for name, body in triggers.items():
+                # Replace a trigger created by an older build (e.g. one
+                # without the WHEN guard); SQLite stores the text minus
+                # IF NOT EXISTS.
+                row = cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                                     (name,)).fetchone()
+                if row and row[0] != f"CREATE TRIGGER {name} {body}":
+                    cursor.execute(f"DROP TRIGGER {name}")
+                cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+        except Exception as e:
+            logger.error("Error adding graph change tracking: %s", e)
+
+    # FTS5 index -> (content table, indexed columns). External-content
+    # tables: the index stores tokens only, the text stays in the base table.
+    _FTS_INDEXES = {
+        'chat_room_messages_fts': ('chat_room_messages', ('message', 'username')),
+        'notification_history_fts': ('notification_history', ('message',)),
+        'track_downloads_fts': ('track_downloads',
+                                ('track_title', 'track_artist', 'track_album', 'source_filename')),
+    }
+
+    def _add_fts_search_indexes(self, cursor):
+        """FTS5 shadow indexes behind chat archive, notification history and
+        download history search, which used to ``LIKE '%q%'`` over the whole
+        (ever-growing) table on every keystroke.
+
+        Triggers keep each index in step with its table. An index holding a
+        different number of rows than its table — just created, or left
+        behind while the triggers were missing — is rebuilt from the table,
+        which is also the backfill for existing history.
+
+        Without FTS5 in this SQLite build the triggers are dropped (they'd
+        make every insert fail) and the search methods keep using LIKE.
+        """
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.fts5_probe USING fts5(x)")
+            cursor.execute("DROP TABLE temp.fts5_probe")
+            available = True
+        except sqlite3.OperationalError:
+            available = False
+
+        for fts, (table, cols) in self._FTS_INDEXES.items():
+            try:
+                if not available:
+                    for event in ('insert', 'delete', 'update'):
+                        cursor.execute(f"DROP TRIGGER IF EXISTS trg_{fts}_{event}")
+                    continue
+                col_list = ', '.join(cols)
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({col_list}, content='{table}', "
+                    "content_rowid='id', tokenize='unicode61 remove_diacritics 2')")
+                new_vals = ', '.join(f"new.{c}" for c in cols)
+                old_vals = ', '.join(f"old.{c}" for c in cols)
+                insert = f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_vals});"
+                delete = f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_vals});"
+                triggers = {
+                    'insert': f"AFTER INSERT ON {table} BEGIN {insert} END",
+                    'delete': f"AFTER DELETE ON {table} BEGIN {delete} END",
+                    'update': f"AFTER UPDATE OF {col_list} ON {table} BEGIN {delete} {insert} END",
+                }
+                for event, body in triggers.items():
+                    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{fts}_{event} {body}")
+
+                indexed = cursor.execute(f"SELECT COUNT(*) FROM {fts}_docsize").fetchone()[0]
+                rows = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                if indexed != rows:
+                    cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+                    logger.info(f"Rebuilt {fts} search index ({rows} rows)")
+            except Exception as e:
+                logger.error("Error adding search index %s: %s", fts, e)
+
+    @staticmethod
+    def _fts_match_expression(query: str) -> Optional[str]:
+        """An FTS5 MATCH expression for a search box query: every word must
+        appear, the last characters typed so far as a prefix of a word (each
+        term quoted, so FTS syntax in user input stays literal). None when
+        the query has no indexable word at all (e.g. ``%``). Words are split
+        the way the unicode61 tokenizer splits them, so ``_`` separates too."""
+        words = re.findall(r'[^\W_]+', query)
+        if not words:
+            return None
+        return ' '.join('"' + w.replace('"', '""') + '"*' for w in words)
+
+    @staticmethod
+    def _like_substring(query: str) -> str:
+        """``%query%`` for ``LIKE ... ESCAPE '\\'``, with the LIKE wildcards in
+        the user's query escaped to literals."""
+        return '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+    # Ranked searches score only the newest this-many matching rows: bm25 over
+    # every message containing a very common word costs more than the LIKE
+    # scan it replaces, and the best of the newest 500 is what a search box
+    # wants anyway. Rarer words (fewer hits) are ranked exhaustively.
+    _FTS_RANK_WINDOW = 500
+
+    def _search_rows(self, fts: str, alias: str, query: str, build, where: str = '1',
+                     args=(), ranked: bool = True) -> List[Dict[str, Any]]:
+        """Run a text search through one of the :attr:`_FTS_INDEXES`.
+
+        ``where`` / ``args`` are the caller's own restriction on the content
+        table ``alias`` (a room, a profile). ``build(source, where, args,
+        rank)`` returns the ``(sql, params)`` to run, as ``SELECT ... FROM
+        {source} WHERE {where} ...`` with ``args`` ahead of any params of its
+        own: ``source`` gives the content table as ``alias`` (driven by the
+        index when there is one), ``where`` / ``args`` restrict it to the
+        caller's rows matching ``query``, and ``rank`` orders by relevance
+        (None for an unranked search or the LIKE fallback).
+
+        Every word of the query must start a word in one of the indexed
+        columns. A query with punctuation the index can't see (``100%``,
+        ``foo_bar``) must also match as a literal substring. When the index is missing or
+        this SQLite has no FTS5, or the query has no words at all, the search
+        is that case-insensitive substring match alone.
+        """
+        table, cols = self._FTS_INDEXES[fts]
+        args = list(args)
+        like = self._like_substring(query)
+        like_where = '(' + ' OR '.join(f"{alias}.{c} LIKE ? ESCAPE '\\'" for c in cols) + ')'
+        like_args = [like] * len(cols)
+        match = self._fts_match_expression(query)
+        with self._get_connection() as conn:
+            if match is not None:
+                hit_where, hit_args = where, args
+                if re.search(r'[^\w\s]|_', query):
+                    hit_where, hit_args = f"{where} AND {like_where}", args + like_args
+                # The index is the outer loop (CROSS JOIN), rather than being
+                # probed once per row of a room / profile. The MATCH
+                # expression is inlined: it is quoted word characters only.
+                if ranked:
+                    # The window is cut after the caller's filters, so it
+                    # holds the newest matching rows of *this* room/profile.
+                    source = (f"(SELECT {fts}.rowid AS rowid, {fts}.rank AS rank FROM {fts} "
+                              f"CROSS JOIN {table} {alias} ON {alias}.id = {fts}.rowid "
+                              f"WHERE {fts} MATCH '{match}' AND {hit_where} "
+                              f"ORDER BY {fts}.rowid DESC LIMIT {self._FTS_RANK_WINDOW}) "
+                              f"AS hits CROSS JOIN {table} {alias} ON {alias}.id = hits.rowid")
+                    text_where, text_args = '1', hit_args
+                else:
+                    source = (f"(SELECT rowid FROM {fts} WHERE {fts} MATCH '{match}') AS hits "
+                              f"CROSS JOIN {table} {alias} ON {alias}.id = hits.rowid")
+                    text_where, text_args = hit_where, hit_args
+                try:
+                    sql, params = build(source, text_where, text_args, 'hits.rank' if ranked else None)
+                    return [dict(r) for r in conn.execute(sql, params).fetchall()]
+                except sqlite3.OperationalError as e:
+                    logger.debug("%s unusable, searching %s with LIKE: %s", fts, table, e)
+            sql, params = build(f"{table} {alias}", f"{where} AND {like_where}", args + like_args, None)
+            return [dict(r) for r in conn.execute(sql, params).fetchall()]
+
     def _ensure_wishlist_quality_columns(self, cursor):
         """Give every wishlist row a pointer to its own quality profile.
 
@@ -2716,6 +3117,21 @@ class MusicDatabase:
         except Exception as e:
             logger.error(f"Error adding watchlist quality profile column: {e}")
 
+    def _add_watchlist_release_fingerprint_table(self, cursor):
+        """Per-artist fingerprint of the release set seen by the last clean
+        watchlist scan. Kept in its own table (keyed by watchlist_artists.id)
+        so the watchlist table recreations never have to know about it."""
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS watchlist_release_fingerprints (
+                    watchlist_artist_id INTEGER PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+        except Exception as e:
+            logger.error(f"Error creating watchlist_release_fingerprints table: {e}")
+
     def _add_watchlist_lookback_days_column(self, cursor):
         """Add per-artist lookback_days column to watchlist_artists table"""
         try:
@@ -5755,6 +6171,37 @@ class MusicDatabase:
         except Exception as e:
             logger.error(f"Error creating repair worker v2 tables: {e}")
 
+    def _add_repair_job_state_tables(self, cursor):
+        """State repair jobs carry between runs: the ledger of files a job has
+        fully verified (e.g. a clean ``flac -t``), fingerprinted by size, mtime
+        and the FLAC STREAMINFO MD5 so an unchanged file isn't decoded again;
+        and the resume cursor of a scan that was interrupted part-way."""
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS repair_verified_files (
+                    job_id TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    streaminfo_md5 TEXT,
+                    verifier TEXT,
+                    verified_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, path)
+                ) WITHOUT ROWID
+            """)
+            # parked = the run was stopped on purpose (user stop / job turned
+            # off): resume on its next regular run rather than straight away.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS repair_job_checkpoints (
+                    job_id TEXT PRIMARY KEY,
+                    cursor_json TEXT NOT NULL,
+                    parked INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+        except Exception as e:
+            logger.error(f"Error creating repair job state tables: {e}")
+
     def _init_manual_library_match_table(self):
         """Create manual_library_track_matches table and indexes."""
         try:
@@ -5843,10 +6290,11 @@ class MusicDatabase:
             row = cursor.fetchone()
             if row:
                 return str(row[0])
-            import os as _os
-            fname = _os.path.basename(str(file_path).replace('\\', '/'))
+            fname, parent = _file_path_key(file_path)
             if fname:
-                cursor.execute("SELECT id FROM tracks WHERE file_path LIKE ? LIMIT 1", (f"%{fname}",))
+                cursor.execute(
+                    "SELECT id FROM tracks WHERE file_basename = ? "
+                    "ORDER BY file_parent = ? DESC LIMIT 1", (fname, parent or None))
                 row = cursor.fetchone()
                 if row:
                     return str(row[0])
@@ -6783,44 +7231,7 @@ class MusicDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Convert artist ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
-                artist_id = str(artist_obj.ratingKey)
-                raw_name = artist_obj.title
-                # Normalize artist name to handle quote variations and other inconsistencies
-                name = self._normalize_artist_name(raw_name)
-
-                # Debug logging to see if normalization is working
-                if raw_name != name:
-                    logger.info(f"Artist name normalized: '{raw_name}' -> '{name}'")
-                thumb_url = getattr(artist_obj, 'thumb', None)
-                
-                # Only preserve timestamps and flags from summary, not full biography
-                full_summary = getattr(artist_obj, 'summary', None) or ''
-                summary = None
-                if full_summary:
-                    # Extract only our tracking markers (timestamps and ignore flags)
-                    import re
-                    markers = []
-                    
-                    # Extract timestamp marker
-                    timestamp_match = re.search(r'-updatedAt\d{4}-\d{2}-\d{2}', full_summary)
-                    if timestamp_match:
-                        markers.append(timestamp_match.group(0))
-                    
-                    # Extract ignore flag
-                    if '-IgnoreUpdate' in full_summary:
-                        markers.append('-IgnoreUpdate')
-                    
-                    # Only store markers, not full biography
-                    summary = '\n\n'.join(markers) if markers else None
-                
-                # Get genres (handle both Plex and Jellyfin formats)
-                genres = []
-                if hasattr(artist_obj, 'genres') and artist_obj.genres:
-                    genres = [genre.tag if hasattr(genre, 'tag') else str(genre) 
-                             for genre in artist_obj.genres]
-                
-                genres_json = json.dumps(genres) if genres else None
+                artist_id, name, thumb_url, genres_json, summary = self._media_artist_fields(artist_obj)
                 
                 # Check if artist exists with this ID and server source
                 cursor.execute("SELECT id FROM artists WHERE id = ? AND server_source = ?", (artist_id, server_source))
@@ -6922,6 +7333,51 @@ class MusicDatabase:
             logger.error(f"Error inserting/updating {server_source} artist {getattr(artist_obj, 'title', 'Unknown')}: {e}")
             return False
 
+    def _media_artist_fields(self, artist_obj) -> Tuple[str, str, Optional[str], Optional[str], Optional[str]]:
+        """Server artist object -> ``(id, name, thumb_url, genres_json, summary)`` as stored.
+
+        Shared by :meth:`insert_or_update_media_artist` and :meth:`bulk_upsert_media_library`.
+        """
+        # Convert artist ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
+        artist_id = str(artist_obj.ratingKey)
+        raw_name = artist_obj.title
+        # Normalize artist name to handle quote variations and other inconsistencies
+        name = self._normalize_artist_name(raw_name)
+
+        # Debug logging to see if normalization is working
+        if raw_name != name:
+            logger.info(f"Artist name normalized: '{raw_name}' -> '{name}'")
+        thumb_url = getattr(artist_obj, 'thumb', None)
+
+        # Only preserve timestamps and flags from summary, not full biography
+        full_summary = getattr(artist_obj, 'summary', None) or ''
+        summary = None
+        if full_summary:
+            # Extract only our tracking markers (timestamps and ignore flags)
+            import re
+            markers = []
+
+            # Extract timestamp marker
+            timestamp_match = re.search(r'-updatedAt\d{4}-\d{2}-\d{2}', full_summary)
+            if timestamp_match:
+                markers.append(timestamp_match.group(0))
+
+            # Extract ignore flag
+            if '-IgnoreUpdate' in full_summary:
+                markers.append('-IgnoreUpdate')
+
+            # Only store markers, not full biography
+            summary = '\n\n'.join(markers) if markers else None
+
+        # Get genres (handle both Plex and Jellyfin formats)
+        genres = []
+        if hasattr(artist_obj, 'genres') and artist_obj.genres:
+            genres = [genre.tag if hasattr(genre, 'tag') else str(genre)
+                      for genre in artist_obj.genres]
+
+        genres_json = json.dumps(genres) if genres else None
+        return artist_id, name, thumb_url, genres_json, summary
+
     def _normalize_artist_name(self, name: str) -> str:
         """
         Normalize artist names to handle inconsistencies like quote variations.
@@ -6968,29 +7424,35 @@ class MusicDatabase:
         """Insert or update album from Plex album object - DEPRECATED: Use insert_or_update_media_album instead"""
         return self.insert_or_update_media_album(plex_album, artist_id, server_source='plex')
     
+    @staticmethod
+    def _media_album_fields(album_obj) -> Tuple[str, str, Any, Optional[str], Optional[str], Any, Any]:
+        """Server album object -> ``(id, title, year, thumb_url, genres_json, track_count, duration)``."""
+        # Convert album ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
+        album_id = str(album_obj.ratingKey)
+        title = album_obj.title
+        year = getattr(album_obj, 'year', None)
+        thumb_url = getattr(album_obj, 'thumb', None)
+
+        # Get track count and duration (handle different server attributes)
+        track_count = getattr(album_obj, 'leafCount', None) or getattr(album_obj, 'childCount', None)
+        duration = getattr(album_obj, 'duration', None)
+
+        # Get genres (handle both Plex and Jellyfin formats)
+        genres = []
+        if hasattr(album_obj, 'genres') and album_obj.genres:
+            genres = [genre.tag if hasattr(genre, 'tag') else str(genre)
+                      for genre in album_obj.genres]
+
+        genres_json = json.dumps(genres) if genres else None
+        return album_id, title, year, thumb_url, genres_json, track_count, duration
+
     def insert_or_update_media_album(self, album_obj, artist_id: str, server_source: str = 'plex') -> bool:
         """Insert or update album from media server album object (Plex or Jellyfin)"""
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            # Convert album ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
-            album_id = str(album_obj.ratingKey)
-            title = album_obj.title
-            year = getattr(album_obj, 'year', None)
-            thumb_url = getattr(album_obj, 'thumb', None)
-            
-            # Get track count and duration (handle different server attributes)
-            track_count = getattr(album_obj, 'leafCount', None) or getattr(album_obj, 'childCount', None)
-            duration = getattr(album_obj, 'duration', None)
-            
-            # Get genres (handle both Plex and Jellyfin formats)
-            genres = []
-            if hasattr(album_obj, 'genres') and album_obj.genres:
-                genres = [genre.tag if hasattr(genre, 'tag') else str(genre) 
-                         for genre in album_obj.genres]
-            
-            genres_json = json.dumps(genres) if genres else None
+            album_id, title, year, thumb_url, genres_json, track_count, duration = self._media_album_fields(album_obj)
             
             # Check if album exists with this ID (PRIMARY KEY check)
             cursor.execute("SELECT id, server_source FROM albums WHERE id = ?", (album_id,))
@@ -7204,6 +7666,113 @@ class MusicDatabase:
         """Insert or update track from Plex track object - DEPRECATED: Use insert_or_update_media_track instead"""
         return self.insert_or_update_media_track(plex_track, album_id, artist_id, server_source='plex')
     
+    @staticmethod
+    def _media_track_fields(track_obj) -> Dict[str, Any]:
+        """Server track object -> the server-provided ``tracks`` columns.
+
+        ``nav_artist`` is the Navidrome/Subsonic per-track artist string; the caller
+        keeps it as ``track_artist`` only when it differs from the album artist's name
+        (which needs the artists row, so it isn't resolved here).
+        """
+        # Convert track ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
+        track_id = str(track_obj.ratingKey)
+        title = track_obj.title
+        track_number = getattr(track_obj, 'trackNumber', None)
+        # Multi-disc: capture the disc number so multi-disc albums don't all
+        # collapse onto disc 1 (which mis-files disc-2+ tracks and flags them
+        # "missing"). Jellyfin/Navidrome wrappers set .discNumber; plexapi's Track
+        # exposes .parentIndex. Floor to >=1 — a missing/0 disc is disc 1.
+        _raw_disc = getattr(track_obj, 'discNumber', None)
+        if _raw_disc is None:
+            _raw_disc = getattr(track_obj, 'parentIndex', None)
+        try:
+            disc_number = int(_raw_disc)
+            if disc_number < 1:
+                disc_number = 1
+        except (TypeError, ValueError):
+            disc_number = 1
+        duration = getattr(track_obj, 'duration', None)
+
+        # Get file path and media info (Plex-specific, Jellyfin may not have these)
+        file_path = None
+        bitrate = None
+        file_size = None
+        if hasattr(track_obj, 'media') and track_obj.media:
+            media = track_obj.media[0] if track_obj.media else None
+            if media:
+                if hasattr(media, 'parts') and media.parts:
+                    part = media.parts[0]
+                    file_path = getattr(part, 'file', None)
+                    # Plex's MediaPart exposes the file size in bytes
+                    # via plexapi — pull it for the Library Disk
+                    # Usage card on Stats. None when the server
+                    # didn't report a size.
+                    _plex_size = getattr(part, 'size', None)
+                    if isinstance(_plex_size, int) and _plex_size > 0:
+                        file_size = _plex_size
+                bitrate = getattr(media, 'bitrate', None)
+
+        # Fallback for Navidrome/Subsonic tracks
+        if file_path is None and hasattr(track_obj, 'path') and track_obj.path:
+            file_path = track_obj.path
+        if bitrate is None and hasattr(track_obj, 'bitRate') and track_obj.bitRate:
+            bitrate = track_obj.bitRate
+        if file_path is None and hasattr(track_obj, 'suffix') and track_obj.suffix:
+            file_path = f"{track_obj.title}.{track_obj.suffix}"
+        # File size: Jellyfin / Navidrome / SoulSync-standalone
+        # all set track_obj.file_size on their wrapper class.
+        # Plex came in via the media.parts[0].size path above —
+        # don't clobber that.
+        if file_size is None and hasattr(track_obj, 'file_size'):
+            _wrapper_size = getattr(track_obj, 'file_size', None)
+            if isinstance(_wrapper_size, int) and _wrapper_size > 0:
+                file_size = _wrapper_size
+
+        # Extract per-track artist for compilations/DJ mixes.
+        # Only stored when it differs from the album artist.
+        track_artist = None
+        # Plex: originalTitle holds the per-track artist on compilation albums
+        plex_original = getattr(track_obj, 'originalTitle', None)
+        if plex_original and plex_original.strip():
+            track_artist = plex_original.strip()
+        # Jellyfin/Emby: store ALL ArtistItems, not just [0]. A track
+        # like "Super Single" by Artist1 feat. Artist2 has both names in
+        # ArtistItems; if we kept only the first, completion checks for
+        # Artist2's discography (where the same track also appears as a
+        # single) would never find this row in the library. Joining with
+        # "; " matches Jellyfin's own UI convention and lets the search
+        # path treat each name as a separate artist credit.
+        if not track_artist and hasattr(track_obj, '_data'):
+            raw = getattr(track_obj, '_data', {}) or {}
+            artist_items = raw.get('ArtistItems', [])
+            if artist_items:
+                jf_track_artist_names = [
+                    a.get('Name', '') for a in artist_items if a.get('Name')
+                ]
+                jf_track_artist = '; '.join(jf_track_artist_names)
+                album_artists = raw.get('AlbumArtists', [])
+                jf_album_artist = album_artists[0].get('Name', '') if album_artists else ''
+                # Store when the track has multiple artists OR when the
+                # single-artist credit differs from the album artist.
+                if jf_track_artist and (
+                    len(jf_track_artist_names) > 1
+                    or jf_track_artist != jf_album_artist
+                ):
+                    track_artist = jf_track_artist
+
+        # Extract MusicBrainz recording ID from server if available (Navidrome provides this)
+        mbid = getattr(track_obj, 'musicBrainzId', None) or None
+
+        nav_artist = None
+        if not track_artist and hasattr(track_obj, 'artist') and isinstance(getattr(track_obj, 'artist', None), str):
+            nav_artist = getattr(track_obj, 'artist', '').strip() or None
+
+        return {
+            'id': track_id, 'title': title, 'track_number': track_number, 'disc_number': disc_number,
+            'duration': duration, 'file_path': file_path, 'bitrate': bitrate, 'file_size': file_size,
+            'track_artist': track_artist, 'nav_artist': nav_artist, 'musicbrainz_recording_id': mbid,
+        }
+
     def insert_or_update_media_track(self, track_obj, album_id: str, artist_id: str, server_source: str = 'plex') -> bool:
         """Insert or update track from media server track object (Plex or Jellyfin) with retry logic"""
         max_retries = 3
@@ -7217,106 +7786,23 @@ class MusicDatabase:
                 # Set shorter timeout to prevent long locks
                 cursor.execute("PRAGMA busy_timeout = 10000")  # 10 second timeout
                 
-                # Convert track ID to string (handles both Plex integer IDs and Jellyfin GUIDs)
-                track_id = str(track_obj.ratingKey)
-                title = track_obj.title
-                track_number = getattr(track_obj, 'trackNumber', None)
-                # Multi-disc: capture the disc number so multi-disc albums don't all
-                # collapse onto disc 1 (which mis-files disc-2+ tracks and flags them
-                # "missing"). Jellyfin/Navidrome wrappers set .discNumber; plexapi's Track
-                # exposes .parentIndex. Floor to >=1 — a missing/0 disc is disc 1.
-                _raw_disc = getattr(track_obj, 'discNumber', None)
-                if _raw_disc is None:
-                    _raw_disc = getattr(track_obj, 'parentIndex', None)
-                try:
-                    disc_number = int(_raw_disc)
-                    if disc_number < 1:
-                        disc_number = 1
-                except (TypeError, ValueError):
-                    disc_number = 1
-                duration = getattr(track_obj, 'duration', None)
-                
-                # Get file path and media info (Plex-specific, Jellyfin may not have these)
-                file_path = None
-                bitrate = None
-                file_size = None
-                if hasattr(track_obj, 'media') and track_obj.media:
-                    media = track_obj.media[0] if track_obj.media else None
-                    if media:
-                        if hasattr(media, 'parts') and media.parts:
-                            part = media.parts[0]
-                            file_path = getattr(part, 'file', None)
-                            # Plex's MediaPart exposes the file size in bytes
-                            # via plexapi — pull it for the Library Disk
-                            # Usage card on Stats. None when the server
-                            # didn't report a size.
-                            _plex_size = getattr(part, 'size', None)
-                            if isinstance(_plex_size, int) and _plex_size > 0:
-                                file_size = _plex_size
-                        bitrate = getattr(media, 'bitrate', None)
-
-                # Fallback for Navidrome/Subsonic tracks
-                if file_path is None and hasattr(track_obj, 'path') and track_obj.path:
-                    file_path = track_obj.path
-                if bitrate is None and hasattr(track_obj, 'bitRate') and track_obj.bitRate:
-                    bitrate = track_obj.bitRate
-                if file_path is None and hasattr(track_obj, 'suffix') and track_obj.suffix:
-                    file_path = f"{track_obj.title}.{track_obj.suffix}"
-                # File size: Jellyfin / Navidrome / SoulSync-standalone
-                # all set track_obj.file_size on their wrapper class.
-                # Plex came in via the media.parts[0].size path above —
-                # don't clobber that.
-                if file_size is None and hasattr(track_obj, 'file_size'):
-                    _wrapper_size = getattr(track_obj, 'file_size', None)
-                    if isinstance(_wrapper_size, int) and _wrapper_size > 0:
-                        file_size = _wrapper_size
-
-                # Extract per-track artist for compilations/DJ mixes.
-                # Only stored when it differs from the album artist.
-                track_artist = None
-                # Plex: originalTitle holds the per-track artist on compilation albums
-                plex_original = getattr(track_obj, 'originalTitle', None)
-                if plex_original and plex_original.strip():
-                    track_artist = plex_original.strip()
-                # Jellyfin/Emby: store ALL ArtistItems, not just [0]. A track
-                # like "Super Single" by Artist1 feat. Artist2 has both names in
-                # ArtistItems; if we kept only the first, completion checks for
-                # Artist2's discography (where the same track also appears as a
-                # single) would never find this row in the library. Joining with
-                # "; " matches Jellyfin's own UI convention and lets the search
-                # path treat each name as a separate artist credit.
-                if not track_artist and hasattr(track_obj, '_data'):
-                    raw = getattr(track_obj, '_data', {}) or {}
-                    artist_items = raw.get('ArtistItems', [])
-                    if artist_items:
-                        jf_track_artist_names = [
-                            a.get('Name', '') for a in artist_items if a.get('Name')
-                        ]
-                        jf_track_artist = '; '.join(jf_track_artist_names)
-                        album_artists = raw.get('AlbumArtists', [])
-                        jf_album_artist = album_artists[0].get('Name', '') if album_artists else ''
-                        # Store when the track has multiple artists OR when the
-                        # single-artist credit differs from the album artist.
-                        if jf_track_artist and (
-                            len(jf_track_artist_names) > 1
-                            or jf_track_artist != jf_album_artist
-                        ):
-                            track_artist = jf_track_artist
+                fields = self._media_track_fields(track_obj)
+                track_id, title, file_path = fields['id'], fields['title'], fields['file_path']
+                track_number, disc_number = fields['track_number'], fields['disc_number']
+                duration, bitrate, file_size = fields['duration'], fields['bitrate'], fields['file_size']
+                track_artist, mbid = fields['track_artist'], fields['musicbrainz_recording_id']
                 # Navidrome/Subsonic: artist attribute is per-track
-                if not track_artist and hasattr(track_obj, 'artist') and isinstance(getattr(track_obj, 'artist', None), str):
-                    nav_artist = getattr(track_obj, 'artist', '').strip()
+                nav_artist = fields['nav_artist']
+                if nav_artist:
                     # Compare against album artist name to only store when different
                     try:
                         artist_row = cursor.execute("SELECT name FROM artists WHERE id = ?", (artist_id,)).fetchone()
                         album_artist_name = artist_row[0] if artist_row else ''
-                        if nav_artist and nav_artist.lower() != album_artist_name.lower():
+                        if nav_artist.lower() != album_artist_name.lower():
                             track_artist = nav_artist
                     except Exception as e:
                         logger.debug("Failed to load album artist for track_artist comparison: %s", e)
 
-                # Extract MusicBrainz recording ID from server if available (Navidrome provides this)
-                mbid = getattr(track_obj, 'musicBrainzId', None) or None
-
                 # Check if track already exists — UPDATE to preserve enrichment columns,
                 # INSERT only for genuinely new tracks
                 cursor.execute("SELECT 1 FROM tracks WHERE id = ? LIMIT 1", (track_id,))
@@ -7452,6 +7938,261 @@ class MusicDatabase:
             logger.error(f"Error checking if track {track_id} exists for server {server_source}: {e}")
             return False
     
+    def bulk_upsert_media_library(self, artists=(), albums=(), tracks=(),
+                                  server_source: str = 'plex') -> Optional[Dict[str, Any]]:
+        """Set-based ingest of a batch of media-server artists, albums and tracks.
+
+        Takes what the per-row methods take — ``artists`` as server artist objects,
+        ``albums`` as ``(album_obj, artist_id)``, ``tracks`` as ``(track_obj, album_id,
+        artist_id)`` — and stores the same result as calling
+        :meth:`insert_or_update_media_artist` / ``_album`` / ``_track`` on each, but stages
+        the rows into TEMP tables and applies one ``INSERT ... ON CONFLICT DO UPDATE`` per
+        table inside a single write transaction, instead of a connection, commit and
+        provenance lookup per track.
+
+        ratingKey rekeys (an unknown id whose name/title matches an existing row) carry an
+        enrichment-copying migration and are rare; those rows go through the per-row
+        methods first. Rows whose parent artist/album isn't in the database are skipped
+        and counted as failed (the per-row path fails them on the foreign key).
+
+        Returns ``{'artists'|'albums'|'tracks': {'inserted', 'updated', 'failed'},
+        'inserted_track_ids', 'existing_track_ids', 'failed_artist_ids', 'failed_album_ids',
+        'failed_track_ids'}`` — ``existing_track_ids`` are rows that already existed for
+        this server (what :meth:`track_exists_by_server` reports) — or None when the batch
+        could not be written (nothing is committed; callers fall back to the per-row path).
+        """
+        result: Dict[str, Any] = {kind: {'inserted': 0, 'updated': 0, 'failed': 0}
+                                  for kind in ('artists', 'albums', 'tracks')}
+        result.update(inserted_track_ids=[], existing_track_ids=[], failed_artist_ids=[], failed_album_ids=[],
+                      failed_track_ids=[])
+
+        # Later duplicates win, as with sequential per-row calls.
+        artist_objs: Dict[str, Any] = {}
+        artist_rows: Dict[str, tuple] = {}
+        for obj in artists:
+            try:
+                row = self._media_artist_fields(obj)
+            except Exception as e:
+                logger.warning(f"Skipping {server_source} artist {getattr(obj, 'title', 'Unknown')}: {e}")
+                result['artists']['failed'] += 1
+                continue
+            artist_objs[row[0]] = obj
+            artist_rows[row[0]] = row
+        album_objs: Dict[str, tuple] = {}
+        album_rows: Dict[str, tuple] = {}
+        for obj, artist_id in albums:
+            try:
+                album_id, *fields = self._media_album_fields(obj)
+            except Exception as e:
+                logger.warning(f"Skipping {server_source} album {getattr(obj, 'title', 'Unknown')}: {e}")
+                result['albums']['failed'] += 1
+                continue
+            album_objs[album_id] = (obj, str(artist_id))
+            album_rows[album_id] = (album_id, str(artist_id), *fields)
+        track_rows: Dict[str, Dict[str, Any]] = {}
+        for obj, album_id, artist_id in tracks:
+            try:
+                fields = self._media_track_fields(obj)
+            except Exception as e:
+                logger.warning(f"Skipping {server_source} track {getattr(obj, 'title', 'Unknown')}: {e}")
+                result['tracks']['failed'] += 1
+                continue
+            fields['album_id'], fields['artist_id'] = str(album_id), str(artist_id)
+            track_rows[fields['id']] = fields
+
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS ingest_artists (id TEXT PRIMARY KEY, name TEXT, "
+                           "thumb_url TEXT, genres TEXT, summary TEXT, state TEXT)")
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS ingest_albums (id TEXT PRIMARY KEY, artist_id TEXT, "
+                           "title TEXT, year INTEGER, thumb_url TEXT, genres TEXT, track_count INTEGER, "
+                           "duration INTEGER, state TEXT)")
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS ingest_tracks (id TEXT PRIMARY KEY, album_id TEXT, "
+                           "artist_id TEXT, title TEXT, track_number INTEGER, disc_number INTEGER, duration INTEGER, "
+                           "file_path TEXT, bitrate INTEGER, file_size INTEGER, track_artist TEXT, nav_artist TEXT, "
+                           "musicbrainz_recording_id TEXT, state TEXT, same_source INTEGER)")
+            for table in ('ingest_artists', 'ingest_albums', 'ingest_tracks'):
+                cursor.execute(f"DELETE FROM {table}")
+            cursor.executemany("INSERT INTO ingest_artists (id, name, thumb_url, genres, summary) "
+                               "VALUES (?, ?, ?, ?, ?)", list(artist_rows.values()))
+            cursor.executemany("INSERT INTO ingest_albums (id, artist_id, title, year, thumb_url, genres, "
+                               "track_count, duration) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", list(album_rows.values()))
+            cursor.executemany(
+                "INSERT INTO ingest_tracks (id, album_id, artist_id, title, track_number, disc_number, duration, "
+                "file_path, bitrate, file_size, track_artist, nav_artist, musicbrainz_recording_id) "
+                "VALUES (:id, :album_id, :artist_id, :title, :track_number, :disc_number, :duration, "
+                ":file_path, :bitrate, :file_size, :track_artist, :nav_artist, :musicbrainz_recording_id)",
+                list(track_rows.values()))
+            conn.commit()
+
+            # Rekeys, artists before albums (an artist rekey moves its albums to
+            # the new artist id, which the album title match then relies on).
+            rekeyed = [r[0] for r in cursor.execute(
+                "SELECT s.id FROM ingest_artists s WHERE NOT EXISTS (SELECT 1 FROM artists a WHERE a.id = s.id) "
+                "AND EXISTS (SELECT 1 FROM artists a WHERE a.name = s.name AND a.server_source = ?)",
+                (server_source,)).fetchall()]
+            for artist_id in rekeyed:
+                ok = self.insert_or_update_media_artist(artist_objs[artist_id], server_source=server_source)
+                result['artists']['updated' if ok else 'failed'] += 1
+                if not ok:
+                    result['failed_artist_ids'].append(artist_id)
+            rekeyed_albums = [r[0] for r in cursor.execute(
+                "SELECT s.id FROM ingest_albums s WHERE NOT EXISTS (SELECT 1 FROM albums a WHERE a.id = s.id) "
+                "AND EXISTS (SELECT 1 FROM albums a WHERE a.title = s.title AND a.artist_id = s.artist_id "
+                "AND a.server_source = ?)", (server_source,)).fetchall()]
+            for album_id in rekeyed_albums:
+                obj, artist_id = album_objs[album_id]
+                ok = self.insert_or_update_media_album(obj, artist_id, server_source=server_source)
+                result['albums']['updated' if ok else 'failed'] += 1
+                if not ok:
+                    result['failed_album_ids'].append(album_id)
+            if rekeyed:
+                cursor.executemany("DELETE FROM ingest_artists WHERE id = ?", [(i,) for i in rekeyed])
+            if rekeyed_albums:
+                cursor.executemany("DELETE FROM ingest_albums WHERE id = ?", [(i,) for i in rekeyed_albums])
+            conn.commit()
+
+            cursor.execute("BEGIN IMMEDIATE")
+            self._bulk_apply_artists(cursor, server_source, result)
+            self._bulk_apply_albums(cursor, server_source, result)
+            self._bulk_apply_tracks(cursor, server_source, result)
+            conn.commit()
+            return result
+        except Exception as e:
+            if conn is not None:
+                try:
+                    conn.rollback()
+                except Exception as rollback_err:
+                    logger.debug("bulk ingest rollback failed: %s", rollback_err)
+            logger.warning(f"Bulk {server_source} ingest failed ({len(artist_rows)} artists, {len(album_rows)} "
+                           f"albums, {len(track_rows)} tracks): {e}")
+            return None
+        finally:
+            if conn is not None:
+                conn.close()
+
+    @staticmethod
+    def _bulk_state_counts(cursor, table: str, result: Dict[str, int]) -> None:
+        for state, count in cursor.execute(f"SELECT state, COUNT(*) FROM {table} GROUP BY state").fetchall():
+            if state == 'new':
+                result['inserted'] += count
+            elif state == 'update':
+                result['updated'] += count
+            else:
+                result['failed'] += count
+
+    def _bulk_apply_artists(self, cursor, server_source: str, result: Dict[str, Any]) -> None:
+        # An id owned by another server is a primary-key clash the per-row path fails on too.
+        cursor.execute("""
+            UPDATE ingest_artists SET state = CASE
+                WHEN NOT EXISTS (SELECT 1 FROM artists a WHERE a.id = ingest_artists.id) THEN 'new'
+                WHEN EXISTS (SELECT 1 FROM artists a WHERE a.id = ingest_artists.id AND a.server_source = ?)
+                    THEN 'update'
+                ELSE 'conflict' END
+        """, (server_source,))
+        self._bulk_state_counts(cursor, 'ingest_artists', result['artists'])
+        result['failed_artist_ids'] += [r[0] for r in cursor.execute(
+            "SELECT id FROM ingest_artists WHERE state = 'conflict'").fetchall()]
+        cursor.execute("""
+            INSERT INTO artists (id, name, thumb_url, genres, summary, server_source)
+            SELECT id, name, thumb_url, genres, summary, ? FROM ingest_artists WHERE state != 'conflict'
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name, thumb_url = excluded.thumb_url, genres = excluded.genres,
+                summary = excluded.summary, updated_at = CURRENT_TIMESTAMP
+            WHERE artists.server_source = excluded.server_source
+        """, (server_source,))
+
+    def _bulk_apply_albums(self, cursor, server_source: str, result: Dict[str, Any]) -> None:
+        cursor.execute("""
+            UPDATE ingest_albums SET state = CASE
+                WHEN NOT EXISTS (SELECT 1 FROM artists a WHERE a.id = ingest_albums.artist_id) THEN 'orphan'
+                WHEN EXISTS (SELECT 1 FROM albums a WHERE a.id = ingest_albums.id) THEN 'update'
+                ELSE 'new' END
+        """)
+        self._bulk_state_counts(cursor, 'ingest_albums', result['albums'])
+        result['failed_album_ids'] += [r[0] for r in cursor.execute(
+            "SELECT id FROM ingest_albums WHERE state = 'orphan'").fetchall()]
+        cursor.execute("""
+            INSERT INTO albums (id, artist_id, title, year, thumb_url, genres, track_count, duration, server_source)
+            SELECT id, artist_id, title, year, thumb_url, genres, track_count, duration, ?
+            FROM ingest_albums WHERE state != 'orphan'
+            ON CONFLICT(id) DO UPDATE SET
+                artist_id = excluded.artist_id, title = excluded.title, year = excluded.year,
+                thumb_url = COALESCE(NULLIF(excluded.thumb_url, ''), albums.thumb_url), genres = excluded.genres,
+                track_count = excluded.track_count, duration = excluded.duration,
+                server_source = excluded.server_source, updated_at = CURRENT_TIMESTAMP
+        """, (server_source,))
+
+    def _bulk_apply_tracks(self, cursor, server_source: str, result: Dict[str, Any]) -> None:
+        # Navidrome per-track artist: kept only when it differs from the album artist.
+        nav_rows = cursor.execute("""
+            SELECT s.id, s.nav_artist, a.name FROM ingest_tracks s LEFT JOIN artists a ON a.id = s.artist_id
+            WHERE s.track_artist IS NULL AND s.nav_artist IS NOT NULL
+        """).fetchall()
+        cursor.executemany("UPDATE ingest_tracks SET track_artist = nav_artist WHERE id = ?",
+                           [(r[0],) for r in nav_rows if r[1].lower() != (r[2] or '').lower()])
+
+        cursor.execute("""
+            UPDATE ingest_tracks SET
+                state = CASE
+                    WHEN NOT EXISTS (SELECT 1 FROM albums a WHERE a.id = ingest_tracks.album_id)
+                      OR NOT EXISTS (SELECT 1 FROM artists a WHERE a.id = ingest_tracks.artist_id) THEN 'orphan'
+                    WHEN EXISTS (SELECT 1 FROM tracks t WHERE t.id = ingest_tracks.id) THEN 'update'
+                    ELSE 'new' END,
+                same_source = EXISTS (SELECT 1 FROM tracks t WHERE t.id = ingest_tracks.id AND t.server_source = ?)
+        """, (server_source,))
+        self._bulk_state_counts(cursor, 'ingest_tracks', result['tracks'])
+        result['inserted_track_ids'] = [r[0] for r in cursor.execute(
+            "SELECT id FROM ingest_tracks WHERE state = 'new' ORDER BY rowid").fetchall()]
+        result['existing_track_ids'] = [r[0] for r in cursor.execute(
+            "SELECT id FROM ingest_tracks WHERE same_source = 1").fetchall()]
+        result['failed_track_ids'] = [r[0] for r in cursor.execute(
+            "SELECT id FROM ingest_tracks WHERE state = 'orphan'").fetchall()]
+
+        # Update server-provided fields only — enrichment columns are untouched, and
+        # NULLs from the server don't wipe file_size / track_artist / MBID (see
+        # insert_or_update_media_track).
+        cursor.execute("""
+            INSERT INTO tracks (id, album_id, artist_id, title, track_number, disc_number, duration, file_path,
+                                bitrate, file_size, server_source, track_artist, musicbrainz_recording_id, updated_at)
+            SELECT id, album_id, artist_id, title, track_number, disc_number, duration, file_path,
+                   bitrate, file_size, ?, track_artist, musicbrainz_recording_id, CURRENT_TIMESTAMP
+            FROM ingest_tracks WHERE state != 'orphan'
+            ON CONFLICT(id) DO UPDATE SET
+                album_id = excluded.album_id, artist_id = excluded.artist_id, title = excluded.title,
+                track_number = excluded.track_number, disc_number = excluded.disc_number,
+                duration = excluded.duration, file_path = excluded.file_path, bitrate = excluded.bitrate,
+                file_size = COALESCE(excluded.file_size, tracks.file_size),
+                server_source = excluded.server_source,
+                track_artist = COALESCE(excluded.track_artist, tracks.track_artist),
+                musicbrainz_recording_id = COALESCE(excluded.musicbrainz_recording_id, tracks.musicbrainz_recording_id),
+                updated_at = CURRENT_TIMESTAMP
+        """, (server_source,))
+
+        # Provenance ID backfill (see insert_or_update_media_track), on this transaction.
+        if cursor.execute("SELECT 1 FROM track_downloads LIMIT 1").fetchone():
+            for track_id, file_path in cursor.execute(
+                "SELECT id, file_path FROM ingest_tracks WHERE state != 'orphan' AND file_path IS NOT NULL"
+            ).fetchall():
+                try:
+                    prov = self._provenance_row(cursor, file_path)
+                    if prov:
+                        self._fill_track_ids_from_provenance(cursor, track_id, prov)
+                except Exception as backfill_err:
+                    logger.debug(f"Provenance ID backfill skipped for track {track_id}: {backfill_err}")
+
+        cursor.execute("""
+            INSERT INTO library_history (event_type, title, artist_name, album_name, server_source, file_path, thumb_url)
+            SELECT 'import', s.title, ar.name, al.title, ?, s.file_path, al.thumb_url
+            FROM ingest_tracks s
+            LEFT JOIN artists ar ON ar.id = s.artist_id
+            LEFT JOIN albums al ON al.id = s.album_id
+            WHERE s.state = 'new'
+            ORDER BY s.rowid
+        """, (server_source,))
+
     def get_track_by_id(self, track_id) -> Optional[DatabaseTrackWithMetadata]:
         """Get a track with artist and album names by ID (supports both int and string IDs)"""
         try:
@@ -8087,59 +8828,11 @@ class MusicDatabase:
             # Album-aware fallback: find album by title (any artist), check tracks on it
             # Handles multi-artist albums filed under a different artist in the library
             if album and best_confidence < confidence_threshold:
-                logger.debug(f"Artist-specific search failed, trying album-aware fallback: '{title}' on '{album}'")
-                try:
-                    album_candidates = self.search_albums(title=album, artist="", limit=10, server_source=server_source)
-                    for album_candidate in album_candidates:
-                        album_title_sim = max(
-                            self._string_similarity(self._normalize_for_comparison(album), self._normalize_for_comparison(album_candidate.title)),
-                            self._string_similarity(self._clean_album_title_for_comparison(album), self._clean_album_title_for_comparison(album_candidate.title))
-                        )
-                        if album_title_sim < 0.8:
-                            continue
-
-                        conn = self._get_connection()
-                        cursor = conn.cursor()
-                        source_filter = "AND t.server_source = ?" if server_source else ""
-                        params = [album_candidate.id] + ([server_source] if server_source else [])
-                        cursor.execute(f"""
-                            SELECT t.*, a.name as artist_name, al.title as album_title
-                            FROM tracks t
-                            JOIN artists a ON a.id = t.artist_id
-                            JOIN albums al ON al.id = t.album_id
-                            WHERE t.album_id = ? {source_filter}
-                        """, params)
-
-                        for row in cursor.fetchall():
-                            # DatabaseTrack is a strict dataclass — only the declared
-                            # fields go in __init__; the joined artist/album/server
-                            # values are attached afterwards just like _rows_to_tracks
-                            # does. Building it the kwarg-soup way used to raise
-                            # TypeError on every fallback row, silently swallowed by
-                            # the outer except, so this path never matched anything.
-                            db_track = DatabaseTrack(
-                                id=row['id'], album_id=row['album_id'], artist_id=row['artist_id'],
-                                title=row['title'], track_number=row['track_number'],
-                                duration=row['duration'], file_path=row['file_path'],
-                                bitrate=row['bitrate'],
-                            )
-                            db_track.artist_name = row['artist_name']
-                            db_track.album_title = row['album_title']
-                            db_track.server_source = row['server_source']
-                            db_track.track_artist = row['track_artist'] if 'track_artist' in row.keys() else None
-                            title_sim = max(
-                                self._string_similarity(self._normalize_for_comparison(title), self._normalize_for_comparison(db_track.title)),
-                                self._string_similarity(self._clean_track_title_for_comparison(title), self._clean_track_title_for_comparison(db_track.title))
-                            )
-                            if title_sim > best_confidence and title_sim >= 0.7:
-                                best_confidence = title_sim
-                                best_match = db_track
-
-                        if best_match and best_confidence >= 0.7:
-                            logger.debug(f"Album-aware fallback matched: '{title}' on '{album}' -> '{best_match.title}' by '{best_match.artist_name}' (title_sim: {best_confidence:.3f})")
-                            return best_match, best_confidence
-                except Exception as album_fallback_err:
-                    logger.debug(f"Album-aware fallback error: {album_fallback_err}")
+                album_match, album_confidence = self._match_track_on_album(
+                    title, album, server_source, best_match, best_confidence)
+                if album_match:
+                    return album_match, album_confidence
+                best_confidence = album_confidence
 
             logger.debug(f"No confident track match for '{title}' (best: {best_confidence:.3f}, threshold: {confidence_threshold})")
             return None, best_confidence
@@ -8148,6 +8841,228 @@ class MusicDatabase:
             logger.error(f"Error checking track existence for '{title}' by '{artist}': {e}")
             return None, 0.0
     
+    def check_tracks_exist(self, queries, confidence_threshold: float = 0.8, server_source: str = None,
+                           legacy_fallback: bool = True) -> List[Tuple[Optional[DatabaseTrack], float]]:
+        """Bulk ``check_track_exists`` for ``(title, artist[, album[, duration]])`` tuples.
+
+        The per-track path fires several LIKE scans per title/artist variation,
+        so analyzing a 3,000-track playlist meant tens of thousands of full
+        table scans. Here the normalized artist and title keys of every query go
+        into temp tables, candidate rows come back from three set-based joins
+        (album artist, per-track artist, exact title), and everything is scored
+        in memory with the same ``_calculate_track_confidence``.
+
+        Returns one ``(track, confidence)`` per query, in input order. Duration
+        (ms, like ``tracks.duration``) only breaks ties between equally
+        confident candidates. A miss whose artist key matched no library row
+        exactly, but is contained in some library artist credit, falls back to
+        ``check_track_exists`` when ``legacy_fallback`` is set — only the LIKE
+        search finds "Artist" inside "Artist & Friends". Other misses with an
+        album still get the album-aware fallback.
+        """
+        from core.text.title_match import base_title_before_dash
+
+        norm = self._normalize_for_comparison
+        start = time.perf_counter()
+        parsed = []
+        artist_keys, title_keys = set(), set()
+        for query in queries:
+            title, artist, album, duration = (tuple(query) + (None, None, None, None))[:4]
+            title, artist = title or '', artist or ''
+            clean_title = norm(self._clean_track_title_for_comparison(title)) if title else ''
+            a_keys = {norm(v) for v in self._get_artist_variations(artist)} - {''} if artist else set()
+            t_keys = {norm(title), norm(base_title_before_dash(title)), ' '.join(clean_title.split())} - {''}
+            artist_keys |= a_keys
+            title_keys |= t_keys
+            parsed.append((title, artist, album, duration, a_keys, t_keys, _title_tokens(clean_title)))
+
+        tracks_by_id: Dict[int, DatabaseTrack] = {}
+        by_artist: Dict[str, set] = {}
+        by_title: Dict[str, set] = {}
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS presence_artist_keys (norm TEXT PRIMARY KEY)")
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS presence_title_keys (norm TEXT PRIMARY KEY)")
+            cursor.execute("DELETE FROM presence_artist_keys")
+            cursor.execute("DELETE FROM presence_title_keys")
+            cursor.executemany("INSERT OR IGNORE INTO presence_artist_keys (norm) VALUES (?)", [(k,) for k in artist_keys])
+            cursor.executemany("INSERT OR IGNORE INTO presence_title_keys (norm) VALUES (?)", [(k,) for k in title_keys])
+
+            source_filter = "AND tracks.server_source = ?" if server_source else ""
+            source_params = [server_source] if server_source else []
+            select = ("SELECT tracks.*, artists.name as artist_name, albums.title as album_title, "
+                      "albums.thumb_url as album_thumb_url, k.norm as presence_key")
+            # CROSS JOIN pins the library table as the outer loop: the
+            # normalizing function runs once per row and probes the temp
+            # table's primary key, instead of once per (row, key) pair.
+            joins = (
+                (by_artist, f"""{select} FROM artists
+                    CROSS JOIN presence_artist_keys k ON k.norm = TRIM(unidecode_lower(artists.name))
+                    JOIN tracks ON tracks.artist_id = artists.id
+                    JOIN albums ON tracks.album_id = albums.id
+                    WHERE 1 = 1 {source_filter}"""),
+                (by_artist, f"""{select} FROM tracks
+                    CROSS JOIN presence_artist_keys k ON k.norm = TRIM(unidecode_lower(tracks.track_artist))
+                    JOIN artists ON tracks.artist_id = artists.id
+                    JOIN albums ON tracks.album_id = albums.id
+                    WHERE tracks.track_artist IS NOT NULL AND tracks.track_artist != '' {source_filter}"""),
+                (by_title, f"""{select} FROM tracks
+                    CROSS JOIN presence_title_keys k ON k.norm = TRIM(unidecode_lower(tracks.title))
+                    JOIN artists ON tracks.artist_id = artists.id
+                    JOIN albums ON tracks.album_id = albums.id
+                    WHERE 1 = 1 {source_filter}"""),
+            )
+            for index, sql in joins:
+                cursor.execute(sql, source_params)
+                rows = cursor.fetchall()
+                for track, row in zip(self._rows_to_tracks(rows), rows, strict=True):
+                    track = tracks_by_id.setdefault(track.id, track)
+                    index.setdefault(row['presence_key'], set()).add(track.id)
+
+            # Artist keys with no exact hit only deserve the per-track LIKE
+            # search when some library artist credit actually contains them.
+            artist_haystack = ''
+            if legacy_fallback and artist_keys - by_artist.keys():
+                artist_source = "WHERE server_source = ?" if server_source else ""
+                cursor.execute(f"SELECT DISTINCT name FROM artists {artist_source}", source_params)
+                credits = [r[0] for r in cursor.fetchall()]
+                cursor.execute(f"""SELECT DISTINCT track_artist FROM tracks
+                    WHERE track_artist IS NOT NULL AND track_artist != '' {source_filter}""", source_params)
+                credits.extend(r[0] for r in cursor.fetchall())
+                artist_haystack = '\n'.join(norm(c) for c in credits if c)
+        except Exception as e:
+            logger.error(f"Bulk library presence lookup failed for {len(parsed)} tracks: {e}")
+            if not legacy_fallback:
+                return [(None, 0.0) for _ in parsed]
+            return [self.check_track_exists(t, a, confidence_threshold, server_source, album=al)
+                    for t, a, al, *_ in parsed]
+        finally:
+            if conn is not None:
+                conn.close()
+
+        title_index: Dict[int, Tuple[str, set]] = {}
+
+        def _indexed_title(tid):
+            if tid not in title_index:
+                db_title = norm(tracks_by_id[tid].title or '')
+                title_index[tid] = (db_title, _title_tokens(db_title))
+            return title_index[tid]
+
+        results = []
+        fallbacks = 0
+        scored = 0
+        for title, artist, album, duration, a_keys, t_keys, tokens in parsed:
+            artist_ids = set().union(*(by_artist.get(k, ()) for k in a_keys))
+            # Mirror the LIKE search: first the artist's tracks whose title
+            # contains (or mostly shares words with) the requested one, then —
+            # only if those miss — any that share a single word, like the
+            # per-track OR-of-words fallback.
+            close_ids, loose_ids = set().union(*(by_title.get(k, ()) for k in t_keys)), set()
+            for tid in artist_ids:
+                db_title, db_tokens = _indexed_title(tid)
+                shared = tokens & db_tokens
+                if not tokens or any(k in db_title for k in t_keys) or (
+                        shared and len(shared) * 2 >= len(tokens | db_tokens)):
+                    close_ids.add(tid)
+                elif shared:
+                    loose_ids.add(tid)
+
+            best_match, best_confidence, best_gap = None, 0.0, None
+            for candidates in (close_ids, loose_ids):
+                for tid in candidates:
+                    track = tracks_by_id[tid]
+                    confidence = self._calculate_track_confidence(title, artist, track)
+                    scored += 1
+                    gap = abs(track.duration - duration) if duration and track.duration else None
+                    if confidence > best_confidence or (
+                            best_match is not None and confidence == best_confidence and gap is not None
+                            and (best_gap is None or gap < best_gap)):
+                        best_match, best_confidence, best_gap = track, confidence, gap
+                if best_match and best_confidence >= confidence_threshold:
+                    break
+
+            if best_match and best_confidence >= confidence_threshold:
+                results.append((best_match, best_confidence))
+            elif legacy_fallback and not artist_ids and any(k in artist_haystack for k in a_keys):
+                fallbacks += 1
+                results.append(self.check_track_exists(title, artist, confidence_threshold, server_source, album=album))
+            elif album:
+                album_match, album_confidence = self._match_track_on_album(
+                    title, album, server_source, best_match, best_confidence)
+                results.append((album_match, album_confidence if album_match else max(best_confidence, album_confidence)))
+            else:
+                results.append((None, best_confidence))
+
+        logger.debug(f"Bulk presence: {len(parsed)} tracks, {len(tracks_by_id)} candidate rows, "
+                     f"{scored} scored, {fallbacks} per-track fallbacks in {(time.perf_counter() - start) * 1000:.0f}ms")
+        return results
+
+    def _match_track_on_album(self, title: str, album: str, server_source: Optional[str],
+                              best_match: Optional[DatabaseTrack] = None,
+                              best_confidence: float = 0.0) -> Tuple[Optional[DatabaseTrack], float]:
+        """Find ``title`` on any library album named like ``album``, whoever it's filed under.
+
+        ``best_match`` / ``best_confidence`` carry the artist search's best
+        so far. Returns ``(track, confidence)`` once a >= 0.7 match is held,
+        else ``(None, best_confidence)``.
+        """
+        logger.debug(f"Artist-specific search failed, trying album-aware fallback: '{title}' on '{album}'")
+        try:
+            album_candidates = self.search_albums(title=album, artist="", limit=10, server_source=server_source)
+            for album_candidate in album_candidates:
+                album_title_sim = max(
+                    self._string_similarity(self._normalize_for_comparison(album), self._normalize_for_comparison(album_candidate.title)),
+                    self._string_similarity(self._clean_album_title_for_comparison(album), self._clean_album_title_for_comparison(album_candidate.title))
+                )
+                if album_title_sim < 0.8:
+                    continue
+
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                source_filter = "AND t.server_source = ?" if server_source else ""
+                params = [album_candidate.id] + ([server_source] if server_source else [])
+                cursor.execute(f"""
+                    SELECT t.*, a.name as artist_name, al.title as album_title
+                    FROM tracks t
+                    JOIN artists a ON a.id = t.artist_id
+                    JOIN albums al ON al.id = t.album_id
+                    WHERE t.album_id = ? {source_filter}
+                """, params)
+
+                for row in cursor.fetchall():
+                    # DatabaseTrack is a strict dataclass — only the declared
+                    # fields go in __init__; the joined artist/album/server
+                    # values are attached afterwards just like _rows_to_tracks
+                    # does. Building it the kwarg-soup way used to raise
+                    # TypeError on every fallback row, silently swallowed by
+                    # the outer except, so this path never matched anything.
+                    db_track = DatabaseTrack(
+                        id=row['id'], album_id=row['album_id'], artist_id=row['artist_id'],
+                        title=row['title'], track_number=row['track_number'],
+                        duration=row['duration'], file_path=row['file_path'],
+                        bitrate=row['bitrate'],
+                    )
+                    db_track.artist_name = row['artist_name']
+                    db_track.album_title = row['album_title']
+                    db_track.server_source = row['server_source']
+                    db_track.track_artist = row['track_artist'] if 'track_artist' in row.keys() else None
+                    title_sim = max(
+                        self._string_similarity(self._normalize_for_comparison(title), self._normalize_for_comparison(db_track.title)),
+                        self._string_similarity(self._clean_track_title_for_comparison(title), self._clean_track_title_for_comparison(db_track.title))
+                    )
+                    if title_sim > best_confidence and title_sim >= 0.7:
+                        best_confidence = title_sim
+                        best_match = db_track
+
+                if best_match and best_confidence >= 0.7:
+                    logger.debug(f"Album-aware fallback matched: '{title}' on '{album}' -> '{best_match.title}' by '{best_match.artist_name}' (title_sim: {best_confidence:.3f})")
+                    return best_match, best_confidence
+        except Exception as album_fallback_err:
+            logger.debug(f"Album-aware fallback error: {album_fallback_err}")
+        return None, best_confidence
+
     def check_album_exists(self, title: str, artist: str, confidence_threshold: float = 0.8) -> Tuple[Optional[DatabaseAlbum], float]:
         """
         Check if an album exists in the database with fuzzy matching and confidence scoring.
@@ -10911,11 +11826,12 @@ class MusicDatabase:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                before = conn.total_changes
                 cursor.executemany(
                     "INSERT INTO chat_room_messages (room, username, message, rich, timestamp, reply, file) "
                     "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
-                inserted = conn.total_changes - before
+                # rowcount, not total_changes: the search-index triggers'
+                # writes would count too.
+                inserted = cursor.rowcount
                 if inserted:
                     cursor.execute(
                         "DELETE FROM chat_room_messages WHERE room = ? AND id NOT IN "
@@ -11108,22 +12024,24 @@ class MusicDatabase:
             return []
 
     def search_chat_messages(self, room: str, query: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Archive search: messages in ``room`` whose text OR sender matches
-        ``query`` (case-insensitive substring), newest first."""
+        """Archive search: messages in ``room`` whose text or sender contains
+        every word of ``query`` (as word prefixes, case/accent-insensitive),
+        best matches first, then newest. See :meth:`_search_rows`."""
         query = str(query or '').strip()
         if not query:
             return []
-        like = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        limit = max(1, min(int(limit), 200))
+
+        def build(source, where, args, rank):
+            order = f"{rank}, m.timestamp DESC, m.id DESC" if rank else "m.timestamp DESC, m.id DESC"
+            return (f"SELECT m.username, m.message, m.rich, m.timestamp FROM {source} "
+                    f"WHERE {where} ORDER BY {order} LIMIT ?", args + [limit])
+
         try:
-            with self._get_connection() as conn:
-                rows = [dict(r) for r in conn.execute(
-                    "SELECT username, message, rich, timestamp, reply FROM chat_room_messages "
-                    "WHERE room = ? AND (message LIKE ? ESCAPE '\\' OR username LIKE ? ESCAPE '\\') "
-                    "ORDER BY timestamp DESC, id DESC LIMIT ?",
-                    (str(room), like, like, max(1, min(int(limit), 200)))).fetchall()]
+            rows = self._search_rows('chat_room_messages_fts', 'm', query, build,
+                                     where="m.room = ?", args=[str(room)])
             for r in rows:
-                r['rich'] = bool(r['rich'])
-                r.pop('reply', None)   # search results render flat
+                r['rich'] = bool(r['rich'])   # search results render flat
             return rows
         except Exception as e:
             logger.error("Error searching chat archive: %s", e)
@@ -11132,22 +12050,27 @@ class MusicDatabase:
     def get_notification_history(self, profile_id: int = 1, type_filter: str = None,
                                  search: str = None, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """A profile's journaled notifications, newest first, optionally
-        filtered by type and/or a case-insensitive message substring."""
+        filtered by type and/or search words in the message (see
+        :meth:`_search_rows`)."""
         try:
-            q = "SELECT id, type, message, created_at FROM notification_history WHERE profile_id = ?"
+            q = "SELECT n.id, n.type, n.message, n.created_at FROM"
             args: list = [int(profile_id)]
+            where = "n.profile_id = ?"
             if type_filter and type_filter in self._NOTIFICATION_TYPES:
-                q += " AND type = ?"
+                where += " AND n.type = ?"
                 args.append(type_filter)
+            page = [max(1, min(int(limit), 500)), max(0, int(offset))]
+            search = str(search or '').strip()
             if search:
-                q += " AND message LIKE ? ESCAPE '\\'"
-                escaped = str(search).replace('\\', '\\\\').replace('%', r'\%').replace('_', r'\_')
-                args.append(f"%{escaped}%")
-            q += " ORDER BY id DESC LIMIT ? OFFSET ?"
-            args += [max(1, min(int(limit), 500)), max(0, int(offset))]
+                def build(source, search_where, search_args, _rank):
+                    return (f"{q} {source} WHERE {search_where} ORDER BY n.id DESC LIMIT ? OFFSET ?",
+                            search_args + page)
+                return self._search_rows('notification_history_fts', 'n', search, build,
+                                         where=where, args=args, ranked=False)
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(q, args)
+                cursor.execute(f"{q} notification_history n WHERE {where} ORDER BY n.id DESC LIMIT ? OFFSET ?",
+                               args + page)
                 return [dict(r) for r in cursor.fetchall()]
         except Exception as e:
             logger.error("Error reading notification history: %s", e)
@@ -11999,6 +12922,44 @@ class MusicDatabase:
             logger.error(f"Error getting watchlist count: {e}")
             return 0
 
+    def get_watchlist_release_fingerprint(self, watchlist_artist_id: int) -> Optional[str]:
+        """Release fingerprint stored by the artist's last clean scan, or None."""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT fingerprint FROM watchlist_release_fingerprints WHERE watchlist_artist_id = ?",
+                    (watchlist_artist_id,),
+                )
+                row = cursor.fetchone()
+                return row['fingerprint'] if row else None
+        except Exception as e:
+            logger.debug(f"Error reading watchlist release fingerprint: {e}")
+            return None
+
+    def set_watchlist_release_fingerprint(self, watchlist_artist_id: int, fingerprint: Optional[str]) -> bool:
+        """Store (or, with None, forget) the artist's release fingerprint."""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                if fingerprint is None:
+                    cursor.execute(
+                        "DELETE FROM watchlist_release_fingerprints WHERE watchlist_artist_id = ?",
+                        (watchlist_artist_id,),
+                    )
+                else:
+                    cursor.execute("""
+                        INSERT INTO watchlist_release_fingerprints (watchlist_artist_id, fingerprint, updated_at)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT(watchlist_artist_id) DO UPDATE SET
+                            fingerprint = excluded.fingerprint, updated_at = CURRENT_TIMESTAMP
+                    """, (watchlist_artist_id, fingerprint))
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error storing watchlist release fingerprint: {e}")
+            return False
+
     def update_watchlist_artist_image(self, artist_id: str, image_url: str) -> bool:
         """Update the image URL for a watchlist artist (checks linked provider IDs)"""
         try:
@@ -15157,13 +16118,13 @@ class MusicDatabase:
                 cursor.execute("SELECT id FROM tracks WHERE file_path = ? LIMIT 1", (file_path,))
                 row = cursor.fetchone()
                 if not row:
-                    # Fallback: match by filename suffix (handles server path vs local path differences)
-                    import os as _os
-                    fname = _os.path.basename(file_path.replace('\\', '/'))
+                    # Fallback: match by filename (handles server path vs local path differences)
+                    fname, parent = _file_path_key(file_path)
                     if fname:
                         cursor.execute(
-                            "SELECT id FROM tracks WHERE file_path LIKE ? OR file_path LIKE ? LIMIT 1",
-                            (f'%/{fname}', f'%\\{fname}')
+                            "SELECT id FROM tracks WHERE file_basename = ? "
+                            "ORDER BY file_parent = ? DESC LIMIT 1",
+                            (fname, parent or None)
                         )
                         row = cursor.fetchone()
                 if row:
@@ -15191,42 +16152,46 @@ class MusicDatabase:
     def get_provenance_by_file_path(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Return the most recent track_downloads row matching ``file_path``.
 
-        Tries exact match first, then a basename-suffix LIKE fallback for
+        Tries exact match first, then an indexed basename fallback for
         cases where the media-server scan reports the file at a slightly
         different path than what was recorded at download time (Windows
         separators, symlink resolution, container mount-root differences).
+        Among same-named files, one in a same-named parent folder wins.
         """
         if not file_path:
             return None
         try:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM track_downloads WHERE file_path = ? ORDER BY id DESC LIMIT 1",
-                (file_path,),
-            )
-            row = cursor.fetchone()
-            if row is None:
-                import os as _os
-                fname = _os.path.basename(file_path.replace('\\', '/'))
-                if fname:
-                    cursor.execute(
-                        "SELECT * FROM track_downloads WHERE file_path LIKE ? OR file_path LIKE ? "
-                        "ORDER BY id DESC LIMIT 1",
-                        (f'%/{fname}', f'%\\{fname}'),
-                    )
-                    row = cursor.fetchone()
-            if row is None:
-                return None
-            try:
-                return dict(row)
-            except (TypeError, ValueError):
-                cols = [c[0] for c in cursor.description]
-                return dict(zip(cols, row, strict=False))
+            return self._provenance_row(conn.cursor(), file_path)
         except Exception as exc:
             logger.debug(f"get_provenance_by_file_path failed: {exc}")
             return None
 
+    @staticmethod
+    def _provenance_row(cursor, file_path: str) -> Optional[Dict[str, Any]]:
+        """:meth:`get_provenance_by_file_path` on a caller-supplied cursor."""
+        cursor.execute(
+            "SELECT * FROM track_downloads WHERE file_path = ? ORDER BY id DESC LIMIT 1",
+            (file_path,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            fname, parent = _file_path_key(file_path)
+            if fname:
+                cursor.execute(
+                    "SELECT * FROM track_downloads WHERE file_basename = ? "
+                    "ORDER BY file_parent = ? DESC, id DESC LIMIT 1",
+                    (fname, parent or None),
+                )
+                row = cursor.fetchone()
+        if row is None:
+            return None
+        try:
+            return dict(row)
+        except (TypeError, ValueError):
+            cols = [c[0] for c in cursor.description]
+            return dict(zip(cols, row, strict=False))
+
     def backfill_track_external_ids_from_provenance(self, track_id: str, file_path: Optional[str]) -> int:
         """Copy external IDs from ``track_downloads`` onto a ``tracks`` row.
 
@@ -15242,53 +16207,55 @@ class MusicDatabase:
         prov = self.get_provenance_by_file_path(file_path)
         if not prov:
             return 0
+        try:
+            conn = self._get_connection()
+            updated = self._fill_track_ids_from_provenance(conn.cursor(), track_id, prov)
+            conn.commit()
+            return updated
+        except Exception as exc:
+            logger.debug(f"backfill_track_external_ids_from_provenance failed: {exc}")
+            return 0
 
-        # Map provenance column -> tracks column. Different naming
-        # conventions because tracks.* uses shorter names (``deezer_id``,
-        # ``tidal_id``, ``qobuz_id``) while track_downloads uses the
-        # explicit ``_track_id`` suffix to avoid ambiguity.
-        prov_to_tracks = {
-            'spotify_track_id': 'spotify_track_id',
-            'itunes_track_id': 'itunes_track_id',
-            'deezer_track_id': 'deezer_id',
-            'tidal_track_id': 'tidal_id',
-            'qobuz_track_id': 'qobuz_id',
-            'musicbrainz_recording_id': 'musicbrainz_recording_id',
-            'audiodb_id': 'audiodb_id',
-            'soul_id': 'soul_id',
-            'isrc': 'isrc',
-        }
+    # Map provenance column -> tracks column. Different naming
+    # conventions because tracks.* uses shorter names (``deezer_id``,
+    # ``tidal_id``, ``qobuz_id``) while track_downloads uses the
+    # explicit ``_track_id`` suffix to avoid ambiguity.
+    _PROVENANCE_TO_TRACK_COLUMNS = {
+        'spotify_track_id': 'spotify_track_id',
+        'itunes_track_id': 'itunes_track_id',
+        'deezer_track_id': 'deezer_id',
+        'tidal_track_id': 'tidal_id',
+        'qobuz_track_id': 'qobuz_id',
+        'musicbrainz_recording_id': 'musicbrainz_recording_id',
+        'audiodb_id': 'audiodb_id',
+        'soul_id': 'soul_id',
+        'isrc': 'isrc',
+    }
 
+    def _fill_track_ids_from_provenance(self, cursor, track_id: str, prov: Dict[str, Any]) -> int:
+        """Coalesce-update one tracks row from a provenance row; no commit."""
         updates: Dict[str, str] = {}
-        for prov_col, track_col in prov_to_tracks.items():
+        for prov_col, track_col in self._PROVENANCE_TO_TRACK_COLUMNS.items():
             val = prov.get(prov_col)
             if not val:
                 continue
             updates[track_col] = str(val)
         if not updates:
             return 0
-
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            # Coalesce-update: only fill empty columns. Preserves any IDs
-            # the enrichment worker already populated (those are usually
-            # more reliable than provenance for non-primary sources).
-            set_clauses = []
-            params = []
-            for track_col, val in updates.items():
-                set_clauses.append(f"{track_col} = COALESCE(NULLIF({track_col}, ''), ?)")
-                params.append(val)
-            params.append(track_id)
-            cursor.execute(
-                f"UPDATE tracks SET {', '.join(set_clauses)} WHERE id = ?",
-                params,
-            )
-            conn.commit()
-            return cursor.rowcount or 0
-        except Exception as exc:
-            logger.debug(f"backfill_track_external_ids_from_provenance failed: {exc}")
-            return 0
+        # Coalesce-update: only fill empty columns. Preserves any IDs
+        # the enrichment worker already populated (those are usually
+        # more reliable than provenance for non-primary sources).
+        set_clauses = []
+        params = []
+        for track_col, val in updates.items():
+            set_clauses.append(f"{track_col} = COALESCE(NULLIF({track_col}, ''), ?)")
+            params.append(val)
+        params.append(track_id)
+        cursor.execute(
+            f"UPDATE tracks SET {', '.join(set_clauses)} WHERE id = ?",
+            params,
+        )
+        return cursor.rowcount or 0
 
     def get_track_downloads(self, track_id: str) -> list:
         """Get all download records for a library track."""
@@ -15305,6 +16272,25 @@ class MusicDatabase:
             logger.error(f"Error getting track downloads: {e}")
             return []
 
+    def search_track_downloads(self, query: str, limit: int = 50) -> list:
+        """Download records whose title, artist, album or source filename
+        contain every word of ``query``, best matches first, then newest.
+        See :meth:`_search_rows`."""
+        query = str(query or '').strip()
+        if not query:
+            return []
+        limit = max(1, min(int(limit), 200))
+
+        def build(source, where, args, rank):
+            order = f"{rank}, d.created_at DESC, d.id DESC" if rank else "d.created_at DESC, d.id DESC"
+            return f"SELECT d.* FROM {source} WHERE {where} ORDER BY {order} LIMIT ?", args + [limit]
+
+        try:
+            return self._search_rows('track_downloads_fts', 'd', query, build)
+        except Exception as e:
+            logger.error(f"Error searching track downloads: {e}")
+            return []
+
     def update_provenance_file_path(self, old_path: str, new_path: str) -> bool:
         """Update file_path in provenance records when a file is transcoded/moved."""
         try:
@@ -15342,13 +16328,14 @@ class MusicDatabase:
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
-            # Match using both separator styles to handle Windows vs Unix paths
+            # Indexed basename key — separator-agnostic (Windows vs Unix paths)
+            fname, parent = _file_path_key(filename)
             cursor.execute("""
                 SELECT * FROM track_downloads
-                WHERE file_path LIKE ? OR file_path LIKE ?
-                ORDER BY created_at DESC
+                WHERE file_basename = ?
+                ORDER BY file_parent = ? DESC, created_at DESC
                 LIMIT 1
-            """, (f'%/{filename}', f'%\\{filename}'))
+            """, (fname, parent or None))
             row = cursor.fetchone()
             if row and link_track_id:
                 # Back-link this record so future track_id lookups work directly
@@ -15363,6 +16350,70 @@ class MusicDatabase:
             logger.error(f"Error getting download by filename: {e}")
             return None
 
+    # ==================== Repair Verified-File Ledger ====================
+
+    def get_verified_files(self, job_id: str) -> Dict[str, Dict[str, Any]]:
+        """Return ``{path: {size, mtime_ns, streaminfo_md5, verifier, verified_at}}``
+        for every file ``job_id`` has recorded as verified."""
+        try:
+            conn = self._get_connection()
+            try:
+                rows = conn.execute(
+                    "SELECT path, size, mtime_ns, streaminfo_md5, verifier, verified_at "
+                    "FROM repair_verified_files WHERE job_id = ?", (job_id,)).fetchall()
+            finally:
+                conn.close()
+            return {r['path']: {'size': r['size'], 'mtime_ns': r['mtime_ns'],
+                                'streaminfo_md5': r['streaminfo_md5'], 'verifier': r['verifier'],
+                                'verified_at': r['verified_at']} for r in rows}
+        except Exception as e:
+            logger.error(f"Error reading verified-file ledger for {job_id}: {e}")
+            return {}
+
+    def record_verified_files(self, job_id: str, entries: List[Dict[str, Any]]) -> int:
+        """Upsert ledger rows (dicts with path, size, mtime_ns, streaminfo_md5,
+        verifier, verified_at). Returns the number written."""
+        if not entries:
+            return 0
+        try:
+            conn = self._get_connection()
+            try:
+                conn.executemany("""
+                    INSERT INTO repair_verified_files
+                        (job_id, path, size, mtime_ns, streaminfo_md5, verifier, verified_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(job_id, path) DO UPDATE SET
+                        size = excluded.size, mtime_ns = excluded.mtime_ns,
+                        streaminfo_md5 = excluded.streaminfo_md5,
+                        verifier = excluded.verifier, verified_at = excluded.verified_at
+                """, [(job_id, e['path'], e['size'], e['mtime_ns'], e.get('streaminfo_md5'),
+                       e.get('verifier'), e['verified_at']) for e in entries])
+                conn.commit()
+            finally:
+                conn.close()
+            return len(entries)
+        except Exception as e:
+            logger.error(f"Error recording verified files for {job_id}: {e}")
+            return 0
+
+    def forget_verified_files(self, job_id: str, paths: List[str]) -> int:
+        """Drop ledger rows so those files are verified again next run."""
+        if not paths:
+            return 0
+        try:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.executemany("DELETE FROM repair_verified_files WHERE job_id = ? AND path = ?",
+                                   [(job_id, p) for p in paths])
+                conn.commit()
+                return cursor.rowcount
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Error clearing verified files for {job_id}: {e}")
+            return 0
+
     # ==================== Discovery Pool Methods ====================
 
     def get_discovery_pool_matched(self, limit: int = 500) -> list:
@@ -25,6 +25,7 @@ import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from core.diagnostics import sql_profiler
 from utils.logging_config import get_logger
 
 logger = get_logger("video_database")
@@ -384,7 +385,7 @@ class VideoDatabase:
     # ── connection ──────────────────────────────────────────────────────────
     def _get_connection(self) -> sqlite3.Connection:
         """A fresh connection with the standard pragmas applied."""
-        conn = sqlite3.connect(str(self.database_path), timeout=30.0)
+        conn = sql_profiler.connect(str(self.database_path), label='video', timeout=30.0)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA journal_mode = WAL")
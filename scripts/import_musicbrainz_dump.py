@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Build or refresh the local MusicBrainz mirror from the JSON dumps.
+
+Download the dumps from https://data.metabrainz.org/pub/musicbrainz/data/json-dumps/
+(artist.tar.xz, release-group.tar.xz, release.tar.xz, recording.tar.xz) or
+point at a JSON-lines subset named after its entity (``artist.jsonl`` ...).
+Rows are upserted, so re-running with newer dumps refreshes in place.
+
+The mirror only answers lookups for entity types it holds in full. Dump
+archives count as complete; pass ``--complete`` for a plain file that holds
+every entity of its type (a subset must not, or lookups of things it lacks
+would stop reaching the web service).
+
+Usage:
+    python scripts/import_musicbrainz_dump.py database/musicbrainz_mirror.db artist.tar.xz release.tar.xz
+    python scripts/import_musicbrainz_dump.py mirror.db subset.jsonl --entity recording
+    python scripts/import_musicbrainz_dump.py mirror.db artist.jsonl --complete
+
+Then set ``musicbrainz.mirror_path`` to the database path in settings.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Allow running directly — put the repo root on the path so `core` imports.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.musicbrainz_mirror import ENTITY_TYPES, MusicBrainzMirror  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("import_musicbrainz_dump")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('database', help='mirror database file (created if missing)')
+    parser.add_argument('dumps', nargs='+', help='JSON dump tarballs or JSON-lines files')
+    parser.add_argument('--entity', choices=ENTITY_TYPES,
+                        help='entity type for plain files not named after their entity')
+    parser.add_argument('--complete', action='store_true', default=None,
+                        help='plain files hold every entity of their type (archives always do)')
+    args = parser.parse_args()
+
+    mirror = MusicBrainzMirror(args.database)
+    for path in args.dumps:
+        logger.info(f"Importing {path} ...")
+        counts = mirror.import_dump(
+            path, entity_type=args.entity, complete=args.complete,
+            progress=lambda c: logger.info(f"  ... {sum(c.values()):,} documents"),
+        )
+        logger.info(f"  {path}: " + ', '.join(f"{k}={v:,}" for k, v in counts.items()))
+
+    stats = mirror.get_stats()
+    logger.info("Mirror now holds: " + ', '.join(f"{k}={v:,}" for k, v in stats['counts'].items()))
+    logger.info("Answered locally: " + (', '.join(stats['complete']) or 'nothing yet (no complete import)'))
+
+
+if __name__ == '__main__':
+    main()
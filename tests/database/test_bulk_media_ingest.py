@@ -0,0 +1,163 @@
+"""MusicDatabase.bulk_upsert_media_library — set-based scan ingest.
+
+The library scan used to call insert_or_update_media_artist / _album / _track
+once per row, each with its own connection, commit and provenance lookup. The
+bulk path stages a batch into TEMP tables and applies one upsert per table in
+one transaction. These tests pin that it stores exactly what the per-row
+methods store (enrichment preserved, NULL-safe columns, ratingKey rekeys,
+Navidrome per-track artist, provenance backfill, import history) and reports
+inserted / updated / failed counts.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from database.music_database import MusicDatabase
+
+
+def _artist(rk, title, genres=(), thumb=None):
+    return SimpleNamespace(ratingKey=rk, title=title, thumb=thumb, summary='',
+                           genres=[SimpleNamespace(tag=g) for g in genres])
+
+
+def _album(rk, title, year=2001, thumb=None):
+    return SimpleNamespace(ratingKey=rk, title=title, year=year, thumb=thumb, leafCount=2,
+                           duration=1000, genres=[])
+
+
+def _track(rk, title, *, path=None, size=None, artist=None, disc=1, mbid=None):
+    t = SimpleNamespace(ratingKey=rk, title=title, trackNumber=1, discNumber=disc, duration=180000,
+                        path=path or f"/music/{rk}.flac", bitRate=320, file_size=size, musicBrainzId=mbid)
+    if artist is not None:
+        t.artist = artist
+    return t
+
+
+def _dump(db):
+    conn = db._get_connection()
+    try:
+        return {
+            'artists': [tuple(r) for r in conn.execute(
+                "SELECT id, name, thumb_url, genres, summary, server_source, spotify_artist_id "
+                "FROM artists ORDER BY id")],
+            'albums': [tuple(r) for r in conn.execute(
+                "SELECT id, artist_id, title, year, thumb_url, track_count, server_source, spotify_album_id "
+                "FROM albums ORDER BY id")],
+            'tracks': [tuple(r) for r in conn.execute(
+                "SELECT id, album_id, artist_id, title, disc_number, file_path, bitrate, file_size, server_source, "
+                "track_artist, musicbrainz_recording_id, spotify_track_id, isrc FROM tracks ORDER BY id")],
+            'history': [tuple(r) for r in conn.execute(
+                "SELECT event_type, title, artist_name, album_name, server_source, file_path, thumb_url "
+                "FROM library_history ORDER BY title")],
+        }
+    finally:
+        conn.close()
+
+
+def _seed(db):
+    """An existing library: enrichment on rows the scan will update, an artist and
+    album whose ratingKeys changed, a track with a size the server now omits, and
+    provenance for a file the scan is about to report."""
+    conn = db._get_connection()
+    conn.executescript("""
+        INSERT INTO artists (id, name, server_source, spotify_artist_id) VALUES
+            ('ar1', 'Known', 'navidrome', 'sp-ar1'),
+            ('old-ar', 'Rekeyed', 'navidrome', 'sp-rekeyed'),
+            ('plex-ar', 'Elsewhere', 'plex', NULL);
+        INSERT INTO albums (id, artist_id, title, thumb_url, server_source, spotify_album_id) VALUES
+            ('al1', 'ar1', 'Known Album', 'keep-thumb', 'navidrome', 'sp-al1'),
+            ('old-al', 'ar1', 'Rekeyed Album', NULL, 'navidrome', 'sp-rekeyed-al');
+        INSERT INTO tracks (id, album_id, artist_id, title, file_path, file_size, server_source,
+                            spotify_track_id, musicbrainz_recording_id) VALUES
+            ('t1', 'al1', 'ar1', 'Old Title', '/music/t1.flac', 5000, 'navidrome', 'sp-t1', 'mb-old');
+    """)
+    conn.execute("INSERT INTO track_downloads (file_path, source_service, isrc, spotify_track_id) "
+                 "VALUES (?, 'soulseek', ?, ?)", ('/music/t3.flac', 'ISRC3', 'sp-t3'))
+    conn.commit()
+    conn.close()
+
+
+def _batch():
+    artists = [_artist('ar1', 'Known', genres=['rock']), _artist('new-ar', 'Rekeyed'),
+               _artist('ar2', 'Brand “New”'), _artist('plex-ar', 'Elsewhere')]
+    albums = [(_album('al1', 'Known Album', thumb=''), 'ar1'),
+              (_album('new-al', 'Rekeyed Album'), 'ar1'),
+              (_album('al2', 'Fresh', thumb='t-al2'), 'ar2'),
+              (_album('al-orphan', 'No Artist'), 'missing-artist')]
+    tracks = [(_track('t1', 'New Title', size=None), 'al1', 'ar1'),
+              (_track('t2', 'Guest Spot', artist='Someone Else'), 'new-al', 'ar1'),
+              (_track('t3', 'Downloaded', artist='Brand "New"', mbid='mb-3'), 'al2', 'ar2'),
+              (_track('t4', 'Disc Two', disc=2), 'al2', 'ar2'),
+              (_track('t5', 'Orphan'), 'al-orphan', 'missing-artist')]
+    return artists, albums, tracks
+
+
+@pytest.fixture
+def dbs(tmp_path):
+    per_row = MusicDatabase(str(tmp_path / 'per_row.db'))
+    bulk = MusicDatabase(str(tmp_path / 'bulk.db'))
+    _seed(per_row)
+    _seed(bulk)
+    return per_row, bulk
+
+
+def test_bulk_matches_per_row_ingest(dbs):
+    per_row, bulk = dbs
+    artists, albums, tracks = _batch()
+    for a in artists:
+        per_row.insert_or_update_media_artist(a, server_source='navidrome')
+    # The orphans are skipped here: the per-row album method leaves its failed
+    # write transaction open, which would stall the rest of this reference run.
+    for obj, artist_id in albums[:-1]:
+        per_row.insert_or_update_media_album(obj, artist_id, server_source='navidrome')
+    for obj, album_id, artist_id in tracks[:-1]:
+        per_row.insert_or_update_media_track(obj, album_id, artist_id, server_source='navidrome')
+
+    result = bulk.bulk_upsert_media_library(*_batch(), server_source='navidrome')
+    assert _dump(bulk) == _dump(per_row)
+
+    assert result['artists'] == {'inserted': 1, 'updated': 2, 'failed': 1}     # plex-ar belongs to plex
+    assert result['albums'] == {'inserted': 1, 'updated': 2, 'failed': 1}      # al-orphan has no artist
+    assert result['tracks'] == {'inserted': 3, 'updated': 1, 'failed': 1}
+    assert result['inserted_track_ids'] == ['t2', 't3', 't4']
+    assert result['existing_track_ids'] == ['t1']
+    assert result['failed_artist_ids'] == ['plex-ar'] and result['failed_album_ids'] == ['al-orphan']
+    assert result['failed_track_ids'] == ['t5']
+
+
+def test_bulk_preserves_enrichment_and_backfills_provenance(dbs):
+    _per_row, bulk = dbs
+    bulk.bulk_upsert_media_library(*_batch(), server_source='navidrome')
+    rows = {r[0]: r for r in _dump(bulk)['tracks']}
+    assert rows['t1'][7] == 5000 and rows['t1'][10] == 'mb-old' and rows['t1'][11] == 'sp-t1'
+    assert rows['t3'][11:] == ('sp-t3', 'ISRC3')
+    assert rows['t2'][9] == 'Someone Else' and rows['t3'][9] is None
+    # Rekeyed artist/album carried their enrichment over to the new ids.
+    artists = {r[0]: r for r in _dump(bulk)['artists']}
+    assert 'old-ar' not in artists and artists['new-ar'][6] == 'sp-rekeyed'
+
+
+def test_rerunning_a_batch_only_updates(dbs):
+    _per_row, bulk = dbs
+    bulk.bulk_upsert_media_library(*_batch(), server_source='navidrome')
+    before = _dump(bulk)
+    again = bulk.bulk_upsert_media_library(*_batch(), server_source='navidrome')
+    assert again['tracks'] == {'inserted': 0, 'updated': 4, 'failed': 1}
+    assert again['inserted_track_ids'] == []
+    assert _dump(bulk) == before
+
+
+def test_failed_batch_commits_nothing(dbs, monkeypatch):
+    _per_row, bulk = dbs
+    before = _dump(bulk)
+
+    def boom(*_args, **_kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(bulk, '_bulk_apply_tracks', boom)
+    artists, albums, tracks = _batch()
+    assert bulk.bulk_upsert_media_library(artists[2:3], albums[2:3], tracks[2:4], server_source='navidrome') is None
+    assert _dump(bulk) == before
@@ -0,0 +1,116 @@
+"""Tests for the indexed ``file_basename`` / ``file_parent`` keys that back
+the "same file, different root" lookups on tracks and track_downloads."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from database.music_database import MusicDatabase, _file_key_sql, _file_path_key
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = MusicDatabase(str(tmp_path / "music.db"))
+    conn = db._get_connection()
+    conn.execute("INSERT INTO artists (id, name, server_source) VALUES ('a-1', 'Artist', 'plex')")
+    conn.execute("INSERT INTO albums (id, artist_id, title, server_source) VALUES ('al-1', 'a-1', 'LP', 'plex')")
+    conn.commit()
+    return db
+
+
+def _track(db, track_id, path):
+    conn = db._get_connection()
+    conn.execute(
+        "INSERT INTO tracks (id, album_id, artist_id, title, file_path, server_source) "
+        "VALUES (?, 'al-1', 'a-1', ?, ?, 'plex')", (track_id, track_id, path))
+    conn.commit()
+
+
+@pytest.mark.parametrize('path', [
+    '/music/Artist/Album/01 - Song.flac',
+    'C:\\Music\\Artist\\Album\\01 - Song.flac',
+    'Song.flac',
+    '/Song.flac',
+    'mixed/dir\\name//Song.flac',
+    '/mnt/Ärtist/Älbum/ö ü.flac',
+])
+def test_sql_and_python_keys_agree(path):
+    base_sql, parent_sql = _file_key_sql('p')
+    conn = sqlite3.connect(':memory:')
+    row = conn.execute(f"WITH t(p) AS (SELECT ?) SELECT {base_sql}, {parent_sql} FROM t", (path,)).fetchone()
+    assert row == _file_path_key(path)
+
+
+def test_keys_follow_inserts_and_path_updates(db):
+    _track(db, 't-1', '/music/Artist/Album/01 - Song.flac')
+    conn = db._get_connection()
+    assert tuple(conn.execute("SELECT file_basename, file_parent FROM tracks WHERE id = 't-1'").fetchone()) == \
+        ('01 - Song.flac', 'Album')
+    conn.execute("UPDATE tracks SET file_path = 'D:\\Lib\\Other\\02.mp3' WHERE id = 't-1'")
+    conn.commit()
+    assert tuple(conn.execute("SELECT file_basename, file_parent FROM tracks WHERE id = 't-1'").fetchone()) == \
+        ('02.mp3', 'Other')
+
+
+def test_find_track_id_by_basename_across_roots(db):
+    _track(db, 't-1', '/data/music/Artist/Album/01 - Song.flac')
+    assert db.find_track_id_by_file_path('/downloads/Artist/Album/01 - Song.flac') == 't-1'
+    assert db.find_track_id_by_file_path('H:\\Music\\Artist\\Album\\01 - song.FLAC') == 't-1'
+    assert db.find_track_id_by_file_path('/downloads/02 - Other.flac') is None
+
+
+def test_parent_directory_disambiguates_same_named_files(db):
+    _track(db, 't-1', '/music/Artist/Album One/01 - Intro.flac')
+    _track(db, 't-2', '/music/Artist/Album Two/01 - Intro.flac')
+    assert db.find_track_id_by_file_path('/srv/Artist/Album Two/01 - Intro.flac') == 't-2'
+    assert db.find_track_id_by_file_path('/srv/Artist/Album One/01 - Intro.flac') == 't-1'
+
+
+def test_provenance_lookup_uses_basename_and_prefers_parent(db):
+    db.record_track_download('/dl/Album One/01 - Intro.flac', 'soulseek', 'u', 'f1', isrc='ISRC-ONE')
+    db.record_track_download('/dl/Album Two/01 - Intro.flac', 'soulseek', 'u', 'f2', isrc='ISRC-TWO')
+    prov = db.get_provenance_by_file_path('/library/Artist/Album One/01 - Intro.flac')
+    assert prov['isrc'] == 'ISRC-ONE'
+    # No parent match: most recent row wins, as before.
+    assert db.get_provenance_by_file_path('/x/Elsewhere/01 - Intro.flac')['isrc'] == 'ISRC-TWO'
+    assert db.get_download_by_filename('01 - Intro.flac')['isrc'] in ('ISRC-ONE', 'ISRC-TWO')
+
+
+def test_record_track_download_links_track_by_basename(db):
+    _track(db, 't-1', '/music/Artist/Album/03 - Tune.flac')
+    db.record_track_download('C:\\Downloads\\Album\\03 - Tune.flac', 'tidal', '', 'x')
+    row = db._get_connection().execute("SELECT track_id FROM track_downloads").fetchone()
+    assert row[0] == 't-1'
+
+
+def test_lookup_is_an_index_search(db):
+    conn = db._get_connection()
+    plan = ' '.join(str(r[-1]) for r in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM track_downloads WHERE file_basename = ? "
+        "ORDER BY file_parent = ? DESC, id DESC LIMIT 1", ('a.flac', 'b')))
+    assert 'idx_track_downloads_file_basename' in plan
+
+
+def test_existing_rows_are_keyed_on_upgrade(tmp_path):
+    db = MusicDatabase(str(tmp_path / "music.db"))
+    conn = db._get_connection()
+    # Roll track_downloads back to its pre-key shape with a row already in it.
+    conn.execute("DROP INDEX idx_track_downloads_file_basename")
+    conn.execute("ALTER TABLE track_downloads DROP COLUMN file_parent")
+    conn.execute("ALTER TABLE track_downloads DROP COLUMN file_basename")
+    conn.execute("INSERT INTO track_downloads (file_path, source_service) VALUES ('/old/Dir/legacy.mp3', 'x')")
+    conn.commit()
+    db._ensure_file_basename_keys(conn.cursor())
+    conn.commit()
+    assert tuple(conn.execute("SELECT file_basename, file_parent FROM track_downloads").fetchone()) == \
+        ('legacy.mp3', 'Dir')
+    assert db.get_provenance_by_file_path('/new/Dir/legacy.mp3')['source_service'] == 'x'
+
+
+def test_generated_keys_stay_out_of_table_info(db):
+    """In-place rebuild migrations copy the PRAGMA table_info column list;
+    the generated keys must not be in it."""
+    cols = {r[1] for r in db._get_connection().execute("PRAGMA table_info(tracks)")}
+    assert 'file_path' in cols and 'file_basename' not in cols
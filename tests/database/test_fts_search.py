@@ -0,0 +1,155 @@
+"""FTS5 search indexes for chat archive, notification history and download
+history (MusicDatabase._FTS_INDEXES).
+
+Search used to ``LIKE '%q%'`` over each whole table. The tables now carry
+external-content FTS5 indexes kept in step by triggers and rebuilt (backfilled)
+when they drift from their table; searches are ranked word-prefix matches, and
+fall back to the old substring LIKE when the index can't be used.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import database.music_database as mdb
+from database.music_database import MusicDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    return MusicDatabase(str(tmp_path / 'music.db'))
+
+
+def _chat(n, text, user='alice'):
+    return {'username': user, 'message': text, 'timestamp': '2026-07-19 10:%02d:00' % n}
+
+
+def _download(db, title, artist, album, filename):
+    db.record_track_download(f"/music/{filename}", 'soulseek', 'peer', filename, 1000, 'FLAC',
+                             track_title=title, track_artist=artist, track_album=album)
+
+
+def _indexed(db, fts):
+    conn = db._get_connection()
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {fts}_docsize").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_prefix_words_rank_and_accents(db):
+    db.add_chat_messages('SoulSync', [
+        _chat(1, 'the new Meshuggah album is heavy, meshuggah forever'),
+        _chat(2, 'anyone heard the new Meshuggah album?'),
+        _chat(3, 'Beyoncé live set tonight'),
+        _chat(4, 'heavy metal', user='meshfan'),
+    ])
+    assert [h['message'] for h in db.search_chat_messages('SoulSync', 'mesh')][:2] == [
+        'heavy metal', 'the new Meshuggah album is heavy, meshuggah forever']
+    assert [h['message'] for h in db.search_chat_messages('SoulSync', 'new alb')] == [
+        'anyone heard the new Meshuggah album?', 'the new Meshuggah album is heavy, meshuggah forever']
+    assert db.search_chat_messages('SoulSync', 'beyonce')[0]['message'] == 'Beyoncé live set tonight'
+    # Word prefixes, not arbitrary substrings.
+    assert db.search_chat_messages('SoulSync', 'shuggah') == []
+
+
+def test_fts_syntax_in_queries_is_literal(db):
+    db.add_notifications([{'type': 'info', 'message': 'Synced NEAR "OR" playlist'},
+                          {'type': 'info', 'message': 'about 100% done'},
+                          {'type': 'info', 'message': '1000 tracks scanned'}])
+    assert len(db.get_notification_history(search='near or play')) == 1
+    assert len(db.get_notification_history(search='"or" play')) == 1
+    assert db.get_notification_history(search='or" -play*') == []
+    # Punctuation the index ignores must still match literally.
+    assert [r['message'] for r in db.get_notification_history(search='100%')] == ['about 100% done']
+    assert len(db.get_notification_history(search='100')) == 2
+
+
+def test_underscore_splits_words_and_is_matched_literally(db):
+    db.add_notifications([{'type': 'info', 'message': 'renamed my_track.flac'},
+                          {'type': 'info', 'message': 'my track was renamed'}])
+    assert MusicDatabase._fts_match_expression('my_track') == '"my"* "track"*'
+    assert [r['message'] for r in db.get_notification_history(search='my_track')] == ['renamed my_track.flac']
+    assert len(db.get_notification_history(search='my track')) == 2
+
+
+def test_rank_window_is_cut_after_the_room_and_literal_filters(db, monkeypatch):
+    monkeypatch.setattr(MusicDatabase, '_FTS_RANK_WINDOW', 20)
+    db.add_chat_messages('quiet', [_chat(0, 'hello world')])
+    db.add_chat_messages('busy', [{'username': 'bob', 'message': f'hello there {i}',
+                                   'timestamp': f'2026-07-19 11:{i:05d}'} for i in range(60)])
+    assert [r['message'] for r in db.search_chat_messages('quiet', 'hello')] == ['hello world']
+    assert len(db.search_chat_messages('busy', 'hello', limit=200)) == 20
+
+    _download(db, 'Done', 'Artist', 'Album', 'done 100% take.flac')
+    for i in range(30):
+        _download(db, f'Take {i}', 'Artist', 'Album', f'{i:02d} 100 take.flac')
+    assert [d['track_title'] for d in db.search_track_downloads('100%')] == ['Done']
+
+
+def test_triggers_follow_updates_deletes_and_pruning(db, monkeypatch):
+    monkeypatch.setattr(MusicDatabase, '_NOTIFICATION_KEEP', 2)
+    db.add_notifications([{'type': 'info', 'message': 'alpha one'}])
+    db.add_notifications([{'type': 'info', 'message': 'beta two'}])
+    db.add_notifications([{'type': 'info', 'message': 'gamma three'}])      # prunes "alpha one"
+    assert db.get_notification_history(search='alpha') == []
+    assert _indexed(db, 'notification_history_fts') == 2
+
+    conn = db._get_connection()
+    conn.execute("UPDATE notification_history SET message = 'delta four' WHERE message = 'beta two'")
+    conn.commit()
+    conn.close()
+    assert db.get_notification_history(search='beta') == []
+    assert db.get_notification_history(search='delt')[0]['message'] == 'delta four'
+
+    assert db.clear_notification_history() == 2
+    assert _indexed(db, 'notification_history_fts') == 0
+
+
+def test_existing_history_is_backfilled(tmp_path):
+    path = str(tmp_path / 'music.db')
+    db = MusicDatabase(path)
+    conn = db._get_connection()
+    for fts in MusicDatabase._FTS_INDEXES:
+        for event in ('insert', 'delete', 'update'):
+            conn.execute(f"DROP TRIGGER trg_{fts}_{event}")
+        conn.execute(f"DROP TABLE {fts}")
+    conn.commit()
+    conn.close()
+    # History written before the indexes existed.
+    db.add_chat_messages('SoulSync', [_chat(1, 'old archived message')])
+    _download(db, 'Bleed', 'Meshuggah', 'obZen', '01 Bleed.flac')
+
+    mdb._database_initialized_paths.discard(str(mdb.Path(path).resolve()))
+    reopened = MusicDatabase(path)
+    assert _indexed(reopened, 'chat_room_messages_fts') == 1
+    assert reopened.search_chat_messages('SoulSync', 'archiv')[0]['message'] == 'old archived message'
+    assert reopened.search_track_downloads('obz')[0]['track_title'] == 'Bleed'
+
+
+def test_missing_index_falls_back_to_like(db):
+    db.add_chat_messages('SoulSync', [_chat(1, 'hello world')])
+    conn = db._get_connection()
+    conn.execute("DROP TRIGGER trg_chat_room_messages_fts_insert")
+    conn.execute("DROP TRIGGER trg_chat_room_messages_fts_delete")
+    conn.execute("DROP TRIGGER trg_chat_room_messages_fts_update")
+    conn.execute("DROP TABLE chat_room_messages_fts")
+    conn.commit()
+    conn.close()
+    # Substring semantics again, as before the index.
+    assert db.search_chat_messages('SoulSync', 'ello')[0]['message'] == 'hello world'
+
+
+def test_download_search_and_route(db, monkeypatch):
+    _download(db, 'Bleed', 'Meshuggah', 'obZen', '01 Bleed.flac')
+    _download(db, 'Rational Gaze', 'Meshuggah', 'Nothing', '03 Rational Gaze.flac')
+    _download(db, 'Blackened', 'Metallica', 'And Justice for All', 'blackened.mp3')
+    assert [d['track_title'] for d in db.search_track_downloads('meshuggah bl')] == ['Bleed']
+    assert {d['track_title'] for d in db.search_track_downloads('bl')} == {'Bleed', 'Blackened'}
+    assert db.search_track_downloads('  ') == []
+
+    import web_server
+    monkeypatch.setattr(web_server, 'get_database', lambda: db)
+    web_server.app.config['TESTING'] = True
+    resp = web_server.app.test_client().get('/api/library/downloads/search?q=rational')
+    assert resp.get_json()['downloads'][0]['source_filename'] == '03 Rational Gaze.flac'
@@ -540,3 +540,115 @@ def test_delay_enforces_minimum_gap_between_downloads():
     gap = completion_times[1] - completion_times[0]
     # Gap is at LEAST the configured delay.
     assert gap >= 0.18, f"expected gap >= 0.2s, got {gap:.3f}"
+
+
+# ---------------------------------------------------------------------------
+# Per-source pools — queue, workers, gauges
+# ---------------------------------------------------------------------------
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_queued_downloads_share_fixed_worker_threads():
+    """A long queue runs on ``concurrency`` long-lived threads, not a
+    thread per dispatch, and FIFO order holds within a source."""
+    engine = DownloadEngine()
+    engine.worker.set_concurrency('pool-src', 2)
+    release = threading.Event()
+    ran, threads = [], set()
+
+    def impl(download_id, target_id, display_name):
+        release.wait(timeout=2.0)
+        ran.append(target_id)
+        threads.add(threading.get_ident())
+        return '/tmp/x.flac'
+
+    before = threading.active_count()
+    ids = [engine.worker.dispatch(source_name='pool-src', target_id=i, display_name=str(i),
+                                  original_filename=f'{i}||x', impl_callable=impl)
+           for i in range(50)]
+    assert threading.active_count() - before <= 2
+    stats = engine.worker.get_stats()['pool-src']
+    assert stats['workers'] == 2 and stats['queued'] == 48
+    release.set()
+    assert _wait_for(lambda: len(ran) == 50)
+    assert len(threads) == 2
+    assert all(engine.get_record('pool-src', d)['state'] == 'Completed, Succeeded' for d in ids)
+    stats = engine.worker.get_stats()['pool-src']
+    assert stats['queued'] == 0 and stats['started'] == 50 and stats['max_wait_ms'] > 0
+
+
+def test_priority_jumps_the_queue_and_equal_priorities_stay_fifo():
+    engine = DownloadEngine()
+    started, gate = threading.Event(), threading.Event()
+    order = []
+
+    def impl(download_id, target_id, display_name):
+        started.set()
+        gate.wait(timeout=2.0)
+        order.append(target_id)
+        return '/tmp/x.flac'
+
+    def _dispatch(target, prio=0):
+        engine.worker.dispatch(source_name='prio', target_id=target, display_name=target,
+                               original_filename=target, impl_callable=impl, priority=prio)
+
+    _dispatch('busy')
+    started.wait(timeout=1.0)
+    for target, prio in (('a', 0), ('b', 0), ('urgent', 5), ('c', 0)):
+        _dispatch(target, prio)
+    gate.set()
+    assert _wait_for(lambda: len(order) == 5)
+    assert order == ['busy', 'urgent', 'a', 'b', 'c']
+
+
+def test_cancelling_a_queued_download_drops_it_without_running():
+    engine = DownloadEngine()
+    gate = threading.Event()
+    ran = []
+
+    def impl(download_id, target_id, display_name):
+        gate.wait(timeout=2.0)
+        ran.append(target_id)
+        return '/tmp/x.flac'
+
+    engine.worker.dispatch(source_name='cx', target_id='first', display_name='1',
+                           original_filename='1', impl_callable=impl)
+    assert _wait_for(lambda: engine.worker.get_stats()['cx']['active'] == 1)
+    queued = [engine.worker.dispatch(source_name='cx', target_id=f'q{i}', display_name='q',
+                                     original_filename='q', impl_callable=impl) for i in range(3)]
+    engine.update_record('cx', queued[0], {'state': 'Cancelled'})
+    engine.remove_record('cx', queued[1])
+    stats = engine.worker.get_stats()['cx']
+    assert stats['queued'] == 1 and stats['dropped'] == 2
+    gate.set()
+    assert _wait_for(lambda: len(ran) == 2)
+    time.sleep(0.05)
+    assert ran == ['first', 'q2']
+    assert engine.get_record('cx', queued[0])['state'] == 'Cancelled'
+
+
+def test_lowering_concurrency_retires_surplus_workers():
+    engine = DownloadEngine()
+    engine.worker.set_concurrency('shrink', 3)
+    gate = threading.Event()
+
+    def impl(*_a):
+        gate.wait(timeout=2.0)
+        return '/tmp/x.flac'
+
+    for i in range(3):
+        engine.worker.dispatch(source_name='shrink', target_id=i, display_name='x',
+                               original_filename='x', impl_callable=impl)
+    assert _wait_for(lambda: engine.worker.get_stats()['shrink']['active'] == 3)
+    assert engine.worker.get_stats()['shrink']['workers'] == 3
+    gate.set()
+    engine.worker.set_concurrency('shrink', 1)
+    assert _wait_for(lambda: engine.worker.get_stats()['shrink']['workers'] == 1)
@@ -0,0 +1,157 @@
+"""Download queue journal: diff-based writes, recovery, and queue rebuild."""
+
+from __future__ import annotations
+
+import threading
+
+from core.downloads.journal import DownloadJournal, dumps_entity, loads_entity, rebuild_queue
+
+
+def _journal(tmp_path, tasks, batches, **kw):
+    return DownloadJournal(str(tmp_path / 'journal.db'), tasks=tasks, batches=batches,
+                           lock=threading.Lock(), **kw)
+
+
+def _batch(queue, **extra):
+    return dict({'phase': 'downloading', 'queue': list(queue), 'queue_index': len(queue),
+                 'active_count': 2, 'max_concurrent': 3, 'cancelled_tracks': set()}, **extra)
+
+
+def test_sets_round_trip_and_unserializable_values_are_dropped():
+    task = {'status': 'pending', 'used_sources': {'b', 'a'}, 'client': object(),
+            'track_info': {'name': 'Song', 'artists': ('A', 'B')}}
+    restored = loads_entity(dumps_entity(task))
+    assert restored == {'status': 'pending', 'used_sources': {'a', 'b'},
+                        'track_info': {'name': 'Song', 'artists': ['A', 'B']}}
+
+
+def test_flush_only_writes_changed_entities(tmp_path):
+    tasks = {'t1': {'status': 'pending', 'batch_id': 'b1'}, 't2': {'status': 'pending', 'batch_id': 'b1'}}
+    batches = {'b1': _batch(['t1', 't2'])}
+    j = _journal(tmp_path, tasks, batches)
+    assert j.flush() == 3
+    assert j.flush() == 0
+    tasks['t1']['status'] = 'downloading'
+    del tasks['t2']
+    assert j.flush() == 2
+    stats = j.get_stats()
+    assert stats['entries_written'] == 5 and stats['flushes'] == 2
+    assert stats['max_flush_ms'] >= stats['last_flush_ms'] >= 0
+    j.close()
+
+
+def test_recover_replays_checkpoint_and_tail(tmp_path):
+    tasks = {'t1': {'status': 'pending', 'batch_id': 'b1', 'used_sources': {'x'}}}
+    batches = {'b1': _batch(['t1'])}
+    j = _journal(tmp_path, tasks, batches, compact_every=2)
+    j.flush()  # 2 rows -> folded into the checkpoint
+    assert j.get_stats()['compactions'] == 1
+    tasks['t1']['status'] = 'queued'
+    tasks['t2'] = {'status': 'pending', 'batch_id': 'b1'}
+    j.flush()
+    j.close()
+
+    fresh = _journal(tmp_path, {}, {})
+    rec_tasks, rec_batches = fresh.recover()
+    assert rec_tasks['t1']['status'] == 'queued'
+    assert rec_tasks['t1']['used_sources'] == {'x'}
+    assert set(rec_tasks) == {'t1', 't2'}
+    assert rec_batches['b1']['cancelled_tracks'] == set()
+    assert fresh.get_stats()['recovered_tasks'] == 2
+    assert fresh.get_stats()['recovery_ms'] is not None
+    # Baseline is primed: nothing changed since, so nothing is rewritten.
+    fresh._tasks.update(rec_tasks)
+    fresh._batches.update(rec_batches)
+    assert fresh.flush() == 0
+    fresh.close()
+
+
+def test_rebuild_reattaches_live_transfers_and_requeues_the_rest():
+    tasks = {
+        'done': {'status': 'completed', 'batch_id': 'b1'},
+        'live': {'status': 'downloading', 'batch_id': 'b1', 'username': 'u', 'filename': 'f1'},
+        'gone': {'status': 'queued', 'batch_id': 'b1', 'username': 'u', 'filename': 'f2', 'download_id': 'd2'},
+        'todo': {'status': 'pending', 'batch_id': 'b1'},
+        'orphan': {'status': 'pending', 'batch_id': 'b-analysis'},
+    }
+    batches = {
+        'b1': _batch(['done', 'gone', 'live', 'todo'], queue_index=3),
+        'b-analysis': _batch(['orphan'], phase='analysis'),
+    }
+    summary = rebuild_queue(tasks, batches, is_live=lambda t: t.get('filename') == 'f1')
+
+    assert summary == {'batches': 1, 'dropped_batches': 1, 'reattached': 1, 'unverified': 0,
+                       'requeued': 2, 'finished': 1}
+    assert set(batches) == {'b1'} and 'orphan' not in tasks
+    b1 = batches['b1']
+    assert b1['queue'] == ['done', 'live', 'gone', 'todo']
+    assert b1['queue_index'] == 2 and b1['active_count'] == 1
+    assert tasks['live']['status'] == 'downloading'
+    assert tasks['gone']['status'] == 'pending' and tasks['gone']['download_id'] is None
+
+
+def test_rebuild_keeps_in_flight_tasks_waiting_when_liveness_is_unknown():
+    tasks = {
+        'dl': {'status': 'downloading', 'batch_id': 'b1', 'username': 'u', 'filename': 'f1', 'download_id': 'd1'},
+        'todo': {'status': 'pending', 'batch_id': 'b1'},
+    }
+    batches = {'b1': _batch(['todo', 'dl'], queue_index=2)}
+    summary = rebuild_queue(tasks, batches, is_live=lambda t: None)
+
+    assert summary['unverified'] == 1 and summary['requeued'] == 1
+    assert tasks['dl']['status'] == 'downloading' and tasks['dl']['download_id'] == 'd1'
+    assert batches['b1']['queue'] == ['dl', 'todo']
+    assert batches['b1']['queue_index'] == 1 and batches['b1']['active_count'] == 1
+
+
+def test_background_writer_flushes_on_stop(tmp_path):
+    tasks, batches = {}, {}
+    j = _journal(tmp_path, tasks, batches, flush_interval=60)
+    j.start()
+    batches['b1'] = _batch([])
+    j.stop()
+    assert j.get_stats()['entries_written'] == 1
+    assert not j.get_stats()['running']
+    j.close()
+
+
+def test_database_is_opened_on_first_use(tmp_path):
+    j = _journal(tmp_path, {}, {})
+    assert not (tmp_path / 'journal.db').exists()
+    j.recover()
+    assert (tmp_path / 'journal.db').exists()
+    j.close()
+
+
+def test_snapshot_serializes_outside_the_tasks_lock(tmp_path):
+    class _Watched(dict):
+        locked = None
+
+        def items(self):
+            _Watched.locked = lock.locked()
+            return super().items()
+
+    lock = threading.Lock()
+    tasks = {'t1': {'status': 'pending', 'batch_id': 'b1', 'track_info': _Watched(name='Song')}}
+    j = DownloadJournal(str(tmp_path / 'journal.db'), tasks=tasks, batches={}, lock=lock)
+    assert j.flush() == 1
+    assert _Watched.locked is False
+    assert j.get_stats()['max_lock_ms'] <= j.get_stats()['max_snapshot_ms']
+    j.close()
+
+
+def test_entity_changing_mid_serialize_is_not_journaled_as_deleted(tmp_path, monkeypatch):
+    from core.downloads import journal as journal_module
+    tasks = {'t1': {'status': 'pending', 'batch_id': 'b1'}}
+    j = _journal(tmp_path, tasks, {})
+    j.flush()
+    tasks['t1']['status'] = 'downloading'
+
+    def _racing(entity):
+        raise RuntimeError('dictionary changed size during iteration')
+
+    monkeypatch.setattr(journal_module, 'dumps_entity', _racing)
+    assert j.flush() == 0
+    monkeypatch.undo()
+    assert j.flush() == 1
+    j.close()
@@ -112,6 +112,29 @@ def test_client_returns_registered_client_by_name():
     assert orch.client('made_up') is None
 
 
+def test_deferred_source_is_built_on_first_use_and_joins_the_engine():
+    """A spec whose ``boot`` says it isn't in use (YouTube / SoundCloud
+    outside their download mode) isn't constructed by ``initialize`` —
+    importing yt-dlp is the expensive part — but the first lookup builds
+    it and the orchestrator registers it with the engine."""
+    built = []
+    youtube = _FakeClient()
+    orch = _build_orchestrator(soulseek=_FakeClient())
+    orch.registry.register(PluginSpec(
+        name='youtube', factory=lambda: built.append(1) or youtube,
+        display_name='YouTube', boot=lambda: False,
+    ))
+    orch.registry.initialize()
+    orch.registry.on_built(orch._register_with_engine)
+
+    assert built == [] and orch.registry.deferred == ['youtube']
+    assert [name for name, _ in orch.registry.all_plugins()] == ['soulseek']
+    assert orch.client('youtube') is youtube
+    assert orch.client('youtube') is youtube and built == [1]
+    assert orch.registry.deferred == []
+    assert orch.engine.get_plugin('youtube') is youtube
+
+
 def test_configured_clients_excludes_unconfigured_sources():
     """Replaces the legacy iteration pattern: 6+ if/hasattr/is_configured
     checks per source. Single call returns dict of configured clients."""
@@ -603,6 +603,36 @@ def test_album_fast_path_misses_fall_through_to_global(monkeypatch):
     assert len(download_batches['B9']['queue']) == 1
 
 
+def test_album_fallback_lookups_are_prefetched_with_the_album(monkeypatch):
+    """The bulk prefetch uses the same album key as the album fast path's fallback."""
+    album = _DBAlbum(id_=42, title='Test Album')
+    db = _FakeDB(album=album, album_tracks=[_DBTrack('Existing')],
+                 found_tracks={('other', 'artist'): 0.9})
+    prefetched, single = [], []
+    lookup = db.check_track_exists
+
+    def _bulk(queries, confidence_threshold=0.7, server_source=None):
+        prefetched.extend(queries)
+        return [lookup(t, a, album=al) for t, a, al, _d in queries]
+
+    db.check_tracks_exist = _bulk
+    db.check_track_exists = lambda *a, **kw: single.append(a) or lookup(*a, **kw)
+    monkeypatch.setattr('database.music_database.MusicDatabase', lambda: db)
+
+    deps = _build_deps(config=_FakeConfig({'wishlist.allow_duplicate_tracks': False}))
+    _seed_batch('B9b',
+                is_album_download=True,
+                album_context={'name': 'Test Album', 'total_tracks': 2},
+                artist_context={'name': 'Artist'})
+
+    tracks = [{'name': 'Existing', 'artists': ['Artist']}, {'name': 'Other', 'artists': ['Artist']}]
+    mw.run_full_missing_tracks_process('B9b', 'album:1', tracks, deps)
+
+    assert [(t, al) for t, _a, al, _d in prefetched] == [('Other', 'Test Album')]
+    assert single == []  # the fallback check was answered from the prefetch
+    assert download_batches['B9b']['phase'] == 'complete'
+
+
 # ---------------------------------------------------------------------------
 # MB release preflight
 # ---------------------------------------------------------------------------
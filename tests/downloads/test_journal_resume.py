@@ -0,0 +1,105 @@
+"""Startup resume of journaled downloads in web_server.
+
+Covers the wiring around :func:`rebuild_queue`: the transfer tracker is
+polled before live transfers are matched, an unreachable slskd keeps
+in-flight tasks waiting, and a failed resume never starts the flusher (which
+would journal every recovered entity as deleted).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("flask")
+
+import web_server  # noqa: E402
+from core.downloads import journal as journal_module  # noqa: E402
+from core.downloads.journal import DownloadJournal  # noqa: E402
+
+
+def _seed(path):
+    """Write one resumable batch with an in-flight task to a journal file."""
+    tasks = {'t1': {'status': 'downloading', 'batch_id': 'b1', 'username': 'u', 'filename': 'f1'}}
+    batches = {'b1': {'phase': 'downloading', 'queue': ['t1'], 'queue_index': 1, 'active_count': 1},
+               'b-done': {'phase': 'complete', 'queue': []}}
+    seeded = DownloadJournal(path, tasks=tasks, batches=batches, lock=web_server.tasks_lock)
+    seeded.flush()
+    seeded.close()
+
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    path = str(tmp_path / 'journal.db')
+    _seed(path)
+    monkeypatch.setattr(web_server.config_manager, 'get',
+                        lambda key, default=None: {'path': path} if key == 'database.download_journal' else default)
+    monkeypatch.setattr(web_server.download_monitor, 'start_monitoring', lambda batch_id: None)
+    monkeypatch.setattr(web_server, '_start_next_batch_of_downloads', lambda batch_id: None)
+    yield path
+    j = journal_module.get_download_journal()
+    if j is not None:
+        j.close()
+    journal_module.set_download_journal(None)
+    with web_server.tasks_lock:
+        web_server.download_tasks.pop('t1', None)
+        web_server.download_batches.pop('b1', None)
+
+
+def test_start_recovers_synchronously_and_reports_resumable_batches(journal, monkeypatch):
+    calls = []
+    monkeypatch.setattr(web_server, '_resume_journaled_downloads',
+                        lambda j, tasks, batches: calls.append(set(batches)))
+    assert web_server._start_download_journal() == {'b1'}
+    assert calls == [{'b1', 'b-done'}]
+
+
+def test_tracker_is_polled_before_live_transfers_are_matched(journal, monkeypatch):
+    order = []
+    monkeypatch.setattr(web_server._transfer_tracker, 'refresh', lambda: order.append('refresh') or ([], []))
+
+    def live():
+        order.append('lookup')
+        return {web_server._make_context_key('u', 'f1'): {'state': 'InProgress'}}
+
+    monkeypatch.setattr(web_server.download_monitor, 'fetch_live_transfers', live)
+    j = DownloadJournal(journal)
+    tasks, batches = j.recover()
+    web_server._resume_journaled_downloads(j, tasks, batches)
+
+    assert order == ['refresh', 'lookup']
+    assert web_server.download_tasks['t1']['status'] == 'downloading'
+    assert j.get_stats()['running']
+    j.close()
+
+
+def test_unreachable_slskd_keeps_in_flight_tasks_waiting(journal, monkeypatch):
+    monkeypatch.setattr(web_server._transfer_tracker, 'refresh', lambda: None)
+    monkeypatch.setattr(web_server.download_monitor, 'fetch_live_transfers', lambda: {})
+    j = DownloadJournal(journal)
+    tasks, batches = j.recover()
+    web_server._resume_journaled_downloads(j, tasks, batches)
+
+    task = web_server.download_tasks['t1']
+    assert task['status'] == 'downloading'
+    assert (task['username'], task['filename']) == ('u', 'f1')
+    j.close()
+
+
+def test_failed_resume_leaves_the_journal_untouched(journal, monkeypatch):
+    monkeypatch.setattr(web_server._transfer_tracker, 'refresh', lambda: ([], []))
+    monkeypatch.setattr(web_server.download_monitor, 'fetch_live_transfers', lambda: {})
+
+    def broken(*args, **kwargs):
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(journal_module, 'rebuild_queue', broken)
+    j = DownloadJournal(journal)
+    journal_module.set_download_journal(j)
+    tasks, batches = j.recover()
+    web_server._resume_journaled_downloads(j, tasks, batches)
+
+    assert not j.get_stats()['running']
+    assert journal_module.get_download_journal() is None
+    web_server._stop_download_journal()
+    reread_tasks, reread_batches = DownloadJournal(journal).recover()
+    assert set(reread_tasks) == {'t1'} and set(reread_batches) == {'b1', 'b-done'}
@@ -0,0 +1,125 @@
+"""Tidal HLS segments are fetched through a bounded sliding window: several
+requests in flight, bodies handed back strictly in playlist order, and the
+shutdown / cancel checks still stop the download between segments."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+import pytest
+
+import core.tidal_download_client as tdc
+from core.tidal_download_client import TidalDownloadClient
+
+
+class _Engine:
+    def __init__(self):
+        self.records = {'d1': {'state': 'InProgress, Downloading', 'progress': 0.0}}
+
+    def get_record(self, source, download_id):
+        return self.records.get(download_id)
+
+    def update_record(self, source, download_id, patch):
+        self.records[download_id].update(patch)
+
+
+def _client(monkeypatch, window=4):
+    c = TidalDownloadClient.__new__(TidalDownloadClient)
+    c.shutdown_check = None
+    c._engine = _Engine()
+    monkeypatch.setattr(c, '_segment_window', lambda: window)
+    return c
+
+
+def test_segments_come_back_in_order_with_bounded_concurrency(monkeypatch):
+    c = _client(monkeypatch, window=4)
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    def _fetch(url):
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(random.uniform(0, 0.01))
+        with lock:
+            state['active'] -= 1
+        return url.encode()
+
+    monkeypatch.setattr(c, '_download_segment_with_retry', _fetch)
+    urls = [f'seg-{i}' for i in range(30)]
+    assert [d.decode() for d in c._iter_segments_in_order(urls, 'd1')] == urls
+    assert 1 < state['peak'] <= 4
+
+
+def test_cancel_stops_between_segments(monkeypatch):
+    c = _client(monkeypatch, window=3)
+    fetched = []
+    monkeypatch.setattr(c, '_download_segment_with_retry', lambda url: fetched.append(url) or b'x')
+    out = []
+    with pytest.raises(tdc._SegmentFetchAborted):
+        for data in c._iter_segments_in_order([f's{i}' for i in range(50)], 'd1'):
+            out.append(data)
+            if len(out) == 2:
+                c._engine.records['d1']['state'] = 'Cancelled'
+    assert len(out) == 2
+    assert len(fetched) < 10
+
+
+def test_segment_failure_propagates(monkeypatch):
+    c = _client(monkeypatch, window=4)
+
+    def _fetch(url):
+        if url == 's3':
+            raise RuntimeError('boom')
+        return b'x'
+
+    monkeypatch.setattr(c, '_download_segment_with_retry', _fetch)
+    with pytest.raises(RuntimeError, match='boom'):
+        list(c._iter_segments_in_order([f's{i}' for i in range(8)]))
+
+
+@pytest.mark.parametrize('window', [1, 4])
+def test_download_sync_writes_file_and_reports_progress(monkeypatch, tmp_path, window):
+    c = _client(monkeypatch, window=window)
+    c.download_path = tmp_path
+    c.session = type('S', (), {'check_login': lambda self: True})()
+    urls = [f'seg-{i}' for i in range(12)]
+    monkeypatch.setattr(c, '_get_hls_manifest', lambda track_id, quality: {
+        'init_uri': 'init', 'segment_uris': urls, 'extension': 'm4a'})
+    monkeypatch.setattr(tdc, 'quality_tier_for_source', lambda *a, **k: 'high')
+    monkeypatch.setattr(c, '_download_segment_with_retry',
+                        lambda url: url.encode().ljust(16 * 1024, b'.'))
+    progress = []
+    original = c._update_download_progress
+    monkeypatch.setattr(c, '_update_download_progress',
+                        lambda *a: progress.append(a[2]) or original(*a))
+
+    path = c._download_sync('d1', 1, 'Artist - Song')
+
+    data = (tmp_path / 'Artist - Song.m4a').read_bytes()
+    assert path.endswith('Artist - Song.m4a')
+    assert data.startswith(b'init') and data.index(b'seg-2.') < data.index(b'seg-10.')
+    assert progress == list(range(1, 14))
+    assert c._engine.records['d1']['transferred'] == 13 * 16 * 1024
+
+
+def test_shutdown_aborts_download_and_removes_partial_file(monkeypatch, tmp_path):
+    c = _client(monkeypatch, window=4)
+    c.download_path = tmp_path
+    c.session = type('S', (), {'check_login': lambda self: True})()
+    calls = {'n': 0}
+
+    def _shutdown():
+        calls['n'] += 1
+        return calls['n'] > 3
+
+    c.shutdown_check = _shutdown
+    monkeypatch.setattr(c, '_get_hls_manifest', lambda track_id, quality: {
+        'init_uri': None, 'segment_uris': [f's{i}' for i in range(20)], 'extension': 'm4a'})
+    monkeypatch.setattr(tdc, 'quality_tier_for_source', lambda *a, **k: 'high')
+    monkeypatch.setattr(c, '_download_segment_with_retry', lambda url: b'x' * 1024)
+
+    assert c._download_sync('d1', 1, 'Song') is None
+    assert not (tmp_path / 'Song.m4a').exists()
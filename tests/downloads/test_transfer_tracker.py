@@ -0,0 +1,145 @@
+"""slskd transfer tracker: diffed polls, indexes, change feed, aging out."""
+
+from __future__ import annotations
+
+from core.downloads.transfer_tracker import TransferTracker
+
+
+def _key(username, filename):
+    return f"{username}::{(filename or '').replace(chr(92), '/').lstrip('/')}"
+
+
+def _tree(*files):
+    users = {}
+    for username, tid, filename, state, done in files:
+        users.setdefault(username, []).append({
+            'id': tid, 'filename': filename, 'state': state,
+            'bytesTransferred': done, 'percentComplete': done, 'averageSpeed': 0})
+    return [{'username': u, 'directories': [{'files': fs}]} for u, fs in users.items()]
+
+
+class _Feed:
+    def __init__(self):
+        self.data = []
+
+    def __call__(self):
+        return self.data
+
+
+def _tracker(feed, **kw):
+    return TransferTracker(feed, _key, poll_interval=60, **kw)
+
+
+def test_only_changed_transfers_are_published_and_unchanged_dicts_are_kept():
+    feed = _Feed()
+    tracker = _tracker(feed)
+    published = []
+    tracker.subscribe(lambda changed, removed: published.append(
+        (sorted(t['id'] for t in changed), removed)))
+    feed.data = _tree(('u1', 'a', 'music\\A.flac', 'InProgress', 10),
+                      ('u2', 'b', 'music\\B.flac', 'Queued, Remotely', 0))
+    tracker.refresh()
+    first = tracker.get_lookup()
+    b_before = first['u2::music/B.flac']
+
+    feed.data = _tree(('u1', 'a', 'music\\A.flac', 'InProgress', 55),
+                      ('u2', 'b', 'music\\B.flac', 'Queued, Remotely', 0))
+    changed, removed = tracker.refresh()
+    assert [t['id'] for t in changed] == ['a'] and removed == []
+    lookup = tracker.get_lookup()
+    assert lookup is not first                      # copy-on-write for readers
+    assert lookup['u2::music/B.flac'] is b_before   # untouched entry reused
+    assert tracker.get_by_id('a')['bytesTransferred'] == 55
+    assert tracker.get('u1', 'music/A.flac')['username'] == 'u1'
+
+    tracker.refresh()
+    assert published == [(['a', 'b'], []), (['a'], [])]
+
+
+def test_removed_and_aged_out_transfers_leave_memory():
+    feed = _Feed()
+    tracker = _tracker(feed, retain_finished=0)
+    feed.data = _tree(('u1', 'a', 'A.flac', 'Completed, Succeeded', 100),
+                      ('u1', 'b', 'B.flac', 'InProgress', 5))
+    tracker.refresh()
+    # Still listed by slskd, but finished long enough: aged out and not re-added.
+    tracker.refresh()
+    assert set(tracker.get_lookup()) == {'u1::B.flac'}
+    tracker.refresh()
+    assert set(tracker.get_lookup()) == {'u1::B.flac'}
+    assert tracker.get_by_id('a') is None
+
+    feed.data = []
+    _, removed = tracker.refresh()
+    assert removed == ['u1::B.flac'] and tracker.get_lookup() == {}
+    assert tracker.get_stats()['aged_out'] == 1
+
+
+def test_change_feed_and_batch_index():
+    feed = _Feed()
+    tracker = _tracker(feed, batch_index=lambda: {'u1::A.flac': 'batch-1', 'u1::Gone.flac': 'batch-1'})
+    feed.data = _tree(('u1', 'a', 'A.flac', 'InProgress', 1), ('u1', 'b', 'B.flac', 'InProgress', 1))
+    tracker.refresh()
+    full = tracker.changes_since(0)
+    assert full['reset'] and len(full['changed']) == 2
+    assert [t['id'] for t in tracker.transfers_for_batch('batch-1')] == ['a']
+
+    feed.data = _tree(('u1', 'a', 'A.flac', 'InProgress', 2))
+    tracker.refresh()
+    delta = tracker.changes_since(full['seq'])
+    assert not delta['reset']
+    assert [t['id'] for t in delta['changed']] == ['a'] and delta['removed'] == ['u1::B.flac']
+    assert tracker.changes_since(delta['seq'])['changed'] == []
+
+
+def test_failed_poll_keeps_previous_view_and_reads_refresh_inline():
+    calls = {'n': 0}
+
+    def fetch():
+        calls['n'] += 1
+        if calls['n'] == 2:
+            raise ConnectionError('slskd down')
+        return _tree(('u1', 'a', 'A.flac', 'InProgress', calls['n']))
+
+    tracker = TransferTracker(fetch, _key, poll_interval=0.1)
+    assert 'u1::A.flac' in tracker.get_lookup()     # inline refresh, no thread
+    assert tracker.refresh() is None
+    assert tracker._lookup['u1::A.flac']['bytesTransferred'] == 1
+    assert tracker.get_stats()['errors'] == 1
+
+
+def test_finished_transfer_a_task_still_waits_on_is_not_aged_out():
+    feed = _Feed()
+    waiting = {'u1::A.flac'}
+    tracker = _tracker(feed, retain_finished=0, pinned=lambda: waiting)
+    feed.data = _tree(('u1', 'a', 'A.flac', 'Completed, Succeeded', 100))
+    tracker.refresh()
+    tracker.refresh()
+    assert tracker.get('u1', 'A.flac')['state'] == 'Completed, Succeeded'
+
+    waiting.clear()     # the task resolved: the finished entry can go now
+    tracker.refresh()
+    assert tracker.get_lookup() == {} and tracker.get_stats()['aged_out'] == 1
+
+
+def test_idle_poll_backs_off_and_reads_catch_a_new_download():
+    import time
+    feed = _Feed()
+    polls = []
+
+    def fetch():
+        polls.append(time.monotonic())
+        return feed.data
+
+    tracker = TransferTracker(fetch, _key, poll_interval=0.1, idle_interval=5)
+    tracker.start()
+    try:
+        time.sleep(0.8)
+        # 0.1, 0.2, 0.4, 0.8 ... instead of a poll every 0.1s
+        assert len(polls) <= 4 and tracker.get_stats()['poll_wait'] > 0.1
+        feed.data = _tree(('u1', 'a', 'A.flac', 'InProgress', 1))
+        assert 'u1::A.flac' in tracker.get_lookup()   # inline refresh while backing off
+        time.sleep(0.35)
+        assert tracker.get_stats()['poll_wait'] == 0.1
+    finally:
+        tracker.stop()
@@ -0,0 +1,176 @@
+"""Local MusicBrainz mirror: dump import, exact lookups, and client fallback.
+
+The mirror answers first and the rate-limited web service only sees what the
+mirror cannot vouch for. These tests build a tiny JSON-lines subset (the same
+shape as the official JSON dumps), import it as complete, and check both the
+mirror's own lookups and that ``MusicBrainzClient`` skips ``session.get`` on a
+hit — and that incomplete types and missing includes still reach the web.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from core import musicbrainz_mirror
+from core.musicbrainz_client import MusicBrainzClient
+from core.musicbrainz_mirror import MusicBrainzMirror, normalize_name
+
+_ARTIST = {
+    "id": "a-1", "name": "Björk", "sort-name": "Björk",
+    "aliases": [{"name": "Bjork Gudmundsdottir"}],
+}
+_CREDIT = [{"name": "Björk", "joinphrase": "", "artist": {"id": "a-1", "name": "Björk"}}]
+_RECORDING = {"id": "rec-1", "title": "Jóga", "length": 305000, "artist-credit": _CREDIT, "isrcs": ["GBAAA9700001"]}
+_RELEASE = {
+    "id": "rel-1", "title": "Homogenic", "date": "1997-09-22", "artist-credit": _CREDIT,
+    "release-group": {"id": "rg-1", "title": "Homogenic", "primary-type": "Album", "first-release-date": "1997-09-22"},
+    "media": [{"tracks": [{"position": 1, "recording": _RECORDING}]}],
+}
+
+
+def _write_jsonl(path, docs):
+    path.write_text("\n".join(json.dumps(d) for d in docs) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    m = MusicBrainzMirror(str(tmp_path / "mirror.db"))
+    m.import_dump(_write_jsonl(tmp_path / "artist.jsonl", [_ARTIST]), complete=True)
+    m.import_dump(_write_jsonl(tmp_path / "release.jsonl", [_RELEASE]), complete=True)
+    m.import_dump(_write_jsonl(tmp_path / "release-group.jsonl", [_RELEASE["release-group"]]), complete=True)
+    m.import_dump(_write_jsonl(tmp_path / "recording.jsonl", [_RECORDING]), complete=True)
+    return m
+
+
+def test_normalize_folds_case_and_diacritics():
+    assert normalize_name("  BJÖRK  ") == normalize_name("bjork") == "bjork"
+
+
+def test_release_import_indexes_embedded_group_recordings_and_isrcs(mirror):
+    assert mirror.get_release("rel-1")["title"] == "Homogenic"
+    assert mirror.get_release_group("rg-1")["title"] == "Homogenic"
+    assert mirror.get_recording("rec-1")["length"] == 305000
+    assert [r["id"] for r in mirror.lookup_isrc("gbaaa9700001")] == ["rec-1"]
+    assert [rg["id"] for rg in mirror.browse_artist_release_groups("a-1", release_types=["album"])] == ["rg-1"]
+    assert mirror.browse_artist_release_groups("a-1", release_types=["single"]) == []
+    assert mirror.browse_artist_release_groups("a-1", offset=100) == []
+    assert mirror.browse_artist_release_groups("unknown-artist") is None
+    assert [r["id"] for r in mirror.browse_release_group_releases("rg-1")] == ["rel-1"]
+
+
+def test_strict_searches_match_normalized_names_and_aliases(mirror):
+    assert [a["id"] for a in mirror.search_artist("bjork")] == ["a-1"]
+    assert mirror.search_artist("bjork")[0]["score"] == 100
+    assert [a["id"] for a in mirror.search_artist("Bjork Gudmundsdottir")] == ["a-1"]
+    assert [r["id"] for r in mirror.search_recording("joga", artist_name="Bjork")] == ["rec-1"]
+    assert mirror.search_recording("joga", artist_name="Someone Else") is None
+    # Fuzzy searches are left to the web service.
+    assert mirror.search_artist("bjork", strict=False) is None
+
+
+def test_tarball_dump_uses_member_name_as_entity(tmp_path):
+    payload = (json.dumps(_ARTIST) + "\n").encode("utf-8")
+    archive = tmp_path / "artist.tar.xz"
+    with tarfile.open(archive, "w:xz") as tar:
+        info = tarfile.TarInfo("mbdump/artist")
+        info.size = len(payload)
+        tar.addfile(info, io.BytesIO(payload))
+    m = MusicBrainzMirror(str(tmp_path / "m.db"))
+    assert m.import_dump(str(archive)) == {"artist": 1}
+    assert m.get_artist("a-1")["name"] == "Björk"
+
+
+def test_reimport_upserts_instead_of_duplicating(mirror, tmp_path):
+    renamed = dict(_ARTIST, name="Bjork")
+    mirror.import_dump(_write_jsonl(tmp_path / "artist.jsonl", [renamed]), complete=True)
+    assert mirror.get_stats()["counts"]["artist"] == 1
+    assert mirror.get_artist("a-1")["name"] == "Bjork"
+
+
+def test_subset_import_is_not_answered_locally(tmp_path):
+    m = MusicBrainzMirror(str(tmp_path / "m.db"))
+    m.import_dump(_write_jsonl(tmp_path / "artist.jsonl", [_ARTIST]))
+    assert m.get_stats()["counts"]["artist"] == 1
+    assert m.get_stats()["complete"] == []
+    assert m.get_artist("a-1") is None
+    assert m.search_artist("bjork") is None
+    assert m.browse_artist_release_groups("a-1") is None
+
+
+def test_embedded_entities_do_not_make_their_type_complete(tmp_path):
+    m = MusicBrainzMirror(str(tmp_path / "m.db"))
+    m.import_dump(_write_jsonl(tmp_path / "release.jsonl", [_RELEASE]), complete=True)
+    assert m.get_release("rel-1")["id"] == "rel-1"
+    assert m.get_recording("rec-1") is None
+    assert m.lookup_isrc("GBAAA9700001") is None
+
+
+def test_interrupted_import_is_not_marked_complete(tmp_path):
+    m = MusicBrainzMirror(str(tmp_path / "m.db"))
+
+    def failing_store(conn, kind, doc):
+        raise RuntimeError("disk full")
+
+    m._store = failing_store
+    with pytest.raises(RuntimeError):
+        m.import_dump(_write_jsonl(tmp_path / "artist.jsonl", [_ARTIST]), complete=True)
+    assert not m.is_complete("artist")
+
+
+def test_subset_top_up_keeps_a_complete_type_complete(mirror, tmp_path):
+    extra = {"id": "a-2", "name": "Sigur Rós", "sort-name": "Sigur Rós"}
+    mirror.import_dump(_write_jsonl(tmp_path / "artist.jsonl", [extra]))
+    assert mirror.is_complete("artist")
+    assert mirror.get_artist("a-1")["id"] == "a-1"
+    assert mirror.get_artist("a-2")["id"] == "a-2"
+
+
+def test_lookup_with_unstored_include_is_not_answered(mirror):
+    assert mirror.get_artist("a-1", includes=["aliases"])["id"] == "a-1"
+    assert mirror.get_artist("a-1", includes=["url-rels"]) is None
+    assert mirror.get_artist("a-1", includes=["release-groups"]) is None
+    assert mirror.get_release("rel-1", includes=["artist-credits", "recordings", "release-groups"])["id"] == "rel-1"
+    assert mirror.get_release("rel-1", includes=["labels"]) is None
+    assert [r["id"] for r in mirror.get_release_group("rg-1", includes=["releases"])["releases"]] == ["rel-1"]
+
+
+@pytest.fixture
+def client_with_mirror(mirror, monkeypatch):
+    monkeypatch.setattr(musicbrainz_mirror, "get_musicbrainz_mirror", lambda: mirror)
+    c = MusicBrainzClient("SoulSync", "2")
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json = MagicMock(return_value={"id": "web", "recordings": [], "releases": []})
+    c.session = MagicMock()
+    c.session.get = MagicMock(return_value=resp)
+    return c
+
+
+def test_client_answers_hits_from_mirror_without_network(client_with_mirror):
+    assert client_with_mirror.get_recording("rec-1")["title"] == "Jóga"
+    assert client_with_mirror.search_release("Homogenic", artist_name="Björk")[0]["id"] == "rel-1"
+    assert client_with_mirror.lookup_isrc("GBAAA9700001")[0]["id"] == "rec-1"
+    client_with_mirror.session.get.assert_not_called()
+
+
+def test_client_falls_back_to_web_service_on_miss(client_with_mirror, monkeypatch):
+    monkeypatch.setattr("core.musicbrainz_client.MIN_API_INTERVAL", 0)
+    assert client_with_mirror.get_recording("not-mirrored")["id"] == "web"
+    client_with_mirror.session.get.assert_called_once()
+
+
+def test_client_falls_back_when_includes_are_not_stored(client_with_mirror, monkeypatch):
+    monkeypatch.setattr("core.musicbrainz_client.MIN_API_INTERVAL", 0)
+    assert client_with_mirror.get_artist("a-1", includes=["url-rels"])["id"] == "web"
+    client_with_mirror.session.get.assert_called_once()
+
+
+def test_client_keeps_empty_mirror_page_past_the_end(client_with_mirror):
+    assert client_with_mirror.browse_artist_release_groups("a-1", offset=100) == []
+    client_with_mirror.session.get.assert_not_called()
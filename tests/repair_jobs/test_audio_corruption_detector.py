@@ -6,6 +6,9 @@ Covered:
   flags (a false positive would delete a good file), ffmpeg fallback.
 * scan: corrupt file → one 'corrupt_audio' finding on the track; clean file →
   none; non-FLAC ignored; "modified within N days" narrows; no decoder → no-op.
+* verified ledger: unchanged files (size/mtime/STREAMINFO MD5) skip the decode,
+  only conclusive clean decodes are recorded, reverify_after_days expires them;
+  the parallel pool still reports every file.
 """
 
 from __future__ import annotations
@@ -239,3 +242,170 @@ def test_scan_surfaces_total_resolution_failure(tmp_path, monkeypatch):
     assert result.skipped == 1 and result.findings_created == 0
     assert any(r.get("log_type") == "error" and "No library paths" in (r.get("log_line") or "")
                for r in reports)
+
+
+# --- verified-file ledger + parallel decode ----------------------------------
+
+def _flac_bytes(md5=bytes(range(1, 17)), audio=b"frames"):
+    """Minimal FLAC head: marker, last-block STREAMINFO header (len 34), a
+    STREAMINFO body whose final 16 bytes are the audio MD5."""
+    return b"fLaC" + b"\x80\x00\x00\x22" + b"\x00" * 18 + md5 + audio
+
+
+def test_streaminfo_md5_read_from_header(tmp_path):
+    f = tmp_path / "a.flac"
+    f.write_bytes(_flac_bytes())
+    assert mod.read_streaminfo_md5(str(f)) == bytes(range(1, 17)).hex()
+    f.write_bytes(_flac_bytes(md5=b"\x00" * 16))
+    assert mod.read_streaminfo_md5(str(f)) is None  # encoder left it unset
+    f.write_bytes(b"ID3" + _flac_bytes())
+    assert mod.read_streaminfo_md5(str(f)) is None
+
+
+def test_integrity_result_marks_untested_verdicts(monkeypatch):
+    monkeypatch.setattr(mod.shutil, "which", lambda b: None)
+    verdict = check_flac_integrity("/x.flac")
+    assert verdict == (True, "") and verdict.tested is False
+    monkeypatch.setattr(mod.shutil, "which", lambda b: "/usr/bin/flac" if b == "flac" else None)
+    monkeypatch.setattr(mod.subprocess, "run", lambda *a, **k: _fake_proc(0))
+    assert check_flac_integrity("/x.flac").tested is True
+
+
+class _LedgerDB(_FakeDB):
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.ledger = {}
+
+    def get_verified_files(self, job_id):
+        return {p: dict(e) for (j, p), e in self.ledger.items() if j == job_id}
+
+    def record_verified_files(self, job_id, entries):
+        for e in entries:
+            self.ledger[(job_id, e["path"])] = dict(e)
+        return len(entries)
+
+    def forget_verified_files(self, job_id, paths):
+        for p in paths:
+            self.ledger.pop((job_id, p), None)
+        return len(paths)
+
+
+def _ledger_run(rows, tmp_path, monkeypatch, verdicts, settings=None):
+    calls = []
+    monkeypatch.setattr(mod, "_decoder_available", lambda: True)
+    monkeypatch.setattr(mod, "resolve_library_file_path", lambda p, **kw: p)
+
+    def _check(path):
+        calls.append(path)
+        return verdicts.get(path, (True, ""))
+
+    monkeypatch.setattr(mod, "check_flac_integrity", _check)
+    ctx, findings = _context(rows, tmp_path, settings)
+    return ctx, findings, calls
+
+
+def test_ledger_skips_unchanged_files_on_the_next_run(tmp_path, monkeypatch):
+    files = []
+    for n in range(3):
+        f = tmp_path / f"{n:02d}.flac"
+        f.write_bytes(_flac_bytes(audio=bytes([n])))
+        files.append(str(f))
+    rows = [_row(n, f"T{n}", p) for n, p in enumerate(files)]
+    db = _LedgerDB(rows)
+
+    ctx, _, calls = _ledger_run(rows, tmp_path, monkeypatch, {})
+    ctx.db = db
+    AudioCorruptionDetectorJob().scan(ctx)
+    assert sorted(calls) == files and len(db.ledger) == 3
+
+    calls.clear()
+    result = AudioCorruptionDetectorJob().scan(ctx)
+    assert calls == [] and result.skipped == 3
+
+    # A changed file (new size + mtime) is tested again; the others aren't.
+    with open(files[1], "ab") as fh:
+        fh.write(b"retagged")
+    AudioCorruptionDetectorJob().scan(ctx)
+    assert calls == [files[1]]
+
+
+def test_ledger_keys_on_streaminfo_md5(tmp_path, monkeypatch):
+    import os
+    f = tmp_path / "a.flac"
+    f.write_bytes(_flac_bytes(md5=b"\x01" * 16))
+    st = os.stat(f)
+    ctx, _, calls = _ledger_run([_row(1, "A", str(f))], tmp_path, monkeypatch, {})
+    ctx.db = _LedgerDB([_row(1, "A", str(f))])
+    AudioCorruptionDetectorJob().scan(ctx)
+    # Same size, same mtime, different audio signature.
+    f.write_bytes(_flac_bytes(md5=b"\x02" * 16))
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+    calls.clear()
+    AudioCorruptionDetectorJob().scan(ctx)
+    assert calls == [str(f)]
+
+
+def test_only_clean_decodes_enter_the_ledger(tmp_path, monkeypatch):
+    bad, slow = tmp_path / "bad.flac", tmp_path / "slow.flac"
+    bad.write_bytes(_flac_bytes())
+    slow.write_bytes(_flac_bytes())
+    rows = [_row(1, "Bad", str(bad)), _row(2, "Slow", str(slow))]
+    db = _LedgerDB(rows)
+    db.ledger[("audio_corruption_detector", str(bad))] = {"size": -1, "mtime_ns": 0,
+                                                         "streaminfo_md5": None, "verified_at": 0}
+    verdicts = {str(bad): (False, "FRAME_CRC_MISMATCH"),
+                str(slow): mod.IntegrityResult(True, "", tested=False)}  # decode timed out
+    ctx, findings, _ = _ledger_run(rows, tmp_path, monkeypatch, verdicts)
+    ctx.db = db
+    result = AudioCorruptionDetectorJob().scan(ctx)
+    assert result.findings_created == 1 and findings[0]["entity_id"] == "1"
+    assert db.ledger == {}
+
+
+def test_reverify_after_days_expires_ledger_entries(tmp_path, monkeypatch):
+    f = tmp_path / "a.flac"
+    f.write_bytes(_flac_bytes())
+    rows = [_row(1, "A", str(f))]
+    db = _LedgerDB(rows)
+    ctx, _, calls = _ledger_run(rows, tmp_path, monkeypatch, {}, settings={
+        "repair.jobs.audio_corruption_detector.reverify_after_days": 30})
+    ctx.db = db
+    AudioCorruptionDetectorJob().scan(ctx)
+    entry = db.ledger[("audio_corruption_detector", str(f))]
+    entry["verified_at"] -= 31 * 86400
+    calls.clear()
+    AudioCorruptionDetectorJob().scan(ctx)
+    assert calls == [str(f)]
+
+
+def test_parallel_scan_reports_every_file(tmp_path, monkeypatch):
+    files = []
+    for n in range(40):
+        f = tmp_path / f"{n:02d}.flac"
+        f.write_bytes(_flac_bytes(audio=bytes([n]) * 100))
+        files.append(str(f))
+    rows = [_row(n, f"T{n}", p) for n, p in enumerate(files)]
+    verdicts = {p: (False, "bad") for p in files[::7]}
+    ctx, findings, calls = _ledger_run(rows, tmp_path, monkeypatch, verdicts, settings={
+        "repair.jobs.audio_corruption_detector.parallel_tests": 4})
+    progress = []
+    ctx.update_progress = lambda done, total: progress.append((done, total))
+    result = AudioCorruptionDetectorJob().scan(ctx)
+
+    assert sorted(calls) == files
+    assert sorted(f["entity_id"] for f in findings) == sorted(str(n) for n in range(0, 40, 7))
+    assert result.scanned == 40 and progress[-1] == (40, 40)
+
+
+def test_music_database_ledger_roundtrip(tmp_path):
+    from database.music_database import MusicDatabase
+
+    db = MusicDatabase(str(tmp_path / "music.db"))
+    entry = {"path": "/m/a.flac", "size": 10, "mtime_ns": 5, "streaminfo_md5": "ab",
+             "verifier": "flac", "verified_at": 1.0}
+    assert db.record_verified_files("job", [entry]) == 1
+    db.record_verified_files("job", [dict(entry, size=11)])
+    got = db.get_verified_files("job")
+    assert got["/m/a.flac"]["size"] == 11 and db.get_verified_files("other") == {}
+    assert db.forget_verified_files("job", ["/m/a.flac"]) == 1
+    assert db.get_verified_files("job") == {}
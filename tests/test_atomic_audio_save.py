@@ -233,3 +233,73 @@ def test_flac_clean_tag_write_replaces(tmp_path):
     assert ok is True
     assert FLAC(str(f))["title"] == ["Clean Write"]
     assert not (tmp_path / "real.flac.sstmp").exists()
+
+
+# ── hardlinked files (reorganize stages library files as hardlinks) ──
+
+def test_atomic_save_breaks_hardlink_leaving_other_name_untouched(tmp_path):
+    original = tmp_path / "library.flac"
+    original.write_bytes(b"ORIGINAL")
+    staged = tmp_path / "staged.flac"
+    os.link(original, staged)
+
+    class Audio:
+        filename = str(staged)
+        tags = None
+
+        def save(self, target=None, **k):
+            with open(target, "ab") as h:
+                h.write(b"+TAGS")
+
+    assert save_audio_file(Audio(), _symbols(180.0)) is True
+    assert staged.read_bytes() == b"ORIGINAL+TAGS"
+    assert original.read_bytes() == b"ORIGINAL"
+    assert os.stat(original).st_nlink == 1
+
+
+def test_inplace_fallback_detaches_hardlink_first(tmp_path):
+    original = tmp_path / "library.flac"
+    original.write_bytes(b"ORIGINAL")
+    staged = tmp_path / "staged.flac"
+    os.link(original, staged)
+
+    class Audio:
+        filename = str(staged)
+        tags = None
+
+        def save(self, target=None, **k):
+            if target is not None:
+                raise TypeError("format can't save to a path")
+            with open(self.filename, "r+b") as h:   # genuine in-place rewrite
+                h.write(b"TAGGED!!")
+
+    assert save_audio_file(Audio(), _symbols(180.0)) is True
+    assert staged.read_bytes() == b"TAGGED!!"
+    assert original.read_bytes() == b"ORIGINAL"
+    assert not (tmp_path / "staged.flac.sslink").exists()
+
+
+def test_inplace_fallback_aborts_when_hardlink_cannot_be_detached(tmp_path, monkeypatch):
+    import core.metadata.common as common
+    original = tmp_path / "library.flac"
+    original.write_bytes(b"ORIGINAL")
+    staged = tmp_path / "staged.flac"
+    os.link(original, staged)
+    inplace = []
+
+    class Audio:
+        filename = str(staged)
+        tags = None
+
+        def save(self, target=None, **k):
+            if target is not None:
+                raise TypeError("format can't save to a path")
+            inplace.append(True)
+
+    def no_copy(*_a, **_k):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(common.shutil, "copy2", no_copy)
+    assert save_audio_file(Audio(), _symbols(180.0)) is False
+    assert inplace == []
+    assert original.read_bytes() == b"ORIGINAL"
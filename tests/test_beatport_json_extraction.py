@@ -0,0 +1,142 @@
+"""Beatport scraper: JSON-first page parsing, page cache, concurrent fetches.
+
+The release/track/chart pages are Next.js pages whose data lives in the
+``__NEXT_DATA__`` script. The fast path pulls that JSON out of the raw bytes
+with a regex; BeautifulSoup is only the fallback. These tests pin that both
+paths agree, that the conditional-request cache revalidates instead of
+re-downloading, and that concurrent enrichment keeps chart order.
+
+No live network: the scraper's ``session.get`` is replaced with a fake.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from bs4 import BeautifulSoup
+
+from beatport_unified_scraper import BeatportUnifiedScraper, extract_next_data_json
+
+
+def _next_page(tracks, filler=''):
+    data = {"props": {"pageProps": {"dehydratedState": {"queries": [
+        {"state": {"data": {"results": tracks}}},
+    ]}}}}
+    return (
+        '<html><head><title>Top 100</title></head><body>'
+        f'{filler}'
+        '<script id="__NEXT_DATA__" type="application/json">'
+        f'{json.dumps(data)}'
+        '</script></body></html>'
+    ).encode('utf-8')
+
+
+def _track(i, release_name=''):
+    release = {"id": 900 + i, "name": release_name, "label": {"name": "Label"}} if release_name else {}
+    return {"id": i, "slug": f"song-{i}", "title": f"Song {i}", "artists": [{"name": f"Artist {i}"}], "release": release}
+
+
+def _response(content=b'', status=200, headers=None):
+    resp = Mock()
+    resp.content = content
+    resp.status_code = status
+    resp.headers = headers or {}
+    resp.raise_for_status = Mock()
+    return resp
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setattr(BeatportUnifiedScraper, '_page_cache', type(BeatportUnifiedScraper._page_cache)())
+    monkeypatch.setattr(BeatportUnifiedScraper, 'cache_stats', {'hits': 0, 'revalidated': 0, 'misses': 0})
+    monkeypatch.setattr(BeatportUnifiedScraper, 'MIN_REQUEST_INTERVAL', 0)
+    s = BeatportUnifiedScraper()
+    s.session = Mock()
+    return s
+
+
+def test_fast_path_matches_soup_path():
+    page = _next_page([_track(1), _track(2)], filler='<div class="x">' * 50 + '</div>' * 50)
+    fast = extract_next_data_json(page)
+    slow = BeatportUnifiedScraper().extract_json_object_from_release_page(BeautifulSoup(page, 'html.parser'))
+    assert fast == slow
+    assert extract_next_data_json(b'<html><script>var x = 1;</script></html>') is None
+
+
+def test_conditional_revalidation_reuses_cached_body(scraper):
+    page = _next_page([_track(1)])
+    scraper.session.get.side_effect = [
+        _response(page, headers={'ETag': '"v1"'}),
+        _response(status=304),
+    ]
+    first = scraper.get_page_json('https://beatport.com/track/song-1/1')
+    second = scraper.get_page_json('https://beatport.com/track/song-1/1')
+    assert first == second
+    _, kwargs = scraper.session.get.call_args
+    assert kwargs['headers'] == {'If-None-Match': '"v1"'}
+    assert scraper.cache_stats['revalidated'] == 1
+
+
+def test_page_cache_is_bounded_by_bytes(scraper, monkeypatch):
+    monkeypatch.setattr(BeatportUnifiedScraper, 'PAGE_CACHE_MAX_BYTES', 2500)
+    scraper.session.get.side_effect = [_response(b'x' * 1000), _response(b'y' * 1000),
+                                       _response(b'z' * 1000), _response(b'w' * 5000)]
+    for i in range(4):
+        scraper.fetch_page_content(f'https://beatport.com/track/song/{i}')
+    cache = BeatportUnifiedScraper._page_cache
+    # the oldest page made room for the third; the oversized fourth was never kept
+    assert list(cache) == ['https://beatport.com/track/song/1', 'https://beatport.com/track/song/2']
+
+
+def test_json_chart_path_skips_enrichment_fetches(scraper):
+    tracks = [_track(i, release_name=f"Release {i}") for i in range(1, 7)]
+    scraper.session.get.return_value = _response(_next_page(tracks))
+    result = scraper.scrape_top_100(limit=100, enrich=True)
+    assert [t['title'] for t in result] == [f"Song {i}" for i in range(1, 7)]
+    assert result[0]['release_name'] == 'Release 1'
+    # one chart fetch; tracks already carried release metadata
+    assert scraper.session.get.call_count == 1
+
+
+def test_release_page_is_fetched_once(scraper):
+    release_tracks = [dict(_track(i), release={"id": 777, "name": "EP"}) for i in (1, 2)]
+    data = {"props": {"pageProps": {"dehydratedState": {"queries": [
+        {"state": {"data": {}}}, {"state": {"data": {"results": release_tracks}}},
+    ]}}}}
+    page = ('<html><script id="__NEXT_DATA__" type="application/json">'
+            f'{json.dumps(data)}</script></html>').encode('utf-8')
+    scraper.session.get.return_value = _response(page)
+    tracks = scraper.extract_individual_tracks_from_release_url(
+        'https://www.beatport.com/release/ep/777', 'Top 10')
+    assert [t['list_name'] for t in tracks] == ['Top 10', 'Top 10']
+    # the None check and the JSON parse share one response
+    assert scraper.session.get.call_count == 1
+
+
+def test_concurrent_enrichment_preserves_order_and_reports_progress(scraper):
+    in_flight = {'now': 0, 'max': 0}
+    lock = threading.Lock()
+
+    def _get(url, **kwargs):
+        with lock:
+            in_flight['now'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['now'])
+        time.sleep(0.02)
+        with lock:
+            in_flight['now'] -= 1
+        track_id = int(url.rstrip('/').split('/')[-1])
+        return _response(_next_page([_track(track_id, release_name=f"Release {track_id}")]))
+
+    scraper.session.get.side_effect = _get
+    chart = [{'title': f'Song {i}', 'url': f'https://beatport.com/track/song-{i}/{i}', 'list_name': 'Top 100'}
+             for i in range(1, 11)]
+    progress = []
+    enriched = scraper.enrich_chart_tracks(chart, progress_callback=lambda done, total, name: progress.append(done))
+
+    assert [t['release_name'] for t in enriched] == [f"Release {i}" for i in range(1, 11)]
+    assert sorted(progress) == list(range(1, 11))
+    assert 1 < in_flight['max'] <= BeatportUnifiedScraper.MAX_CONCURRENT_FETCHES
@@ -0,0 +1,126 @@
+"""DatabaseUpdateWorker writes scans through bulk_upsert_media_library.
+
+Each artist's albums/tracks are fetched first and written as one batch. In the
+threaded path the pool only fetches: a single writer thread drains the queued
+batches into shared bulk transactions. These tests pin that the sequential
+and threaded paths store the same rows, report the same per-artist details,
+collect newly inserted tracks for post-scan hooks, and fall back to the
+per-row methods when a bulk write fails.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core.database_update_worker import DatabaseUpdateWorker, _IngestWriter
+from database.music_database import MusicDatabase
+
+
+def _library(n_artists=6, n_albums=2, n_tracks=4):
+    artists = []
+    for a in range(n_artists):
+        albums = []
+        for b in range(n_albums):
+            tracks = [SimpleNamespace(ratingKey=f"t{a}-{b}-{t}", title=f"Track {t}", trackNumber=t + 1,
+                                      discNumber=1, duration=1000, path=f"/m/{a}/{b}/{t}.flac", bitRate=320)
+                      for t in range(n_tracks)]
+            albums.append(SimpleNamespace(ratingKey=f"al{a}-{b}", title=f"Album {a}-{b}", year=2000 + b,
+                                          thumb=None, leafCount=n_tracks, duration=0, genres=[],
+                                          tracks=lambda tracks=tracks: tracks))
+        artists.append(SimpleNamespace(ratingKey=f"ar{a}", title=f"Artist {a}", thumb=None, summary='',
+                                       genres=[], albums=lambda albums=albums: albums))
+    return artists
+
+
+@pytest.fixture()
+def make_worker(tmp_path, monkeypatch):
+    def factory(name, force_sequential):
+        db = MusicDatabase(str(tmp_path / f"{name}.db"))
+        monkeypatch.setattr("core.database_update_worker.get_database", lambda path=None: db)
+        w = DatabaseUpdateWorker(media_client=SimpleNamespace(), database_path=str(tmp_path / f"{name}.db"),
+                                 server_type="navidrome", force_sequential=force_sequential)
+        w.database = db
+        w.details = {}
+        w.callbacks['artist_processed'].append(
+            lambda name, ok, details, albums, tracks: w.details.__setitem__(name, (ok, details, albums, tracks)))
+        return w
+
+    return factory
+
+
+def _dump(db):
+    conn = db._get_connection()
+    try:
+        return [conn.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+                for table in ('artists', 'albums', 'tracks')]
+    finally:
+        conn.close()
+
+
+def _strip_timestamps(rows):
+    return [[tuple(v for v in r if not (isinstance(v, str) and v[:2] == '20' and ':' in v)) for r in t]
+            for t in rows]
+
+
+def test_threaded_scan_matches_sequential_scan(make_worker):
+    seq = make_worker('seq', force_sequential=True)
+    seq._process_all_artists(_library())
+    par = make_worker('par', force_sequential=False)
+    calls = []
+    original = par.database.bulk_upsert_media_library
+    par.database.bulk_upsert_media_library = lambda *a, **kw: calls.append(len(a[0])) or original(*a, **kw)
+    par._process_all_artists(_library())
+
+    assert _strip_timestamps(_dump(par.database)) == _strip_timestamps(_dump(seq.database))
+    assert par.details == seq.details
+    assert par.details['Artist 0'] == (True, "Updated with 2 albums, 8 tracks", 2, 8)
+    assert par._new_track_ids == seq._new_track_ids and len(par._new_track_ids) == 48
+    assert (par.processed_albums, par.processed_tracks) == (12, 48)
+    assert sum(calls) == 6 and par._writer is None
+
+
+def test_deep_scan_reports_existing_tracks_as_updated(make_worker):
+    w = make_worker('deep', force_sequential=True)
+    w._process_all_artists(_library(n_artists=1))
+    w._new_track_ids.clear()
+
+    artist = _library(n_artists=1)[0]
+    seen = set()
+    assert w._process_artist_with_content(artist, skip_existing_tracks=True, seen_track_ids=seen) == (
+        True, "2 albums, 0 new tracks (8 existing updated)", 2, 0)
+    assert len(seen) == 8 and not w._new_track_ids
+
+
+def test_writer_coalesces_queued_batches(make_worker):
+    w = make_worker('writer', force_sequential=True)
+    batches = [w._collect_artist_content(a) for a in _library()]
+    release = threading.Event()
+    calls = []
+
+    def write(group):
+        release.wait(timeout=30)
+        calls.append(len(group))
+        return w._write_batches(group)
+
+    writer = _IngestWriter(write)
+    try:
+        # The first batch holds the writer while the rest queue up behind it.
+        futures = [writer.submit(b) for b in batches]
+        release.set()
+        results = [f.result(timeout=30) for f in futures]
+    finally:
+        writer.close()
+    assert calls[0] >= 1 and sum(calls) == 6 and len(calls) < 6
+    assert all(r == (True, "Updated with 2 albums, 8 tracks", 2, 8) for r in results)
+
+
+def test_failed_bulk_write_falls_back_to_per_row(make_worker):
+    w = make_worker('fallback', force_sequential=True)
+    w.database.bulk_upsert_media_library = lambda *a, **kw: None
+    w._process_all_artists(_library(n_artists=2))
+    assert w.details['Artist 1'] == (True, "Updated with 2 albums, 8 tracks", 2, 8)
+    assert len(w._new_track_ids) == 16
+    assert len(_dump(w.database)[2]) == 16
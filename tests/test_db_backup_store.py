@@ -0,0 +1,127 @@
+"""Tests for core.db_backup_store — deduplicated, compressed backup snapshots.
+
+Consecutive snapshots must only store the chunks that changed, and restore /
+verify must refuse anything that doesn't hash back to what was stored.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+
+import pytest
+
+from core.db_backup_store import BackupChunkStore, run_configured_backup
+from core.db_integrity import DBIntegrityError, is_healthy
+
+
+def _make_db(path, rows=3000):
+    c = sqlite3.connect(path)
+    c.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    c.executemany("INSERT INTO t (v) VALUES (?)", [(f"row-{i}-" + "x" * 80,) for i in range(rows)])
+    c.commit()
+    c.close()
+
+
+def _rows(path):
+    c = sqlite3.connect(path)
+    try:
+        return c.execute("SELECT id, v FROM t ORDER BY id").fetchall()
+    finally:
+        c.close()
+
+
+def test_second_snapshot_only_stores_changed_chunks(tmp_path):
+    db = str(tmp_path / "lib.db")
+    _make_db(db)
+    store = BackupChunkStore(str(tmp_path / "store"), codec="gzip", chunk_pages=4)
+
+    first = store.put(db, "20260101_000000")
+    assert first["new_chunks"] == first["chunks"] and first["reused_chunks"] == 0
+    assert first["bytes_written"] < first["bytes_read"]  # compressed
+
+    c = sqlite3.connect(db)
+    c.execute("UPDATE t SET v = 'changed' WHERE id = 5")
+    c.commit()
+    c.close()
+    second = store.put(db, "20260102_000000")
+
+    assert second["reused_chunks"] > 0
+    assert second["new_chunks"] < second["chunks"] // 2
+    assert [s["name"] for s in store.list()] == ["20260102_000000", "20260101_000000"]
+
+
+def test_restore_and_verify_round_trip(tmp_path):
+    db = str(tmp_path / "lib.db")
+    _make_db(db)
+    store = BackupChunkStore(str(tmp_path / "store"), codec="gzip")
+    store.put(db, "snap")
+
+    assert store.verify("snap")["ok"] is True
+    out = str(tmp_path / "restored.db")
+    stats = store.restore("snap", out)
+    assert stats["bytes_written"] == os.path.getsize(db)
+    assert is_healthy(out) and _rows(out) == _rows(db)
+
+
+def test_corrupt_chunk_fails_verify_and_restore(tmp_path):
+    db = str(tmp_path / "lib.db")
+    _make_db(db)
+    store = BackupChunkStore(str(tmp_path / "store"), codec="none", chunk_pages=4)
+    store.put(db, "snap")
+    digest = store.load_manifest("snap")["chunks"][1]
+    obj = store._find_object(digest)
+    with open(obj, "r+b") as f:
+        f.write(b"\xff" * 64)
+
+    result = store.verify("snap")
+    assert result["ok"] is False and "corrupt chunk" in result["error"]
+    out = str(tmp_path / "restored.db")
+    with pytest.raises(DBIntegrityError):
+        store.restore("snap", out)
+    assert not os.path.exists(out)
+
+
+def test_prune_keeps_newest_and_collects_unreferenced_chunks(tmp_path):
+    db = str(tmp_path / "lib.db")
+    _make_db(db)
+    store = BackupChunkStore(str(tmp_path / "store"), codec="gzip", chunk_pages=4)
+    for day in range(1, 5):
+        c = sqlite3.connect(db)
+        c.execute("UPDATE t SET v = ? WHERE id = ?", (f"day-{day}", day * 500))
+        c.commit()
+        c.close()
+        store.put(db, f"2026010{day}_000000")
+
+    result = store.prune(2)
+
+    assert result["deleted"] == ["20260101_000000", "20260102_000000"]
+    assert result["removed_chunks"] > 0
+    assert [s["name"] for s in store.list()] == ["20260104_000000", "20260103_000000"]
+    assert all(store.verify(s["name"])["ok"] for s in store.list())
+
+
+def test_invalid_snapshot_names_are_rejected(tmp_path):
+    store = BackupChunkStore(str(tmp_path / "store"))
+    for bad in ("../escape", "", ".hidden"):
+        with pytest.raises(ValueError):
+            store.load_manifest(bad)
+
+
+def test_run_configured_backup_snapshots_into_store(tmp_path):
+    db = str(tmp_path / "music_library.db")
+    _make_db(db)
+    settings = {
+        "database.backup.pages_per_step": 8,
+        "database.backup.step_sleep_ms": 0,
+        "database.backup.chunk_store.enabled": True,
+        "database.backup.chunk_store.compression": "gzip",
+    }
+    backup_path = db + ".backup_20260101_000000"
+
+    result = run_configured_backup(db, backup_path, lambda key, default=None: settings.get(key, default))
+
+    assert result["backup"]["steps"] > 1 and is_healthy(backup_path)
+    assert result["store"]["name"] == "20260101_000000"
+    store = BackupChunkStore(str(tmp_path / "backup_store" / "music_library.db"))
+    assert store.verify("20260101_000000")["ok"] is True
@@ -131,3 +131,37 @@ def test_prune_noop_under_limit(tmp_path):
     for i in range(3):
         p = str(tmp_path / f"b{i}.db"); _make_db(p); paths.append(p)
     assert prune_backups(paths, max_keep=5) == []
+
+
+def test_safe_backup_copies_in_steps_and_reports_cost(tmp_path):
+    src = str(tmp_path / "src.db"); dst = str(tmp_path / "dst.db")
+    _make_db(src, rows=5000)
+    seen = []
+    stats = safe_backup(src, dst, pages_per_step=4, step_sleep=0,
+                        progress=lambda remaining, total: seen.append((remaining, total)))
+    assert stats.steps > 1 and len(seen) == stats.steps
+    assert seen[-1][0] == 0
+    assert stats.bytes_written == os.path.getsize(dst)
+    # one pass over the source pages plus the result check — no second
+    # full read of the source for a separate pre-copy quick_check
+    assert stats.verified_result and not stats.verified_source
+    assert stats.bytes_read == stats.pages * stats.page_size + os.path.getsize(dst)
+    assert is_healthy(dst)
+
+
+def test_safe_backup_under_constant_writes_falls_back_to_one_step(tmp_path):
+    src = str(tmp_path / "src.db"); dst = str(tmp_path / "dst.db")
+    _make_db(src, rows=5000)
+    writer = sqlite3.connect(src)
+
+    def write_between_steps(remaining, total):
+        # every write from another connection restarts a stepped copy
+        writer.execute("INSERT INTO t (v) VALUES ('late')")
+        writer.commit()
+
+    stats = safe_backup(src, dst, pages_per_step=4, step_sleep=0, max_restarts=2,
+                        progress=write_between_steps)
+    writer.close()
+    assert stats.restarts == 3 and stats.single_step
+    assert stats.steps < 10
+    assert is_healthy(dst)
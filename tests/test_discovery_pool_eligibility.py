@@ -0,0 +1,145 @@
+"""Maintained eligibility flags + window sampling for discovery playlists.
+
+``_select_discovery_tracks`` used to run a correlated NOT EXISTS against
+``tracks`` (three OR'd ID columns), a blocklist NOT IN subquery and
+``ORDER BY RANDOM()`` over the whole pool on every generation. discovery_pool
+now carries trigger-maintained ``owned`` / ``blocked`` flags, a normalized
+``artist_key`` and a ``sample_key`` the selector reads a random window of.
+These pin the flags to every writer path and the selector to the same
+results the subqueries gave.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from core.personalized_playlists import PersonalizedPlaylistsService
+from database.music_database import MusicDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = MusicDatabase(str(tmp_path / "music.db"))
+    conn = db._get_connection()
+    conn.execute("INSERT INTO artists (id, name, server_source) VALUES ('a-1', 'Artist', 'plex')")
+    conn.execute("INSERT INTO albums (id, artist_id, title, server_source) VALUES ('al-1', 'a-1', 'LP', 'plex')")
+    conn.commit()
+    return db
+
+
+def _pool(db, n=1, *, artist='Pool Artist', source='spotify', **ids):
+    conn = db._get_connection()
+    for i in range(n):
+        row = {'source': source, 'track_name': f'T{i}', 'artist_name': artist,
+               'album_name': f'Album {i}', 'track_data_json': '{}'}
+        row.update({k: (v if n == 1 else f'{v}-{i}') for k, v in ids.items()})
+        conn.execute(f"INSERT INTO discovery_pool ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+                     tuple(row.values()))
+    conn.commit()
+
+
+def _flags(db):
+    return {tuple(r)[0]: tuple(r)[1:] for r in db._get_connection().execute(
+        "SELECT COALESCE(spotify_track_id, itunes_track_id, deezer_track_id), owned, blocked "
+        "FROM discovery_pool")}
+
+
+def _sql(db, statement, params=()):
+    conn = db._get_connection()
+    conn.execute(statement, params)
+    conn.commit()
+
+
+def test_owned_follows_library_tracks(db):
+    _pool(db, spotify_track_id='sp-1')
+    _pool(db, deezer_track_id='dz-1')
+    assert _flags(db) == {'sp-1': (0, 0), 'dz-1': (0, 0)}
+
+    _sql(db, "INSERT INTO tracks (id, album_id, artist_id, title, server_source, spotify_track_id) "
+             "VALUES ('t-1', 'al-1', 'a-1', 'x', 'plex', 'sp-1')")
+    _sql(db, "INSERT INTO tracks (id, album_id, artist_id, title, server_source) "
+             "VALUES ('t-2', 'al-1', 'a-1', 'y', 'plex')")
+    _sql(db, "UPDATE tracks SET deezer_id = 'dz-1' WHERE id = 't-2'")   # tracks.deezer_id ↔ deezer_track_id
+    assert _flags(db) == {'sp-1': (1, 0), 'dz-1': (1, 0)}
+
+    _sql(db, "DELETE FROM tracks WHERE id = 't-1'")
+    _sql(db, "UPDATE tracks SET deezer_id = NULL WHERE id = 't-2'")
+    assert _flags(db) == {'sp-1': (0, 0), 'dz-1': (0, 0)}
+
+
+def test_pool_rows_added_after_the_track_start_owned(db):
+    _sql(db, "INSERT INTO tracks (id, album_id, artist_id, title, server_source, itunes_track_id) "
+             "VALUES ('t-1', 'al-1', 'a-1', 'x', 'plex', 'it-1')")
+    _pool(db, source='itunes', itunes_track_id='it-1')
+    assert _flags(db) == {'it-1': (1, 0)}
+
+
+def test_blocked_follows_both_blocklists_case_insensitively(db):
+    _pool(db, spotify_track_id='sp-1', artist='Some Artist')
+    _pool(db, spotify_track_id='sp-2', artist='Other')
+
+    _sql(db, "INSERT INTO blocklist (entity_type, name) VALUES ('artist', 'SOME ARTIST')")
+    _sql(db, "INSERT INTO blocklist (entity_type, name) VALUES ('album', 'Other')")   # not an artist ban
+    assert _flags(db) == {'sp-1': (0, 1), 'sp-2': (0, 0)}
+
+    _sql(db, "INSERT INTO discovery_artist_blacklist (artist_name) VALUES ('other')")
+    _sql(db, "DELETE FROM blocklist WHERE entity_type = 'artist'")
+    assert _flags(db) == {'sp-1': (0, 0), 'sp-2': (0, 1)}
+
+    _sql(db, "UPDATE discovery_artist_blacklist SET artist_name = 'Some Artist'")
+    assert _flags(db) == {'sp-1': (0, 1), 'sp-2': (0, 0)}
+
+
+def test_startup_resyncs_drifted_flags(db):
+    _pool(db, spotify_track_id='sp-1')
+    _sql(db, "UPDATE discovery_pool SET owned = 1, blocked = 1, sample_key = NULL")
+    conn = db._get_connection()
+    db._ensure_discovery_eligibility(conn.cursor())
+    conn.commit()
+    assert _flags(db) == {'sp-1': (0, 0)}
+    assert conn.execute("SELECT sample_key FROM discovery_pool").fetchone()[0] is not None
+
+
+def test_selector_matches_the_subquery_filters(db):
+    _pool(db, 30, spotify_track_id='sp')
+    _pool(db, 5, spotify_track_id='blocked', artist='Banned')
+    _pool(db, 5, deezer_track_id='other-source', source='deezer')
+    _sql(db, "INSERT INTO tracks (id, album_id, artist_id, title, server_source, spotify_track_id) "
+             "VALUES ('t-1', 'al-1', 'a-1', 'x', 'plex', 'sp-3')")
+    _sql(db, "INSERT INTO blocklist (entity_type, name) VALUES ('artist', 'banned')")
+
+    service = PersonalizedPlaylistsService(db)
+    picked = service._select_discovery_tracks(source='spotify', fetch_limit=100)
+    assert sorted(t['spotify_track_id'] for t in picked) == sorted(f'sp-{i}' for i in range(30) if i != 3)
+
+    with_owned = service._select_discovery_tracks(source='spotify', fetch_limit=100, exclude_owned=False)
+    assert len(with_owned) == 30
+
+
+def test_random_sample_is_bounded_and_varies(db):
+    _pool(db, 200, spotify_track_id='sp')
+    service = PersonalizedPlaylistsService(db)
+    seen = set()
+    for _ in range(20):
+        picked = service._select_discovery_tracks(source='spotify', fetch_limit=15)
+        ids = [t['spotify_track_id'] for t in picked]
+        assert len(ids) == 15 and len(set(ids)) == 15
+        seen.update(ids)
+    assert len(seen) > 100   # windows start anywhere, wrapping past the top
+
+
+def test_random_sample_honors_extra_where(db):
+    _pool(db, 50, spotify_track_id='sp')
+    _sql(db, "UPDATE discovery_pool SET popularity = id")
+    service = PersonalizedPlaylistsService(db)
+    picked = service._select_discovery_tracks(source='spotify', extra_where="AND popularity < ?",
+                                              extra_params=(11,), fetch_limit=30)
+    assert len(picked) == 10 and all(t['popularity'] < 11 for t in picked)
+
+
+def test_sample_walks_the_partial_index(db):
+    plan = ' '.join(str(r[-1]) for r in db._get_connection().execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM discovery_pool WHERE source = ? "
+        "AND (spotify_track_id IS NOT NULL OR itunes_track_id IS NOT NULL OR deezer_track_id IS NOT NULL) "
+        "AND blocked = 0 AND owned = 0 AND sample_key >= ? ORDER BY sample_key LIMIT ?", ('spotify', 0, 10)))
+    assert 'idx_discovery_pool_eligible_sample' in plan and 'TEMP B-TREE' not in plan
@@ -0,0 +1,145 @@
+"""Tests for the duplicate detector's candidate generation.
+
+The title/artist pass used to compare every pair inside a first-4-chars
+title bucket; it now scores only the pairs ``_BlockingIndex`` proposes
+(shared normalized key + sorted-neighbourhood windows). These pin down that
+the proposals cover the duplicate shapes the job is for, that exact scoring
+is unchanged (``_similar`` agrees with ``SequenceMatcher``), and that the
+full ``scan`` flow still emits findings.
+"""
+
+import random
+from difflib import SequenceMatcher
+from types import SimpleNamespace
+
+import pytest
+
+from core.repair_jobs.duplicate_detector import (
+    DuplicateDetectorJob,
+    _BlockingIndex,
+    _normalize,
+    _similar,
+)
+
+
+def _track(track_id, title, artist, *, album="Album", duration=200000, path=None):
+    return {
+        'id': track_id, 'title': title, 'norm_title': _normalize(title),
+        'artist': artist, 'norm_artist': _normalize(artist), 'album': album,
+        'file_path': path or f"/music/{artist}/{album}/{track_id}.flac",
+        'bitrate': 320, 'duration': duration,
+        'album_thumb_url': None, 'artist_thumb_url': None, 'artist_id': None,
+    }
+
+
+def _filler(n, prefix="love "):
+    """Many unrelated tracks sharing a title prefix — the shape that made
+    the old 4-char buckets quadratic."""
+    rng = random.Random(3)
+    return [_track(1000 + i, f"{prefix}{rng.choice('abcdefghij')}{i} song", f"Band {i}",
+                   duration=rng.randint(120, 420) * 1000) for i in range(n)]
+
+
+class _Ctx:
+    def __init__(self):
+        self.findings = []
+        self.report_progress = None
+        self.update_progress = None
+        self.check_stop = lambda: False
+
+    def create_finding(self, **kwargs):
+        self.findings.append(kwargs)
+        return True
+
+
+def _groups(job, tracks, **overrides):
+    ctx = _Ctx()
+    holder = {'count': 0, 'pairs': 0}
+    kwargs = dict(require_metadata_match=True, title_threshold=0.85, artist_threshold=0.80,
+                  ignore_cross_album=False, found_groups=set(), processed_holder=holder,
+                  total=len(tracks), result=SimpleNamespace(scanned=0, findings_created=0, errors=0),
+                  context=ctx)
+    kwargs.update(overrides)
+    job._scan_bucket(bucket_tracks=tracks, candidates=_BlockingIndex(tracks, job.block_window), **kwargs)
+    return [{t['id'] for t in f['details']['tracks']} for f in ctx.findings], holder['pairs']
+
+
+class TestSimilar:
+    def test_matches_sequence_matcher_on_random_strings(self):
+        rng = random.Random(11)
+        alphabet = 'abc de'
+        for _ in range(2000):
+            a = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            b = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            for threshold in (0.0, 0.5, 0.8, 0.85, 1.0):
+                assert _similar(a, b, threshold) == (SequenceMatcher(None, a, b).ratio() >= threshold)
+
+
+class TestBlockingIndex:
+    def test_after_returns_ascending_later_indices(self):
+        tracks = _filler(50)
+        index = _BlockingIndex(tracks, window=3)
+        for i in range(len(tracks)):
+            later = index.after(i)
+            assert later == sorted(later)
+            assert all(j > i for j in later)
+
+    def test_same_key_members_are_all_candidates_beyond_the_window(self):
+        tracks = [_track(i, "Intro", "Same Artist") for i in range(40)]
+        index = _BlockingIndex(tracks, window=1)
+        assert index.after(0) == list(range(1, 40))
+
+    @pytest.mark.parametrize('original,variant', [
+        ("Love Song", "LOVE SONG!"),                      # case / punctuation
+        ("Love Story Tonight", "Love Story Tonite"),      # typo at the end
+        ("Hello Darkness My Friend", "Jello Darkness My Friend"),  # typo at the start
+        ("Summer Rain Anthem", "Summer Rain Anthem (Live)"),  # suffix
+    ])
+    def test_planted_duplicate_found_among_prefix_bucket_noise(self, original, variant):
+        job = DuplicateDetectorJob()
+        tracks = _filler(3000)
+        tracks.insert(500, _track(1, original, "The Artist"))
+        tracks.append(_track(2, variant, "The Artist"))
+        groups, pairs = _groups(job, tracks)
+        expected_match = SequenceMatcher(None, _normalize(original), _normalize(variant)).ratio() >= 0.85
+        assert ({1, 2} in groups) == expected_match
+        # All pairs in the single "love" prefix bucket would be ~4.5M.
+        assert pairs < 3001 * job.block_window * 6
+
+    def test_cross_album_guard_still_applies(self):
+        job = DuplicateDetectorJob()
+        tracks = [_track(1, "Clasp", "Throwing Snow", album="Axioms"),
+                  _track(2, "Clasp", "Throwing Snow", album="Glower")]
+        assert _groups(job, tracks, ignore_cross_album=True)[0] == []
+        assert _groups(job, tracks)[0] == [{1, 2}]
+
+
+class TestScanEndToEnd:
+    def test_scan_flags_duplicates_from_the_database_rows(self):
+        rows = [
+            (1, "Blue Monday", "New Order", "Substance", "/m/a/1.flac", 320, 450000, None, None, 'a1'),
+            (2, "Blue Monday ", "New Order", "Substance", "/m/a/2.mp3", 128, 450000, None, None, 'a1'),
+            (3, "True Faith", "New Order", "Substance", "/m/a/3.flac", 320, 350000, None, None, 'a1'),
+        ]
+
+        class _Cursor:
+            def execute(self, *_a):
+                pass
+
+            def fetchall(self):
+                return rows
+
+        class _Conn:
+            def cursor(self):
+                return _Cursor()
+
+            def close(self):
+                pass
+
+        ctx = _Ctx()
+        ctx.db = SimpleNamespace(_get_connection=lambda: _Conn())
+        ctx.config_manager = None
+        result = DuplicateDetectorJob().scan(ctx)
+        assert result.findings_created == 1
+        assert {t['id'] for t in ctx.findings[0]['details']['tracks']} == {1, 2}
+        assert ctx.findings[0]['entity_id'] == '1'  # highest bitrate first
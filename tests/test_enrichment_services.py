@@ -383,6 +383,64 @@ class TestResumeRoute:
         assert host_state['yield_override'] == set()
 
 
+# ---------------------------------------------------------------------------
+# Deferred workers (built on demand by worker_loader)
+# ---------------------------------------------------------------------------
+
+
+class TestDeferredWorker:
+    def _register(self, built: List[Any]):
+        holder: Dict[str, Any] = {}
+
+        def loader():
+            holder['worker'] = _FakeWorker()
+            built.append(holder['worker'])
+            return holder['worker']
+
+        register_services([
+            EnrichmentService(
+                id='amazon', display_name='Amazon Music',
+                worker_getter=lambda: holder.get('worker'),
+                worker_loader=loader,
+                config_paused_key='amazon_enrichment_paused',
+            ),
+        ])
+
+    def test_status_reports_paused_and_deferred_without_building(self, client):
+        built: List[Any] = []
+        self._register(built)
+        body = client.get('/api/enrichment/amazon/status').get_json()
+        assert body['paused'] is True
+        assert body['deferred'] is True
+        assert built == []
+
+    def test_resume_builds_then_resumes(self, client, host_state):
+        built: List[Any] = []
+        self._register(built)
+        resp = client.post('/api/enrichment/amazon/resume')
+        assert resp.status_code == 200
+        assert len(built) == 1 and built[0].resume_calls == 1
+        assert host_state['config']['amazon_enrichment_paused'] is False
+
+    def test_pause_while_deferred_persists_without_building(self, client, host_state):
+        built: List[Any] = []
+        self._register(built)
+        resp = client.post('/api/enrichment/amazon/pause')
+        assert resp.status_code == 200
+        assert built == []
+        assert host_state['config']['amazon_enrichment_paused'] is True
+
+    def test_loader_failure_returns_400(self, client):
+        def loader():
+            raise RuntimeError('boom')
+
+        register_services([
+            EnrichmentService(id='x', display_name='X', worker_getter=lambda: None,
+                              worker_loader=loader),
+        ])
+        assert client.post('/api/enrichment/x/resume').status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # 404 path
 # ---------------------------------------------------------------------------
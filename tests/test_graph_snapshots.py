@@ -0,0 +1,213 @@
+"""Versioned artist-graph snapshots (core/graph/snapshots.py).
+
+/api/graph/library and /api/graph/discovery used to re-read artists + the
+profile's similar_artists and rebuild the graph on every request. They now
+serve a cached gzip snapshot tagged with change counters that triggers on
+artists / similar_artists maintain; a stale snapshot is served while a
+background rebuild runs, and only the changed source artists' rows are
+re-read.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from core.graph.artist_graph import build_discovery_map, build_genre_grouped_map
+from core.graph.snapshots import DISCOVERY, LIBRARY, GraphSnapshotStore
+from database.music_database import MusicDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = MusicDatabase(str(tmp_path / 'music.db'))
+    conn = database._get_connection()
+    conn.executemany(
+        "INSERT INTO artists (id, name, thumb_url, genres, server_source) VALUES (?, ?, ?, ?, 'plex')",
+        [('a1', 'Alpha', 't1', '["rock"]'), ('a2', 'Beta', 't2', '["rock"]'),
+         ('a3', 'Gamma', None, '["jazz"]')])
+    conn.commit()
+    conn.close()
+    for src, name, sp in (('spA', 'Beta', 'spB'), ('spA', 'Unowned One', 'spU1'),
+                          ('spB', 'Alpha', 'spA'), ('spB', 'Unowned Two', 'spU2'),
+                          ('spC', 'Unowned One', 'spU1')):
+        database.add_or_update_similar_artist(src, name, similar_artist_spotify_id=sp, popularity=50)
+    database.add_or_update_similar_artist('spA', 'Other Profile', profile_id=2)
+    return database
+
+
+@pytest.fixture
+def store(db):
+    s = GraphSnapshotStore(lambda: db, rebuild_delay=0.01)
+    yield s
+    s.stop()
+
+
+def _versions(db):
+    conn = db._get_connection()
+    try:
+        return dict(conn.execute("SELECT scope, version FROM graph_data_versions").fetchall())
+    finally:
+        conn.close()
+
+
+def _payload(snapshot):
+    return json.loads(gzip.decompress(snapshot.body))
+
+
+def _fresh_inputs(db, profile_id=1):
+    """What the routes used to load per request."""
+    conn = db._get_connection()
+    try:
+        artists, owned, meta = [], set(), {}
+        for name, thumb, genres, aid, source in conn.execute(
+                "SELECT name, thumb_url, genres, id, server_source FROM artists"):
+            key = name.strip().lower()
+            owned.add(key)
+            meta[key] = {"thumb_url": thumb, "genres": genres, "id": aid}
+            artists.append((name, genres, thumb, aid, source))
+        rows = conn.execute(
+            "SELECT source_artist_id, similar_artist_name, similar_artist_spotify_id, similar_artist_deezer_id, "
+            "similar_artist_itunes_id, occurrence_count, popularity, image_url, genres "
+            "FROM similar_artists WHERE profile_id = ? ORDER BY id", (profile_id,)).fetchall()
+        return artists, owned, meta, [tuple(r) for r in rows]
+    finally:
+        conn.close()
+
+
+class TestChangeTracking:
+    def test_graph_columns_bump_versions_but_status_columns_do_not(self, db):
+        before = _versions(db)
+        conn = db._get_connection()
+        conn.execute("UPDATE artists SET similar_artists_match_status = 'matched'")
+        conn.commit()
+        assert _versions(db) == before
+
+        conn.execute("UPDATE artists SET thumb_url = 'new' WHERE id = 'a3'")
+        conn.commit()
+        conn.close()
+        assert _versions(db)['artists'] == before['artists'] + 1
+
+    def test_rewriting_unchanged_values_does_not_bump_versions(self, db):
+        before = _versions(db)
+        conn = db._get_connection()
+        conn.execute("UPDATE artists SET name = name, thumb_url = thumb_url, genres = genres")
+        conn.execute("UPDATE similar_artists SET popularity = popularity, image_url = image_url")
+        conn.commit()
+        assert _versions(db) == before
+
+        conn.execute("UPDATE artists SET thumb_url = NULL WHERE id = 'a1'")
+        conn.commit()
+        conn.close()
+        assert _versions(db)['artists'] == before['artists'] + 1
+
+    def test_unguarded_update_triggers_from_older_builds_are_replaced(self, db):
+        conn = db._get_connection()
+        conn.execute("DROP TRIGGER trg_artists_graph_update")
+        conn.execute("CREATE TRIGGER trg_artists_graph_update AFTER UPDATE OF name ON artists BEGIN "
+                     "UPDATE graph_data_versions SET version = version + 1 WHERE scope = 'artists'; END")
+        conn.commit()
+        db._add_graph_change_tracking(conn.cursor())
+        conn.commit()
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'trg_artists_graph_update'").fetchone()[0]
+        conn.close()
+        assert 'OLD.name IS NOT NEW.name' in sql
+
+    def test_similar_upserts_log_the_source_per_profile(self, db):
+        db.add_or_update_similar_artist('spC', 'Unowned One', popularity=90)
+        conn = db._get_connection()
+        try:
+            logged = dict(conn.execute(
+                "SELECT source_artist_id, seq FROM graph_similar_changes WHERE profile_id = 1").fetchall())
+            other = conn.execute(
+                "SELECT source_artist_id FROM graph_similar_changes WHERE profile_id = 2").fetchall()
+        finally:
+            conn.close()
+        assert set(logged) == {'spA', 'spB', 'spC'}
+        assert logged['spC'] == max(logged.values()) == _versions(db)['similar_artists']
+        assert [r[0] for r in other] == ['spA']
+
+
+class TestSnapshotStore:
+    def test_payloads_match_the_builders_on_fresh_inputs(self, db, store):
+        artists, owned, meta, rows = _fresh_inputs(db)
+        assert _payload(store.get(1, LIBRARY))['nodes'] == build_genre_grouped_map(
+            artists, [r[:7] for r in rows], owned, artist_meta=meta)['nodes']
+        discovery = _payload(store.get(1, DISCOVERY, (None, None)))
+        assert discovery['nodes'] == build_discovery_map(rows, owned, meta)['nodes']
+        assert discovery['counts']['discovery'] == 2
+        assert 'other profile' not in {n['key'] for n in discovery['nodes']}
+
+    def test_unchanged_data_is_served_from_memory(self, store):
+        first = store.get(1, LIBRARY)
+        assert store.get(1, LIBRARY) is first
+        assert store.stats['builds'] == 1 and store.stats['hits'] == 1
+
+    def test_stale_snapshot_is_served_while_rebuilding(self, db, store):
+        first = store.get(1, DISCOVERY, (None, None))
+        db.add_or_update_similar_artist('spA', 'Unowned Three', similar_artist_spotify_id='spU3')
+
+        assert store.get(1, DISCOVERY, (None, None)) is first
+        assert store.wait_for_rebuilds()
+        rebuilt = store.get(1, DISCOVERY, (None, None))
+        assert rebuilt is not first and rebuilt.etag != first.etag
+        assert 'unowned three' in {n['key'] for n in _payload(rebuilt)['nodes']}
+
+    def test_incremental_reload_equals_a_full_load(self, db, store):
+        store.get(1, LIBRARY)
+        db.add_or_update_similar_artist('spA', 'Gamma', similar_artist_spotify_id='spG')
+        conn = db._get_connection()
+        conn.execute("DELETE FROM similar_artists WHERE source_artist_id = 'spB' AND similar_artist_name = 'Alpha'")
+        conn.execute("UPDATE similar_artists SET source_artist_id = 'spD' WHERE source_artist_id = 'spC'")
+        conn.commit()
+        conn.close()
+
+        owned, meta, rows = store.inputs(1)
+        assert store.stats['incremental_loads'] == 1 and store.stats['sources_reloaded'] == 4
+        _artists, fresh_owned, fresh_meta, fresh_rows = _fresh_inputs(db)
+        assert (owned, meta, rows) == (fresh_owned, fresh_meta, fresh_rows)
+
+    def test_other_profiles_writes_do_not_invalidate(self, db, store):
+        first = store.get(1, LIBRARY)
+        db.add_or_update_similar_artist('spB', 'Elsewhere', profile_id=2)
+        assert store.get(1, LIBRARY) is first
+
+    def test_worker_hint_refreshes_existing_snapshots(self, db, store):
+        first = store.get(1, LIBRARY)
+        store.note_similar_artists_changed(1)       # nothing changed yet
+        assert store.wait_for_rebuilds()
+        assert store.get(1, LIBRARY) is first
+
+        db.add_or_update_similar_artist('spA', 'Gamma', similar_artist_spotify_id='spG')
+        store.note_similar_artists_changed(1)
+        assert store.wait_for_rebuilds()
+        hits = store.stats['hits']
+        refreshed = store.get(1, LIBRARY)
+        assert refreshed is not first and store.stats['hits'] == hits + 1
+
+
+class TestRoutes:
+    @pytest.fixture
+    def client(self, store, monkeypatch):
+        import core.graph.snapshots as snapshots
+        import web_server
+        monkeypatch.setattr(snapshots, '_singleton', store)
+        monkeypatch.setattr(web_server, 'get_current_profile_id', lambda: 1)
+        web_server.app.config['TESTING'] = True
+        return web_server.app.test_client()
+
+    def test_gzip_body_etag_and_304(self, client):
+        resp = client.get('/api/graph/library', headers={'Accept-Encoding': 'gzip'})
+        assert resp.status_code == 200 and resp.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in resp.headers['Vary']
+        assert json.loads(gzip.decompress(resp.data))['counts']['artists'] == 3
+
+        again = client.get('/api/graph/library', headers={'If-None-Match': resp.headers['ETag']})
+        assert again.status_code == 304 and again.data == b''
+
+    def test_identity_client_gets_plain_json(self, client):
+        resp = client.get('/api/graph/discovery?seed=1', headers={'Accept-Encoding': 'identity'})
+        assert 'Content-Encoding' not in resp.headers
+        assert resp.get_json()['counts']['owned'] == 1
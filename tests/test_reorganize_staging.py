@@ -0,0 +1,185 @@
+"""Staging for library reorganize: files reach the staging folder as a
+reflink, a hardlink or (last resort) a copy, per ``library.reorganize_staging``.
+
+A hardlinked staged file shares its inode with the library original, so the
+contract pinned here is that tag writes on the staged name never reach the
+original, that a filesystem refusing a method falls back (and stops retrying
+it for the run), and that throughput lands in the progress payload.
+"""
+
+import errno
+import os
+import threading
+
+import pytest
+
+from core import library_reorganize
+from core.library_reorganize import _RunContext, _stage_track
+
+
+def _ctx(tmp_path, mode='auto', on_progress=None):
+    staging = tmp_path / 'staging'
+    staging.mkdir(exist_ok=True)
+    return _RunContext(
+        album_id='alb-1', api_album={}, artist_name='A', album_title='B',
+        total_discs=1, local_year=None, staging_album_dir=str(staging),
+        state_lock=threading.Lock(),
+        summary={'moved': 0, 'skipped': 0, 'failed': 0, 'errors': []},
+        src_dirs_touched=set(), dst_dirs_touched=set(),
+        resolve_file_path_fn=lambda p: p, post_process_fn=lambda *a: None,
+        on_progress=on_progress, staging_mode=mode,
+    )
+
+
+def _library_file(tmp_path, name='song.flac', content=b'AUDIO' * 100):
+    lib = tmp_path / 'library'
+    lib.mkdir(exist_ok=True)
+    p = lib / name
+    p.write_bytes(content)
+    return str(p)
+
+
+def _no_reflink(monkeypatch):
+    def refuse(src, dst):
+        raise OSError(errno.EOPNOTSUPP, 'no reflink here')
+    monkeypatch.setattr(library_reorganize, '_reflink_file', refuse)
+
+
+def test_same_filesystem_stages_without_copying(tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+    src = _library_file(tmp_path)
+    ctx = _ctx(tmp_path)
+    staged = _stage_track(ctx, 't1', 'Song', src)
+    assert os.path.samefile(staged, src)
+    assert ctx.staging_stats['hardlink'] == 1 and ctx.staging_stats['copy'] == 0
+    assert ctx.staging_stats['bytes'] == 500
+
+
+def test_reflink_preferred_when_available(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_reflink(src, dst):
+        calls.append(src)
+        with open(src, 'rb') as s, open(dst, 'xb') as d:
+            d.write(s.read())
+    monkeypatch.setattr(library_reorganize, '_reflink_file', fake_reflink)
+    src = _library_file(tmp_path)
+    ctx = _ctx(tmp_path)
+    staged = _stage_track(ctx, 't1', 'Song', src)
+    assert calls == [src] and not os.path.samefile(staged, src)
+    assert ctx.staging_stats['reflink'] == 1
+
+
+def test_tag_write_on_hardlinked_stage_leaves_original_untouched(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from core.metadata.common import save_audio_file
+    _no_reflink(monkeypatch)
+    src = _library_file(tmp_path, content=b'ORIGINAL')
+    staged = _stage_track(_ctx(tmp_path), 't1', 'Song', src)
+
+    class Audio:
+        filename = staged
+        tags = None
+
+        def save(self, target=None, **k):
+            with open(target or self.filename, 'ab') as h:
+                h.write(b'+TAGS')
+
+    symbols = SimpleNamespace(ID3=type('ID3', (), {}), FLAC=type('FLAC', (), {}),
+                              File=lambda p: SimpleNamespace(info=SimpleNamespace(length=180.0)))
+    assert save_audio_file(Audio(), symbols) is True
+    assert open(staged, 'rb').read() == b'ORIGINAL+TAGS'
+    assert open(src, 'rb').read() == b'ORIGINAL'
+
+
+def test_cross_device_falls_back_to_copy_and_stops_retrying(tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+    attempts = []
+
+    def exdev(src, dst):
+        attempts.append(src)
+        raise OSError(errno.EXDEV, 'Invalid cross-device link')
+    monkeypatch.setattr(library_reorganize.os, 'link', exdev)
+
+    ctx = _ctx(tmp_path)
+    for n in range(3):
+        src = _library_file(tmp_path, f'{n}.flac')
+        staged = _stage_track(ctx, f't{n}', 'Song', src)
+        assert open(staged, 'rb').read() == open(src, 'rb').read()
+    assert len(attempts) == 1
+    assert ctx.staging_unsupported == {'reflink', 'hardlink'}
+    assert ctx.staging_stats['copy'] == 3
+
+
+def test_transient_link_error_is_retried_next_track(tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+    real_link = os.link
+    attempts = []
+
+    def flaky(src, dst):
+        attempts.append(src)
+        if len(attempts) == 1:
+            raise OSError(errno.EIO, 'I/O error')
+        real_link(src, dst)
+    monkeypatch.setattr(library_reorganize.os, 'link', flaky)
+
+    ctx = _ctx(tmp_path)
+    _stage_track(ctx, 't1', 'Song', _library_file(tmp_path, '1.flac'))
+    _stage_track(ctx, 't2', 'Song', _library_file(tmp_path, '2.flac'))
+    assert ctx.staging_stats['copy'] == 1 and ctx.staging_stats['hardlink'] == 1
+
+
+@pytest.mark.parametrize('mode,expected', [('copy', 'copy'), ('reflink', 'copy')])
+def test_modes_that_never_hardlink(tmp_path, monkeypatch, mode, expected):
+    _no_reflink(monkeypatch)
+    src = _library_file(tmp_path)
+    ctx = _ctx(tmp_path, mode=mode)
+    staged = _stage_track(ctx, 't1', 'Song', src)
+    assert not os.path.samefile(staged, src)
+    assert ctx.staging_stats[expected] == 1 and ctx.staging_stats['hardlink'] == 0
+
+
+def test_copy_failure_is_recorded(tmp_path):
+    ctx = _ctx(tmp_path, mode='copy')
+    assert _stage_track(ctx, 't1', 'Gone', str(tmp_path / 'missing.flac')) is None
+    assert ctx.summary['failed'] == 1
+    assert 'Couldn\'t copy to staging' in ctx.summary['errors'][0]['error']
+
+
+def test_staging_mode_setting(monkeypatch):
+    class _Cfg:
+        def __init__(self, value):
+            self.value = value
+
+        def get(self, key, default=None):
+            return self.value if key == 'library.reorganize_staging' else default
+
+    import config.settings as settings
+    for value, expected in (('copy', 'copy'), ('REFLINK', 'reflink'), ('bogus', 'auto'), (None, 'auto')):
+        monkeypatch.setattr(settings, 'config_manager', _Cfg(value))
+        assert library_reorganize._staging_mode() == expected
+
+
+def test_throughput_reported_with_progress(tmp_path, monkeypatch):
+    _no_reflink(monkeypatch)
+    ctx = _ctx(tmp_path)
+    _stage_track(ctx, 't1', 'Song', _library_file(tmp_path))
+    ctx.summary['moved'] = 1
+    with ctx.state_lock:
+        stats = ctx.throughput()
+    assert stats['bytes_processed'] == 500
+    assert stats['bytes_per_sec'] > 0 and stats['files_per_sec'] > 0
+    assert stats['staging'] == {'reflink': 0, 'hardlink': 1, 'copy': 0}
+
+
+@pytest.mark.skipif(library_reorganize.fcntl is None, reason='no ioctl on this platform')
+def test_real_reflink_either_clones_or_refuses_cleanly(tmp_path):
+    src = _library_file(tmp_path)
+    dst = str(tmp_path / 'clone.flac')
+    try:
+        library_reorganize._reflink_file(src, dst)
+    except OSError:
+        assert not os.path.exists(dst)   # no half-written clone left behind
+    else:
+        assert open(dst, 'rb').read() == open(src, 'rb').read()
@@ -0,0 +1,257 @@
+"""Concurrent lanes + resume checkpoints for the Library Maintenance worker.
+
+The worker used to run one job at a time, so a multi-hour decode scan blocked
+every cheap DB sweep behind it, and a restart threw away a half-done scan.
+Now each job declares a lane (``db`` / ``io`` / ``cpu`` / ``network``), the
+dispatcher fills each lane's free slots independently, and a job can persist
+a resume cursor through ``JobContext.save_checkpoint``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from core.repair_jobs.base import JOB_LANES, JobContext, JobResult, RepairJob
+from core.repair_jobs import get_all_jobs
+from core.repair_worker import RepairWorker
+from database.music_database import MusicDatabase
+
+
+class _BlockingJob(RepairJob):
+    """Scans until released (or stopped), recording that it started."""
+    display_name = 'Blocking'
+    default_enabled = True
+    default_interval_hours = 24
+
+    def __init__(self, job_id, lane):
+        self.job_id = job_id
+        self.lane = lane
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def scan(self, context):
+        self.started.set()
+        while not self.release.is_set():
+            if context.check_stop():
+                break
+            time.sleep(0.01)
+        return JobResult(scanned=1)
+
+
+class _CursorJob(RepairJob):
+    """Walks 10 items, checkpointing before each; stops itself after `stop_at`."""
+    job_id = 'cursor_job'
+    display_name = 'Cursor'
+    default_enabled = True
+    default_interval_hours = 24
+    lane = 'cpu'
+
+    def __init__(self, stop_at=None, fail=False):
+        self.stop_at = stop_at
+        self.fail = fail
+        self.seen = []
+        self.loaded = None
+
+    def scan(self, context):
+        self.loaded = context.load_checkpoint()
+        start = (self.loaded or {}).get('next', 0)
+        for i in range(start, 10):
+            if self.stop_at is not None and i == self.stop_at:
+                self.stop()
+            if context.check_stop():
+                return JobResult(scanned=len(self.seen))
+            context.save_checkpoint({'next': i})
+            self.seen.append(i)
+        if self.fail:
+            raise RuntimeError('boom')
+        return JobResult(scanned=len(self.seen))
+
+
+@pytest.fixture
+def worker(tmp_path):
+    w = RepairWorker(database=MusicDatabase(str(tmp_path / 'music.db')), transfer_folder=str(tmp_path))
+    w.enabled = True
+    yield w
+    w._stop_event.set()
+    for job in w._jobs.values():
+        if isinstance(job, _BlockingJob):
+            job.release.set()
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_every_registered_job_declares_a_known_lane():
+    for job_id, job_cls in get_all_jobs().items():
+        assert job_cls.lane in JOB_LANES, job_id
+
+
+def test_file_mutating_jobs_share_the_io_lane():
+    jobs = get_all_jobs()
+    for job_id in ('library_reorganize', 'dead_file_cleaner', 'orphan_file_detector',
+                   'unknown_artist_fixer', 'track_number_repair', 'library_retag',
+                   'replaygain_filler', 'acoustid_scanner'):
+        assert jobs[job_id].lane == 'io', job_id
+
+
+def test_long_cpu_job_does_not_block_other_lanes(worker):
+    cpu = _BlockingJob('slow_decode', 'cpu')
+    cpu2 = _BlockingJob('another_decode', 'cpu')
+    db = _BlockingJob('genre_sweep', 'db')
+    worker._jobs = {j.job_id: j for j in (cpu, cpu2, db)}
+
+    worker._dispatch()
+    assert cpu.started.wait(2) or cpu2.started.wait(2)
+    assert db.started.wait(2)
+    # One slot per lane by default: the second cpu job waits its turn.
+    assert sum(j.started.is_set() for j in (cpu, cpu2)) == 1
+    stats = worker.get_stats()
+    assert {r['job_id'] for r in stats['running_jobs']} >= {'genre_sweep'}
+    assert stats['lanes']['db']['running'] == ['genre_sweep']
+
+    db.release.set()
+    assert _wait_until(lambda: 'genre_sweep' not in worker._active)
+    first = cpu if cpu.started.is_set() else cpu2
+    first.release.set()
+    assert _wait_until(lambda: first.job_id not in worker._active)
+    worker._dispatch()
+    other = cpu2 if first is cpu else cpu
+    assert other.started.wait(2)
+    other.release.set()
+
+
+def test_lane_concurrency_is_configurable(worker):
+    class _Cfg:
+        def get(self, key, default=None):
+            return 2 if key == 'repair.lane_concurrency.cpu' else default
+
+    worker._config_manager = _Cfg()
+    jobs = [_BlockingJob(f'decode_{n}', 'cpu') for n in range(3)]
+    worker._jobs = {j.job_id: j for j in jobs}
+    worker._dispatch()
+    assert _wait_until(lambda: sum(j.started.is_set() for j in jobs) == 2)
+    time.sleep(0.1)
+    assert sum(j.started.is_set() for j in jobs) == 2
+    for j in jobs:
+        j.release.set()
+
+
+def test_io_lane_stays_single_slot_whatever_the_setting(worker):
+    class _Cfg:
+        def get(self, key, default=None):
+            return 4 if key.startswith('repair.lane_concurrency.') else default
+
+    worker._config_manager = _Cfg()
+    assert worker._lane_slots('io') == 1 and worker._lane_slots('cpu') == 4
+
+
+def test_stop_cancels_only_the_named_run(worker):
+    a, b = _BlockingJob('job_a', 'cpu'), _BlockingJob('job_b', 'network')
+    worker._jobs = {'job_a': a, 'job_b': b}
+    worker._dispatch()
+    assert a.started.wait(2) and b.started.wait(2)
+
+    assert worker.stop_current_job('job_a')['was_running'] is True
+    assert _wait_until(lambda: 'job_a' not in worker._active)
+    assert 'job_b' in worker._active
+    b.release.set()
+
+
+def test_run_now_waits_for_a_busy_lane(worker):
+    running, queued = _BlockingJob('running', 'io'), _BlockingJob('queued', 'io')
+    queued.default_enabled = False
+    worker._jobs = {'running': running, 'queued': queued}
+    worker._dispatch()
+    assert running.started.wait(2)
+    worker.run_job_now('queued')
+    worker._dispatch()
+    assert worker._force_run_queue == ['queued'] and not queued.started.is_set()
+
+    running.release.set()
+    assert _wait_until(lambda: 'running' not in worker._active)
+    worker._dispatch()
+    assert queued.started.wait(2)
+    queued.release.set()
+
+
+# --- checkpoints -------------------------------------------------------------
+
+def test_save_checkpoint_is_throttled():
+    writes = []
+    ctx = JobContext(db=None, transfer_folder='', config_manager=None,
+                     persist_checkpoint=writes.append)
+    assert ctx.save_checkpoint({'next': 1}) is True
+    assert ctx.save_checkpoint({'next': 2}) is False      # within min_interval
+    assert ctx.checkpoint == {'next': 2}                  # still tracked in memory
+    assert ctx.save_checkpoint({'next': 3}, min_interval=0) is True
+    ctx.clear_checkpoint()
+    assert writes == [{'next': 1}, {'next': 3}, None] and ctx.load_checkpoint() is None
+
+
+def test_shutdown_mid_scan_resumes_on_the_next_start(worker):
+    job = _CursorJob(stop_at=4)
+    job.stop = worker._stop_event.set             # the worker shuts down at item 4
+    worker._jobs = {'cursor_job': job}
+    worker._run_job('cursor_job')
+    assert job.seen == [0, 1, 2, 3]
+    # Flushed past the throttle, and due straight away once the worker is back.
+    assert worker._load_checkpoint('cursor_job') == {'next': 3}
+    assert worker._resumable_jobs() == {'cursor_job'}
+
+    worker._stop_event.clear()
+    resumed = _CursorJob()
+    worker._jobs = {'cursor_job': resumed}
+    assert worker._pick_next_job() == 'cursor_job'
+    worker._run_job('cursor_job')
+    assert resumed.loaded == {'next': 3} and resumed.seen == list(range(3, 10))
+    assert worker._load_checkpoint('cursor_job') is None   # finished → dropped
+
+
+def test_user_stop_parks_the_checkpoint(worker):
+    job = _CursorJob(stop_at=6)
+    job.stop = lambda: worker.stop_current_job('cursor_job')
+    worker._jobs = {'cursor_job': job}
+    worker._run_job('cursor_job')
+    assert worker._load_checkpoint('cursor_job') == {'next': 5}
+    # Kept for the next regular run, but not forced due.
+    assert worker._resumable_jobs() == set()
+
+
+def test_failed_scan_starts_over(worker):
+    worker._store_checkpoint('cursor_job', {'next': 8})
+    worker._jobs = {'cursor_job': _CursorJob(fail=True)}
+    worker._run_job('cursor_job')
+    assert worker._load_checkpoint('cursor_job') is None
+
+
+def test_fake_lossless_resumes_from_its_cursor(tmp_path, monkeypatch):
+    import core.repair_jobs.fake_lossless_detector as mod
+
+    for name in ('a', 'b', 'c', 'd'):
+        (tmp_path / f'{name}.flac').write_bytes(b'x')
+    analyzed = []
+    monkeypatch.setattr(mod, '_is_ffprobe_available', lambda: True)
+    monkeypatch.setattr(mod, '_analyze_file', lambda p: analyzed.append(p) or None)
+
+    ctx = JobContext(db=None, transfer_folder=str(tmp_path), config_manager=None,
+                     checkpoint={'resume_from': str(tmp_path / 'c.flac'), 'cutoff_khz': 16.0,
+                                 'transfer': str(tmp_path)})
+    mod.FakeLosslessDetectorJob().scan(ctx)
+    assert analyzed == [str(tmp_path / 'c.flac'), str(tmp_path / 'd.flac')]
+
+    # A cursor from a different cutoff setting is ignored.
+    analyzed.clear()
+    ctx = JobContext(db=None, transfer_folder=str(tmp_path), config_manager=None,
+                     checkpoint={'resume_from': str(tmp_path / 'c.flac'), 'cutoff_khz': 18.0,
+                                 'transfer': str(tmp_path)})
+    mod.FakeLosslessDetectorJob().scan(ctx)
+    assert len(analyzed) == 4
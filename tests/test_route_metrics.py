@@ -0,0 +1,118 @@
+"""Tests for core.diagnostics.route_metrics — per-route latency histograms."""
+
+from __future__ import annotations
+
+import flask
+import pytest
+
+from core.diagnostics import route_metrics as rm
+
+
+@pytest.fixture(autouse=True)
+def _fresh():
+    rm.reset()
+    yield
+    rm.reset()
+
+
+def _record(key, ms, status=200):
+    started = rm.begin(key)
+    return rm.end(key, started - ms / 1000.0, status)
+
+
+def _route(snap, key):
+    return next(r for r in snap['routes'] if r['route'] == key)
+
+
+def test_route_key_collapses_unmatched_requests():
+    assert rm.route_key('GET', '/api/artist/<artist_id>') == 'GET /api/artist/<artist_id>'
+    assert rm.route_key('GET', None) == rm.route_key('GET', '') == 'GET <unmatched>'
+
+
+def test_histogram_percentiles_and_status_counts():
+    key = 'GET /api/x'
+    for _ in range(90):
+        _record(key, 3)
+    for _ in range(10):
+        _record(key, 700, status=503)
+
+    row = _route(rm.snapshot(), key)
+    assert row['count'] == 100 and row['errors'] == 10
+    assert row['status'] == {'200': 90, '503': 10}
+    assert 2.5 <= row['p50_ms'] <= 5
+    assert 500 <= row['p95_ms'] <= 1000
+    assert row['p99_ms'] <= row['max_ms'] and row['max_ms'] >= 700
+    assert row['histogram'] == {'5': 90, '1000': 10}
+
+
+def test_in_flight_gauge_and_peak():
+    key = 'POST /api/slow'
+    a = rm.begin(key)
+    b = rm.begin(key)
+    assert _route(rm.snapshot(), key)['in_flight'] == 2
+    rm.end(key, a, 200)
+    rm.end(key, b, 200)
+    row = _route(rm.snapshot(), key)
+    assert row['in_flight'] == 0 and row['peak_in_flight'] == 2
+
+
+def test_snapshot_ordering_prefix_and_reset():
+    _record('GET /api/a', 1)
+    _record('GET /api/a', 1)
+    _record('GET /static/<path:filename>', 50)
+    snap = rm.snapshot(order='count')
+    assert [r['route'] for r in snap['routes']][0] == 'GET /api/a'
+    assert rm.snapshot(order='max')['routes'][0]['route'] == 'GET /static/<path:filename>'
+    assert [r['route'] for r in rm.snapshot(prefix='/api/')['routes']] == ['GET /api/a']
+    assert rm.reset()['cleared'] == 2
+    assert rm.snapshot()['routes'] == []
+
+
+def test_flask_hooks_record_rule_templates_and_raised_errors():
+    app = flask.Flask(__name__)
+
+    @app.before_request
+    def begin():
+        rule = flask.request.url_rule.rule if flask.request.url_rule is not None else None
+        flask.g.key = rm.route_key(flask.request.method, rule)
+        flask.g.started = rm.begin(flask.g.key)
+
+    @app.after_request
+    def status(response):
+        flask.g.status = response.status_code
+        return response
+
+    @app.teardown_request
+    def end(exc):
+        rm.end(flask.g.key, flask.g.started, 500 if exc is not None else flask.g.get('status') or 500)
+
+    @app.route('/item/<int:item_id>')
+    def item(item_id):
+        return {'id': item_id}
+
+    @app.route('/boom')
+    def boom():
+        raise ValueError('boom')
+
+    client = app.test_client()
+    client.get('/item/1')
+    client.get('/item/2')
+    client.get('/nope')
+    client.get('/boom')
+
+    snap = rm.snapshot()
+    assert _route(snap, 'GET /item/<int:item_id>')['count'] == 2
+    assert _route(snap, 'GET <unmatched>')['status'] == {'404': 1}
+    assert _route(snap, 'GET /boom')['status'] == {'500': 1}
+    assert snap['in_flight'] == 0
+
+
+def test_reset_route_is_admin_only():
+    import web_server
+    _record('GET /x', 5)
+    view = web_server.app.view_functions['debug_route_metrics_reset']
+    with web_server.app.test_request_context('/api/debug/routes/reset'):
+        flask.g.profile_id = 2
+        _body, status = view()
+    assert status == 403
+    assert _route(rm.snapshot(), 'GET /x')['count'] == 1
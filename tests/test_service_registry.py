@@ -0,0 +1,137 @@
+"""Tests for core.service_registry — lazy, measured construction of
+enrichment workers and other optional services."""
+
+import threading
+
+import pytest
+
+from core.service_registry import ServiceRegistry
+
+
+class _Worker:
+    def __init__(self, cls):
+        self.cls = cls
+
+
+@pytest.fixture
+def registry():
+    return ServiceRegistry()
+
+
+def _build_counter(calls):
+    def build(target):
+        calls.append(target)
+        return _Worker(target)
+    return build
+
+
+def test_register_does_not_import_or_build(registry):
+    calls = []
+    registry.register('od', 'collections', 'OrderedDict', _build_counter(calls))
+    assert calls == []
+    assert registry.peek('od') is None
+    assert registry.report()['services'][0]['state'] == 'registered'
+
+
+def test_get_imports_target_and_builds_once(registry):
+    import collections
+    calls = []
+    registry.register('od', 'collections', 'OrderedDict', _build_counter(calls))
+    first = registry.get('od')
+    assert first.cls is collections.OrderedDict
+    assert registry.get('od') is first
+    assert len(calls) == 1
+    row = registry.report()['services'][0]
+    assert row['state'] == 'built'
+    assert row['import_ms'] is not None and row['init_ms'] is not None
+
+
+def test_unknown_service_is_none(registry):
+    assert registry.get('nope') is None
+    assert registry.peek('nope') is None
+
+
+def test_boot_builds_enabled_and_defers_the_rest(registry):
+    calls = []
+    registry.register('on', 'collections', 'OrderedDict', _build_counter(calls))
+    registry.register('off', 'collections', 'deque', _build_counter(calls), enabled=lambda: False)
+    report = registry.boot()
+    assert report['built'] == 1 and report['deferred'] == 1
+    assert registry.peek('on') is not None
+    assert registry.peek('off') is None
+    # Deferred services still build on first use.
+    assert registry.get('off') is not None
+    assert registry.report()['deferred'] == 0
+
+
+def test_refresh_builds_services_configured_after_boot(registry):
+    configured = {'lastfm': False}
+    registry.register('lastfm', 'collections', 'deque', _build_counter([]),
+                      enabled=lambda: configured['lastfm'])
+    assert registry.refresh() == []  # nothing is built before the host boots
+    registry.boot()
+    assert registry.peek('lastfm') is None
+    configured['lastfm'] = True
+    assert registry.refresh() == ['lastfm']
+    assert registry.peek('lastfm') is not None
+    assert registry.refresh() == []
+
+
+def test_enabled_check_that_raises_still_builds(registry):
+    def broken():
+        raise RuntimeError('config unavailable')
+    registry.register('svc', 'collections', 'OrderedDict', _build_counter([]), enabled=broken)
+    registry.boot()
+    assert registry.peek('svc') is not None
+
+
+def test_failed_build_is_recorded_and_not_retried(registry):
+    attempts = []
+
+    def build(target):
+        attempts.append(1)
+        raise RuntimeError('no credentials')
+
+    registry.register('bad', 'collections', 'OrderedDict', build)
+    assert registry.get('bad') is None
+    assert registry.get('bad') is None
+    assert attempts == [1]
+    report = registry.report()
+    assert report['failed'] == 1
+    assert report['services'][0]['error'] == 'no credentials'
+
+
+def test_missing_module_fails_cleanly(registry):
+    registry.register('ghost', 'core.definitely_not_a_module', 'X', _build_counter([]))
+    assert registry.get('ghost') is None
+    assert registry.report()['services'][0]['state'] == 'failed'
+
+
+def test_listeners_see_every_build(registry):
+    seen = []
+    registry.on_built(lambda name, inst: seen.append((name, inst)))
+    registry.on_built(lambda name, inst: 1 / 0)   # a broken listener can't break builds
+    registry.register('a', 'collections', 'OrderedDict', _build_counter([]))
+    inst = registry.get('a')
+    assert seen == [('a', inst)]
+
+
+def test_concurrent_get_builds_once(registry):
+    calls = []
+    gate = threading.Event()
+
+    def build(target):
+        gate.wait(1)
+        calls.append(1)
+        return _Worker(target)
+
+    registry.register('slow', 'collections', 'OrderedDict', build)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get('slow'))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
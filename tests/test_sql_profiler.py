@@ -0,0 +1,132 @@
+"""Tests for core.diagnostics.sql_profiler — opt-in SQLite statement profiling.
+
+Off by default (plain sqlite3 connections, nothing recorded); on, statements
+aggregate by fingerprint with latency percentiles and rows, slow ones land in
+the slow log with their query plan, and reset() clears the table.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from core.diagnostics import sql_profiler
+
+
+@pytest.fixture(autouse=True)
+def _clean_profiler():
+    sql_profiler.disable()
+    sql_profiler.reset()
+    yield
+    sql_profiler.disable()
+    sql_profiler.reset()
+
+
+def _db(tmp_path, label="music"):
+    conn = sql_profiler.connect(str(tmp_path / "p.db"), label=label)
+    conn.execute("CREATE TABLE IF NOT EXISTS t (id INTEGER PRIMARY KEY, name TEXT, n INTEGER)")
+    return conn
+
+
+def _row(report, needle):
+    return next(r for r in report["table"] if needle in r["fingerprint"])
+
+
+@pytest.mark.parametrize("sql,expected", [
+    ("SELECT * FROM t WHERE id = 5", "SELECT * FROM t WHERE id = ?"),
+    ("SELECT * FROM t WHERE name = 'it''s'  AND n > 3.5", "SELECT * FROM t WHERE name = ? AND n > ?"),
+    ("SELECT * FROM t WHERE id IN (?, ?, ?)", "SELECT * FROM t WHERE id IN (?+)"),
+    ("SELECT * FROM t WHERE id IN (1,2,3,4)", "SELECT * FROM t WHERE id IN (?+)"),
+    ("INSERT INTO t (a, b) VALUES (?, ?), (?, ?);", "INSERT INTO t (a, b) VALUES (?, ?)+"),
+    ("SELECT col2 FROM t2", "SELECT col2 FROM t2"),
+])
+def test_fingerprint_normalizes_literals(sql, expected):
+    assert sql_profiler.fingerprint(sql) == expected
+
+
+def test_disabled_returns_plain_connections_and_records_nothing(tmp_path):
+    conn = _db(tmp_path)
+    assert type(conn) is sqlite3.Connection
+    conn.execute("SELECT 1").fetchall()
+    conn.close()
+    assert sql_profiler.report()["table"] == []
+
+
+def test_statements_aggregate_by_fingerprint_with_rows(tmp_path):
+    sql_profiler.enable(slow_ms=10_000)
+    conn = _db(tmp_path)
+    conn.row_factory = sqlite3.Row
+    conn.executemany("INSERT INTO t (name, n) VALUES (?, ?)", [(f"n{i}", i) for i in range(20)])
+    conn.commit()
+    for i in range(5):
+        rows = conn.execute(f"SELECT name FROM t WHERE n >= {i}").fetchall()
+        assert rows[0]["name"] == f"n{i}"
+    cur = conn.cursor()
+    cur.execute("SELECT id FROM t WHERE n < ?", (3,))
+    assert [r[0] for r in cur] == [1, 2, 3]
+    conn.close()
+
+    report = sql_profiler.report()
+    select = _row(report, "SELECT name FROM t WHERE n >= ?")
+    assert select["count"] == 5 and select["rows"] == sum(20 - i for i in range(5))
+    assert select["db"] == "music"
+    assert 0 <= select["p50_ms"] <= select["p95_ms"] <= select["max_ms"]
+    assert _row(report, "SELECT id FROM t WHERE n < ?")["rows"] == 3
+    assert _row(report, "INSERT INTO t")["rows"] == 20
+    assert _row(report, "COMMIT")["count"] >= 1
+
+
+def test_slow_statements_are_logged_with_query_plan(tmp_path):
+    sql_profiler.enable(slow_ms=0)
+    conn = _db(tmp_path, label="video")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_t_n ON t (n)")
+    conn.execute("SELECT * FROM t WHERE n = ?", (4,)).fetchall()
+    conn.execute("SELECT * FROM t WHERE n = ?", (5,)).fetchall()
+    conn.close()
+
+    slow = [s for s in sql_profiler.report()["slow_queries"] if s["fingerprint"] == "SELECT * FROM t WHERE n = ?"]
+    assert len(slow) == 2
+    assert "idx_t_n" in slow[0]["plan"] and slow[0]["db"] == "video"
+
+
+def test_untimed_statements_are_counted_through_the_trace_callback(tmp_path):
+    sql_profiler.enable(slow_ms=10_000)
+    conn = _db(tmp_path)
+    conn.executescript("INSERT INTO t (name, n) VALUES ('a', 1); DELETE FROM t WHERE n = 1;")
+    conn.close()
+    delete = _row(sql_profiler.report(), "DELETE FROM t WHERE n = ?")
+    assert delete["untimed"] == delete["count"] == 1
+
+
+def test_reset_clears_table_and_disable_stops_recording(tmp_path):
+    sql_profiler.enable(slow_ms=10_000)
+    conn = _db(tmp_path)
+    conn.execute("SELECT 1").fetchall()
+    assert sql_profiler.reset()["cleared"] > 0
+    assert sql_profiler.report()["table"] == []
+    sql_profiler.disable()
+    conn.execute("SELECT 2").fetchall()
+    conn.close()
+    assert sql_profiler.report()["table"] == []
+
+
+def test_music_database_connections_are_instrumented_when_enabled(tmp_path):
+    from database.music_database import MusicDatabase
+    db = MusicDatabase(str(tmp_path / "m.db"))
+    sql_profiler.enable(slow_ms=10_000)
+    with db._get_connection() as conn:
+        conn.execute("SELECT COUNT(*) FROM artists").fetchone()
+    assert _row(sql_profiler.report(db="music"), "SELECT COUNT(*) FROM artists")["count"] == 1
+
+
+@pytest.mark.parametrize("action", ["start", "report", "reset", "stop"])
+def test_debug_routes_are_admin_only(action):
+    import web_server
+    from flask import g
+    view = web_server.app.view_functions[f"debug_sql_{action}"]
+    with web_server.app.test_request_context(f"/api/debug/sql/{action}"):
+        g.profile_id = 2
+        _body, status = view()
+    assert status == 403
+    assert not sql_profiler.is_enabled()
@@ -0,0 +1,70 @@
+"""Tests for core.diagnostics.stack_sampler — the all-threads stack sampler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from core.diagnostics import stack_sampler
+
+
+def _spin_in_marker_function(stop):
+    while not stop.is_set():
+        sum(range(200))
+
+
+def test_sample_sees_busy_background_threads_in_collapsed_output():
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin_in_marker_function, args=(stop,), name='busy-worker', daemon=True)
+    worker.start()
+    try:
+        result = stack_sampler.sample(0.3, 0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert result['sweeps'] > 5
+    lines = [line for line in result['collapsed'].splitlines() if line.startswith('busy-worker;')]
+    assert lines, result['collapsed']
+    stack, count = lines[0].rsplit(' ', 1)
+    assert int(count) > 0
+    assert stack.split(';')[-1].startswith('_spin_in_marker_function (')
+    assert any(f['function'].startswith('_spin_in_marker_function') for f in result['top_functions'])
+
+
+def test_idle_threads_are_skipped_unless_requested():
+    stop = threading.Event()
+    waiter = threading.Thread(target=stop.wait, name='parked', daemon=True)
+    waiter.start()
+    try:
+        quiet = stack_sampler.sample(0.05, 0.01)
+        noisy = stack_sampler.sample(0.05, 0.01, include_idle=True)
+    finally:
+        stop.set()
+        waiter.join()
+    assert 'parked;' not in quiet['collapsed'] and quiet['idle_skipped'] > 0
+    assert 'parked;' in noisy['collapsed']
+
+
+def test_only_one_sample_runs_at_a_time():
+    errors = []
+    first = threading.Thread(target=stack_sampler.sample, args=(0.3, 0.01), daemon=True)
+    first.start()
+    time.sleep(0.05)
+    try:
+        stack_sampler.sample(0.01, 0.01)
+    except RuntimeError as e:
+        errors.append(e)
+    first.join()
+    assert errors and not stack_sampler.is_running()
+
+
+@pytest.mark.parametrize('seconds,interval_ms,expected', [
+    (None, None, (10.0, 0.01)),
+    (999, 0, (stack_sampler.MAX_DURATION, stack_sampler.MIN_INTERVAL)),
+    (-1, 50, (0.1, 0.05)),
+])
+def test_parse_args_clamps(seconds, interval_ms, expected):
+    assert stack_sampler.parse_args(seconds, interval_ms) == expected
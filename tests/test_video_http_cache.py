@@ -0,0 +1,161 @@
+"""Tests for the video enrichment disk-backed HTTP cache (core/video/enrichment/http_cache).
+
+Driven by a fake session so nothing reaches TMDB/TVDB/OMDb: fresh hits skip the
+network, expired entries revalidate with ETag / Last-Modified (a 304 re-arms
+them), credentials never reach the key, the store is LRU-bounded, and the
+clients fall back to bare ``requests.get`` without a cache.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import requests
+
+from core.video.enrichment import http_cache as hc
+from core.video.enrichment.clients import OMDBClient, TMDBClient
+
+
+def _resp(status=200, body=None, headers=None):
+    r = requests.models.Response()
+    r.status_code = status
+    r._content = json.dumps(body).encode() if body is not None else b""
+    r.headers.update(headers or {})
+    return r
+
+
+class FakeSession:
+    def __init__(self, responder):
+        self.responder = responder
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append((url, dict(params or {}), dict(headers or {})))
+        return self.responder(url, params or {}, headers or {})
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return Clock()
+
+
+def _cache(tmp_path, responder, clock, **kw):
+    session = FakeSession(responder)
+    return hc.HTTPCache(tmp_path / "video_http_cache.db", session=session, clock=clock, **kw), session
+
+
+def test_fresh_hit_skips_the_network_and_counts_bytes_saved(tmp_path, clock):
+    cache, session = _cache(tmp_path, lambda u, p, h: _resp(body={"id": 7}, headers={"ETag": '"v1"'}), clock)
+    url = TMDBClient.BASE + "/movie/7"
+    first = cache.get("tmdb", url, params={"api_key": "K1", "append_to_response": "credits"})
+    second = cache.get("tmdb", url, params={"api_key": "K2", "append_to_response": "credits"})
+
+    assert first.json() == second.json() == {"id": 7}
+    assert getattr(second, "from_cache", False) and len(session.calls) == 1
+    stats = cache.get_stats("tmdb")
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+    assert stats["bytes_saved"] == len(first.content) and stats["entries"] == 1
+
+
+def test_expired_entry_revalidates_and_304_rearms(tmp_path, clock):
+    def responder(url, params, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return _resp(304)
+        return _resp(body={"v": 1}, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    cache, session = _cache(tmp_path, responder, clock)
+    url = TMDBClient.BASE + "/movie/9/release_dates"
+    cache.get("tmdb", url, params={"api_key": "K"})
+    clock.now += hc.ttl_for("tmdb", url) + 1
+    again = cache.get("tmdb", url, params={"api_key": "K"})
+
+    assert again.status_code == 200 and again.json() == {"v": 1}
+    assert session.calls[-1][2]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    cache.get("tmdb", url, params={"api_key": "K"})
+    assert len(session.calls) == 2
+    assert cache.get_stats("tmdb")["revalidated"] == 1
+
+
+def test_errors_are_returned_not_stored(tmp_path, clock):
+    cache, session = _cache(tmp_path, lambda u, p, h: _resp(429, body={}), clock)
+    url = TMDBClient.BASE + "/search/movie"
+    assert cache.get("tmdb", url, params={"query": "x"}).status_code == 429
+    assert cache.get("tmdb", url, params={"query": "x"}).status_code == 429
+    assert len(session.calls) == 2 and cache.get_stats()["entries"] == 0
+
+
+def test_omdb_error_bodies_are_not_stored(tmp_path, clock):
+    cache, session = _cache(tmp_path, lambda u, p, h: _resp(body={"Response": "False", "Error": "Request limit reached!"}), clock)
+    cache.get("omdb", OMDBClient.BASE, params={"apikey": "K", "i": "tt1"})
+    cache.get("omdb", OMDBClient.BASE, params={"apikey": "K", "i": "tt1"})
+    assert len(session.calls) == 2
+
+
+def test_uncached_requests_still_use_the_session(tmp_path, clock):
+    cache, session = _cache(tmp_path, lambda u, p, h: _resp(body={}), clock)
+    cache.get("tmdb", TMDBClient.BASE + "/configuration", params={"api_key": "K"})
+    cache.get("omdb", OMDBClient.BASE, params={"i": "tt1"}, cache=False)
+    assert len(session.calls) == 2
+    assert cache.get_stats()["uncached"] == 2
+
+
+def test_lru_eviction_keeps_the_store_under_its_cap(tmp_path, clock):
+    blob = "x" * 200_000
+    cache, _ = _cache(tmp_path, lambda u, p, h: _resp(body={"blob": blob, "u": u}), clock, max_bytes=1024 * 1024)
+    urls = [TMDBClient.BASE + f"/movie/{i}" for i in range(6)]
+    for url in urls[:4]:
+        clock.now += 1
+        cache.get("tmdb", url)
+    clock.now += 1
+    cache.get("tmdb", urls[0])                      # touch: now most recently used
+    for url in urls[4:]:
+        clock.now += 1
+        cache.get("tmdb", url)
+
+    stats = cache.get_stats()
+    assert stats["store_bytes"] <= cache.max_bytes and stats["evictions"] == 2
+    assert cache._lookup(hc.cache_key(urls[0])) is not None
+    assert cache._lookup(hc.cache_key(urls[1])) is None
+    assert cache._lookup(hc.cache_key(urls[2])) is None
+
+
+@pytest.mark.parametrize("provider,url,params,ttl", [
+    ("tmdb", TMDBClient.BASE + "/configuration", None, 0),
+    ("tmdb", TMDBClient.BASE + "/trending/all/week", None, 3600),
+    ("tmdb", TMDBClient.BASE + "/movie/1", {"append_to_response": "videos,watch/providers"}, 3600),
+    ("tmdb", TMDBClient.BASE + "/movie/1/images", None, 7 * hc.DAY),
+    ("tmdb", TMDBClient.BASE + "/movie/1", {"append_to_response": "credits"}, hc.DAY),
+    ("tvdb", "https://api4.thetvdb.com/v4/series/5/extended", None, 3 * hc.DAY),
+    ("omdb", OMDBClient.BASE, {"i": "tt1"}, 3 * hc.DAY),
+])
+def test_ttl_policy(provider, url, params, ttl):
+    assert hc.ttl_for(provider, url, params) == ttl
+
+
+def test_cache_key_ignores_credentials():
+    assert hc.cache_key("u", {"api_key": "a", "q": "x"}) == hc.cache_key("u", {"q": "x", "api_key": "b"})
+    assert hc.cache_key("u", {"q": "x"}) != hc.cache_key("u", {"q": "y"})
+
+
+def test_clients_route_through_the_cache_and_workers_report_it(tmp_path, clock):
+    from core.video.enrichment.worker import VideoEnrichmentWorker
+    from database.video_database import VideoDatabase
+
+    cache, session = _cache(tmp_path, lambda u, p, h: _resp(body={"posters": [], "logos": []}), clock)
+    client = TMDBClient("KEY", cache)
+    client.poster_options("movie", 3)
+    client.poster_options("movie", 3)
+    assert len(session.calls) == 1
+
+    db = VideoDatabase(database_path=str(tmp_path / "video_library.db"))
+    stats = VideoEnrichmentWorker(db, "tmdb", client).get_stats()["http_cache"]
+    assert stats["hits"] == 1 and stats["hit_rate"] == 0.5
@@ -1277,3 +1277,138 @@ def test_scan_records_per_run_track_ledger(monkeypatch):
     assert events[0]["artist_name"] == "Artist One"
     # The 10-item live FIFO only carries the ADDED one, as before.
     assert [a["track_name"] for a in scan_state["recent_wishlist_additions"]] == ["Added Track"]
+
+
+def _patch_scan_flow(monkeypatch, scanner, discography, is_missing):
+    monkeypatch.setattr(watchlist_scanner_module, "DELAY_BETWEEN_ARTISTS", 0)
+    monkeypatch.setattr(watchlist_scanner_module, "DELAY_BETWEEN_ALBUMS", 0)
+    scanner._database.has_fresh_similar_artists = lambda *a, **k: True
+    monkeypatch.setattr(scanner, "_backfill_missing_ids", lambda *a, **k: None)
+    monkeypatch.setattr(scanner, "get_artist_image_url", lambda *a, **k: "")
+    monkeypatch.setattr(scanner, "get_artist_discography_for_watchlist", discography)
+    monkeypatch.setattr(scanner, "_get_lookback_period_setting", lambda: "all")
+    monkeypatch.setattr(scanner, "_get_rescan_cutoff", lambda: None)
+    monkeypatch.setattr(scanner, "_should_include_release", lambda *a, **k: True)
+    monkeypatch.setattr(scanner, "_should_include_track", lambda *a, **k: True)
+    monkeypatch.setattr(scanner, "prefetch_library_presence", lambda *a, **k: None)
+    monkeypatch.setattr(scanner, "is_track_missing_from_library", is_missing)
+    monkeypatch.setattr(scanner, "add_track_to_wishlist", lambda *a, **k: True)
+    monkeypatch.setattr(scanner, "update_artist_scan_timestamp", lambda *a, **k: True)
+    monkeypatch.setattr(scanner, "_backfill_similar_artists_fallback_ids", lambda *a, **k: 0)
+
+
+_ONE_TRACK_ALBUM = {
+    "name": "Album One",
+    "tracks": {"items": [{
+        "id": "track-1", "name": "Track One", "track_number": 1,
+        "disc_number": 1, "artists": [{"name": "Artist One"}],
+    }]},
+}
+
+
+def test_unchanged_release_fingerprint_skips_album_fetches_and_track_checks(monkeypatch):
+    artist = _build_artist()
+    scanner = _build_scanner(_ONE_TRACK_ALBUM, [artist])
+    stored = {}
+    scanner._database.get_watchlist_release_fingerprint = lambda artist_id: stored.get(artist_id)
+    scanner._database.set_watchlist_release_fingerprint = (
+        lambda artist_id, fp: stored.__setitem__(artist_id, fp) or True)
+
+    albums = [types.SimpleNamespace(id="album-1", name="Album One", total_tracks=1)]
+    album_fetches = []
+    original_get_album = scanner.metadata_service.get_album
+    scanner.metadata_service.get_album = lambda album_id: album_fetches.append(album_id) or original_get_album(album_id)
+    checks = []
+    _patch_scan_flow(monkeypatch, scanner, lambda *a, **k: list(albums),
+                     lambda *a, **k: checks.append(1) and False)
+
+    first = scanner.scan_watchlist_artists([artist])
+    assert first[0].success and album_fetches == ["album-1"] and len(checks) == 1
+    assert stored.get(artist.id)
+
+    second = scanner.scan_watchlist_artists([artist])
+    assert second[0].success and second[0].albums_checked == 1
+    assert album_fetches == ["album-1"] and len(checks) == 1
+
+    albums.append(types.SimpleNamespace(id="album-2", name="Album Two", total_tracks=1))
+    scanner.scan_watchlist_artists([artist])
+    assert album_fetches == ["album-1", "album-1", "album-2"]
+    assert len(checks) == 3
+
+
+def test_missing_tracks_not_on_wishlist_keep_the_artist_rechecked(monkeypatch):
+    artist = _build_artist()
+    artist.auto_download = False  # follow only: found tracks never reach the wishlist
+    scanner = _build_scanner(_ONE_TRACK_ALBUM, [artist])
+    stored = {artist.id: "stale"}
+    scanner._database.get_watchlist_release_fingerprint = lambda artist_id: stored.get(artist_id)
+    scanner._database.set_watchlist_release_fingerprint = (
+        lambda artist_id, fp: stored.__setitem__(artist_id, fp) or True)
+    albums = [types.SimpleNamespace(id="album-1", name="Album One", total_tracks=1)]
+    _patch_scan_flow(monkeypatch, scanner, lambda *a, **k: list(albums), lambda *a, **k: True)
+
+    results = scanner.scan_watchlist_artists([artist])
+
+    assert results[0].new_tracks_found == 1
+    assert stored[artist.id] is None
+
+
+def test_next_artist_is_fetched_while_current_artist_is_checked(monkeypatch):
+    import threading
+
+    artist_a = _build_artist("Artist One")
+    artist_b = _build_artist("Artist Two")
+    artist_b.id = 456
+    scanner = _build_scanner(_ONE_TRACK_ALBUM, [artist_a, artist_b])
+    album = types.SimpleNamespace(id="album-1", name="Album One", total_tracks=1)
+    fetched_b = threading.Event()
+    overlap = []
+
+    def _discography(artist, *_a, **_k):
+        if artist is artist_b:
+            fetched_b.set()
+        return [album]
+
+    def _is_missing(*_a, **_k):
+        if not overlap:
+            overlap.append(fetched_b.wait(5))
+        return False
+
+    _patch_scan_flow(monkeypatch, scanner, _discography, _is_missing)
+    monkeypatch.setattr(scanner, "_scan_prefetch_depth", lambda: 1)
+
+    scan_state = {}
+    results = scanner.scan_watchlist_artists([artist_a, artist_b], scan_state=scan_state)
+
+    assert overlap == [True]
+    assert [r.artist_name for r in results] == ["Artist One", "Artist Two"]
+    assert all(r.success for r in results)
+    assert scan_state["status"] == "completed"
+
+
+def test_similar_artist_lookups_share_the_prefetch_thread(monkeypatch):
+    import threading
+
+    artist_a = _build_artist("Artist One")
+    artist_b = _build_artist("Artist Two")
+    artist_b.id = 456
+    scanner = _build_scanner(_ONE_TRACK_ALBUM, [artist_a, artist_b])
+    album = types.SimpleNamespace(id="album-1", name="Album One", total_tracks=1)
+    provider_threads = []
+
+    def _discography(*_a, **_k):
+        provider_threads.append(('discography', threading.current_thread().name))
+        return [album]
+
+    _patch_scan_flow(monkeypatch, scanner, _discography, lambda *a, **k: False)
+    scanner._database.has_fresh_similar_artists = lambda *a, **k: False
+    monkeypatch.setattr(scanner, "update_similar_artists", lambda artist, **_k: provider_threads.append(
+        ('similar', threading.current_thread().name)))
+    monkeypatch.setattr(scanner, "_scan_prefetch_depth", lambda: 1)
+
+    results = scanner.scan_watchlist_artists([artist_a, artist_b])
+
+    assert all(r.success for r in results)
+    assert sorted(kind for kind, _ in provider_threads) == ['discography', 'discography', 'similar', 'similar']
+    assert len({name for _, name in provider_threads}) == 1
+    assert provider_threads[0][1].startswith('watchlist-prefetch')
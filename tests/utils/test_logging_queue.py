@@ -0,0 +1,130 @@
+"""Queued logging pipeline and the in-memory live log buffer."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import time
+
+from utils.logging_config import (
+    DroppingQueueHandler,
+    LiveLogBuffer,
+    get_logging_stats,
+    install_queued_handlers,
+    live_log_buffer,
+)
+
+
+class _SlowHandler(logging.Handler):
+    """Sink that stands in for a slow disk."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.records = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.records.append(record.getMessage())
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_caller_does_not_wait_for_slow_sink():
+    log = logging.getLogger('soulsync.test_queue_slow')
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    sink = _SlowHandler(0.05)
+    install_queued_handlers(log, [sink], source='test_slow')
+    try:
+        start = time.monotonic()
+        for i in range(20):
+            log.info('msg %d', i)
+        # 20 records x 50ms would be a full second if written inline.
+        assert time.monotonic() - start < 0.5
+        assert _wait_for(lambda: len(sink.records) == 20)
+        assert sink.records[0] == 'msg 0'
+    finally:
+        log.handlers.clear()
+
+
+def test_live_buffer_receives_formatted_records_by_source():
+    log = logging.getLogger('soulsync.test_queue_live')
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    sink = _SlowHandler(0)
+    sink.setFormatter(logging.Formatter('%(levelname)s | %(message)s'))
+    start_seq = live_log_buffer.last_seq
+    install_queued_handlers(log, [sink], source='test_live')
+    try:
+        log.warning('disk %s', 'full')
+        log.debug('noise')
+        assert _wait_for(lambda: len(sink.records) == 2)
+        records = live_log_buffer.since(start_seq, source='test_live')
+        assert [r['line'] for r in records] == ['WARNING | disk full', 'DEBUG | noise']
+        assert live_log_buffer.since(start_seq, source='test_live', level='warning')[0]['message'] == 'disk full'
+        assert live_log_buffer.since(start_seq, source='other') == []
+    finally:
+        log.handlers.clear()
+
+
+def test_full_queue_drops_and_counts_instead_of_blocking():
+    q = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(q, source='test_drop')
+    log = logging.getLogger('soulsync.test_queue_drop')
+    log.propagate = False
+    log.handlers = [handler]
+    try:
+        for i in range(5):
+            log.error('burst %d', i)
+        stats = get_logging_stats()['sources']['test_drop']
+        assert stats == {'enqueued': 2, 'dropped': 3}
+    finally:
+        log.handlers.clear()
+
+
+def test_buffer_is_bounded_and_filters_by_module():
+    buf = LiveLogBuffer(maxlen=3)
+    for i, name in enumerate(['soulsync.a', 'soulsync.a.b', 'soulsync.ab', 'soulsync.a']):
+        rec = logging.LogRecord(name, logging.INFO, __file__, 1, f'm{i}', None, None)
+        buf.append('app', rec, f'm{i}')
+    assert [r['message'] for r in buf.since(0)] == ['m1', 'm2', 'm3']
+    assert [r['message'] for r in buf.since(0, module='a')] == ['m1', 'm3']
+    assert [r['message'] for r in buf.since(0, limit=1)] == ['m3']
+    assert buf.since(buf.last_seq) == []
+
+
+def test_poll_cursor_never_skips_records_appended_after_the_read():
+    buf = LiveLogBuffer(maxlen=10)
+
+    def add(source, msg):
+        buf.append(source, logging.LogRecord('soulsync.x', logging.INFO, __file__, 1, msg, None, None), msg)
+
+    add('app', 'a1')
+    add('other', 'o1')
+    records, cursor = buf.poll(0, source='app')
+    assert [r['message'] for r in records] == ['a1'] and cursor == 2  # filtered-out o1 is scanned too
+    add('app', 'a2')   # lands after the read, before the next push
+    records, cursor = buf.poll(cursor, source='app')
+    assert [r['message'] for r in records] == ['a2'] and cursor == 3
+    assert buf.poll(cursor, source='app') == ([], 3)
+
+
+def test_stopping_listener_flushes_pending_records():
+    log = logging.getLogger('soulsync.test_queue_stop')
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    sink = _SlowHandler(0.01)
+    listener = install_queued_handlers(log, [sink], source='test_stop')
+    for i in range(10):
+        log.info('pending %d', i)
+    listener.stop()
+    assert len(sink.records) == 10
+    log.handlers.clear()
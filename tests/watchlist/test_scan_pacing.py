@@ -0,0 +1,113 @@
+"""Watchlist scan pacing follows real provider traffic: no API calls since
+the last pace point means no delay, rate-limit events back the delay off,
+and the per-artist release fingerprint round-trips through the database."""
+
+from __future__ import annotations
+
+import threading
+
+from core.api_call_tracker import ApiCallTracker
+from core.watchlist.pacing import ScanPacer
+from database.music_database import MusicDatabase
+
+
+class _Totals:
+    def __init__(self):
+        self.calls = 0
+        self.events = 0
+
+    def __call__(self):
+        return self.calls, self.events
+
+
+def _pacer(totals):
+    slept = []
+    return ScanPacer(totals=totals, sleep=slept.append), slept
+
+
+def test_cache_hits_cost_no_delay():
+    totals = _Totals()
+    pacer, slept = _pacer(totals)
+    assert pacer.pace(4.0) == 0.0
+    assert pacer.pace(4.0) == 0.0
+    assert slept == []
+    assert pacer.stats['skipped'] == 2
+
+
+def test_real_calls_are_paced_once_per_window():
+    totals = _Totals()
+    pacer, slept = _pacer(totals)
+    totals.calls += 3
+    assert pacer.pace(0.5) == 0.5
+    # Nothing new since the last pace point
+    assert pacer.pace(0.5) == 0.0
+    assert slept == [0.5]
+
+
+def test_rate_limit_events_back_off_and_clean_windows_recover():
+    totals = _Totals()
+    pacer, slept = _pacer(totals)
+    totals.calls += 1
+    totals.events += 1
+    assert pacer.pace(1.0) == 2.0
+    totals.calls += 1
+    totals.events += 1
+    assert pacer.pace(1.0) == 4.0
+    totals.calls += 1
+    assert pacer.pace(1.0) == 2.0
+    totals.calls += 1
+    assert pacer.pace(1.0) == 1.0
+    assert slept == [2.0, 4.0, 2.0, 1.0]
+    assert pacer.stats['rate_limit_events'] == 2
+
+
+def test_backoff_is_capped():
+    totals = _Totals()
+    pacer, _ = _pacer(totals)
+    for _ in range(10):
+        totals.events += 1
+        pacer.pace(1.0)
+    assert pacer.backoff == pacer.max_backoff
+
+
+def test_tracker_totals_are_monotonic_and_per_thread(monkeypatch):
+    monkeypatch.setattr(ApiCallTracker, '_load', lambda self: None)
+    tracker = ApiCallTracker()
+    tracker.record_call('spotify', endpoint='get_album')
+    tracker.record_call('deezer')
+    tracker.record_event('deezer', 'rate_limited')
+    assert tracker.get_thread_totals() == (2, 1)
+    other = threading.Thread(target=lambda: tracker.record_call('itunes'))
+    other.start()
+    other.join()
+    assert tracker.get_thread_totals() == (2, 1)
+
+
+def test_other_threads_traffic_does_not_pace_the_scan(monkeypatch):
+    monkeypatch.setattr(ApiCallTracker, '_load', lambda self: None)
+    tracker = ApiCallTracker()
+    slept = []
+    pacer = ScanPacer(totals=tracker.get_thread_totals, sleep=slept.append)
+
+    def enrichment_worker():
+        for _ in range(5):
+            tracker.record_call('spotify')
+        tracker.record_event('spotify', 'rate_limited')
+    worker = threading.Thread(target=enrichment_worker)
+    worker.start()
+    worker.join()
+    assert pacer.pace(1.0) == 0.0 and pacer.backoff == 1.0
+
+    tracker.record_call('spotify')   # the scan's own call
+    assert pacer.pace(1.0) == 1.0
+    assert slept == [1.0]
+
+
+def test_release_fingerprint_round_trip(tmp_path):
+    db = MusicDatabase(str(tmp_path / 'm.db'))
+    assert db.get_watchlist_release_fingerprint(7) is None
+    assert db.set_watchlist_release_fingerprint(7, 'abc') is True
+    assert db.set_watchlist_release_fingerprint(7, 'def') is True
+    assert db.get_watchlist_release_fingerprint(7) == 'def'
+    assert db.set_watchlist_release_fingerprint(7, None) is True
+    assert db.get_watchlist_release_fingerprint(7) is None
@@ -0,0 +1,186 @@
+"""Response compression (core/webui/compression.py) and its web_server wiring.
+
+Static text assets are served gzip/brotli-compressed from an in-memory cache
+keyed by content hash (also the ETag), with immutable caching for Vite's
+hashed files and URLs tagged with the current ``?v=``; JSON responses above a
+size threshold are compressed per ``Accept-Encoding`` and counted.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+
+import pytest
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+
+from core.webui import compression
+from core.webui.compression import (
+    compress_json_response,
+    compression_stats,
+    is_content_hashed_asset,
+    negotiate_encoding,
+    reset_compression_stats,
+    static_tree_version,
+    static_variant,
+)
+
+
+def _accept(header):
+    return parse_accept_header(header, Accept)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state():
+    compression.clear_static_variant_cache()
+    reset_compression_stats()
+    yield
+    compression.clear_static_variant_cache()
+
+
+class TestNegotiation:
+    def test_quality_and_availability(self, monkeypatch):
+        monkeypatch.setattr(compression, '_brotli', None)
+        assert negotiate_encoding(_accept('gzip, deflate')) == 'gzip'
+        assert negotiate_encoding(_accept('identity')) is None
+        assert negotiate_encoding(_accept('gzip;q=0')) is None
+        assert negotiate_encoding(_accept('')) is None
+        monkeypatch.setattr(compression, '_brotli', object())
+        assert negotiate_encoding(_accept('gzip, br')) == 'br'
+        assert negotiate_encoding(_accept('gzip, br;q=0.5')) == 'gzip'
+
+
+class TestJson:
+    def _response(self, payload, **kwargs):
+        from flask import Response
+        return Response(json.dumps(payload), mimetype='application/json', **kwargs)
+
+    def test_large_json_is_compressed_and_counted(self):
+        payload = {'tracks': [{'id': i, 'title': f'Track {i}'} for i in range(500)]}
+        resp = compress_json_response(self._response(payload), _accept('gzip'))
+        assert resp.headers['Content-Encoding'] == 'gzip' and 'Accept-Encoding' in resp.headers['Vary']
+        assert json.loads(gzip.decompress(resp.get_data())) == payload
+        stats = compression_stats()['json']
+        assert stats['responses'] == 1 and stats['bytes_saved'] == stats['bytes_in'] - len(resp.get_data()) > 0
+
+    def test_left_alone(self):
+        big = {'x': 'y' * 5000}
+        small = compress_json_response(self._response({'ok': True}), _accept('gzip'))
+        assert 'Content-Encoding' not in small.headers
+        identity = compress_json_response(self._response(big), _accept('identity'))
+        assert 'Content-Encoding' not in identity.headers and compression_stats()['json']['skipped'] == 1
+        error = compress_json_response(self._response(big, status=500), _accept('gzip'))
+        assert 'Content-Encoding' not in error.headers
+        opted_out = self._response(big, headers={'Cache-Control': 'no-transform'})
+        assert 'Content-Encoding' not in compress_json_response(opted_out, _accept('gzip')).headers
+
+    def test_already_encoded_body_is_not_compressed_twice(self):
+        from flask import Response
+        body = gzip.compress(b'{"nodes": [' + b'1,' * 5000 + b'1]}')
+        resp = Response(body, mimetype='application/json', headers={'Content-Encoding': 'gzip'})
+        assert compress_json_response(resp, _accept('gzip')).get_data() == body
+
+    def test_etag_names_the_encoding(self):
+        resp = self._response({'x': 'y' * 5000})
+        resp.set_etag('abc')
+        compress_json_response(resp, _accept('gzip'))
+        assert resp.get_etag() == ('abc-gzip', False)
+
+
+class TestStaticVariants:
+    def test_variant_cached_by_content_and_refreshed_on_change(self, tmp_path):
+        asset = tmp_path / 'app.js'
+        asset.write_text('const x = 1;\n' * 500)
+        encoding, body, etag, size = static_variant(asset, _accept('gzip'))
+        assert encoding == 'gzip' and gzip.decompress(body) == asset.read_bytes() and size == asset.stat().st_size
+        assert static_variant(asset, _accept('gzip'))[1] is body
+        assert compression_stats()['static_cache'] == {'files': 1, 'bytes': size + len(body), 'hits': 1, 'builds': 1}
+
+        asset.write_text('const y = 2;\n' * 600)
+        os.utime(asset, ns=(asset.stat().st_atime_ns, asset.stat().st_mtime_ns + 10**9))
+        _enc, body2, etag2, _size = static_variant(asset, _accept('gzip'))
+        assert etag2 != etag and gzip.decompress(body2) == asset.read_bytes()
+        assert compression_stats()['static_cache']['files'] == 1
+
+    def test_small_binary_or_identity_requests_are_served_as_files(self, tmp_path):
+        (tmp_path / 'tiny.css').write_text('a{}')
+        (tmp_path / 'art.png').write_bytes(b'\x89PNG' + b'0' * 5000)
+        (tmp_path / 'big.css').write_text('a { color: red; }\n' * 200)
+        assert static_variant(tmp_path / 'tiny.css', _accept('gzip')) is None
+        assert static_variant(tmp_path / 'art.png', _accept('gzip')) is None
+        assert static_variant(tmp_path / 'big.css', _accept('identity')) is None
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        cache = compression._StaticVariantCache(max_bytes=30000)
+        monkeypatch.setattr(compression, '_static_cache', cache)
+        for i in range(5):
+            path = tmp_path / f'f{i}.js'
+            path.write_text(f'// {i}\n' + 'var a = 1;\n' * 1000)
+            static_variant(path, _accept('gzip'))
+        assert cache.stats()['bytes'] <= 30000 and cache.stats()['files'] < 5
+
+    def test_hashed_assets_and_tree_version(self, tmp_path):
+        assert is_content_hashed_asset('dist/assets/main-Bx3f9a.js')
+        assert not is_content_hashed_asset('library.js')
+        (tmp_path / 'a.js').write_text('1')
+        version = static_tree_version(tmp_path)
+        assert static_tree_version(tmp_path) == version
+        (tmp_path / 'img.png').write_bytes(b'x')
+        assert static_tree_version(tmp_path) != version
+
+
+class TestWebServer:
+    @pytest.fixture
+    def app(self):
+        import web_server
+        web_server.app.config['TESTING'] = True
+        return web_server
+
+    def test_static_asset_gzip_etag_304_and_immutable(self, app):
+        client = app.app.test_client()
+        url = f'/static/library.js?v={app._STATIC_CACHE_BUST}'
+        resp = client.get(url, headers={'Accept-Encoding': 'gzip'})
+        raw = open(os.path.join(app.app.static_folder, 'library.js'), 'rb').read()
+        assert resp.status_code == 200 and resp.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(resp.data) == raw
+        assert resp.headers['Cache-Control'] == compression.IMMUTABLE_CACHE_CONTROL
+        assert 'Accept-Encoding' in resp.headers['Vary']
+
+        again = client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': resp.headers['ETag']})
+        assert again.status_code == 304
+        assert compression_stats()['static']['responses'] == 1
+
+        plain = client.get('/static/library.js', headers={'Accept-Encoding': 'identity'})
+        assert plain.data == raw and 'Content-Encoding' not in plain.headers
+        assert 'immutable' not in plain.headers['Cache-Control']
+        assert plain.headers['ETag'].strip('"') == resp.headers['ETag'].strip('"').rsplit('-', 1)[0]
+        assert client.get('/static/missing.js').status_code == 404
+
+    def test_after_request_compresses_json_but_not_encoded_responses(self, app):
+        from flask import Response, jsonify
+        payload = {'albums': [{'id': i, 'title': f'Album {i}'} for i in range(300)]}
+        with app.app.test_request_context('/api/library/albums', headers={'Accept-Encoding': 'gzip'}):
+            resp = app.app.process_response(jsonify(payload))
+            assert resp.headers['Content-Encoding'] == 'gzip'
+            assert json.loads(gzip.decompress(resp.get_data())) == payload
+
+            snapshot = gzip.compress(json.dumps(payload).encode())
+            encoded = Response(snapshot, mimetype='application/json', headers={'Content-Encoding': 'gzip'})
+            assert app.app.process_response(encoded).get_data() == snapshot
+
+    def test_debug_endpoint_reports_savings(self, app):
+        client = app.app.test_client()
+        client.get('/static/library.js', headers={'Accept-Encoding': 'gzip'})
+        stats = client.get('/api/debug/compression').get_json()
+        assert stats['static']['bytes_saved'] > 0 and 'gzip' in stats['encodings']
+
+    def test_stats_reset_is_admin_only(self, app):
+        from flask import g
+        view = app.app.view_functions['debug_compression_stats_reset']
+        compression_stats()  # counters exist before the attempt
+        with app.app.test_request_context('/api/debug/compression/reset'):
+            g.profile_id = 2
+            _body, status = view()
+        assert status == 403
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark Beatport page parsing: __NEXT_DATA__ regex fast path vs BeautifulSoup.
+
+Builds a synthetic chart page shaped like Beatport's Next.js output (a
+dehydrated-state JSON blob with N tracks plus a realistic amount of
+surrounding markup) and times both extraction paths on it. No network.
+
+Usage:
+    python tools/bench_beatport_parse.py              # 100-track page, 20 runs
+    python tools/bench_beatport_parse.py --tracks 150 --runs 50
+    python tools/bench_beatport_parse.py --page saved_release_page.html
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from beatport_unified_scraper import BeatportUnifiedScraper, extract_next_data_json  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_beatport_parse")
+
+
+def build_fixture_page(n_tracks: int) -> bytes:
+    """A chart page: N track rows of markup plus the matching JSON state."""
+    tracks = []
+    rows = []
+    for i in range(1, n_tracks + 1):
+        tracks.append({
+            "id": 17000000 + i, "slug": f"track-{i}", "name": f"Track {i}", "mix_name": "Extended Mix",
+            "artists": [{"id": i, "name": f"Artist {i}"}, {"id": i + 1, "name": f"Featured {i}"}],
+            "bpm": 124, "key": {"name": "A Minor"}, "genre": {"name": "Tech House"}, "length": "6:12",
+            "release": {"id": 4000000 + i, "name": f"Release {i}", "image": {"uri": f"https://img/{i}.jpg"},
+                        "label": {"name": f"Label {i % 20}"}, "publish_date": "2026-01-01"},
+        })
+        rows.append(
+            f'<div class="row" data-testid="tracks-list-item"><div class="artwork"><img src="https://img/{i}.jpg"/></div>'
+            f'<div class="meta"><a href="/track/track-{i}/{17000000 + i}"><span>Track {i}</span> <span>Extended Mix</span></a>'
+            f'<div class="artists"><a href="/artist/a/{i}">Artist {i}</a>, <a href="/artist/f/{i + 1}">Featured {i}</a></div>'
+            f'<div class="label"><a href="/label/l/{i % 20}">Label {i % 20}</a></div></div>'
+            f'<div class="bpm">124 BPM - A Min</div><div class="price"><button>$1.49</button></div></div>'
+        )
+    state = {"props": {"pageProps": {"dehydratedState": {"queries": [
+        {"state": {"data": {"page": "1/1", "count": n_tracks}}},
+        {"state": {"data": {"results": tracks}}},
+    ]}}}}
+    nav = '<nav>' + ''.join(f'<a href="/genre/g/{g}">Genre {g}</a>' for g in range(60)) + '</nav>'
+    return (
+        '<!DOCTYPE html><html><head><title>Top 100</title>'
+        + ''.join(f'<link rel="preload" href="/_next/static/chunk{c}.js"/>' for c in range(40))
+        + f'</head><body>{nav}<main>{"".join(rows)}</main>'
+        + '<script id="__NEXT_DATA__" type="application/json">' + json.dumps(state) + '</script>'
+        + '</body></html>'
+    ).encode('utf-8')
+
+
+def _time(func, runs: int) -> float:
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tracks', type=int, default=100)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--page', help='time a saved Beatport page instead of the synthetic fixture')
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, 'rb') as f:
+            page = f.read()
+    else:
+        page = build_fixture_page(args.tracks)
+    scraper = BeatportUnifiedScraper()
+
+    fast = extract_next_data_json(page)
+    slow = scraper.extract_json_object_from_release_page(BeautifulSoup(page, 'html.parser'))
+    if fast != slow:
+        logger.info("WARNING: fast and soup paths returned different JSON")
+
+    fast_s = _time(lambda: extract_next_data_json(page), args.runs)
+    slow_s = _time(lambda: scraper.extract_json_object_from_release_page(BeautifulSoup(page, 'html.parser')), args.runs)
+
+    logger.info(f"Page size: {len(page) / 1024:.0f} KB  (best of {args.runs} runs)")
+    logger.info(f"  __NEXT_DATA__ regex + json.loads : {fast_s * 1000:8.2f} ms")
+    logger.info(f"  BeautifulSoup html.parser + scan : {slow_s * 1000:8.2f} ms")
+    logger.info(f"  Speedup                          : {slow_s / fast_s:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark the library scan's database writes: the per-row
+insert_or_update_media_artist / _album / _track calls (one connection, commit
+and provenance lookup per row) vs bulk_upsert_media_library (TEMP staging +
+one upsert per table in one transaction), for a first scan and a rescan of the
+same library.
+
+The artists / albums / tracks are synthetic objects with the attributes the
+Plex / Jellyfin / Navidrome clients hand the DatabaseUpdateWorker; each path
+writes its own database in a temporary directory, and the row counts of the
+two are printed at the end so a silent drop shows up.
+
+Usage:
+    python tools/bench_bulk_ingest.py                            # 300 artists x 5 albums x 12 tracks
+    python tools/bench_bulk_ingest.py --artists 100 --batch 500
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.music_database import MusicDatabase  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_bulk_ingest")
+
+
+def library(n_artists, n_albums, n_tracks):
+    artists, albums, tracks = [], [], []
+    for a in range(n_artists):
+        artists.append(SimpleNamespace(ratingKey=f"ar{a}", title=f"Artist {a}", thumb=f"/thumb/ar{a}",
+                                       summary='', genres=[SimpleNamespace(tag='rock')]))
+        for b in range(n_albums):
+            album_id = f"al{a}-{b}"
+            albums.append((SimpleNamespace(ratingKey=album_id, title=f"Album {a}-{b}", year=2000 + b,
+                                           thumb=None, leafCount=n_tracks, duration=0, genres=[]), f"ar{a}"))
+            for t in range(n_tracks):
+                tracks.append((SimpleNamespace(ratingKey=f"t{a}-{b}-{t}", title=f"Track {t}", trackNumber=t + 1,
+                                               discNumber=1, duration=200000, path=f"/music/{a}/{b}/{t}.flac",
+                                               bitRate=900), album_id, f"ar{a}"))
+    return artists, albums, tracks
+
+
+def per_row(db, artists, albums, tracks):
+    for artist in artists:
+        db.insert_or_update_media_artist(artist, server_source='navidrome')
+    for album, artist_id in albums:
+        db.insert_or_update_media_album(album, artist_id, server_source='navidrome')
+    for track, album_id, artist_id in tracks:
+        db.insert_or_update_media_track(track, album_id, artist_id, server_source='navidrome')
+
+
+def bulk(db, artists, albums, tracks, batch_tracks):
+    """Write in writer-sized groups: whole artists until ~batch_tracks tracks."""
+    by_artist_albums, by_artist_tracks = {}, {}
+    for album, artist_id in albums:
+        by_artist_albums.setdefault(artist_id, []).append((album, artist_id))
+    for row in tracks:
+        by_artist_tracks.setdefault(row[2], []).append(row)
+    group = ([], [], [])
+    for artist in artists:
+        group[0].append(artist)
+        group[1].extend(by_artist_albums.get(artist.ratingKey, []))
+        group[2].extend(by_artist_tracks.get(artist.ratingKey, []))
+        if len(group[2]) >= batch_tracks:
+            db.bulk_upsert_media_library(*group, server_source='navidrome')
+            group = ([], [], [])
+    if group[0]:
+        db.bulk_upsert_media_library(*group, server_source='navidrome')
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artists", type=int, default=300)
+    parser.add_argument("--albums", type=int, default=5, help="albums per artist")
+    parser.add_argument("--tracks", type=int, default=12, help="tracks per album")
+    parser.add_argument("--batch", type=int, default=2000, help="tracks per bulk transaction (writer group size)")
+    args = parser.parse_args()
+
+    artists, albums, tracks = library(args.artists, args.albums, args.tracks)
+    with tempfile.TemporaryDirectory(prefix="bench-ingest-") as tmp:
+        row_db = MusicDatabase(os.path.join(tmp, "per_row.db"))
+        bulk_db = MusicDatabase(os.path.join(tmp, "bulk.db"))
+        results = {}
+        for label in ("first scan", "rescan"):
+            results[label] = (timed(lambda: per_row(row_db, artists, albums, tracks)),
+                              timed(lambda: bulk(bulk_db, artists, albums, tracks, args.batch)))
+
+        logger.info(f"{len(artists)} artists, {len(albums)} albums, {len(tracks)} tracks; "
+                    f"bulk groups of ~{args.batch} tracks")
+        for label, (row_s, bulk_s) in results.items():
+            logger.info(f"{label:10}: per-row {row_s:7.2f} s ({len(tracks) / row_s:8.0f} tracks/s) | "
+                        f"bulk {bulk_s:6.2f} s ({len(tracks) / bulk_s:8.0f} tracks/s) -> {row_s / bulk_s:.0f}x")
+
+        counts = []
+        for db in (row_db, bulk_db):
+            conn = db._get_connection()
+            counts.append(tuple(conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                                for t in ("artists", "albums", "tracks")))
+            conn.close()
+        logger.info(f"rows stored (artists, albums, tracks): per-row {counts[0]} | bulk {counts[1]}")
+        assert counts[0] == counts[1]
+
+
+if __name__ == "__main__":
+    main()
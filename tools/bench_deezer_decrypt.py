@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark Deezer BF_CBC_STRIPE decryption: the old per-chunk path (a new
+Blowfish cipher, key schedule included, for every encrypted 2 KB chunk)
+vs the streaming _StripeDecryptor fed with large read buffers.
+
+Runs entirely in memory on random bytes and checks both paths produce the
+same output. No Deezer account or network access needed.
+
+Usage:
+    python tools/bench_deezer_decrypt.py                 # one 40 MB "FLAC", 64 KB reads
+    python tools/bench_deezer_decrypt.py --mb 10 --tracks 20 --read-kb 256
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.deezer_download_client import (  # noqa: E402
+    _CHUNK_SIZE, _decrypt_chunk, _get_blowfish_key, _StripeDecryptor,
+)
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_deezer_decrypt")
+
+
+def per_chunk(data, key):
+    digest = hashlib.sha256()
+    for index, offset in enumerate(range(0, len(data), _CHUNK_SIZE)):
+        chunk = data[offset:offset + _CHUNK_SIZE]
+        if index % 3 == 0 and len(chunk) == _CHUNK_SIZE:
+            chunk = _decrypt_chunk(chunk, key)
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def streaming(data, key, read_size):
+    digest = hashlib.sha256()
+    decryptor = _StripeDecryptor(key)
+    for offset in range(0, len(data), read_size):
+        digest.update(decryptor.feed(data[offset:offset + read_size]))
+    digest.update(decryptor.finish())
+    return digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=40.0, help="size of each synthetic track")
+    parser.add_argument("--tracks", type=int, default=1, help="tracks to decrypt per path")
+    parser.add_argument("--read-kb", type=int, default=64, help="network read buffer for the streaming path")
+    args = parser.parse_args()
+
+    data = os.urandom(int(args.mb * 2**20))
+    keys = [_get_blowfish_key(str(3135556 + n)) for n in range(args.tracks)]
+    total_mb = args.mb * args.tracks
+    logger.info(f"{args.tracks} track(s) x {args.mb:.0f} MB, {args.read_kb} KB reads")
+
+    start = time.perf_counter()
+    old = [per_chunk(data, key) for key in keys]
+    old_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = [streaming(data, key, args.read_kb * 1024) for key in keys]
+    new_s = time.perf_counter() - start
+
+    logger.info(f"per-chunk : {old_s:7.2f}s  {total_mb / old_s:7.1f} MB/s")
+    logger.info(f"streaming : {new_s:7.2f}s  {total_mb / new_s:7.1f} MB/s  ({old_s / new_s:.1f}x faster)")
+    logger.info(f"output    : {'identical' if old == new else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
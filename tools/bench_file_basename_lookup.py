@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark "same file, different root" lookups: the old leading-wildcard
+``file_path LIKE '%/<name>'`` scan vs the indexed ``file_basename`` key.
+
+track_downloads and tracks are filled with the same number of synthetic rows
+in a temporary database. Lookups use media-server-style paths (a different
+mount root, some with Windows separators) and go through both the old query
+and get_provenance_by_file_path; the report includes how often the indexed
+path lands in the right parent directory and on the same row as the scan.
+
+Usage:
+    python tools/bench_file_basename_lookup.py                      # 400k rows, 2,000 lookups
+    python tools/bench_file_basename_lookup.py --rows 100000 --lookups 500
+    python tools/bench_file_basename_lookup.py --like-sample 50     # time only a slice of the slow path
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.music_database import MusicDatabase, _file_path_key  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_file_basename_lookup")
+
+_WORDS = ("love night fire heart dream light rain city summer wild blue gold shadow river "
+          "ghost electric midnight paper silver echo storm ocean glass neon velvet").split()
+
+
+def _name(rng, words):
+    return " ".join(rng.choice(_WORDS).capitalize() for _ in range(words))
+
+
+def seed(db, n_rows, rng):
+    """n_rows downloads + tracks under /downloads/<artist>/<album>/<nn - title>.flac.
+    Track numbers repeat across albums, so plenty of basenames collide only by
+    directory ("01 - Intro.flac")."""
+    conn = db._get_connection()
+    n_artists = max(1, n_rows // 40)
+    paths = []
+    for i in range(n_rows):
+        artist = f"Artist {i % n_artists}"
+        album = f"{_name(rng, 2)} {(i // n_artists) % 4}"
+        title = "Intro" if rng.random() < 0.05 else f"{_name(rng, 3)} {i}"
+        paths.append(f"/downloads/{artist}/{album}/{(i % 14) + 1:02d} - {title}.flac")
+    conn.executemany("INSERT INTO track_downloads (file_path, source_service, isrc) VALUES (?, 'soulseek', ?)",
+                     [(p, f"ISRC{i:08d}") for i, p in enumerate(paths)])
+    conn.execute("INSERT INTO artists (id, name, server_source) VALUES ('ar', 'Bench', 'plex')")
+    conn.execute("INSERT INTO albums (id, artist_id, title, server_source) VALUES ('al', 'ar', 'Bench', 'plex')")
+    conn.executemany("INSERT INTO tracks (id, album_id, artist_id, title, file_path, server_source) "
+                     "VALUES (?, 'al', 'ar', ?, ?, 'plex')",
+                     [(f"t{i}", f"t{i}", p.replace('/downloads/', '/data/music/')) for i, p in enumerate(paths)])
+    conn.commit()
+    conn.close()
+    return paths
+
+
+def media_server_path(path, rng):
+    moved = path.replace('/downloads/', '/media/library/')
+    return moved.replace('/', '\\') if rng.random() < 0.2 else moved
+
+
+def like_lookup(cursor, file_path):
+    """The pre-index query, kept here for comparison."""
+    fname = os.path.basename(file_path.replace('\\', '/'))
+    cursor.execute("SELECT * FROM track_downloads WHERE file_path LIKE ? OR file_path LIKE ? "
+                   "ORDER BY id DESC LIMIT 1", (f'%/{fname}', f'%\\{fname}'))
+    return cursor.fetchone()
+
+
+def indexed_lookup(cursor, file_path):
+    """The query get_provenance_by_file_path now runs, on a shared cursor."""
+    fname, parent = _file_path_key(file_path)
+    cursor.execute("SELECT * FROM track_downloads WHERE file_basename = ? "
+                   "ORDER BY file_parent = ? DESC, id DESC LIMIT 1", (fname, parent or None))
+    return cursor.fetchone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=400000, help="rows in track_downloads (and tracks)")
+    parser.add_argument("--lookups", type=int, default=2000, help="paths to resolve")
+    parser.add_argument("--like-sample", type=int, default=100,
+                        help="time the LIKE path on only this many lookups and extrapolate (0 = all)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="bench-basename-") as tmp:
+        db = MusicDatabase(os.path.join(tmp, "bench.db"))
+        start = time.perf_counter()
+        paths = seed(db, args.rows, rng)
+        logger.info(f"Seeded {args.rows} downloads + {args.rows} tracks in {time.perf_counter() - start:.1f}s "
+                    f"(basename keys generated + indexed on write)")
+        queries = [media_server_path(rng.choice(paths), rng) for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        indexed = [db.get_provenance_by_file_path(q) for q in queries]
+        indexed_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        track_ids = [db.find_track_id_by_file_path(q) for q in queries]
+        tracks_s = time.perf_counter() - start
+
+        sample = queries[:args.like_sample] if args.like_sample else queries
+        conn = db._get_connection()
+        cursor = conn.cursor()
+        start = time.perf_counter()
+        like = [like_lookup(cursor, q) for q in sample]
+        like_s = (time.perf_counter() - start) * len(queries) / len(sample)
+        start = time.perf_counter()
+        for q in queries:
+            indexed_lookup(cursor, q)
+        query_s = time.perf_counter() - start
+
+        # Same basename in another album: the indexed lookup prefers the
+        # matching parent directory, the LIKE took whichever row was newest.
+        parent_ok = sum(1 for q, row in zip(queries, indexed, strict=False)
+                        if row and _file_path_key(row['file_path']) == _file_path_key(q))
+        agree = sum(1 for row, old in zip(indexed, like, strict=False)
+                    if row and old and row['id'] == old['id'])
+        logger.info(f"LIKE scan     : {like_s:8.2f}s{' (extrapolated)' if args.like_sample else ''} "
+                    f"for {len(queries)} provenance lookups")
+        logger.info(f"basename index: {query_s:8.3f}s  "
+                    f"({like_s / query_s if query_s else float('inf'):.0f}x faster, same connection)")
+        # The public methods open a connection per call, which dominates once
+        # the scan is gone.
+        logger.info(f"get_provenance_by_file_path: {indexed_s:8.3f}s; find_track_id_by_file_path: "
+                    f"{tracks_s:8.3f}s ({sum(1 for t in track_ids if t)}/{len(queries)} found)")
+        logger.info(f"right parent dir: {parent_ok}/{len(queries)}; same row as LIKE on {len(sample)}: "
+                    f"{agree}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
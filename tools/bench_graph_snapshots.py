@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark the artist-graph endpoints' data path: loading artists + the
+profile's similar_artists and building the graph per request (the old route
+body) vs the versioned snapshot store — a cache hit, and the refresh after the
+similar-artists worker stores one more artist (incremental input reload +
+rebuild).
+
+The temporary database holds a library and a similar_artists table sized
+like what the Taste Map / Discovery Web load on a large install. Also prints
+the gzip-compressed snapshot size next to the raw JSON payload.
+
+Usage:
+    python tools/bench_graph_snapshots.py                        # 4k artists, 75k similar rows
+    python tools/bench_graph_snapshots.py --artists 1000 --rows 20000 --runs 5
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.graph.artist_graph import build_discovery_map, build_genre_grouped_map  # noqa: E402
+from core.graph.snapshots import DISCOVERY, LIBRARY, GraphSnapshotStore  # noqa: E402
+from database.music_database import MusicDatabase  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_graph_snapshots")
+
+_GENRES = ["rock", "pop", "jazz", "house", "techno", "hip hop", "folk", "metal", "ambient", "soul"]
+
+
+def seed(db, n_artists, n_rows, rng):
+    conn = db._get_connection()
+    conn.executemany(
+        "INSERT INTO artists (id, name, thumb_url, genres, server_source) VALUES (?, ?, ?, ?, 'plex')",
+        [(f"a{i}", f"Artist {i}", f"http://img/{i}", json.dumps(rng.sample(_GENRES, 2))) for i in range(n_artists)])
+    per_source = 25
+    rows = []
+    for i in range(n_rows):
+        src = i // per_source
+        target = rng.randrange(n_artists * 4)      # 3/4 of targets are not in the library
+        rows.append((f"sp{src}", f"Artist {target}", f"sp{target}", rng.randint(1, 5), rng.randint(0, 100),
+                     f"http://img/{target}", json.dumps([rng.choice(_GENRES)])))
+    conn.executemany(
+        "INSERT OR IGNORE INTO similar_artists (source_artist_id, similar_artist_name, similar_artist_spotify_id, "
+        "occurrence_count, popularity, image_url, genres, profile_id) VALUES (?, ?, ?, ?, ?, ?, ?, 1)", rows)
+    conn.commit()
+    conn.close()
+
+
+def per_request(db):
+    """The old route body: load everything, build, serialize."""
+    conn = db._get_connection()
+    try:
+        artists, owned, meta = [], set(), {}
+        for name, thumb, genres, aid, source in conn.execute(
+                "SELECT name, thumb_url, genres, id, server_source FROM artists"):
+            key = (name or "").strip().lower()
+            owned.add(key)
+            meta[key] = {"thumb_url": thumb, "genres": genres, "id": aid}
+            artists.append((name, genres, thumb, aid, source))
+        rows = conn.execute(
+            "SELECT source_artist_id, similar_artist_name, similar_artist_spotify_id, similar_artist_deezer_id, "
+            "similar_artist_itunes_id, occurrence_count, popularity, image_url, genres "
+            "FROM similar_artists WHERE profile_id = 1").fetchall()
+    finally:
+        conn.close()
+    library = json.dumps(build_genre_grouped_map(artists, [r[:7] for r in rows], owned, artist_meta=meta))
+    discovery = json.dumps(build_discovery_map(rows, owned, meta))
+    return len(library) + len(discovery)
+
+
+def timed(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    return (time.perf_counter() - start) / runs, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artists", type=int, default=4000, help="library artists")
+    parser.add_argument("--rows", type=int, default=75000, help="similar_artists rows")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="bench-graph-") as tmp:
+        db = MusicDatabase(os.path.join(tmp, "bench.db"))
+        seed(db, args.artists, args.rows, rng)
+        store = GraphSnapshotStore(lambda: db)
+
+        old_s, raw_bytes = timed(lambda: per_request(db), args.runs)
+        start = time.perf_counter()
+        lib, disc = store.get(1, LIBRARY), store.get(1, DISCOVERY, (None, None))
+        first_s = time.perf_counter() - start
+        hit_s, _ = timed(lambda: (store.get(1, LIBRARY), store.get(1, DISCOVERY, (None, None))), args.runs * 10)
+
+        refresh = []
+        for n in range(args.runs):
+            db.add_or_update_similar_artist("sp0", f"Bench New {n}", similar_artist_spotify_id=f"spnew{n}")
+            start = time.perf_counter()
+            store._build((1, LIBRARY, ()))
+            store._build((1, DISCOVERY, (None, None)))
+            refresh.append(time.perf_counter() - start)
+        refresh_s = sum(refresh) / len(refresh)
+
+        gz = len(lib.body) + len(disc.body)
+        logger.info(f"{args.artists} artists, {args.rows} similar rows; payloads {raw_bytes / 1024:.0f} KiB JSON, "
+                    f"{gz / 1024:.0f} KiB gzip ({raw_bytes / gz:.1f}x smaller on the wire)")
+        logger.info(f"per-request load+build     : {old_s * 1000:8.1f} ms (both graphs)")
+        logger.info(f"first snapshot build       : {first_s * 1000:8.1f} ms (full load, once)")
+        logger.info(f"snapshot hit               : {hit_s * 1000:8.2f} ms (version check only)")
+        logger.info(f"refresh after 1 new row    : {refresh_s * 1000:8.1f} ms (1 source reloaded, background)")
+        logger.info(f"store stats: {store.stats}")
+        assert json.loads(gzip.decompress(lib.body))["counts"]["artists"] == args.artists
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark history search: the old ``LIKE '%q%'`` scans vs the FTS5 indexes on
+the chat archive, notification history and download history tables.
+
+Chat messages and download history rows are generated into a temporary
+database. Each search-box query runs through MusicDatabase both ways (the
+LIKE path is what the search methods fall back to without the index). Hit
+counts can differ slightly: FTS5 matches word prefixes, LIKE matches any
+substring.
+
+Usage:
+    python tools/bench_history_search.py                         # 200k chat, 100k downloads
+    python tools/bench_history_search.py --chat 50000 --downloads 20000 --runs 50
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.music_database import MusicDatabase  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_history_search")
+
+_COMMON = ("flac mp3 album single remaster deluxe live vinyl rip share queue slow peer anyone looking "
+           "for the new release tonight bitrate lossless edition bonus").split()
+
+
+def seed(db, n_chat, n_downloads, rng):
+    # A few very common words plus a long tail, like real chat / filenames.
+    tail = [f"w{i}x" for i in range(20000)]
+    weights = [1.0 / (rank + 1) for rank in range(len(tail))]
+
+    def sentence(n):
+        words = rng.choices(tail, weights, k=n)
+        return ' '.join(rng.choice(_COMMON) if rng.random() < 0.5 else w for w in words)
+
+    conn = db._get_connection()
+    conn.executemany(
+        "INSERT INTO chat_room_messages (room, username, message, timestamp) VALUES ('SoulSync', ?, ?, ?)",
+        [(f"user{rng.randrange(500)}", f"{sentence(rng.randint(4, 14))} #{i}", f"2026-01-01 {i:09d}")
+         for i in range(n_chat)])
+    conn.executemany(
+        "INSERT INTO track_downloads (file_path, source_service, source_filename, track_title, track_artist, "
+        "track_album) VALUES (?, 'soulseek', ?, ?, ?, ?)",
+        [(f"/music/{i}.flac", f"{i:05d} {sentence(3)}.flac", sentence(3), f"Artist {rng.randrange(3000)}",
+          sentence(2)) for i in range(n_downloads)])
+    conn.commit()
+    conn.close()
+
+
+def timed(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    return (time.perf_counter() - start) / runs, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chat", type=int, default=200000, help="chat archive rows")
+    parser.add_argument("--downloads", type=int, default=100000, help="track_downloads rows")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="bench-history-search-") as tmp:
+        db = MusicDatabase(os.path.join(tmp, "bench.db"))
+        seed(db, args.chat, args.downloads, rng)
+
+        cases = (("chat common 'lossl'", lambda: db.search_chat_messages("SoulSync", "lossl")),
+                 ("chat tail 'w1234x'", lambda: db.search_chat_messages("SoulSync", "w1234x")),
+                 ("chat no hit 'zzz'", lambda: db.search_chat_messages("SoulSync", "zzz")),
+                 ("downloads 'artist 1234'", lambda: db.search_track_downloads("artist 1234")),
+                 ("downloads no hit 'zzz'", lambda: db.search_track_downloads("zzz")))
+        for label, fn in cases:
+            fts_s, fts_rows = timed(fn, args.runs)
+            # No MATCH expression -> the search takes the LIKE path.
+            db._fts_match_expression = lambda query: None
+            like_s, like_rows = timed(fn, args.runs)
+            del db._fts_match_expression
+            logger.info(f"{label:24}: LIKE scan {like_s * 1000:8.1f} ms | FTS5 {fts_s * 1000:6.2f} ms "
+                        f"({like_s / fts_s if fts_s else float('inf'):.0f}x); {len(fts_rows)} vs {len(like_rows)} "
+                        "hits (word-prefix vs substring)")
+
+
+if __name__ == "__main__":
+    main()
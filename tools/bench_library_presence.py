@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark library-presence checks: per-track check_track_exists vs the bulk
+check_tracks_exist resolver.
+
+The playlist is built against a synthetic library in a temporary database:
+most of its tracks are owned, with the usual title / artist spelling drift,
+and the rest are missing. Both paths answer the same queries, and the report
+says how often the bulk answer matches the per-track one.
+
+Usage:
+    python tools/bench_library_presence.py                       # 20k-track library, 3,000 queries
+    python tools/bench_library_presence.py --library 100000 --queries 3000 --owned 0.8
+    python tools/bench_library_presence.py --per-track-sample 300   # time only a slice of the slow path
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.music_database import MusicDatabase  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_library_presence")
+
+_WORDS = ("love night fire heart dream light rain city summer wild blue gold shadow river "
+          "ghost electric midnight paper silver echo storm ocean glass neon velvet").split()
+
+
+def _title(rng):
+    return " ".join(rng.choice(_WORDS).capitalize() for _ in range(rng.randint(1, 4)))
+
+
+def seed_library(db, n_tracks, rng, tracks_per_artist=40):
+    conn = db._get_connection()
+    artists, albums, tracks = [], [], []
+    n_artists = max(1, n_tracks // tracks_per_artist)
+    for a in range(n_artists):
+        artists.append((f"ar{a}", f"Artist {a} {rng.choice(_WORDS).title()}", "plex"))
+        for b in range(4):
+            albums.append((f"al{a}-{b}", f"ar{a}", f"{_title(rng)} LP", "plex"))
+    for t in range(n_tracks):
+        a = t % n_artists
+        tracks.append((f"t{t}", f"al{a}-{t % 4}", f"ar{a}", f"{_title(rng)} {t}",
+                       rng.randint(120, 420) * 1000, "plex"))
+    conn.executemany("INSERT INTO artists (id, name, server_source) VALUES (?, ?, ?)", artists)
+    conn.executemany("INSERT INTO albums (id, artist_id, title, server_source) VALUES (?, ?, ?, ?)", albums)
+    conn.executemany("INSERT INTO tracks (id, album_id, artist_id, title, duration, server_source) "
+                     "VALUES (?, ?, ?, ?, ?, ?)", tracks)
+    conn.commit()
+    artist_names = {a[0]: a[1] for a in artists}
+    conn.close()
+    return [(title, artist_names[artist_id], duration) for _id, _al, artist_id, title, duration, _s in tracks]
+
+
+def build_queries(library, n_queries, owned_ratio, rng):
+    queries = []
+    for i in range(n_queries):
+        if rng.random() < owned_ratio:
+            title, artist, duration = rng.choice(library)
+            drift = rng.random()
+            if drift < 0.2:
+                title = f"{title} - Remastered 2011"
+            elif drift < 0.3:
+                title = title.upper()
+            queries.append((title, artist, None, duration + rng.randint(-1500, 1500)))
+        else:
+            queries.append((f"{_title(rng)} missing {i}", f"Artist {rng.randint(0, 10**6)} Unknown", None, None))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--library", type=int, default=20000, help="tracks in the synthetic library")
+    parser.add_argument("--queries", type=int, default=3000, help="playlist tracks to check")
+    parser.add_argument("--owned", type=float, default=0.7, help="fraction of queries that are owned")
+    parser.add_argument("--per-track-sample", type=int, default=0,
+                        help="time the per-track path on only this many queries and extrapolate (0 = all)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="bench-presence-") as tmp:
+        db = MusicDatabase(os.path.join(tmp, "bench.db"))
+        library = seed_library(db, args.library, rng)
+        queries = build_queries(library, args.queries, args.owned, rng)
+        logger.info(f"Library: {args.library} tracks; playlist: {len(queries)} tracks ({args.owned:.0%} owned)")
+
+        start = time.perf_counter()
+        bulk = db.check_tracks_exist(queries, confidence_threshold=0.7)
+        bulk_s = time.perf_counter() - start
+
+        sample = queries[:args.per_track_sample] if args.per_track_sample else queries
+        start = time.perf_counter()
+        single = [db.check_track_exists(t, a, confidence_threshold=0.7) for t, a, _al, _d in sample]
+        single_s = (time.perf_counter() - start) * len(queries) / len(sample)
+
+        agree = sum(1 for (b, _), (s, _) in zip(bulk, single, strict=False)
+                    if getattr(b, 'id', None) == getattr(s, 'id', None))
+        found = sum(1 for t, _ in bulk if t is not None)
+        logger.info(f"per-track : {single_s:8.2f}s{' (extrapolated)' if args.per_track_sample else ''}")
+        logger.info(f"bulk      : {bulk_s:8.2f}s  ({single_s / bulk_s if bulk_s else float('inf'):.1f}x faster)")
+        logger.info(f"found     : {found}/{len(queries)}; agreement with per-track on {len(sample)}: "
+                    f"{agree}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
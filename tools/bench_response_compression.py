@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark response compression: bytes on the wire and compression cost for the
+web UI's static text assets and a synthetic large JSON API response.
+
+Static assets are compressed once per process (the first request pays the
+"cold" cost, every later one is a cache hit); JSON is compressed per response,
+so its per-request time is what a worker thread spends. Also prints the time
+to move each payload over a slow link, which is roughly how long a gunicorn
+thread is held by that response. Reads the assets under webui/static and
+builds the JSON in memory; nothing is served.
+
+Usage:
+    python tools/bench_response_compression.py
+    python tools/bench_response_compression.py --tracks 20000 --mbit 5 --runs 20
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.datastructures import Accept  # noqa: E402
+
+from core.webui import compression  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_response_compression")
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "webui" / "static"
+
+
+def library_payload(n_tracks, rng):
+    return {"success": True, "tracks": [
+        {"id": i, "title": f"Track {i}", "artist": f"Artist {rng.randrange(2000)}",
+         "album": f"Album {rng.randrange(8000)}", "duration": rng.randrange(90000, 400000),
+         "file_path": f"/music/Artist {i % 2000}/Album {i % 8000}/{i:02d} - Track {i}.flac",
+         "bitrate": rng.choice((320, 1411, 256)), "year": rng.randrange(1960, 2026)}
+        for i in range(n_tracks)]}
+
+
+def timed(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    return (time.perf_counter() - start) / runs, result
+
+
+def report(label, raw, out, seconds, mbit):
+    bytes_per_s = mbit * 1_000_000 / 8
+    logger.info(f"{label:28}: {raw / 1024:9.1f} KB -> {out / 1024:8.1f} KB ({out / raw:5.1%}) | "
+                f"{seconds * 1000:7.2f} ms | wire @ {mbit:g} Mbit/s {raw / bytes_per_s * 1000:7.0f} -> "
+                f"{out / bytes_per_s * 1000:6.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=10000, help="tracks in the synthetic JSON listing")
+    parser.add_argument("--mbit", type=float, default=10.0, help="client link speed for the wire estimate")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logger.info(f"encodings available: {', '.join(compression.available_encodings())}")
+    for encoding in compression.available_encodings():
+        accept = Accept([(encoding, 1)])
+        total_raw = total_out = 0
+        cold = 0.0
+        compression.clear_static_variant_cache()
+        for path in sorted(STATIC_DIR.rglob("*")):
+            if not path.is_file() or path.suffix.lower() not in compression.COMPRESSIBLE_SUFFIXES:
+                continue
+            seconds, found = timed(lambda: compression.static_variant(path, accept), 1)
+            if found is None:
+                continue
+            cold += seconds
+            total_raw += found[3]
+            total_out += len(found[1])
+        warm, _ = timed(lambda: compression.static_variant(STATIC_DIR / "library.js", accept), args.runs)
+        if total_raw:
+            report(f"static assets ({encoding}, cold)", total_raw, total_out, cold, args.mbit)
+            logger.info(f"{'':28}  cached variant lookup {warm * 1000:.3f} ms")
+
+        body = json.dumps(library_payload(args.tracks, random.Random(args.seed))).encode("utf-8")
+        seconds, out = timed(lambda: compression.compress_bytes(body, encoding, "json"), args.runs)
+        report(f"json {args.tracks} tracks ({encoding})", len(body), len(out), seconds, args.mbit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark Tidal HLS segment fetching: sequential vs the sliding-window
+fetcher in TidalDownloadClient._iter_segments_in_order.
+
+Starts a local threaded HTTP server that serves fake segments behind an
+artificial per-request latency (the round trip that dominates real Tidal
+downloads), then pulls the same playlist through the client's segment path
+at each window size and checks the reassembled bytes are identical.
+No Tidal account or network access needed.
+
+Usage:
+    python tools/bench_tidal_segments.py                          # 60 x 256 KiB segments, 80ms latency
+    python tools/bench_tidal_segments.py --segments 120 --latency-ms 150 --windows 1 2 4 8
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.tidal_download_client import TidalDownloadClient  # noqa: E402
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+logger = logging.getLogger("bench_tidal_segments")
+
+
+def _make_handler(segment_bytes, latency_s):
+    class _SegmentHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            index = int(self.path.rsplit("/", 1)[-1])
+            body = index.to_bytes(4, "big") * (segment_bytes // 4)
+            time.sleep(latency_s)
+            self.send_response(200)
+            self.send_header("Content-Type", "video/mp4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return _SegmentHandler
+
+
+def _fetch_all(urls, window):
+    client = TidalDownloadClient.__new__(TidalDownloadClient)
+    client.shutdown_check = None
+    client._engine = None
+    digest = hashlib.sha256()
+    total = 0
+    with patch.object(TidalDownloadClient, "_segment_window", lambda self: window):
+        start = time.perf_counter()
+        for data in client._iter_segments_in_order(urls):
+            digest.update(data)
+            total += len(data)
+        elapsed = time.perf_counter() - start
+    return elapsed, total, digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=60, help="media segments in the playlist")
+    parser.add_argument("--segment-kib", type=int, default=256, help="size of each segment")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="server delay per request")
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="window sizes to compare (1 = sequential)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0),
+                                 _make_handler(args.segment_kib * 1024, args.latency_ms / 1000))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/seg/{i}" for i in range(args.segments)]
+    logger.info(f"{args.segments} segments x {args.segment_kib} KiB, {args.latency_ms:.0f}ms latency")
+
+    try:
+        baseline = None
+        for window in args.windows:
+            elapsed, total, digest = _fetch_all(urls, window)
+            if baseline is None:
+                baseline = (elapsed, digest)
+            same = "ok" if digest == baseline[1] else "MISMATCH"
+            logger.info(f"window {window:>2}: {elapsed:7.2f}s  {total / elapsed / 2**20:7.1f} MiB/s  "
+                        f"{baseline[0] / elapsed:5.1f}x  bytes {same}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
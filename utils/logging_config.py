@@ -1,13 +1,24 @@
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 import re
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 LOGGER_NAMESPACE = "soulsync"
 
+# Bound on records waiting for the listener thread. Sized so a burst of
+# several seconds of debug logging fits; past that records are dropped (and
+# counted) rather than making the caller wait on disk I/O.
+LOG_QUEUE_MAX = 10000
+# Structured records kept in memory for the live log viewer.
+LIVE_LOG_BUFFER_MAX = 2000
+
 class SafeFormatter(logging.Formatter):
     """Formatter that handles Unicode characters safely on Windows"""
     
@@ -51,14 +62,222 @@ class ColoredFormatter(SafeFormatter):
         record.levelname = f"{log_color}{record.levelname}{reset_color}"
         return super().format(record)
 
+def _level_bucket(levelno: int) -> str:
+    """Collapse a numeric level onto the four buckets the log viewer filters by."""
+    if levelno >= logging.ERROR:
+        return 'ERROR'
+    if levelno >= logging.WARNING:
+        return 'WARNING'
+    if levelno >= logging.INFO:
+        return 'INFO'
+    return 'DEBUG'
+
+
+class LiveLogBuffer:
+    """Bounded ring of structured log records for the live log viewer.
+
+    Every record gets a monotonically increasing ``seq`` so consumers can poll
+    with a cursor (``since(seq)``) instead of re-reading the log file. Old
+    records fall off the front once ``maxlen`` is reached.
+    """
+
+    def __init__(self, maxlen: int = LIVE_LOG_BUFFER_MAX):
+        self._records = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def append(self, source: str, record: logging.LogRecord, line: str) -> None:
+        with self._lock:
+            self._seq += 1
+            self._records.append({
+                'seq': self._seq,
+                'ts': record.created,
+                'source': source,
+                'level': _level_bucket(record.levelno),
+                'logger': record.name,
+                'message': record.getMessage(),
+                'line': line,
+            })
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            return self._seq
+
+    def since(self, seq: int = 0, source: Optional[str] = None, level: Optional[str] = None,
+              module: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Records newer than ``seq``, oldest first.
+
+        ``level`` matches the viewer's buckets exactly (``ERROR`` includes
+        ``CRITICAL``); ``module`` matches a logger-name prefix with or without
+        the ``soulsync.`` namespace. ``limit`` keeps the newest N.
+        """
+        return self.poll(seq, source=source, level=level, module=module, limit=limit)[0]
+
+    def poll(self, seq: int = 0, source: Optional[str] = None, level: Optional[str] = None,
+             module: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """:meth:`since` plus the cursor for the next call: the newest seq
+        scanned, taken under the same lock as the records. A pusher that
+        reads ``last_seq`` separately skips whatever lands in between."""
+        level = (level or '').upper() or None
+        if module and not module.startswith(LOGGER_NAMESPACE + '.') and module != LOGGER_NAMESPACE:
+            module = f"{LOGGER_NAMESPACE}.{module}"
+        with self._lock:
+            records = [r for r in self._records if r['seq'] > seq]
+            cursor = max(seq, self._seq)
+        out = []
+        for r in records:
+            if source and r['source'] != source:
+                continue
+            if level and r['level'] != level:
+                continue
+            if module and not (r['logger'] == module or r['logger'].startswith(module + '.')):
+                continue
+            out.append(r)
+        if limit is not None:
+            out = out[-limit:] if limit > 0 else []
+        return out, cursor
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+live_log_buffer = LiveLogBuffer()
+
+
+class LiveLogHandler(logging.Handler):
+    """Handler that appends formatted records to the in-memory live log buffer."""
+
+    def __init__(self, source: str = 'app', buffer: Optional[LiveLogBuffer] = None):
+        super().__init__()
+        self.source = source
+        self.buffer = buffer or live_log_buffer
+
+    def emit(self, record):
+        try:
+            self.buffer.append(self.source, record, self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+class _LogStats:
+    """Per-source counters for the queued logging pipeline."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._enqueued: Dict[str, int] = {}
+        self._dropped: Dict[str, int] = {}
+
+    def record(self, source: str, dropped: bool) -> None:
+        bucket = self._dropped if dropped else self._enqueued
+        with self._lock:
+            bucket[source] = bucket.get(source, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            sources = set(self._enqueued) | set(self._dropped)
+            return {
+                src: {'enqueued': self._enqueued.get(src, 0), 'dropped': self._dropped.get(src, 0)}
+                for src in sorted(sources)
+            }
+
+
+_log_stats = _LogStats()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks the caller.
+
+    When the bounded queue is full the record is dropped and counted under
+    its source instead of waiting for the listener to catch up.
+    """
+
+    def __init__(self, log_queue: queue.Queue, source: str = 'app'):
+        super().__init__(log_queue)
+        self.source = source
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _log_stats.record(self.source, dropped=True)
+            return
+        _log_stats.record(self.source, dropped=False)
+
+
+# logger name -> running QueueListener, so re-configuring a logger stops the
+# previous listener thread instead of leaking it.
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def install_queued_handlers(logger: logging.Logger, handlers: List[logging.Handler],
+                            source: str = 'app', live_formatter: Optional[logging.Formatter] = None,
+                            queue_size: int = LOG_QUEUE_MAX) -> logging.handlers.QueueListener:
+    """Route ``logger`` through a non-blocking queue to ``handlers``.
+
+    The sink handlers (console, rotating file, ...) run on a single listener
+    thread; the logger itself only gets a ``DroppingQueueHandler``. A
+    ``LiveLogHandler`` tagged with ``source`` is always added so the live log
+    viewer reads from memory instead of tailing the file.
+    """
+    live_handler = LiveLogHandler(source)
+    live_handler.setFormatter(live_formatter or (handlers[-1].formatter if handlers else None))
+    # The live handler runs first: ColoredFormatter rewrites levelname in place.
+    sinks = [live_handler, *handlers]
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    listener = logging.handlers.QueueListener(log_queue, *sinks, respect_handler_level=True)
+
+    with _listeners_lock:
+        previous = _listeners.pop(logger.name, None)
+        if previous is not None:
+            try:
+                previous.stop()
+            except Exception:
+                pass
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(DroppingQueueHandler(log_queue, source))
+        listener.start()
+        _listeners[logger.name] = listener
+    return listener
+
+
+def get_logging_stats() -> Dict:
+    """Queue depth and enqueued/dropped counters for every queued logger."""
+    with _listeners_lock:
+        depths = {name: listener.queue.qsize() for name, listener in _listeners.items()}
+    return {
+        'sources': _log_stats.snapshot(),
+        'queue_depth': depths,
+        'live_buffer_seq': live_log_buffer.last_seq,
+    }
+
+
+def stop_logging() -> None:
+    """Flush and stop every queue listener (registered at exit)."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+atexit.register(stop_logging)
+
+
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     log_level = getattr(logging, level.upper(), logging.INFO)
     
     logger = logging.getLogger(LOGGER_NAMESPACE)
     logger.setLevel(log_level)
     
-    if logger.handlers:
-        logger.handlers.clear()
+    sinks = []
     
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
@@ -71,7 +290,7 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> loggin
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    sinks.append(console_handler)
     
     if log_file:
         log_path = Path(log_file)
@@ -87,7 +306,12 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> loggin
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        sinks.append(file_handler)
+    
+    install_queued_handlers(logger, sinks, source='app', live_formatter=SafeFormatter(
+        fmt='%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
     
     logger.info(f"Logging initialized with level: {level}")
     return logger
@@ -104,9 +328,14 @@ def set_log_level(level: str) -> bool:
         root_logger = logging.getLogger(LOGGER_NAMESPACE)
         root_logger.setLevel(log_level)
 
-        # Update all handlers
+        # Update all handlers, including the sinks behind the queue listener
         for handler in root_logger.handlers:
             handler.setLevel(log_level)
+        with _listeners_lock:
+            listener = _listeners.get(LOGGER_NAMESPACE)
+        if listener is not None:
+            for handler in listener.handlers:
+                handler.setLevel(log_level)
 
         root_logger.info(f"Log level changed to: {level.upper()}")
         return True
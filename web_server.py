@@ -15,6 +15,7 @@ import sqlite3
 import types
 import collections
 import functools
+import mimetypes
 from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
@@ -27,7 +28,8 @@ from core.webui.mimetypes_fix import corrected_script_content_type, ensure_web_m
 ensure_web_mimetypes()
 from flask import Flask, abort, render_template, request, jsonify, redirect, send_file, send_from_directory, Response, session, g
 from flask_socketio import SocketIO, emit, join_room, leave_room
-from utils.logging_config import get_logger, setup_logging
+from werkzeug.utils import safe_join
+from utils.logging_config import get_logger, setup_logging, install_queued_handlers, live_log_buffer, get_logging_stats
 from utils.async_helpers import run_async
 from mutagen.flac import FLAC
 from mutagen.mp4 import MP4
@@ -74,7 +76,7 @@ if not source_reuse_logger.handlers:
         _log_dir / "source_reuse.log", encoding="utf-8", maxBytes=5*1024*1024, backupCount=2
     )
     _sr_handler.setFormatter(_logging.Formatter("%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
-    source_reuse_logger.addHandler(_sr_handler)
+    install_queued_handlers(source_reuse_logger, [_sr_handler], source='source_reuse')
     source_reuse_logger.propagate = False
 
 # Dedicated post-processing logger (failures only) — writes alongside app.log in the configured log directory
@@ -85,7 +87,7 @@ if not pp_logger.handlers:
         _log_dir / "post_processing.log", encoding="utf-8", maxBytes=5*1024*1024, backupCount=2
     )
     _pp_handler.setFormatter(_logging.Formatter("%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
-    pp_logger.addHandler(_pp_handler)
+    install_queued_handlers(pp_logger, [_pp_handler], source='post_processing')
     pp_logger.propagate = False
 from core.api_validation import parse_strict_bool, parse_strict_id, parse_strict_int
 from core.spotify_client import SpotifyClient, Playlist as SpotifyPlaylist, Track as SpotifyTrack, _is_globally_rate_limited as _spotify_rate_limited, SPOTIFY_OAUTH_SCOPE
@@ -105,6 +107,18 @@ from core.metadata import registry as metadata_registry
 from core.metadata import is_internal_image_host
 from core.metadata import normalize_image_url as fix_artist_image_url
 from core.webui import build_webui_vite_assets, should_serve_webui_spa
+from core.webui.compression import (
+    COMPRESSIBLE_SUFFIXES as _COMPRESSIBLE_STATIC,
+    IMMUTABLE_CACHE_CONTROL,
+    compress_json_response,
+    compression_stats,
+    is_content_hashed_asset,
+    record_transfer as record_compressed_transfer,
+    reset_compression_stats,
+    static_content_hash,
+    static_tree_version,
+    static_variant,
+)
 from core.metadata.registry import (
     clear_cached_metadata_client,
     get_metadata_source_label,
@@ -231,23 +245,17 @@ if not hasattr(MusicDatabase, 'get_system_automation_by_action'):
         "Then run: docker compose down && docker compose up -d"
     )
 from datetime import datetime, timezone
-import yt_dlp
-from beatport_unified_scraper import BeatportUnifiedScraper
-from core.musicbrainz_worker import MusicBrainzWorker
-from core.audiodb_worker import AudioDBWorker
-from core.discogs_worker import DiscogsWorker
-from core.deezer_worker import DeezerWorker
-from core.jiosaavn_worker import JioSaavnWorker
-from core.spotify_worker import SpotifyWorker
-from core.itunes_worker import iTunesWorker
-from core.lastfm_worker import LastFMWorker
-from core.genius_worker import GeniusWorker
-from core.bandcamp_worker import BandcampWorker
-from core.tidal_worker import TidalWorker
-from core.qobuz_worker import QobuzWorker
-from core.hydrabase_worker import HydrabaseWorker
-from core.amazon_worker import AmazonWorker
-from core.hydrabase_client import HydrabaseClient
+# Enrichment workers, Hydrabase, yt_dlp and the Beatport scraper are imported
+# on first use (see _services below / _beatport_scraper) — not at module import.
+from core.service_registry import get_service_registry
+_services = get_service_registry()
+
+
+def _beatport_scraper():
+    from beatport_unified_scraper import BeatportUnifiedScraper
+    return BeatportUnifiedScraper()
+
+
 from core.automation_engine import AutomationEngine
 
 # --- Flask App Setup ---
@@ -297,10 +305,10 @@ app.config['TEMPLATES_AUTO_RELOAD'] = DEV_STATIC_NO_CACHE
 app.jinja_env.auto_reload = DEV_STATIC_NO_CACHE
 # Static assets (library.js / style.css / etc.) get aggressive browser
 # caching (1 year). Safe because every static URL is bust-tagged with
-# `?v=static_v` (computed once per process start — see below) so each
-# server restart effectively invalidates every cached asset for every
-# user. Within a single deploy, repeat page loads hit zero round-trips
-# on static files — was a 304 round-trip per asset under the old
+# `?v=static_v` (a hash of the static tree's contents — see below) so
+# any changed asset invalidates every cached asset for every user.
+# Within a single deploy, repeat page loads hit zero round-trips on
+# static files — was a 304 round-trip per asset under the old
 # max-age=0 setting.
 #
 # In dev, DEV_STATIC_NO_CACHE flips this back to 0 so iterating on JS
@@ -308,14 +316,20 @@ app.jinja_env.auto_reload = DEV_STATIC_NO_CACHE
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0 if DEV_STATIC_NO_CACHE else 31536000
 
 
-# Cache-bust query string for static assets. Computed once per process
-# start so each server restart invalidates the browser's cached copy of
-# every JS/CSS file. This is the surefire fix for "user has stale JS
-# even after Ctrl+Shift+R" — the URL itself changes, so the browser
-# cannot reuse a previously-cached response no matter what its
-# Cache-Control header said.
-import time as _cache_bust_time
-_STATIC_CACHE_BUST = str(int(_cache_bust_time.time()))
+# Cache-bust query string for static assets: a hash of the static tree's
+# contents, computed once per process start, so a deploy that changes any
+# asset invalidates the browser's cached copy of every JS/CSS file. This
+# is the surefire fix for "user has stale JS even after Ctrl+Shift+R" —
+# the URL itself changes, so the browser cannot reuse a previously-cached
+# response no matter what its Cache-Control header said. Keyed by content
+# (not the start time), restarts without changes keep those caches warm
+# and URLs carrying the current version are served as immutable.
+try:
+    _STATIC_CACHE_BUST = static_tree_version(Path(app.static_folder))
+except Exception as _cache_bust_err:
+    import time as _cache_bust_time
+    logger.warning(f"Static cache-bust hash failed, using start time: {_cache_bust_err}")
+    _STATIC_CACHE_BUST = str(int(_cache_bust_time.time()))
 
 def _valid_hex_color(value, fallback='#1db954'):
     value = str(value or '').strip()
@@ -504,6 +518,37 @@ _get_video_repair().start()
 _plex_pin_requests = {}
 _plex_pin_requests_lock = threading.Lock()
 
+# --- Per-route latency histograms (core/diagnostics/route_metrics) ---
+# Registered ahead of the auth gates so requests they reject are counted too;
+# teardown_request closes the in-flight gauge even when the view raised.
+from core.diagnostics import route_metrics as _route_metrics
+
+
+@app.before_request
+def _route_metrics_begin():
+    rule = request.url_rule.rule if request.url_rule is not None else None
+    g.route_metrics_key = _route_metrics.route_key(request.method, rule)
+    g.route_metrics_started = _route_metrics.begin(g.route_metrics_key)
+
+
+@app.after_request
+def _route_metrics_status(response):
+    g.route_metrics_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def _route_metrics_end(exc):
+    key = g.get('route_metrics_key')
+    if key is None:
+        return
+    status = g.get('route_metrics_status') or 500
+    try:
+        _route_metrics.end(key, g.route_metrics_started, 500 if exc is not None else status)
+    except Exception as e:
+        logger.debug("route metrics record failed: %s", e)
+
+
 @app.before_request
 def _log_rejected_socketio_origin():
     """Hook the WS upgrade path so users see a clear log line when their
@@ -704,6 +749,19 @@ def _force_module_script_mimetype(response):
     return response
 
 
+@app.after_request
+def _compress_json_response(response):
+    """gzip/brotli JSON responses over ~1.4 KB when the client accepts it
+    (core/webui/compression.py) — library listings, discovery pools and the like
+    otherwise hold a gunicorn thread for their full-size transfer. Already-encoded
+    responses (the pre-gzipped graph snapshots) pass through untouched."""
+    try:
+        return compress_json_response(response, request.accept_encodings)
+    except Exception as e:
+        logger.debug("json response compression failed: %s", e)
+    return response
+
+
 @app.after_request
 def _add_discover_cache_headers(response):
     """Browser-cache discover GETs for 5 minutes.
@@ -1078,15 +1136,21 @@ except Exception as e:
 
 # Inject shutdown check callback into every download source that
 # accepts one. Generic dispatch via the registry — no per-source
-# attribute reaches needed.
+# attribute reaches needed. Sources the registry defers (yt-dlp backed
+# ones outside the configured download mode) get it when first built.
+def _install_download_shutdown_check(_src_name, _src_client):
+    if _src_client is not None and hasattr(_src_client, 'set_shutdown_check'):
+        try:
+            _src_client.set_shutdown_check(lambda: IS_SHUTTING_DOWN)
+            logger.info("  Configured %s client shutdown callback", _src_name)
+        except Exception as _exc:
+            logger.warning("  %s set_shutdown_check failed: %s", _src_name, _exc)
+
+
 if download_orchestrator and hasattr(download_orchestrator, 'registry'):
     for _src_name, _src_client in download_orchestrator.registry.all_plugins():
-        if _src_client is not None and hasattr(_src_client, 'set_shutdown_check'):
-            try:
-                _src_client.set_shutdown_check(lambda: IS_SHUTTING_DOWN)
-                logger.info("  Configured %s client shutdown callback", _src_name)
-            except Exception as _exc:
-                logger.warning("  %s set_shutdown_check failed: %s", _src_name, _exc)
+        _install_download_shutdown_check(_src_name, _src_client)
+    download_orchestrator.registry.on_built(_install_download_shutdown_check)
 
 # Initialize web scan manager for automatic post-download scanning
 try:
@@ -1586,6 +1650,64 @@ def _mark_task_completed(task_id, track_info=None):
 
 # --- Shared Transfer Data Cache ---
 # Cache transfer data to avoid hammering the Soulseek API with multiple concurrent modals
+from core.downloads import transfer_tracker as _transfer_tracker_module
+
+
+def _fetch_slskd_transfers():
+    """Raw slskd ``transfers/downloads`` tree, or [] when Soulseek isn't in use.
+
+    Raises when Soulseek is in use but slskd can't be asked, so the tracker
+    keeps its previous view instead of reporting every transfer gone.
+    """
+    _dl_mode = config_manager.get('download_source.mode', 'hybrid')
+    _hybrid_order = config_manager.get('download_source.hybrid_order', ['hifi', 'youtube', 'soulseek'])
+    _slsk_active = (_dl_mode == 'soulseek' or
+                   (_dl_mode == 'hybrid' and 'soulseek' in _hybrid_order))
+    if not _slsk_active:
+        return []
+    _slsk = download_orchestrator.client("soulseek") if download_orchestrator else None
+    if not _slsk or not _slsk.base_url:
+        return []
+    if not _status_cache.get('soulseek', {}).get('connected', True):
+        raise ConnectionError("slskd is disconnected")
+    transfers = run_async(download_orchestrator._make_request('GET', 'transfers/downloads'))
+    if transfers is None:
+        raise ConnectionError("slskd transfers request failed")
+    return transfers
+
+
+def _transfer_batch_index():
+    with tasks_lock:
+        return {
+            _make_context_key(task.get('username'), task.get('filename')): task.get('batch_id')
+            for task in download_tasks.values()
+            if task.get('username') and task.get('filename') and task.get('batch_id')
+        }
+
+
+def _unresolved_transfer_keys():
+    """Transfers a download task is still waiting on — kept in the tracker
+    past the retain window so the monitor never loses sight of them."""
+    with tasks_lock:
+        return {
+            _make_context_key(task.get('username'), task.get('filename'))
+            for task in download_tasks.values()
+            if task.get('username') and task.get('filename')
+            and task.get('status') in ('pending', 'queued', 'searching', 'downloading', 'post_processing')
+        }
+
+
+_transfer_tracker_cfg = config_manager.get('soulseek.transfer_tracker', {}) or {}
+_transfer_tracker = _transfer_tracker_module.TransferTracker(
+    _fetch_slskd_transfers, _make_context_key,
+    poll_interval=float(_transfer_tracker_cfg.get('poll_interval_seconds', 1.0) or 1.0),
+    retain_finished=float(_transfer_tracker_cfg.get('retain_finished_seconds', 600) or 600),
+    batch_index=_transfer_batch_index,
+    pinned=_unresolved_transfer_keys,
+    idle_interval=float(_transfer_tracker_cfg.get('idle_poll_interval_seconds', 15.0) or 15.0),
+)
+_transfer_tracker_module.set_transfer_tracker(_transfer_tracker)
+
 
 def get_cached_transfer_data():
     """
@@ -1602,35 +1724,14 @@ def get_cached_transfer_data():
         # Cache expired or empty, fetch new data
         live_transfers_lookup = {}
         try:
-            # Skip Soulseek API call if not active or known disconnected
-            _dl_mode = config_manager.get('download_source.mode', 'hybrid')
-            _hybrid_order = config_manager.get('download_source.hybrid_order', ['hifi', 'youtube', 'soulseek'])
-            _slsk_active = (_dl_mode == 'soulseek' or
-                           (_dl_mode == 'hybrid' and 'soulseek' in _hybrid_order))
-            soulseek_known_down = not _slsk_active or not _status_cache.get('soulseek', {}).get('connected', True)
-
-            # First, get Soulseek downloads from API
-            transfers_data = None
-            _slsk = download_orchestrator.client("soulseek") if download_orchestrator else None
-            if not soulseek_known_down and _slsk and _slsk.base_url:
-                transfers_data = run_async(download_orchestrator._make_request('GET', 'transfers/downloads'))
-            if transfers_data:
-                all_transfers = []
-                for user_data in transfers_data:
-                    username = user_data.get('username', 'Unknown')
-                    if 'directories' in user_data:
-                        for directory in user_data['directories']:
-                            if 'files' in directory:
-                                for file_info in directory['files']:
-                                    file_info['username'] = username
-                                    all_transfers.append(file_info)
-                for transfer in all_transfers:
-                    key = _make_context_key(transfer.get('username'), transfer.get('filename', ''))
-                    live_transfers_lookup[key] = transfer
+            # Soulseek transfers come from the shared tracker, which polls
+            # slskd once per interval for every consumer and only rebuilds
+            # entries that changed.
+            live_transfers_lookup.update(_transfer_tracker.get_lookup())
 
             # Also add non-Soulseek downloads. Soulseek is excluded
-            # because slskd's transfers endpoint was already pulled
-            # above — without the exclude both fetch paths run.
+            # because the tracker already covers slskd's transfers —
+            # without the exclude both fetch paths run.
             # Every streaming source must appear here — task progress
             # for in-flight downloads comes from this lookup. Missing a
             # source = task.progress stays at 0 even when the
@@ -2042,6 +2143,11 @@ def _shutdown_runtime_components():
     _download_monitor_module.IS_SHUTTING_DOWN = True
     _cancel_batch_healing_timer()
 
+    # Final journal flush before executors are torn down and in-flight tasks
+    # get marked failed — the next start should resume them, not mourn them.
+    _stop_download_journal()
+    _transfer_tracker.stop()
+
     cleanup_monitor()
 
     _stop_component(web_scan_manager, "web scan manager")
@@ -2475,6 +2581,49 @@ def service_worker():
     return response
 
 
+def _serve_static_asset(filename):
+    """Flask's /static/<filename> view, plus compression and content-hash caching.
+
+    Text assets go out gzip/brotli-compressed when the client accepts it — compressed
+    once per file content and kept in memory (core/webui/compression.py) — with the
+    content hash as ETag. Vite's hashed bundle files, and any asset requested with the
+    current `?v=static_v`, are marked immutable: their URL changes when they do, so
+    browsers skip even the revalidation on reload.
+    """
+    path = safe_join(app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    max_age = app.get_send_file_max_age(filename)
+    compressible = os.path.splitext(filename)[1].lower() in _COMPRESSIBLE_STATIC
+    variant = static_variant(path, request.accept_encodings) if compressible and not request.range else None
+    if variant is not None:
+        encoding, body, content_hash, size = variant
+        response = Response(body, mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(f"{content_hash}-{encoding}")
+        response.last_modified = int(os.path.getmtime(path))
+        if max_age:
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+        else:
+            response.cache_control.no_cache = True
+        response.make_conditional(request)
+        if response.status_code == 200:
+            record_compressed_transfer('static', size, len(body))
+    else:
+        content_hash = static_content_hash(path) if compressible else None
+        response = send_from_directory(app.static_folder, filename, max_age=max_age, etag=content_hash or True)
+    if compressible:
+        response.vary.add('Accept-Encoding')
+    if not DEV_STATIC_NO_CACHE and (is_content_hashed_asset(filename)
+                                    or request.args.get('v') == _STATIC_CACHE_BUST):
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+app.view_functions['static'] = _serve_static_asset
+
+
 @app.route('/<path:page>')
 def spa_catch_all(page):
     # Serve index.html for client-side routes; let Flask handle real routes first.
@@ -3146,19 +3295,13 @@ def _build_system_stats():
 
     if soulseek_active and not soulseek_known_down:
         try:
-            transfers_data = run_async(download_orchestrator._make_request('GET', 'transfers/downloads'))
-            if transfers_data:
-                for user_data in transfers_data:
-                    if 'directories' in user_data:
-                        for directory in user_data['directories']:
-                            if 'files' in directory:
-                                for file_info in directory['files']:
-                                    state = file_info.get('state', '').lower()
-                                    # Only count actively downloading files
-                                    if 'inprogress' in state or 'downloading' in state or 'transferring' in state:
-                                        speed = file_info.get('averageSpeed', 0)
-                                        if isinstance(speed, (int, float)) and speed > 0:
-                                            total_download_speed += float(speed)
+            for file_info in _transfer_tracker.get_lookup().values():
+                state = file_info.get('state', '').lower()
+                # Only count actively downloading files
+                if 'inprogress' in state or 'downloading' in state or 'transferring' in state:
+                    speed = file_info.get('averageSpeed', 0)
+                    if isinstance(speed, (int, float)) and speed > 0:
+                        total_download_speed += float(speed)
         except Exception as e:
             logger.error(f"Could not fetch download speeds: {e}")
 
@@ -3329,6 +3472,147 @@ def debug_memory_stop():
         return jsonify({'error': str(e)}), 500
 
 
+# ── SQL statement profiler ──
+# Opt-in like the memory tracker: while on, every connection MusicDatabase /
+# VideoDatabase open is instrumented (per-fingerprint latency table + slow
+# statements logged with EXPLAIN QUERY PLAN). database.sql_profiler.enabled
+# turns it on at startup; these endpoints drive it at runtime. They're
+# admin-only: they switch instrumentation on for every connection and the
+# report carries statement text and query plans.
+
+from core.diagnostics import sql_profiler as _sql_profiler
+
+if config_manager.get('database.sql_profiler.enabled', False):
+    _sql_profiler.enable(slow_ms=config_manager.get('database.sql_profiler.slow_ms', 100),
+                         explain=config_manager.get('database.sql_profiler.explain', True))
+
+
+@app.route('/api/debug/sql/start')
+@admin_only
+def debug_sql_start():
+    try:
+        slow_ms = request.args.get('slow_ms', type=float)
+        if slow_ms is None:
+            slow_ms = config_manager.get('database.sql_profiler.slow_ms', 100)
+        return jsonify(_sql_profiler.enable(slow_ms=slow_ms))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/debug/sql/report')
+@admin_only
+def debug_sql_report():
+    try:
+        top = request.args.get('top', 50, type=int)
+        return jsonify(_sql_profiler.report(
+            top=max(1, min(top, 500)),
+            order=request.args.get('order', 'total'),
+            db=request.args.get('db') or None,
+        ))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/debug/sql/reset')
+@admin_only
+def debug_sql_reset():
+    try:
+        return jsonify(_sql_profiler.reset())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/debug/sql/stop')
+@admin_only
+def debug_sql_stop():
+    try:
+        return jsonify(_sql_profiler.disable())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# ── Route latency + CPU sampling ──
+# /api/debug/routes is the always-on per-route histogram table. The stack
+# sampler walks every thread's frames for N seconds and returns collapsed
+# stacks (flamegraph.pl / speedscope input); it's admin-only since it blocks
+# a request thread for the whole window and exposes code paths.
+
+@app.route('/api/debug/routes')
+def debug_route_metrics():
+    try:
+        top = request.args.get('top', 50, type=int)
+        return jsonify(_route_metrics.snapshot(
+            top=max(1, min(top, 500)),
+            order=request.args.get('order', 'total'),
+            prefix=request.args.get('prefix') or None,
+        ))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/debug/routes/reset')
+@admin_only
+def debug_route_metrics_reset():
+    try:
+        return jsonify(_route_metrics.reset())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# ── Response compression ──
+# Bytes saved by gzip/brotli on JSON responses and static assets, plus the
+# in-memory static variant cache (core/webui/compression.py). Clearing the
+# counters is admin-only.
+
+@app.route('/api/debug/compression')
+def debug_compression_stats():
+    try:
+        return jsonify(compression_stats())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/debug/compression/reset')
+@admin_only
+def debug_compression_stats_reset():
+    try:
+        return jsonify(reset_compression_stats())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/debug/profile')
+@admin_only
+def debug_stack_profile():
+    """?seconds=10&interval_ms=10&idle=0&format=json|collapsed"""
+    from core.diagnostics import stack_sampler
+    try:
+        duration, interval = stack_sampler.parse_args(
+            request.args.get('seconds', type=float), request.args.get('interval_ms', type=float))
+        result = stack_sampler.sample(
+            duration, interval,
+            include_idle=request.args.get('idle', '0').lower() in ('1', 'true', 'yes'),
+            top=max(1, min(request.args.get('top', 30, type=int), 200)),
+        )
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 409
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    if request.args.get('format') == 'collapsed':
+        return Response(result['collapsed'] + '\n', mimetype='text/plain')
+    return jsonify(result)
+
+
+@app.route('/api/debug/services')
+def debug_services():
+    """Which enrichment workers were built at boot vs deferred, and what each
+    cost to import + construct (ms, RSS growth, modules pulled in)."""
+    try:
+        return jsonify(_services.report())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/debug/memory/objects')
 def debug_memory_objects():
     """One-shot memory breakdown by live object type (plain gc — NO tracemalloc, so it
@@ -3625,6 +3909,8 @@ def handle_settings():
                 genius_worker._init_client()
             if tidal_enrichment_worker:
                 tidal_enrichment_worker.client = tidal_client
+            # Build the workers whose credentials / opt-in were just saved
+            _services.refresh()
             if 'spotify' in new_settings:
                 publish_spotify_status(
                     connected=False,
@@ -3695,6 +3981,7 @@ def handle_dev_mode():
         data = request.get_json()
         if data.get('password') == 'hydratest':
             dev_mode_enabled = True
+            _services.get('hydrabase_worker')
             logger.info("Dev mode activated")
             return jsonify({"success": True, "enabled": True})
         return jsonify({"success": False, "error": "Invalid password"}), 401
@@ -3818,6 +4105,7 @@ def hydrabase_connect():
         config_manager.set('hydrabase.url', url)
         config_manager.set('hydrabase.api_key', api_key)
         config_manager.set('hydrabase.auto_connect', True)
+        _services.get('hydrabase_client')
         logger.info(f"[Hydrabase] Connected to {url}")
         return jsonify({"success": True, "message": "Connected"})
     except Exception as e:
@@ -3985,10 +4273,9 @@ def handle_log_level():
 # LIVE LOG VIEWER API
 # ===========================
 
-# In-memory ring buffer for live log streaming via WebSocket
-_live_log_buffer = []
-_live_log_buffer_lock = threading.Lock()
-_LIVE_LOG_BUFFER_MAX = 500
+# Live log streaming reads from utils.logging_config.live_log_buffer — every
+# queued logger (app, acoustid, post_processing, source_reuse) tees its
+# formatted records into that ring, so the WebSocket push never touches disk.
 
 
 @app.route('/api/logs/tail', methods=['GET'])
@@ -4064,6 +4351,30 @@ def get_log_tail():
         'source': log_source,
         'total': len(result_lines),
         'available_logs': available,
+        'logging_stats': get_logging_stats(),
+    })
+
+
+@app.route('/api/logs/live', methods=['GET'])
+def get_live_log_records():
+    """Return structured records from the in-memory live log buffer.
+
+    Query params: ``since`` (seq cursor), ``source``, ``level``, ``module``
+    (logger-name prefix) and ``limit``. Never reads the log file.
+    """
+    since = request.args.get('since', 0, type=int)
+    limit = max(1, min(request.args.get('limit', 200, type=int), 2000))
+    records, last_seq = live_log_buffer.poll(
+        since,
+        source=request.args.get('source', 'app'),
+        level=request.args.get('level') or None,
+        module=request.args.get('module') or None,
+        limit=limit,
+    )
+    return jsonify({
+        'records': records,
+        'last_seq': last_seq,
+        'stats': get_logging_stats(),
     })
 
 
@@ -5974,6 +6285,7 @@ def tidal_callback():
             tidal_client = TidalClient()
             if tidal_enrichment_worker:
                 tidal_enrichment_worker.client = tidal_client
+            _services.refresh()
             return "<h1>Tidal Authentication Successful!</h1><p>You can now close this window and return to the SoulSync application.</p>"
         else:
             return "<h1>Tidal Authentication Failed</h1><p>Could not exchange authorization code for a token. Please try again.</p>", 400
@@ -6091,7 +6403,7 @@ def get_beatport_hero_tracks():
         logger.info("Cache miss - scraping fresh hero tracks data...")
 
         # Initialize scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get tracks from hero slideshow (increased limit to capture all slides)
         tracks = scraper.scrape_new_on_beatport_hero(limit=15)
@@ -6241,7 +6553,7 @@ def get_beatport_new_releases():
         logger.info("Cache miss - scraping fresh new releases data...")
 
         # Initialize scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get page and extract releases
         soup = scraper.get_page(scraper.base_url)
@@ -6373,7 +6685,7 @@ def get_beatport_featured_charts():
         logger.info("Cache miss - scraping fresh featured charts data...")
 
         # Initialize scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get page and extract charts
         soup = scraper.get_page(scraper.base_url)
@@ -6522,7 +6834,7 @@ def get_beatport_dj_charts():
         logger.info("Cache miss - scraping fresh DJ charts data...")
 
         # Initialize scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get page and extract charts
         soup = scraper.get_page(scraper.base_url)
@@ -10844,6 +11156,22 @@ def set_artist_art(artist_id):
         return jsonify({"error": str(e)}), 500
 
 
+def _graph_snapshot_response(snapshot):
+    """Serve a cached graph snapshot: 304 on a matching ETag, the stored gzip bytes
+    as-is when the client accepts gzip, otherwise the decompressed JSON."""
+    if snapshot.etag in request.if_none_match:
+        resp = Response(status=304)
+    elif request.accept_encodings['gzip']:
+        resp = Response(snapshot.body, mimetype='application/json')
+        resp.headers['Content-Encoding'] = 'gzip'
+    else:
+        resp = Response(snapshot.json_bytes(), mimetype='application/json')
+    resp.set_etag(snapshot.etag)
+    resp.vary.add('Accept-Encoding')
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    return resp
+
+
 @app.route('/api/graph/library', methods=['GET'])
 def get_library_graph():
     """Library "Taste Map": EVERY library artist as a node, grouped by genre + wired by similarity.
@@ -10852,37 +11180,14 @@ def get_library_graph():
     "edges": [{source,target,weight,kind}]}. Every artist is included (attached to a per-genre hub node
     so a force layout clusters them); similarity edges come from similar_artists (resolved in-memory —
     a SQL self-join is too slow at 75k rows).
+
+    Served from a versioned snapshot (core/graph/snapshots.py): rebuilt only when artists /
+    similar_artists change, gzip-compressed once, ETag'd for conditional requests.
     """
     try:
-        from core.graph.artist_graph import build_genre_grouped_map
-        db = get_database()
-        conn = db._get_connection()
-        try:
-            cur = conn.cursor()
-            owned = set()
-            meta = {}
-            artists = []
-            for name, thumb, genres, aid, source in cur.execute(
-                "SELECT name, thumb_url, genres, id, server_source FROM artists"
-            ):
-                key = (name or "").strip().lower()
-                owned.add(key)
-                meta[key] = {"thumb_url": thumb, "genres": genres}
-                artists.append((name, genres, thumb, aid, source))
-            rows = cur.execute(
-                "SELECT source_artist_id, similar_artist_name, similar_artist_spotify_id, "
-                "similar_artist_deezer_id, similar_artist_itunes_id, occurrence_count, popularity "
-                "FROM similar_artists WHERE profile_id = ?", (get_current_profile_id(),)
-            ).fetchall()
-        finally:
-            conn.close()
-        graph = build_genre_grouped_map(artists, rows, owned, artist_meta=meta)
-        n_artists = sum(1 for n in graph["nodes"] if n.get("kind") == "artist")
-        n_genres = sum(1 for n in graph["nodes"] if n.get("kind") == "genre")
-        return jsonify({**graph, "counts": {
-            "nodes": len(graph["nodes"]), "edges": len(graph["edges"]),
-            "artists": n_artists, "genres": n_genres,
-        }})
+        from core.graph.snapshots import LIBRARY, get_snapshot_store
+        snapshot = get_snapshot_store().get(get_current_profile_id(), LIBRARY)
+        return _graph_snapshot_response(snapshot)
     except Exception as e:
         logger.error("[library-graph] failed: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
@@ -10895,10 +11200,11 @@ def get_discovery_graph():
     Candidates are enriched from the metadata cache (image/genres/popularity) so they render as real
     artists you could add, not bare dots. Returns the WHOLE frontier by default — its real size is
     modest (only artists whose similars were fetched can anchor); ``seed``/``per`` query params
-    optionally trim to the top anchors / top candidates per anchor.
+    optionally trim to the top anchors / top candidates per anchor. Snapshot-cached per
+    (profile, seed, per) like /api/graph/library.
     """
     try:
-        from core.graph.artist_graph import build_discovery_map
+        from core.graph.snapshots import DISCOVERY, get_snapshot_store
 
         def _opt_int(name):
             raw = request.args.get(name)
@@ -10912,52 +11218,13 @@ def get_discovery_graph():
 
         seed = _opt_int('seed')
         per = _opt_int('per')
-        db = get_database()
-        conn = db._get_connection()
-        try:
-            cur = conn.cursor()
-            owned, owned_meta, rows = _discovery_load_inputs(cur)
-            graph = build_discovery_map(rows, owned, owned_meta, seed_count=seed, per_anchor=per)
-        finally:
-            conn.close()
-
-        n_owned = sum(1 for n in graph["nodes"] if n.get("kind") == "owned")
-        n_disc = sum(1 for n in graph["nodes"] if n.get("kind") == "discovery")
-        return jsonify({**graph, "counts": {
-            "nodes": len(graph["nodes"]), "edges": len(graph["edges"]),
-            "owned": n_owned, "discovery": n_disc,
-        }})
+        snapshot = get_snapshot_store().get(get_current_profile_id(), DISCOVERY, (seed, per))
+        return _graph_snapshot_response(snapshot)
     except Exception as e:
         logger.error("[discovery-graph] failed: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
-def _discovery_load_inputs(cur):
-    """Shared input load for the discovery routes: owned artists + this profile's similar_artists.
-
-    similar_artists is per-profile (unique on profile_id + source + name); without the filter, a
-    multi-profile install double-counts every anchor->target pair and leaks one profile's discovery
-    taste into another's graph.
-
-    Rows include the table's OWN image_url/genres columns (~99% of rows carry image + real
-    popularity) — enriching from metadata_cache_entities instead measured 18-250s per request
-    (random reads into a 1.3M-row table), for data these rows already have.
-    """
-    owned = set()
-    owned_meta = {}
-    for name, thumb, genres, aid in cur.execute("SELECT name, thumb_url, genres, id FROM artists"):
-        key = (name or "").strip().lower()
-        owned.add(key)
-        owned_meta[key] = {"thumb_url": thumb, "genres": genres, "id": aid}
-    rows = cur.execute(
-        "SELECT source_artist_id, similar_artist_name, similar_artist_spotify_id, "
-        "similar_artist_deezer_id, similar_artist_itunes_id, occurrence_count, popularity, "
-        "image_url, genres "
-        "FROM similar_artists WHERE profile_id = ?", (get_current_profile_id(),)
-    ).fetchall()
-    return owned, owned_meta, rows
-
-
 @app.route('/api/graph/discovery/expand', methods=['POST'])
 def expand_discovery_graph():
     """Expand-on-click for the Discovery Web: one node's similar artists, minus what's on screen.
@@ -10965,9 +11232,13 @@ def expand_discovery_graph():
     POST JSON: ``key`` (normalized artist name), ``ids`` (external ids — for unowned candidates whose
     similars are keyed by id), ``exclude`` (node keys already in the graph — JSON body because artist
     names can contain commas), ``per`` (max new nodes). Same node/edge shape as /api/graph/discovery.
+
+    Inputs come from the snapshot store's per-profile cache (owned artists + this profile's
+    similar_artists rows incl. their own image_url/genres), refreshed incrementally on change.
     """
     try:
         from core.graph.artist_graph import expand_discovery_node
+        from core.graph.snapshots import get_snapshot_store
         payload = request.get_json(silent=True) or {}
         node_key = str(payload.get('key') or '').strip().lower()
         if not node_key:
@@ -10979,14 +11250,8 @@ def expand_discovery_graph():
         except (TypeError, ValueError):
             per = 10
         per = max(1, min(per, 30))
-        db = get_database()
-        conn = db._get_connection()
-        try:
-            cur = conn.cursor()
-            owned, owned_meta, rows = _discovery_load_inputs(cur)
-            graph = expand_discovery_node(rows, owned, node_key, node_ids, owned_meta, per=per, exclude=exclude)
-        finally:
-            conn.close()
+        owned, owned_meta, rows = get_snapshot_store().inputs(get_current_profile_id())
+        graph = expand_discovery_node(rows, owned, node_key, node_ids, owned_meta, per=per, exclude=exclude)
         return jsonify({**graph, "counts": {"nodes": len(graph["nodes"]), "edges": len(graph["edges"])}})
     except Exception as e:
         logger.error("[discovery-expand] failed: %s", e, exc_info=True)
@@ -14053,6 +14318,7 @@ def _get_artist_id_for_entity(database, entity_type, entity_id):
 
 def _run_single_enrichment(service, entity_type, entity_id, name, artist_name):
     """Run a single enrichment service on a single entity."""
+    _services.get(service)  # builds a deferred (paused-at-boot) worker on demand
     if service == 'audiodb':
         if not audiodb_worker:
             return {"success": False, "error": "AudioDB worker not initialized"}
@@ -14209,6 +14475,7 @@ def library_search_service():
         if not service or not entity_type or not query:
             return jsonify({"success": False, "error": "service, entity_type, and query are required"}), 400
 
+        _services.get(service)  # a deferred worker is built on first manual match
         results = _search_service(service, entity_type, query)
         return jsonify({"success": True, "results": results})
 
@@ -14593,6 +14860,19 @@ def get_track_source_info(track_id):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route('/api/library/downloads/search', methods=['GET'])
+def search_track_downloads():
+    """Search download provenance records by title, artist, album or source filename."""
+    try:
+        query = request.args.get('q', '')
+        limit = request.args.get('limit', default=50, type=int) or 50
+        return jsonify({"success": True, "downloads": get_database().search_track_downloads(query, limit=limit),
+                        "q": query})
+    except Exception as e:
+        logger.error(f"Error searching track downloads: {e}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 # ==================================================================================
 # TRACK REDOWNLOAD — Search metadata, search download sources, start redownload
 # ==================================================================================
@@ -16845,6 +17125,7 @@ def _fetch_youtube_video_artist(video_id, cookie_opts):
     opts = {'quiet': True, 'no_warnings': True, 'skip_download': True, 'ignoreerrors': True}
     opts.update(cookie_opts or {})
     try:
+        import yt_dlp
         with yt_dlp.YoutubeDL(opts) as ydl:
             info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
     except Exception as e:
@@ -16895,6 +17176,7 @@ def parse_youtube_playlist(url):
         
         tracks = []
         
+        import yt_dlp
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             # Extract playlist info
             playlist_info = ydl.extract_info(url, download=False)
@@ -19191,7 +19473,8 @@ def backup_database_endpoint():
     """Create a rolling backup of the database (max 5)."""
     try:
         import glob as _glob
-        from core.db_integrity import DBIntegrityError, safe_backup, prune_backups
+        from core.db_integrity import DBIntegrityError, prune_backups
+        from core.db_backup_store import run_configured_backup
         db_path = os.environ.get('DATABASE_PATH', 'database/music_library.db')
         if not os.path.exists(db_path):
             return jsonify({"success": False, "error": "Database file not found"}), 404
@@ -19202,7 +19485,7 @@ def backup_database_endpoint():
         # RESULT after — so a corrupt DB can never silently produce a backup
         # (the incident where every rolling backup copied the corruption).
         try:
-            safe_backup(db_path, backup_path)
+            backup_stats = run_configured_backup(db_path, backup_path, config_manager.get)
         except DBIntegrityError as integ:
             logger.error("Backup refused — database integrity check failed: %s", integ)
             return jsonify({
@@ -19231,7 +19514,8 @@ def backup_database_endpoint():
                     os.remove(removed + '.meta.json')
             except Exception as e:
                 logger.debug("rolling backup cleanup failed: %s", e)
-        return jsonify({"success": True, "backup_path": backup_path, "size_mb": size_mb, "version": SOULSYNC_VERSION})
+        return jsonify({"success": True, "backup_path": backup_path, "size_mb": size_mb,
+                        "version": SOULSYNC_VERSION, "stats": backup_stats})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -19407,6 +19691,58 @@ def download_backup_endpoint(filename):
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+def _music_backup_store():
+    from core.db_backup_store import BackupChunkStore, store_root_for
+    db_path = os.environ.get('DATABASE_PATH', 'database/music_library.db')
+    root = store_root_for(db_path, config_manager.get('database.backup.chunk_store.path', '') or '')
+    return db_path, BackupChunkStore(root, codec=config_manager.get('database.backup.chunk_store.compression', None) or None)
+
+@app.route('/api/database/backup-store', methods=['GET'])
+def list_backup_store_endpoint():
+    """List the deduplicated chunk-store snapshots of the music database."""
+    try:
+        _db_path, store = _music_backup_store()
+        return jsonify({"success": True, "snapshots": store.list(), "stats": store.get_stats()})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/database/backup-store/<name>/verify', methods=['POST'])
+@admin_only
+def verify_backup_store_snapshot_endpoint(name):
+    """Read back every chunk of a snapshot and check its hashes."""
+    try:
+        _db_path, store = _music_backup_store()
+        result = store.verify(name)
+        return jsonify({"success": result['ok'], **result}), (200 if result['ok'] else 409)
+    except ValueError:
+        return jsonify({"success": False, "error": "Invalid snapshot name"}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/database/backup-store/<name>/materialize', methods=['POST'])
+@admin_only
+def materialize_backup_store_snapshot_endpoint(name):
+    """Rebuild a chunk-store snapshot as a regular ``.backup_<ts>`` file, so the
+    normal (version-checked, safety-backup-first) restore flow can use it."""
+    try:
+        from core.db_integrity import DBIntegrityError
+        db_path, store = _music_backup_store()
+        filename = f"{os.path.basename(db_path)}.backup_{name}"
+        if not _BACKUP_FILENAME_RE.match(filename):
+            return jsonify({"success": False, "error": "Invalid snapshot name"}), 400
+        backup_path = os.path.join(os.path.dirname(db_path), filename)
+        if os.path.exists(backup_path):
+            return jsonify({"success": True, "filename": filename, "existing": True})
+        try:
+            result = store.restore(name, backup_path)
+        except FileNotFoundError:
+            return jsonify({"success": False, "error": "Snapshot not found"}), 404
+        except DBIntegrityError as integ:
+            return jsonify({"success": False, "error": str(integ), "integrity_failed": True}), 409
+        return jsonify({"success": True, "filename": filename, "stats": result})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
 # ===============================
 # == DATABASE MAINTENANCE      ==
 # ===============================
@@ -20922,6 +21258,35 @@ def get_all_downloads_unified():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/downloads/journal', methods=['GET'])
+def get_download_journal_stats():
+    """Write latency and recovery timing for the download queue journal."""
+    journal = _download_journal_module.get_download_journal()
+    if journal is None:
+        return jsonify({'success': True, 'enabled': False})
+    return jsonify({'success': True, 'enabled': True, 'stats': journal.get_stats()})
+
+
+@app.route('/api/downloads/transfers/changes', methods=['GET'])
+def get_transfer_changes():
+    """Soulseek transfers that changed since ``?since=<seq>`` (0 = full view)."""
+    try:
+        since = int(request.args.get('since', 0))
+    except (TypeError, ValueError):
+        since = 0
+    changes = _transfer_tracker.changes_since(since)
+    return jsonify({'success': True, **changes, 'stats': _transfer_tracker.get_stats()})
+
+
+@app.route('/api/downloads/workers', methods=['GET'])
+def get_download_worker_stats():
+    """Per-source queue depth, wait time and worker gauges for streaming downloads."""
+    engine = getattr(download_orchestrator, 'engine', None) if download_orchestrator else None
+    if engine is None:
+        return jsonify({'success': True, 'sources': {}})
+    return jsonify({'success': True, 'sources': engine.worker.get_stats()})
+
+
 @app.route('/api/downloads/batch-history', methods=['GET'])
 def get_batch_history():
     """Return completed batch summaries from the last N days for the batch panel history section."""
@@ -24620,6 +24985,8 @@ def _sync_qobuz_credentials_to_worker():
         worker = qobuz_enrichment_worker if 'qobuz_enrichment_worker' in globals() else None
         if worker and getattr(worker, 'client', None):
             worker.client.reload_credentials()
+        else:
+            _services.refresh()  # first login: the worker was deferred for lack of a session
     except Exception as e:
         logger.debug(f"Could not sync Qobuz credentials to enrichment worker: {e}")
 
@@ -33360,6 +33727,7 @@ def search_blocklist_candidates():
             return jsonify({"success": True, "results": []})
         from core.metadata.registry import get_primary_source
         source = get_primary_source() or 'spotify'
+        _services.get(source)
         results = _search_service(source, entity_type, query)
         return jsonify({"success": True, "source": source, "results": results})
     except Exception as e:
@@ -35393,7 +35761,7 @@ def get_beatport_genres():
         logger.info("API request for Beatport genres")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         include_images = request.args.get('include_images', 'false').lower() == 'true'
@@ -35431,7 +35799,7 @@ def get_beatport_genre_tracks(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre tracks (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '100'))
@@ -35488,7 +35856,7 @@ def extract_beatport_chart_tracks():
         logger.info(f"Chart URL: {chart_url}")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         if enrich:
             # Full extraction + enrichment (legacy synchronous path)
@@ -35534,7 +35902,7 @@ def get_beatport_genre_top_10(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre top 10 tracks (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Create genre dict for scraper
         genre = {
@@ -35571,7 +35939,7 @@ def get_beatport_genre_releases_top_10(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre top 10 releases (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Create genre dict for scraper
         genre = {
@@ -35608,7 +35976,7 @@ def get_beatport_genre_releases_top_100(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre top 100 releases (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '100'))
@@ -35648,7 +36016,7 @@ def get_beatport_genre_staff_picks(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre staff picks (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '50'))
@@ -35688,7 +36056,7 @@ def get_beatport_genre_hype_top_10(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre hype top 10 (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Create genre dict for scraper
         genre = {
@@ -35725,7 +36093,7 @@ def get_beatport_genre_hype_top_100(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre hype top 100 (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Create genre dict for scraper
         genre = {
@@ -35762,7 +36130,7 @@ def get_beatport_genre_hype_picks(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre hype picks (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '50'))
@@ -35802,7 +36170,7 @@ def get_beatport_genre_latest_releases(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre latest releases (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '50'))
@@ -35842,7 +36210,7 @@ def get_beatport_genre_new_charts(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre new charts (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '50'))
@@ -35898,7 +36266,7 @@ def get_beatport_genre_hero(genre_slug, genre_id):
             })
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Scrape hero slider data
         hero_releases = scraper.scrape_genre_hero_slider(genre_slug, genre_id)
@@ -35955,7 +36323,7 @@ def get_beatport_genre_top10_lists(genre_slug, genre_id):
             return jsonify(cached_data)
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Scrape Top 10 lists from genre page
         top10_data = scraper.scrape_genre_top10_tracks(genre_slug, genre_id)
@@ -36026,7 +36394,7 @@ def get_beatport_genre_top10_releases(genre_slug, genre_id):
             return jsonify(cached_data)
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Scrape Top 10 releases from genre page
         releases = scraper.scrape_genre_top10_releases(genre_slug, genre_id)
@@ -36079,7 +36447,7 @@ def get_beatport_genre_sections(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre sections discovery (ID: {genre_id})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Create genre dict for scraper
         genre = {
@@ -36114,7 +36482,7 @@ def get_beatport_top_100():
         logger.info("API request for Beatport Top 100")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '100'))
@@ -36148,7 +36516,7 @@ def get_beatport_genre_image(genre_slug, genre_id):
         logger.info(f"API request for {genre_slug} genre image")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Construct genre URL
         genre_url = f"{scraper.base_url}/genre/{genre_slug}/{genre_id}"
@@ -36188,7 +36556,7 @@ def get_beatport_hype_top_100():
         logger.info("API request for Beatport Hype Top 100")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '100'))
@@ -36222,7 +36590,7 @@ def get_beatport_top_100_releases():
         logger.info("API request for Beatport Top 100 Releases")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '100'))
@@ -36256,7 +36624,7 @@ def get_beatport_homepage_new_releases():
         logger.info(f"🆕 API request for Beatport homepage New Releases (limit: {limit})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get new releases from homepage
         new_releases = scraper.scrape_new_releases(limit=limit)
@@ -36287,7 +36655,7 @@ def get_beatport_homepage_hype_picks():
         logger.info(f"API request for Beatport homepage Hype Picks (limit: {limit})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get hype picks from homepage
         hype_picks = scraper.scrape_hype_picks_homepage(limit=limit)
@@ -36318,7 +36686,7 @@ def get_beatport_homepage_top_10_releases():
         logger.info(f"API request for Beatport homepage Top 10 Releases (limit: {limit})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get top 10 releases from homepage
         top_10_releases = scraper.scrape_top_10_releases_homepage(limit=limit)
@@ -36358,7 +36726,7 @@ def get_beatport_homepage_top10_lists():
         logger.info("Cache miss - scraping fresh top 10 lists data...")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get top 10 lists from homepage
         top10_lists = scraper.scrape_homepage_top10_lists()
@@ -36409,7 +36777,7 @@ def get_beatport_homepage_top10_releases_cards():
         logger.info("Cache miss - scraping fresh top 10 releases data...")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get top 10 releases from homepage
         top10_releases = scraper.scrape_homepage_top10_releases()
@@ -36474,7 +36842,7 @@ def scrape_beatport_releases():
         logger.info(f"API request to scrape {len(release_urls)} release URLs with source: {source_name}")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Use our new general scraper function
         tracks = scraper.scrape_multiple_releases(release_urls, source_name)
@@ -36526,7 +36894,7 @@ def get_beatport_release_metadata():
 
         logger.info(f"API request for release metadata: {release_url}")
 
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
         result = scraper.get_release_metadata(release_url)
 
         if not result.get('success'):
@@ -36629,7 +36997,7 @@ def enrich_beatport_tracks():
                         else:
                             logger.warning(f"on_progress: task {enrichment_id} not found in _enrichment_tasks!")
 
-                scraper = BeatportUnifiedScraper()
+                scraper = _beatport_scraper()
                 newly_enriched = scraper.enrich_chart_tracks(uncached_tracks, progress_callback=on_progress)
 
                 # Clean and cache
@@ -36721,7 +37089,7 @@ def get_beatport_homepage_featured_charts():
         logger.info(f"API request for Beatport homepage Featured Charts (limit: {limit})")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get featured charts from homepage
         featured_charts = scraper.scrape_featured_charts(limit=limit)
@@ -36751,7 +37119,7 @@ def get_beatport_chart_sections():
         logger.info("API request for Beatport chart sections discovery")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Discover chart sections dynamically
         chart_sections = scraper.discover_chart_sections()
@@ -36780,7 +37148,7 @@ def get_beatport_dj_charts_improved():
         logger.info("API request for Beatport DJ Charts (improved)")
 
         # Initialize the Beatport scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get query parameters
         limit = int(request.args.get('limit', '20'))
@@ -36824,7 +37192,7 @@ def get_beatport_hype_picks():
         logger.info("Cache miss - scraping fresh hype picks data...")
 
         # Initialize scraper
-        scraper = BeatportUnifiedScraper()
+        scraper = _beatport_scraper()
 
         # Get page and extract releases
         soup = scraper.get_page(scraper.base_url)
@@ -38846,6 +39214,7 @@ def start_oauth_callback_servers():
                         tidal_client = TidalClient()
                         if tidal_enrichment_worker:
                             tidal_enrichment_worker.client = tidal_client
+                        _services.refresh()
 
                         add_activity_item("", "Tidal Auth Complete", "Successfully authenticated with Tidal", "Now")
                         self.send_response(200)
@@ -38904,27 +39273,74 @@ def start_oauth_callback_servers():
 # MUSICBRAINZ ENRICHMENT - PHASE 5 WEB UI INTEGRATION
 # ================================================================================================
 
+# --- Enrichment worker registry ---
+# Every enrichment worker below is a recipe in core.service_registry: nothing
+# is imported or constructed where it's registered. _boot_services() (from
+# start_runtime_services, never at import) builds the ones wanted at startup:
+# a worker that needs credentials or an opt-in stays deferred until they're
+# saved (settings save / auth routes call _services.refresh()), and one whose
+# only consumers are its bubble / manual match stays deferred while paused.
+# Deferred workers are built on first use. /api/debug/services reports
+# per-worker import + init cost.
+
+def _enrichment_worker_build(display_name, paused_key, *, paused_default=False,
+                             pause_before_start=False, **build_kwargs):
+    """The usual worker boot: construct on its own MusicDatabase, start, and
+    restore the persisted pause flag. Callable kwargs are resolved at build time."""
+    def build(worker_cls):
+        from database.music_database import MusicDatabase
+        kwargs = {k: (v() if callable(v) else v) for k, v in build_kwargs.items()}
+        worker = worker_cls(database=MusicDatabase(), **kwargs)
+        paused = config_manager.get(paused_key, paused_default)
+        if paused and pause_before_start:
+            worker.paused = True
+        worker.start()
+        if paused and not pause_before_start:
+            worker.pause()
+        if paused:
+            logger.info(f"{display_name} enrichment worker initialized (paused — restored from config)")
+        else:
+            logger.info(f"{display_name} enrichment worker initialized and started")
+        return worker
+    return build
+
+
+def _enabled_when(paused_key=None, *, paused_default=False, configured=None):
+    """Boot predicate: build at startup only when the service is configured
+    (``configured()`` — credentials present, opted in) and, if ``paused_key``
+    is given, the user hasn't paused it."""
+    def enabled():
+        if paused_key and config_manager.get(paused_key, paused_default):
+            return False
+        return configured is None or bool(configured())
+    return enabled
+
+
+def _config_present(*keys):
+    return lambda: all(config_manager.get(key, '') for key in keys)
+
+
+def _tidal_authorized():
+    return bool(tidal_client and (getattr(tidal_client, 'access_token', None)
+                                  or getattr(tidal_client, 'refresh_token', None)))
+
+
+def _qobuz_session_saved():
+    return bool((config_manager.get('qobuz.session', {}) or {}).get('user_auth_token'))
+
+
+def _experimental_source_enabled(source):
+    def enabled():
+        from core.metadata.registry import is_source_enabled
+        return is_source_enabled(source)
+    return enabled
+
+
 # --- MusicBrainz Worker Initialization ---
 mb_worker = None
-try:
-    from database.music_database import MusicDatabase
-    mb_db = MusicDatabase()
-    mb_worker = MusicBrainzWorker(
-        database=mb_db,
-        app_name="SoulSync",
-        app_version="1.0",
-        contact_email=""
-    )
-    # Start worker automatically (can be paused via UI)
-    mb_worker.start()
-    if config_manager.get('musicbrainz_enrichment_paused', False):
-        mb_worker.pause()
-        logger.info("MusicBrainz enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("MusicBrainz enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"MusicBrainz worker initialization failed: {e}")
-    mb_worker = None
+_services.register('musicbrainz', 'core.musicbrainz_worker', 'MusicBrainzWorker',
+                   _enrichment_worker_build('MusicBrainz', 'musicbrainz_enrichment_paused',
+                                            app_name="SoulSync", app_version="1.0", contact_email=""))
 
 # MusicBrainz status / pause / resume routes are now served by the
 # generic enrichment blueprint registered in core/enrichment/api.py
@@ -38941,19 +39357,8 @@ except Exception as e:
 
 # --- AudioDB Worker Initialization ---
 audiodb_worker = None
-try:
-    from database.music_database import MusicDatabase
-    audiodb_db = MusicDatabase()
-    audiodb_worker = AudioDBWorker(database=audiodb_db)
-    audiodb_worker.start()
-    if config_manager.get('audiodb_enrichment_paused', False):
-        audiodb_worker.pause()
-        logger.info("AudioDB enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("AudioDB enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"AudioDB worker initialization failed: {e}")
-    audiodb_worker = None
+_services.register('audiodb', 'core.audiodb_worker', 'AudioDBWorker',
+                   _enrichment_worker_build('AudioDB', 'audiodb_enrichment_paused'))
 
 # AudioDB status / pause / resume routes are now served by the
 # generic enrichment blueprint at /api/enrichment/audiodb/{status,pause,resume}.
@@ -38963,21 +39368,12 @@ except Exception as e:
 # ================================================================================================
 
 # --- Discogs Worker Initialization ---
+# Only the Discogs bubble and manual match use this worker, so a paused one
+# isn't built at boot — resume / manual match build it on demand.
 discogs_worker = None
-try:
-    from core.discogs_worker import DiscogsWorker
-    from database.music_database import MusicDatabase
-    discogs_db = MusicDatabase()
-    discogs_worker = DiscogsWorker(database=discogs_db)
-    discogs_worker.start()
-    if config_manager.get('discogs_enrichment_paused', False):
-        discogs_worker.pause()
-        logger.info("Discogs enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("Discogs enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Discogs worker initialization failed: {e}")
-    discogs_worker = None
+_services.register('discogs', 'core.discogs_worker', 'DiscogsWorker',
+                   _enrichment_worker_build('Discogs', 'discogs_enrichment_paused'),
+                   enabled=_enabled_when('discogs_enrichment_paused'))
 
 # Discogs status / pause / resume routes are now served by the
 # generic enrichment blueprint at /api/enrichment/discogs/{status,pause,resume}.
@@ -38988,19 +39384,8 @@ except Exception as e:
 
 # --- Deezer Worker Initialization ---
 deezer_worker = None
-try:
-    from database.music_database import MusicDatabase
-    deezer_db = MusicDatabase()
-    deezer_worker = DeezerWorker(database=deezer_db)
-    deezer_worker.start()
-    if config_manager.get('deezer_enrichment_paused', False):
-        deezer_worker.pause()
-        logger.info("Deezer enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("Deezer enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Deezer worker initialization failed: {e}")
-    deezer_worker = None
+_services.register('deezer', 'core.deezer_worker', 'DeezerWorker',
+                   _enrichment_worker_build('Deezer', 'deezer_enrichment_paused'))
 
 # Deezer status / pause / resume routes are now served by the
 # generic enrichment blueprint at /api/enrichment/deezer/{status,pause,resume}.
@@ -39013,20 +39398,11 @@ except Exception as e:
 # JIOSAAVN ENRICHMENT INTEGRATION
 # ================================================================================================
 
+# Experimental opt-in: not built until 'experimental.jiosaavn_enabled' is on.
 jiosaavn_worker = None
-try:
-    from database.music_database import MusicDatabase
-    jiosaavn_db = MusicDatabase()
-    jiosaavn_worker = JioSaavnWorker(database=jiosaavn_db)
-    jiosaavn_worker.start()
-    if config_manager.get('jiosaavn_enrichment_paused', False):
-        jiosaavn_worker.pause()
-        logger.info("JioSaavn enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("JioSaavn enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"JioSaavn worker initialization failed: {e}")
-    jiosaavn_worker = None
+_services.register('jiosaavn', 'core.jiosaavn_worker', 'JioSaavnWorker',
+                   _enrichment_worker_build('JioSaavn', 'jiosaavn_enrichment_paused'),
+                   enabled=_enabled_when(configured=_experimental_source_enabled('jiosaavn')))
 
 # JioSaavn status / pause / resume routes are served by the
 # generic enrichment blueprint at /api/enrichment/jiosaavn/{status,pause,resume}.
@@ -39035,23 +39411,15 @@ except Exception as e:
 # END JIOSAAVN INTEGRATION
 # ================================================================================================
 
+# Opt-in by default: Amazon enrichment depends on an external public proxy
+# (T2Tunes) that can be down, so it stays paused unless the user has
+# explicitly enabled it (amazon_enrichment_paused=False). This stops an
+# instance outage from grinding/log-flooding installs that never opted in.
+# While paused it isn't built at all; the bubble's resume builds it.
 amazon_worker = None
-try:
-    amazon_db = MusicDatabase()
-    amazon_worker = AmazonWorker(database=amazon_db)
-    amazon_worker.start()
-    # Opt-in by default: Amazon enrichment depends on an external public proxy
-    # (T2Tunes) that can be down, so it stays paused unless the user has
-    # explicitly enabled it (amazon_enrichment_paused=False). This stops an
-    # instance outage from grinding/log-flooding installs that never opted in.
-    if config_manager.get('amazon_enrichment_paused', True):
-        amazon_worker.pause()
-        logger.info("Amazon enrichment worker initialized (paused — enable it in Settings)")
-    else:
-        logger.info("Amazon enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Amazon worker initialization failed: {e}")
-    amazon_worker = None
+_services.register('amazon', 'core.amazon_worker', 'AmazonWorker',
+                   _enrichment_worker_build('Amazon', 'amazon_enrichment_paused', paused_default=True),
+                   enabled=_enabled_when('amazon_enrichment_paused', paused_default=True))
 
 
 # --- Similar Artists Worker Initialization ---
@@ -39060,19 +39428,9 @@ except Exception as e:
 # self-paces (~3s/artist) and backs off on MusicMap outages. Respects a saved
 # pause choice across restarts.
 similar_artists_worker = None
-try:
-    from core.similar_artists_worker import SimilarArtistsWorker
-    similar_artists_db = MusicDatabase()
-    similar_artists_worker = SimilarArtistsWorker(database=similar_artists_db)
-    similar_artists_worker.start()
-    if config_manager.get('similar_artists_enrichment_paused', False):
-        similar_artists_worker.pause()
-        logger.info("Similar Artists worker initialized (paused — restored from config)")
-    else:
-        logger.info("Similar Artists worker initialized and started")
-except Exception as e:
-    logger.error(f"Similar Artists worker initialization failed: {e}")
-    similar_artists_worker = None
+_services.register('similar_artists', 'core.similar_artists_worker', 'SimilarArtistsWorker',
+                   _enrichment_worker_build('Similar Artists', 'similar_artists_enrichment_paused'),
+                   enabled=_enabled_when('similar_artists_enrichment_paused'))
 
 
 # ================================================================================================
@@ -39089,29 +39447,33 @@ except Exception as e:
 #
 # Gate the worker at boot: only auto-start when Spotify is the configured primary
 # source. Users on other sources can manually unpause the worker from settings if
-# they explicitly want background Spotify enrichment.
+# they explicitly want background Spotify enrichment. Without a client id/secret
+# it isn't built at all.
 spotify_enrichment_worker = None
-try:
+
+
+def _build_spotify_enrichment_worker(worker_cls):
     from core.metadata_service import get_configured_primary_source
     from database.music_database import MusicDatabase
-    spotify_enrichment_db = MusicDatabase()
-    spotify_enrichment_worker = SpotifyWorker(database=spotify_enrichment_db)
+    worker = worker_cls(database=MusicDatabase())
     # Use configured source only — get_primary_source() probes Spotify auth and can
     # block gunicorn worker boot indefinitely when the API is unreachable.
     _primary = get_configured_primary_source()
     _user_paused = config_manager.get('spotify_enrichment_paused', False)
     if _user_paused or _primary != 'spotify':
-        spotify_enrichment_worker.paused = True  # Set BEFORE start() to prevent race condition
-    spotify_enrichment_worker.start()
-    if not spotify_enrichment_worker.paused:
+        worker.paused = True  # Set BEFORE start() to prevent race condition
+    worker.start()
+    if not worker.paused:
         logger.info("Spotify enrichment worker initialized and started")
     elif _user_paused:
         logger.info("Spotify enrichment worker initialized (paused — restored from config)")
     else:
         logger.info(f"Spotify enrichment worker initialized (paused — primary metadata source is '{_primary}', not Spotify)")
-except Exception as e:
-    logger.error(f"Spotify enrichment worker initialization failed: {e}")
-    spotify_enrichment_worker = None
+    return worker
+
+
+_services.register('spotify', 'core.spotify_worker', 'SpotifyWorker', _build_spotify_enrichment_worker,
+                   enabled=_enabled_when(configured=_config_present('spotify.client_id', 'spotify.client_secret')))
 
 # --- API Rate Monitor Endpoints ---
 
@@ -39145,19 +39507,8 @@ def get_rate_monitor_history(service_key):
 
 # --- iTunes Worker Initialization ---
 itunes_enrichment_worker = None
-try:
-    from database.music_database import MusicDatabase
-    itunes_enrichment_db = MusicDatabase()
-    itunes_enrichment_worker = iTunesWorker(database=itunes_enrichment_db)
-    itunes_enrichment_worker.start()
-    if config_manager.get('itunes_enrichment_paused', False):
-        itunes_enrichment_worker.pause()
-        logger.info("iTunes enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("iTunes enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"iTunes enrichment worker initialization failed: {e}")
-    itunes_enrichment_worker = None
+_services.register('itunes', 'core.itunes_worker', 'iTunesWorker',
+                   _enrichment_worker_build('iTunes', 'itunes_enrichment_paused'))
 
 # iTunes status / pause / resume routes are now served by the
 # generic enrichment blueprint at /api/enrichment/itunes/{status,pause,resume}.
@@ -39172,19 +39523,9 @@ except Exception as e:
 # ================================================================================================
 
 lastfm_worker = None
-try:
-    from database.music_database import MusicDatabase
-    lastfm_db = MusicDatabase()
-    lastfm_worker = LastFMWorker(database=lastfm_db)
-    lastfm_worker.start()
-    if config_manager.get('lastfm_enrichment_paused', False):
-        lastfm_worker.pause()
-        logger.info("Last.fm enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("Last.fm enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Last.fm worker initialization failed: {e}")
-    lastfm_worker = None
+_services.register('lastfm', 'core.lastfm_worker', 'LastFMWorker',
+                   _enrichment_worker_build('Last.fm', 'lastfm_enrichment_paused'),
+                   enabled=_enabled_when(configured=_config_present('lastfm.api_key')))
 
 # Last.fm status / pause / resume routes are now served by the
 # generic enrichment blueprint at /api/enrichment/lastfm/{status,pause,resume}.
@@ -39265,20 +39606,9 @@ def lastfm_callback():
 # ================================================================================================
 
 genius_worker = None
-try:
-    from database.music_database import MusicDatabase
-    genius_db = MusicDatabase()
-    genius_worker = GeniusWorker(database=genius_db)
-    if config_manager.get('genius_enrichment_paused', False):
-        genius_worker.paused = True
-    genius_worker.start()
-    if genius_worker.paused:
-        logger.info("Genius enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("Genius enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Genius worker initialization failed: {e}")
-    genius_worker = None
+_services.register('genius', 'core.genius_worker', 'GeniusWorker',
+                   _enrichment_worker_build('Genius', 'genius_enrichment_paused', pause_before_start=True),
+                   enabled=_enabled_when(configured=_config_present('genius.access_token')))
 
 # --- Genius API Endpoints ---
 
@@ -39296,25 +39626,14 @@ except Exception as e:
 # BANDCAMP ENRICHMENT WORKER
 # ================================================================================================
 # Opt-in experimental source (core.metadata.registry.EXPERIMENTAL_SOURCES) —
-# started unconditionally like the other enrichment workers, but the worker
-# loop itself stays idle unless 'experimental.bandcamp_enabled' is on
-# (checked live, so toggling the setting takes effect without a restart).
+# not built until 'experimental.bandcamp_enabled' is on (saving the setting
+# builds it). Once built the worker loop re-checks the flag live, so turning
+# it back off idles the worker without a restart.
 
 bandcamp_worker = None
-try:
-    from database.music_database import MusicDatabase
-    bandcamp_db = MusicDatabase()
-    bandcamp_worker = BandcampWorker(database=bandcamp_db)
-    if config_manager.get('bandcamp_enrichment_paused', False):
-        bandcamp_worker.paused = True
-    bandcamp_worker.start()
-    if bandcamp_worker.paused:
-        logger.info("Bandcamp enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("Bandcamp enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Bandcamp worker initialization failed: {e}")
-    bandcamp_worker = None
+_services.register('bandcamp', 'core.bandcamp_worker', 'BandcampWorker',
+                   _enrichment_worker_build('Bandcamp', 'bandcamp_enrichment_paused', pause_before_start=True),
+                   enabled=_enabled_when(configured=_experimental_source_enabled('bandcamp')))
 
 # Bandcamp status / pause / resume routes are served by the generic
 # enrichment blueprint at /api/enrichment/bandcamp/{status,pause,resume},
@@ -39329,19 +39648,9 @@ except Exception as e:
 # ================================================================================================
 
 tidal_enrichment_worker = None
-try:
-    from database.music_database import MusicDatabase
-    tidal_enrich_db = MusicDatabase()
-    tidal_enrichment_worker = TidalWorker(database=tidal_enrich_db, client=tidal_client)
-    tidal_enrichment_worker.start()
-    if config_manager.get('tidal_enrichment_paused', False):
-        tidal_enrichment_worker.pause()
-        logger.info("Tidal enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("Tidal enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Tidal worker initialization failed: {e}")
-    tidal_enrichment_worker = None
+_services.register('tidal', 'core.tidal_worker', 'TidalWorker',
+                   _enrichment_worker_build('Tidal', 'tidal_enrichment_paused', client=lambda: tidal_client),
+                   enabled=_enabled_when(configured=_tidal_authorized))
 
 # Tidal status / pause / resume routes are now served by the
 # generic enrichment blueprint at /api/enrichment/tidal/{status,pause,resume}.
@@ -39353,36 +39662,88 @@ except Exception as e:
 # ================================================================================================
 
 qobuz_enrichment_worker = None
-try:
-    from database.music_database import MusicDatabase
+
+
+def _qobuz_enrichment_client():
     from core.qobuz_client import QobuzClient
-    qobuz_enrich_db = MusicDatabase()
-    qobuz_enrich_client = QobuzClient()  # Separate client instance for thread safety
-    qobuz_enrichment_worker = QobuzWorker(database=qobuz_enrich_db, client=qobuz_enrich_client)
-    qobuz_enrichment_worker.start()
-    if config_manager.get('qobuz_enrichment_paused', False):
-        qobuz_enrichment_worker.pause()
-        logger.info("Qobuz enrichment worker initialized (paused — restored from config)")
-    else:
-        logger.info("Qobuz enrichment worker initialized and started")
-except Exception as e:
-    logger.error(f"Qobuz worker initialization failed: {e}")
-    qobuz_enrichment_worker = None
-
-_init_service_search(
-    spotify_worker=spotify_enrichment_worker,
-    itunes_worker=itunes_enrichment_worker,
-    musicbrainz_worker=mb_worker,
-    lastfm_worker_obj=lastfm_worker,
-    genius_worker_obj=genius_worker,
-    tidal_worker=tidal_enrichment_worker,
-    qobuz_worker=qobuz_enrichment_worker,
-    discogs_worker_obj=discogs_worker,
-    audiodb_worker_obj=audiodb_worker,
-    amazon_worker_obj=amazon_worker,
-    bandcamp_worker_obj=bandcamp_worker,
-    jiosaavn_worker_obj=jiosaavn_worker,
-)
+    return QobuzClient()  # Separate client instance for thread safety
+
+
+_services.register('qobuz', 'core.qobuz_worker', 'QobuzWorker',
+                   _enrichment_worker_build('Qobuz', 'qobuz_enrichment_paused', client=_qobuz_enrichment_client),
+                   enabled=_enabled_when(configured=_qobuz_session_saved))
+
+# Bind each built worker / client to its module global (the status loop,
+# shutdown, scan pause/resume and manual match all read those) and to the
+# modules holding their own references (manual service search, connection
+# test, metadata registry, API v1) — at boot, and again whenever a deferred
+# one is built.
+_SERVICE_WORKER_GLOBALS = {
+    'musicbrainz': 'mb_worker', 'audiodb': 'audiodb_worker', 'discogs': 'discogs_worker',
+    'deezer': 'deezer_worker', 'jiosaavn': 'jiosaavn_worker', 'amazon': 'amazon_worker',
+    'similar_artists': 'similar_artists_worker', 'spotify': 'spotify_enrichment_worker',
+    'itunes': 'itunes_enrichment_worker', 'lastfm': 'lastfm_worker', 'genius': 'genius_worker',
+    'bandcamp': 'bandcamp_worker', 'tidal': 'tidal_enrichment_worker', 'qobuz': 'qobuz_enrichment_worker',
+    'hydrabase_worker': 'hydrabase_worker', 'hydrabase_client': 'hydrabase_client',
+}
+
+
+def _bind_service_search():
+    _init_service_search(
+        spotify_worker=spotify_enrichment_worker,
+        itunes_worker=itunes_enrichment_worker,
+        musicbrainz_worker=mb_worker,
+        lastfm_worker_obj=lastfm_worker,
+        genius_worker_obj=genius_worker,
+        tidal_worker=tidal_enrichment_worker,
+        qobuz_worker=qobuz_enrichment_worker,
+        discogs_worker_obj=discogs_worker,
+        audiodb_worker_obj=audiodb_worker,
+        amazon_worker_obj=amazon_worker,
+        bandcamp_worker_obj=bandcamp_worker,
+        jiosaavn_worker_obj=jiosaavn_worker,
+    )
+
+
+def _bind_connection_test():
+    _init_connection_test(
+        download_orchestrator_obj=download_orchestrator,
+        qobuz_worker=qobuz_enrichment_worker,
+        hydrabase_client_obj=hydrabase_client,
+        docker_resolve_url_fn=docker_resolve_url,
+        docker_resolve_path_fn=docker_resolve_path,
+    )
+
+
+def _bind_service_worker(name, worker):
+    var = _SERVICE_WORKER_GLOBALS.get(name)
+    if var is None:
+        return
+    globals()[var] = worker
+    if name.startswith('hydrabase_'):
+        if hasattr(app, 'soulsync'):
+            app.soulsync[name] = worker
+        if name == 'hydrabase_client':
+            register_runtime_clients(hydrabase_client=worker)
+    if name in ('qobuz', 'hydrabase_client'):
+        _bind_connection_test()
+    _bind_service_search()
+
+
+def _boot_services():
+    """Build the enrichment workers and clients the config asks for. Runs from
+    start_runtime_services so importing web_server constructs none of them."""
+    report = _services.boot()
+    logger.info(
+        f"Enrichment workers: {report['built']} built, {report['deferred']} deferred "
+        f"({report['boot_ms']}ms)"
+    )
+    return report
+
+
+_services.on_built(_bind_service_worker)
+_bind_service_search()
+
 
 # Qobuz status / pause / resume routes are now served by the
 # generic enrichment blueprint at /api/enrichment/qobuz/{status,pause,resume}.
@@ -39399,36 +39760,42 @@ _init_service_search(
 # ================================================================================================
 
 # --- Hydrabase Worker & Client Initialization ---
+# Both live in the service registry. The metadata client is built once a
+# Hydrabase URL + API key are saved (boot, or /api/hydrabase/connect); the
+# mirror worker only has work in dev mode, so activating dev mode builds it.
 hydrabase_worker = None
 hydrabase_client = None
-try:
-    def _get_hydrabase_ws_and_lock():
-        return (_hydrabase_ws, _hydrabase_lock)
-    hydrabase_worker = HydrabaseWorker(get_ws_and_lock=_get_hydrabase_ws_and_lock)
-    hydrabase_worker.start()
-    hydrabase_client = HydrabaseClient(get_ws_and_lock=_get_hydrabase_ws_and_lock)
-    logger.info("Hydrabase P2P mirror worker and metadata client initialized")
-    # Update API blueprint references
-    if hasattr(app, 'soulsync'):
-        app.soulsync['hydrabase_client'] = hydrabase_client
-        app.soulsync['hydrabase_worker'] = hydrabase_worker
-except Exception as e:
-    logger.error(f"Hydrabase initialization failed: {e}")
-    hydrabase_worker = None
-    hydrabase_client = None
+
+
+def _get_hydrabase_ws_and_lock():
+    return (_hydrabase_ws, _hydrabase_lock)
+
+
+def _build_hydrabase_worker(worker_cls):
+    worker = worker_cls(get_ws_and_lock=_get_hydrabase_ws_and_lock)
+    worker.start()
+    logger.info("Hydrabase P2P mirror worker initialized")
+    return worker
+
+
+def _build_hydrabase_client(client_cls):
+    client = client_cls(get_ws_and_lock=_get_hydrabase_ws_and_lock)
+    logger.info("Hydrabase metadata client initialized")
+    return client
+
+
+_hydrabase_configured = _config_present('hydrabase.url', 'hydrabase.api_key')
+_services.register('hydrabase_worker', 'core.hydrabase_worker', 'HydrabaseWorker', _build_hydrabase_worker,
+                   enabled=lambda: dev_mode_enabled)
+_services.register('hydrabase_client', 'core.hydrabase_client', 'HydrabaseClient', _build_hydrabase_client,
+                   enabled=_hydrabase_configured, kind='client')
 
 register_runtime_clients(
     hydrabase_client=hydrabase_client,
     dev_mode_enabled_provider=lambda: dev_mode_enabled,
 )
 
-_init_connection_test(
-    download_orchestrator_obj=download_orchestrator,
-    qobuz_worker=qobuz_enrichment_worker,
-    hydrabase_client_obj=hydrabase_client,
-    docker_resolve_url_fn=docker_resolve_url,
-    docker_resolve_path_fn=docker_resolve_path,
-)
+_bind_connection_test()
 
 _init_discovery_scoring(matching_engine_obj=matching_engine)
 
@@ -39480,8 +39847,99 @@ _init_download_monitor(
     orphaned_download_keys=_orphaned_download_keys,
     missing_download_executor_obj=missing_download_executor,
     download_orchestrator_obj=download_orchestrator,
+    transfer_tracker_obj=_transfer_tracker,
 )
 
+# --- Download queue journal (warm restart) ---
+from core.downloads import journal as _download_journal_module
+
+
+def _resume_journaled_downloads(journal, recovered_tasks, recovered_batches):
+    """Re-attach live transfers to the recovered batches, restart their workers,
+    then start journaling. A failed resume leaves the journal file untouched —
+    starting the flusher would journal every recovered entity as deleted."""
+    try:
+        if recovered_batches:
+            # One synchronous poll first: the tracker's view is empty until
+            # its first poll lands, and an empty view would requeue (and
+            # download twice) every transfer still running in slskd. None
+            # means slskd couldn't be asked.
+            live_known = _transfer_tracker.refresh() is not None
+            live = {}
+            try:
+                live = download_monitor.fetch_live_transfers()
+            except Exception as e:
+                logger.warning(f"[Download Journal] Live transfer lookup failed, keeping in-flight tasks waiting: {e}")
+                live_known = False
+
+            def _is_live(task):
+                if _download_monitor_module._lookup_live_info(task, live) is not None:
+                    return True
+                return False if live_known else None
+
+            summary = _download_journal_module.rebuild_queue(recovered_tasks, recovered_batches, is_live=_is_live)
+            with tasks_lock:
+                for batch_id, batch in recovered_batches.items():
+                    if batch_id not in download_batches:
+                        download_batches[batch_id] = batch
+                for task_id, task in recovered_tasks.items():
+                    download_tasks.setdefault(task_id, task)
+            logger.info(
+                f"[Download Journal] Resumed {summary['batches']} batches: {summary['reattached']} re-attached, "
+                f"{summary['unverified']} waiting on an unreachable transfer client, "
+                f"{summary['requeued']} requeued, {summary['finished']} already finished "
+                f"(recovery {journal.get_stats()['recovery_ms']}ms)"
+            )
+            for batch_id in recovered_batches:
+                download_monitor.start_monitoring(batch_id)
+                _start_next_batch_of_downloads(batch_id)
+    except Exception as e:
+        logger.error(f"[Download Journal] Resume failed, journaling disabled until restart "
+                     f"(journal file left as-is): {e}")
+        if _download_journal_module.get_download_journal() is journal:
+            _download_journal_module.set_download_journal(None)
+        journal.close()
+        return
+    journal.start()
+
+
+def _start_download_journal():
+    """Open and recover the download journal, then resume its batches in the
+    background. Returns the ids of the batches that will be resumed."""
+    cfg = config_manager.get('database.download_journal', {}) or {}
+    if not cfg.get('enabled', True):
+        return set()
+    path = cfg.get('path') or os.path.join(
+        os.path.dirname(config_manager.get('database.path', 'database/music_library.db')) or '.',
+        'download_journal.db',
+    )
+    journal = None
+    try:
+        journal = _download_journal_module.DownloadJournal(
+            path, flush_interval=float(cfg.get('flush_interval_seconds', 1.0) or 1.0),
+        )
+        recovered_tasks, recovered_batches = journal.recover()
+    except Exception as e:
+        logger.error(f"[Download Journal] Could not recover {path}, journaling disabled until restart: {e}")
+        if journal is not None:
+            journal.close()
+        return set()
+    _download_journal_module.set_download_journal(journal)
+    # Live transfer lookups can block on slskd — keep them off the startup path.
+    threading.Thread(target=_resume_journaled_downloads, args=(journal, recovered_tasks, recovered_batches),
+                     name='download-journal-recovery', daemon=True).start()
+    return {
+        batch_id for batch_id, batch in recovered_batches.items()
+        if batch.get('phase') not in _download_journal_module.SKIPPED_BATCH_PHASES
+    }
+
+
+def _stop_download_journal():
+    journal = _download_journal_module.get_download_journal()
+    if journal is not None:
+        journal.stop()
+
+
 # --- Hydrabase Auto-Reconnect ---
 try:
     _hydra_cfg = config_manager.get_hydrabase_config()
@@ -41273,6 +41731,7 @@ _register_enrichment_services([
     _EnrichmentService(
         id='discogs', display_name='Discogs',
         worker_getter=lambda: discogs_worker,
+        worker_loader=lambda: _services.get('discogs'),
         config_paused_key='discogs_enrichment_paused',
     ),
     _EnrichmentService(
@@ -41283,6 +41742,7 @@ _register_enrichment_services([
     _EnrichmentService(
         id='spotify', display_name='Spotify',
         worker_getter=lambda: spotify_enrichment_worker,
+        worker_loader=lambda: _services.get('spotify'),
         config_paused_key='spotify_enrichment_paused',
         pre_resume_check=_spotify_resume_pre_check,
         auto_pause_token='spotify-enrichment',
@@ -41295,45 +41755,53 @@ _register_enrichment_services([
     _EnrichmentService(
         id='lastfm', display_name='Last.fm',
         worker_getter=lambda: lastfm_worker,
+        worker_loader=lambda: _services.get('lastfm'),
         config_paused_key='lastfm_enrichment_paused',
         auto_pause_token='lastfm-enrichment',
     ),
     _EnrichmentService(
         id='genius', display_name='Genius',
         worker_getter=lambda: genius_worker,
+        worker_loader=lambda: _services.get('genius'),
         config_paused_key='genius_enrichment_paused',
         auto_pause_token='genius-enrichment',
     ),
     _EnrichmentService(
         id='tidal', display_name='Tidal',
         worker_getter=lambda: tidal_enrichment_worker,
+        worker_loader=lambda: _services.get('tidal'),
         config_paused_key='tidal_enrichment_paused',
         extra_status_defaults={'authenticated': False},
     ),
     _EnrichmentService(
         id='qobuz', display_name='Qobuz',
         worker_getter=lambda: qobuz_enrichment_worker,
+        worker_loader=lambda: _services.get('qobuz'),
         config_paused_key='qobuz_enrichment_paused',
         extra_status_defaults={'authenticated': False},
     ),
     _EnrichmentService(
         id='amazon', display_name='Amazon Music',
         worker_getter=lambda: amazon_worker,
+        worker_loader=lambda: _services.get('amazon'),
         config_paused_key='amazon_enrichment_paused',
     ),
     _EnrichmentService(
         id='jiosaavn', display_name='JioSaavn',
         worker_getter=lambda: jiosaavn_worker,
+        worker_loader=lambda: _services.get('jiosaavn'),
         config_paused_key='jiosaavn_enrichment_paused',
     ),
     _EnrichmentService(
         id='similar_artists', display_name='Similar Artists',
         worker_getter=lambda: similar_artists_worker,
+        worker_loader=lambda: _services.get('similar_artists'),
         config_paused_key='similar_artists_enrichment_paused',
     ),
     _EnrichmentService(
         id='bandcamp', display_name='Bandcamp',
         worker_getter=lambda: bandcamp_worker,
+        worker_loader=lambda: _services.get('bandcamp'),
         config_paused_key='bandcamp_enrichment_paused',
     ),
 ])
@@ -41630,53 +42098,42 @@ def _emit_tool_progress_loop():
             logger.debug(f"Error emitting logs: {e}")
 
 def _emit_live_log_loop():
-    """Background thread that tails app.log and pushes new lines via WebSocket."""
-    _last_pos = {}  # {source: file_position}
-    _active_source = 'app'
-    log_map = {
-        'app': Path(_log_path),
-        'acoustid': _log_dir / 'acoustid.log',
-        'post_processing': _log_dir / 'post_processing.log',
-        'source_reuse': _log_dir / 'source_reuse.log',
-    }
+    """Background thread that pushes new live-log records via WebSocket.
+
+    Reads from the in-memory ring fed by the logging queue listeners, so no
+    log file is opened or tailed here.
+    """
+    # Start at the current head — the client fetches history via /api/logs/tail.
+    _last_seq = live_log_buffer.last_seq
+    _last_dropped = 0
     while not globals().get('IS_SHUTTING_DOWN', False):
         socketio.sleep(0.5)
         try:
-            # Read which source clients want (stored by subscribe handler)
             source = getattr(_emit_live_log_loop, '_source', 'app')
-            log_path = log_map.get(source, log_map['app'])
-            if not os.path.exists(log_path):
-                continue
-
-            file_size = os.path.getsize(log_path)
-            last_pos = _last_pos.get(source, 0)
-
-            # File was truncated or rotated
-            if file_size < last_pos:
-                last_pos = 0
-
-            if file_size == last_pos:
-                continue  # No new data
-
-            new_lines = []
-            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-                f.seek(last_pos)
-                for line in f:
-                    stripped = line.rstrip()
-                    if stripped:
-                        new_lines.append(stripped)
-                _last_pos[source] = f.tell()
-
-            if new_lines:
+            # poll() hands back the cursor it scanned up to — re-reading
+            # last_seq here would skip records appended in between.
+            records, _last_seq = live_log_buffer.poll(
+                _last_seq,
+                source=source,
+                level=getattr(_emit_live_log_loop, '_level', None),
+                module=getattr(_emit_live_log_loop, '_module', None),
+            )
+            stats = get_logging_stats()['sources'].get(source, {})
+            dropped = stats.get('dropped', 0)
+            if records or dropped != _last_dropped:
                 # Cap at 50 lines per push to avoid flooding
                 socketio.emit('logs:live', {
-                    'lines': new_lines[-50:],
+                    'lines': [r['line'] for r in records[-50:]],
                     'source': source,
+                    'dropped': dropped,
                 })
+                _last_dropped = dropped
         except Exception as e:
             logger.debug(f"Error in live log emitter: {e}")
 
 _emit_live_log_loop._source = 'app'
+_emit_live_log_loop._level = None
+_emit_live_log_loop._module = None
 
 
 @socketio.on('logs:subscribe')
@@ -41684,6 +42141,8 @@ def handle_logs_subscribe(data):
     """Client subscribes to live log stream with optional source."""
     source = data.get('source', 'app')
     _emit_live_log_loop._source = source
+    _emit_live_log_loop._level = data.get('level') or None
+    _emit_live_log_loop._module = data.get('module') or None
     join_room('logs:live')
 
 
@@ -42010,14 +42469,27 @@ def start_runtime_services():
         else:
             logger.warning("No stuck flags detected - system healthy")
 
+        # Build the enrichment workers and optional clients that are enabled
+        # and configured; the rest are built on first use.
+        _boot_services()
+
+        # Start the shared slskd transfer poller here rather than at import,
+        # so importing web_server (tests, tools) never spawns it. Before the
+        # journal so resumed batches see live transfers.
+        _transfer_tracker.start()
+
+        # Open the download journal and resume the batches it holds. Done
+        # here rather than at import so importing web_server (tests, tools)
+        # never creates or touches download_journal.db.
+        _resumed_batch_ids = _start_download_journal()
+
         # Album-bundle staging sweep — remove orphan ``<batch_id>``
         # dirs left behind by previous-session crashes, errored
         # batches, or pre-fix Soulseek bundles that the per-batch
         # cleanup gate excluded. Runs once at startup, before any
         # new batch can register a staging dir, so we can't race a
-        # starting batch. download_batches is empty at this point
-        # (no batches survive a process restart) — every dir on
-        # disk is by definition an orphan.
+        # starting batch. Batches the journal is resuming keep their
+        # dirs; every other dir on disk is an orphan.
         try:
             from core.downloads.lifecycle import sweep_orphan_album_bundle_staging
             _staging_root = config_manager.get(
@@ -42026,7 +42498,7 @@ def start_runtime_services():
             ) or 'storage/album_bundle_staging'
             _swept = sweep_orphan_album_bundle_staging(
                 _staging_root,
-                active_batch_ids=set(download_batches.keys()),
+                active_batch_ids=set(download_batches.keys()) | _resumed_batch_ids,
             )
             if _swept:
                 logger.warning(